@@ -0,0 +1,251 @@
+"""
+Command Analysis Benchmark - Regex/shlex Parsing vs Cached Command AST
+
+Replays a synthetic autonomous-coding session (commands drawn from the
+distinct commands agents issue while scaffolding, testing and committing a
+Node.js project) through CommandSecurityPolicy.validate, comparing:
+
+- legacy: the regex splitting + ``shlex`` extraction used before the shared
+  command-analysis module, run on every call
+- parse: the command AST parser with no caching (first sight of a command)
+- cached: the default path, memoized parse and verdict cache
+
+Verdicts that differ from the legacy ones are listed; they should all be
+commands the legacy extraction missed (e.g. unspaced pipes, substitutions).
+
+Usage:
+    python agents/command_analysis_benchmark.py
+    python agents/command_analysis_benchmark.py --session 20000 --repeat 5
+"""
+
+import argparse
+import os
+import random
+import re
+import shlex
+import sys
+import time
+from typing import Any, Callable, Dict, List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from agents.tools.command_analysis import VerdictCache, parse_command
+from agents.tools.security import (
+    COMMANDS_NEEDING_EXTRA_VALIDATION,
+    CommandSecurityPolicy,
+    ValidationResult,
+    validate_commands,
+)
+
+SESSION_COMMANDS = [
+    "ls -la",
+    "ls",
+    "pwd",
+    "ls src/",
+    "ls -la src/components",
+    "cat package.json",
+    "cat README.md",
+    "cat feature_list.json | head -50",
+    "cat claude-progress.txt",
+    "head -100 src/App.jsx",
+    "tail -20 server.log",
+    "wc -l src/*.js",
+    "grep -r 'TODO' src/",
+    "grep -n 'useState' src/App.jsx",
+    "grep -c '\"passes\": false' feature_list.json",
+    "npm install",
+    "npm install --save-dev vitest",
+    "npm run build",
+    "npm run dev",
+    "npm test",
+    "npm test -- --run",
+    "npm run lint",
+    "npm test 2>&1 | tail -30",
+    "npm run build 2>&1 | head -40",
+    "node --version",
+    "node server.js",
+    "node scripts/seed.js",
+    "git status",
+    "git diff",
+    "git diff --stat",
+    "git log --oneline -10",
+    "git add .",
+    "git add -A && git commit -m 'Implement feature'",
+    'git commit -m "Add login form validation"',
+    "git init",
+    "git status || git init",
+    "mkdir -p src/components",
+    "mkdir -p tests && cp .env.example .env",
+    "cp src/App.jsx src/App.backup.jsx",
+    "chmod +x init.sh",
+    "chmod +x init.sh && ./init.sh",
+    "./init.sh",
+    "sleep 2",
+    "sleep 5 && ps aux | grep node",
+    "ps aux | grep vite",
+    "lsof -i :3000",
+    "lsof -i :5173 | grep LISTEN",
+    "pkill -f 'node server.js'",
+    "pkill -f vite",
+    "pkill node; sleep 1; npm run dev",
+    "cd frontend && npm install",
+    "ls -la > listing.txt",
+    "cat nonexistent.txt 2>/dev/null || echo missing",
+    "rm -rf node_modules",
+    "curl http://localhost:3000/api/health",
+    "python3 -m http.server",
+    "cat package.json|grep version",
+    "ls dist/*.map|xargs rm",
+    "echo $(cat .env)",
+]
+
+# Commands are reused with a long-tailed frequency, as in real sessions
+WEIGHTS = [1.0 / (rank + 1) for rank in range(len(SESSION_COMMANDS))]
+
+
+def make_session(length: int, seed: int = 0) -> List[str]:
+    rng = random.Random(seed)
+    return rng.choices(SESSION_COMMANDS, weights=WEIGHTS, k=length)
+
+
+def legacy_split_command_segments(command_string: str) -> List[str]:
+    segments = re.split(r"\s*(?:&&|\|\|)\s*", command_string)
+    result = []
+    for segment in segments:
+        for sub in re.split(r"(?<![\"'])\s*;\s*(?![\"'])", segment):
+            sub = sub.strip()
+            if sub:
+                result.append(sub)
+    return result
+
+
+def legacy_extract_commands(command_string: str) -> List[str]:
+    commands = []
+    for segment in re.split(r"(?<![\"'])\s*;\s*(?![\"'])", command_string):
+        segment = segment.strip()
+        if not segment:
+            continue
+        try:
+            tokens = shlex.split(segment)
+        except ValueError:
+            return []
+        expect_command = True
+        for token in tokens:
+            if token in ("|", "||", "&&", "&"):
+                expect_command = True
+                continue
+            if token in ("if", "then", "else", "elif", "fi", "for", "while"):
+                continue
+            if token in ("until", "do", "done", "case", "esac", "in", "!", "{", "}"):
+                continue
+            if token.startswith("-"):
+                continue
+            if "=" in token and not token.startswith("="):
+                continue
+            if expect_command:
+                commands.append(os.path.basename(token))
+                expect_command = False
+    return commands
+
+
+def legacy_validate(policy: CommandSecurityPolicy, command: str) -> ValidationResult:
+    if not command.strip():
+        return ValidationResult(False, "Command is empty")
+    for segment in legacy_split_command_segments(command):
+        commands = legacy_extract_commands(segment)
+        if not commands:
+            return ValidationResult(False, "Unable to parse command")
+        for cmd in commands:
+            if cmd not in policy.allowed_commands:
+                return ValidationResult(False, f"Command '{cmd}' is not allowed")
+        if any(cmd in COMMANDS_NEEDING_EXTRA_VALIDATION for cmd in commands):
+            validation = validate_commands(segment, commands)
+            if not validation.allowed:
+                return validation
+    return ValidationResult(True)
+
+
+def best_time_ms(func: Callable[[], Any], repeat: int) -> float:
+    """Best-of-N wall time in milliseconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def benchmark(session_length: int, repeat: int) -> Dict[str, Any]:
+    session = make_session(session_length)
+    policy = CommandSecurityPolicy()
+
+    def run_legacy() -> None:
+        for command in session:
+            legacy_validate(policy, command)
+
+    def run_parse() -> None:
+        for command in session:
+            policy.validate_ast(parse_command.__wrapped__(command))
+
+    def run_cached() -> None:
+        cached = CommandSecurityPolicy(verdict_cache=VerdictCache())
+        for command in session:
+            cached.validate(command)
+
+    differences = [
+        (command, legacy_validate(policy, command), policy.validate(command))
+        for command in SESSION_COMMANDS
+        if legacy_validate(policy, command).allowed != policy.validate(command).allowed
+    ]
+    legacy_ms = best_time_ms(run_legacy, repeat)
+    return {
+        "commands": session_length,
+        "distinct": len(set(session)),
+        "legacy_ms": legacy_ms,
+        "parse_ms": best_time_ms(run_parse, repeat),
+        "cached_ms": best_time_ms(run_cached, repeat),
+        "differences": differences,
+    }
+
+
+def format_report(result: Dict[str, Any]) -> str:
+    n = result["commands"]
+    lines = [
+        f"Session: {n} commands, {result['distinct']} distinct",
+        "",
+        "| Path | Total (ms) | Per command (us) | Speedup |",
+        "|------|------------|------------------|---------|",
+    ]
+    for label, key in (
+        ("legacy regex+shlex", "legacy_ms"),
+        ("AST, uncached", "parse_ms"),
+        ("AST + verdict cache", "cached_ms"),
+    ):
+        ms = result[key]
+        lines.append(
+            f"| {label} | {ms:.1f} | {ms * 1000 / n:.2f} | "
+            f"{result['legacy_ms'] / ms:.1f}x |"
+        )
+    lines.append("")
+    lines.append("Verdicts that differ from legacy:")
+    for command, legacy, new in result["differences"]:
+        lines.append(
+            f"  {command!r}: legacy {'allow' if legacy.allowed else 'block'}, "
+            f"now {'allow' if new.allowed else 'block'} ({new.reason or 'ok'})"
+        )
+    if not result["differences"]:
+        lines.append("  none")
+    return "\n".join(lines)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Command analysis benchmark")
+    parser.add_argument("--session", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(format_report(benchmark(args.session, args.repeat)))
+
+
+if __name__ == "__main__":
+    main()
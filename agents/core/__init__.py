@@ -11,6 +11,7 @@ from .categorical_engine import CategoricalEngine, SyllogismType
 from .fallacy_detector import (
     FallacyCategory,
     FallacyDetector,
+    FallacyIndex,
     FallacyPattern,
     FallacySeverity,
 )
@@ -26,4 +27,5 @@ __all__ = [
     "FallacyCategory",
     "FallacySeverity",
     "FallacyPattern",
+    "FallacyIndex",
 ]
@@ -15,6 +15,8 @@ from datetime import datetime
 from enum import Enum
 from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 
+from .pattern_scanner import PatternScanner
+
 
 class ThreatCategory(Enum):
     """Categories of adversarial threats."""
@@ -108,6 +110,7 @@ class ThreatPatternLibrary:
 
     def __init__(self):
         self.patterns: Dict[str, ThreatPattern] = {}
+        self._scanner: Optional[PatternScanner] = None
         self._initialize_patterns()
 
     def _initialize_patterns(self):
@@ -263,6 +266,21 @@ class ThreatPatternLibrary:
     def add_pattern(self, pattern: ThreatPattern):
         """Add a threat pattern."""
         self.patterns[pattern.pattern_id] = pattern
+        if self._scanner is not None:
+            self._scanner.add_rule(
+                pattern.pattern_id, pattern.patterns, pattern.keywords
+            )
+
+    @property
+    def scanner(self) -> PatternScanner:
+        """Compiled scanner over every pattern, kept in sync by add_pattern."""
+        if self._scanner is None:
+            self._scanner = PatternScanner()
+            for pattern in self.patterns.values():
+                self._scanner.add_rule(
+                    pattern.pattern_id, pattern.patterns, pattern.keywords
+                )
+        return self._scanner
 
     def get_pattern(self, pattern_id: str) -> Optional[ThreatPattern]:
         """Get a pattern by ID."""
@@ -288,32 +306,29 @@ class ThreatDetector:
         """Detect threats in text."""
         detections = []
         input_hash = hashlib.sha256(text.encode()).hexdigest()[:16]
+        # One scan for all patterns; first match per regex, as re.search
+        scan = self.library.scanner.scan(text, find_all=False)
 
         for pattern in self.library.patterns.values():
-            detection = self._check_pattern(text, pattern, input_hash)
+            detection = self._check_pattern(
+                pattern,
+                [hit.pattern for hit in scan.matches.get(pattern.pattern_id, [])],
+                scan.keywords.get(pattern.pattern_id, []),
+                input_hash,
+            )
             if detection.detected:
                 detections.append(detection)
 
         return detections
 
     def _check_pattern(
-        self, text: str, pattern: ThreatPattern, input_hash: str
+        self,
+        pattern: ThreatPattern,
+        matched_patterns: List[str],
+        matched_keywords: List[str],
+        input_hash: str,
     ) -> ThreatDetection:
-        """Check text against a single pattern."""
-        matched_patterns: List[str] = []
-        matched_keywords: List[str] = []
-
-        # Check regex patterns
-        for regex in pattern.patterns:
-            if re.search(regex, text):
-                matched_patterns.append(regex)
-
-        # Check keywords
-        text_lower = text.lower()
-        for keyword in pattern.keywords:
-            if keyword.lower() in text_lower:
-                matched_keywords.append(keyword)
-
+        """Score a single pattern from its regex and keyword hits."""
         # Compute confidence
         pattern_score = len(matched_patterns) / max(len(pattern.patterns), 1)
         keyword_score = len(matched_keywords) / max(len(pattern.keywords), 1)
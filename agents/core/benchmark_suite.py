@@ -6,15 +6,36 @@ Provides comprehensive benchmarking for the agent system:
 - Accuracy metrics
 - Regression tracking
 - Comparison across versions
+
+Run the built-in performance benchmarks against the stored baselines with
+``python -m agents.core.benchmark_suite`` (exits non-zero on regression).
+
+Baselines are machine-specific, so none are committed. Record them on the
+machine that will run the checks with
+``python -m agents.core.benchmark_suite --update-baseline``, which writes
+``agents/core/benchmark_baselines.json`` (or the ``--baseline`` path).
 """
 
+import argparse
+import gc
 import json
+import math
+import multiprocessing
+import os
+import random
 import statistics
+import sys
 import time
-from dataclasses import dataclass, field
+import tracemalloc
+from collections import deque
+from dataclasses import asdict, dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Deque, Dict, List, Optional, Sequence, Tuple
+
+DEFAULT_BASELINE_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "benchmark_baselines.json"
+)
 
 
 class BenchmarkCategory(Enum):
@@ -37,6 +58,20 @@ class BenchmarkConfig:
     iterations: int = 10
     timeout_seconds: float = 60.0
     parameters: Dict[str, Any] = field(default_factory=dict)
+    # Auto-calibration: size the run to take about min_time_seconds, with
+    # ``iterations`` as the floor and ``max_iterations`` as the ceiling.
+    auto_calibrate: bool = False
+    min_time_seconds: float = 0.5
+    max_iterations: int = 100_000
+    # Measurement hygiene
+    collect_garbage: bool = True  # gc.collect() before timing
+    disable_gc: bool = False  # keep the collector off while timing
+    isolate: bool = False  # run in a forked child process
+    track_memory: bool = True  # tracemalloc peak over one extra call
+    # Statistics: timings kept for percentiles, CIs and regression tests
+    max_samples: int = 2000
+    bootstrap_resamples: int = 1000
+    confidence_level: float = 0.95
 
 
 @dataclass
@@ -56,10 +91,13 @@ class BenchmarkResult:
     p99_ms: float
     throughput: Optional[float] = None  # operations per second
     accuracy: Optional[float] = None  # 0-1 for accuracy benchmarks
-    memory_mb: Optional[float] = None
+    memory_mb: Optional[float] = None  # tracemalloc peak for one call
     error: Optional[str] = None
     timestamp: str = field(default_factory=lambda: datetime.now().isoformat())
     metadata: Dict[str, Any] = field(default_factory=dict)
+    ci_low_ms: Optional[float] = None  # bootstrap CI of the mean
+    ci_high_ms: Optional[float] = None
+    samples_ms: List[float] = field(default_factory=list, repr=False)
 
 
 @dataclass
@@ -73,49 +111,292 @@ class RegressionResult:
     is_regression: bool
     threshold_percent: float
     details: str
+    p_value: Optional[float] = None
+    method: str = "mean"  # "mann_whitney" when both sides have samples
+    change_ci_low: Optional[float] = None  # bootstrap CI of the median change
+    change_ci_high: Optional[float] = None
+
+
+def percentile(sorted_values: Sequence[float], q: float) -> float:
+    """Linearly interpolated percentile (q in 0-100) of sorted values."""
+    if not sorted_values:
+        return 0.0
+    position = (len(sorted_values) - 1) * q / 100
+    lower = math.floor(position)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    fraction = position - lower
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (
+        fraction
+    )
 
 
-class BenchmarkRunner:
-    """Runs benchmarks and collects results."""
+def bootstrap_ci(
+    samples: Sequence[float],
+    statistic: Callable[[Sequence[float]], float] = statistics.fmean,
+    resamples: int = 1000,
+    confidence_level: float = 0.95,
+    seed: int = 0,
+) -> Tuple[float, float]:
+    """Percentile bootstrap confidence interval (deterministic for a seed)."""
+    if len(samples) < 2 or resamples <= 0:
+        value = statistic(samples) if samples else 0.0
+        return value, value
+    rng = random.Random(seed)
+    k = len(samples)
+    estimates = sorted(statistic(rng.choices(samples, k=k)) for _ in range(resamples))
+    tail = (1 - confidence_level) / 2 * 100
+    return percentile(estimates, tail), percentile(estimates, 100 - tail)
+
+
+def bootstrap_change_ci(
+    baseline: Sequence[float],
+    current: Sequence[float],
+    resamples: int = 1000,
+    confidence_level: float = 0.95,
+    seed: int = 0,
+) -> Tuple[float, float]:
+    """
+    Percentile bootstrap CI of the percent change in median, current vs baseline.
 
-    def __init__(self):
-        self._results: Dict[str, List[BenchmarkResult]] = {}
-        self._baselines: Dict[str, BenchmarkResult] = {}
+    Both sides are resampled independently, so the interval reflects the
+    noise in each run and not just the sample size.
+    """
+    rng = random.Random(seed)
+    n1, n2 = len(baseline), len(current)
+    changes = []
+    for _ in range(resamples):
+        reference = statistics.median(rng.choices(baseline, k=n1))
+        value = statistics.median(rng.choices(current, k=n2))
+        changes.append((value - reference) / reference * 100 if reference else 0.0)
+    changes.sort()
+    tail = (1 - confidence_level) / 2 * 100
+    return percentile(changes, tail), percentile(changes, 100 - tail)
+
+
+def mann_whitney_u(
+    baseline: Sequence[float], current: Sequence[float]
+) -> Tuple[float, float]:
+    """
+    One-sided Mann-Whitney U test that ``current`` tends to be larger.
 
-    def run_benchmark(
-        self,
-        config: BenchmarkConfig,
-        func: Callable[[], Any],
-        accuracy_checker: Optional[Callable[[Any], bool]] = None,
-    ) -> BenchmarkResult:
-        """Run a single benchmark."""
-        timings = []
-        successes = 0
-        error_msg = None
+    Returns (U for ``current``, p-value) using the normal approximation
+    with tie and continuity corrections.
+    """
+    n1, n2 = len(baseline), len(current)
+    if not n1 or not n2:
+        return 0.0, 1.0
 
-        # Warmup
-        for _ in range(config.warmup_iterations):
-            try:
-                func()
-            except Exception:
-                pass
+    combined = sorted(
+        [(v, 0) for v in baseline] + [(v, 1) for v in current], key=lambda x: x[0]
+    )
+    n = n1 + n2
+    rank_sum_current = 0.0
+    tie_term = 0.0
+    i = 0
+    while i < n:
+        j = i
+        while j + 1 < n and combined[j + 1][0] == combined[i][0]:
+            j += 1
+        average_rank = (i + j) / 2 + 1
+        ties = j - i + 1
+        tie_term += ties**3 - ties
+        rank_sum_current += average_rank * sum(
+            1 for k in range(i, j + 1) if combined[k][1] == 1
+        )
+        i = j + 1
+
+    u_current = rank_sum_current - n2 * (n2 + 1) / 2
+    mean_u = n1 * n2 / 2
+    variance = n1 * n2 / 12 * ((n + 1) - tie_term / (n * (n - 1)))
+    if variance <= 0:
+        return u_current, 1.0
+    z = (u_current - mean_u - 0.5) / math.sqrt(variance)
+    return u_current, 0.5 * math.erfc(z / math.sqrt(2))
+
+
+def _measure(
+    config: BenchmarkConfig,
+    func: Callable[[], Any],
+    accuracy_checker: Optional[Callable[[Any], bool]] = None,
+) -> Dict[str, Any]:
+    """
+    Time ``func`` per ``config`` and return summary statistics.
 
-        # Actual runs
-        for _ in range(config.iterations):
+    Running mean and variance cover every iteration; only a reservoir
+    sample of at most ``max_samples`` timings is kept for percentiles,
+    bootstrap intervals and regression tests.
+    """
+    rng = random.Random(0)
+    samples: List[float] = []
+    count = 0
+    mean = m2 = 0.0
+    lowest, highest = math.inf, 0.0
+    successes = 0
+    error_msg = None
+    timed_out = False
+
+    # Warmup (also the calibration probe)
+    warmup_times = []
+    for _ in range(max(config.warmup_iterations, 1 if config.auto_calibrate else 0)):
+        start = time.perf_counter()
+        try:
+            func()
+        except Exception:
+            pass
+        warmup_times.append(time.perf_counter() - start)
+
+    iterations = config.iterations
+    if config.auto_calibrate and warmup_times:
+        per_call = max(statistics.median(warmup_times), 1e-9)
+        iterations = max(
+            config.iterations,
+            min(config.max_iterations, math.ceil(config.min_time_seconds / per_call)),
+        )
+
+    if config.collect_garbage:
+        gc.collect()
+    gc_was_enabled = gc.isenabled()
+    if config.disable_gc:
+        gc.disable()
+    deadline = time.perf_counter() + config.timeout_seconds
+    try:
+        for _ in range(iterations):
             start = time.perf_counter()
             try:
                 result = func()
                 elapsed = (time.perf_counter() - start) * 1000
-                timings.append(elapsed)
-
                 if accuracy_checker is None or accuracy_checker(result):
                     successes += 1
             except Exception as e:
                 elapsed = (time.perf_counter() - start) * 1000
-                timings.append(elapsed)
                 error_msg = str(e)
 
-        if not timings:
+            count += 1
+            delta = elapsed - mean
+            mean += delta / count
+            m2 += delta * (elapsed - mean)
+            lowest = min(lowest, elapsed)
+            highest = max(highest, elapsed)
+            if len(samples) < config.max_samples:
+                samples.append(elapsed)
+            else:
+                slot = rng.randrange(count)
+                if slot < config.max_samples:
+                    samples[slot] = elapsed
+
+            if time.perf_counter() > deadline:
+                timed_out = count < iterations
+                break
+    finally:
+        if config.disable_gc and gc_was_enabled:
+            gc.enable()
+
+    memory_mb = None
+    if config.track_memory and count:
+        was_tracing = tracemalloc.is_tracing()
+        if not was_tracing:
+            tracemalloc.start()
+        tracemalloc.reset_peak()
+        try:
+            func()
+        except Exception:
+            pass
+        memory_mb = tracemalloc.get_traced_memory()[1] / (1024 * 1024)
+        if not was_tracing:
+            tracemalloc.stop()
+
+    return {
+        "count": count,
+        "mean": mean,
+        "std": math.sqrt(m2 / (count - 1)) if count > 1 else 0.0,
+        "min": lowest if count else 0.0,
+        "max": highest,
+        "samples": samples,
+        "successes": successes,
+        "error": error_msg,
+        "memory_mb": memory_mb,
+        "timed_out": timed_out,
+    }
+
+
+def _measure_in_child(
+    config: BenchmarkConfig,
+    func: Callable[[], Any],
+    accuracy_checker: Optional[Callable[[Any], bool]],
+    queue: Any,
+) -> None:
+    try:
+        queue.put(_measure(config, func, accuracy_checker))
+    except BaseException as e:  # report, never hang the parent
+        queue.put({"count": 0, "error": f"{type(e).__name__}: {e}"})
+
+
+def _measure_isolated(
+    config: BenchmarkConfig,
+    func: Callable[[], Any],
+    accuracy_checker: Optional[Callable[[Any], bool]] = None,
+) -> Dict[str, Any]:
+    """Run _measure in a forked child, isolated from the caller's heap and caches."""
+    if "fork" not in multiprocessing.get_all_start_methods():
+        return {"count": 0, "error": "Process isolation requires the fork start method"}
+    ctx = multiprocessing.get_context("fork")
+    queue = ctx.Queue()
+    process = ctx.Process(
+        target=_measure_in_child, args=(config, func, accuracy_checker, queue)
+    )
+    process.start()
+    try:
+        return queue.get(timeout=config.timeout_seconds + 30)
+    except Exception:
+        return {"count": 0, "error": "Isolated benchmark process did not report"}
+    finally:
+        process.join(timeout=5)
+        if process.is_alive():
+            process.terminate()
+
+
+def _result_to_dict(result: "BenchmarkResult") -> Dict[str, Any]:
+    data = asdict(result)
+    data["category"] = result.category.value
+    return data
+
+
+def _result_from_dict(data: Dict[str, Any]) -> "BenchmarkResult":
+    data = dict(data)
+    data["category"] = BenchmarkCategory(data["category"])
+    return BenchmarkResult(**data)
+
+
+class BenchmarkRunner:
+    """
+    Runs benchmarks and collects results.
+
+    Baselines can be persisted to a JSON file (``baseline_path``) and are
+    loaded from it on construction when it exists.
+    """
+
+    def __init__(self, baseline_path: Optional[str] = None, history_limit: int = 50):
+        self._results: Dict[str, Deque[BenchmarkResult]] = {}
+        self._baselines: Dict[str, BenchmarkResult] = {}
+        self.history_limit = history_limit
+        self.baseline_path = baseline_path
+        if baseline_path and os.path.exists(baseline_path):
+            self.load_baselines(baseline_path)
+
+    def run_benchmark(
+        self,
+        config: BenchmarkConfig,
+        func: Callable[[], Any],
+        accuracy_checker: Optional[Callable[[Any], bool]] = None,
+    ) -> BenchmarkResult:
+        """Run a single benchmark."""
+        if config.isolate:
+            measured = _measure_isolated(config, func, accuracy_checker)
+        else:
+            measured = _measure(config, func, accuracy_checker)
+
+        n = measured["count"]
+        if not n:
             return BenchmarkResult(
                 name=config.name,
                 category=config.category,
@@ -128,34 +409,48 @@ class BenchmarkRunner:
                 p50_ms=0,
                 p90_ms=0,
                 p99_ms=0,
-                error="No timings recorded",
+                error=measured.get("error") or "No timings recorded",
             )
 
-        sorted_timings = sorted(timings)
-        n = len(sorted_timings)
+        samples = measured["samples"]
+        sorted_timings = sorted(samples)
+        mean = measured["mean"]
+        ci_low, ci_high = bootstrap_ci(
+            samples,
+            resamples=config.bootstrap_resamples,
+            confidence_level=config.confidence_level,
+        )
 
         result = BenchmarkResult(
             name=config.name,
             category=config.category,
-            success=error_msg is None,
+            success=measured["error"] is None,
             iterations=n,
-            mean_ms=statistics.mean(timings),
-            std_ms=statistics.stdev(timings) if n > 1 else 0,
-            min_ms=sorted_timings[0],
-            max_ms=sorted_timings[-1],
-            p50_ms=sorted_timings[n // 2],
-            p90_ms=sorted_timings[int(n * 0.9)] if n >= 10 else sorted_timings[-1],
-            p99_ms=sorted_timings[int(n * 0.99)] if n >= 100 else sorted_timings[-1],
-            throughput=1000 / statistics.mean(timings)
-            if statistics.mean(timings) > 0
-            else 0,
-            accuracy=successes / n if accuracy_checker else None,
-            error=error_msg,
+            mean_ms=mean,
+            std_ms=measured["std"],
+            min_ms=measured["min"],
+            max_ms=measured["max"],
+            p50_ms=percentile(sorted_timings, 50),
+            p90_ms=percentile(sorted_timings, 90),
+            p99_ms=percentile(sorted_timings, 99),
+            throughput=1000 / mean if mean > 0 else 0,
+            accuracy=measured["successes"] / n if accuracy_checker else None,
+            memory_mb=measured["memory_mb"],
+            error=measured["error"],
+            ci_low_ms=ci_low,
+            ci_high_ms=ci_high,
+            samples_ms=samples,
+            metadata={
+                "confidence_level": config.confidence_level,
+                "isolated": config.isolate,
+                "gc_disabled": config.disable_gc,
+                "timed_out": measured["timed_out"],
+            },
         )
 
         # Store result
         if config.name not in self._results:
-            self._results[config.name] = []
+            self._results[config.name] = deque(maxlen=self.history_limit)
         self._results[config.name].append(result)
 
         return result
@@ -164,10 +459,54 @@ class BenchmarkRunner:
         """Set a baseline result for regression tracking."""
         self._baselines[name] = result
 
+    def get_baseline(self, name: str) -> Optional[BenchmarkResult]:
+        """Get the baseline for a benchmark, if any."""
+        return self._baselines.get(name)
+
+    def load_baselines(self, path: str) -> int:
+        """Load baselines from a JSON file; returns how many were loaded."""
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        for name, entry in data.get("benchmarks", {}).items():
+            self._baselines[name] = _result_from_dict(entry)
+        return len(data.get("benchmarks", {}))
+
+    def save_baselines(self, path: Optional[str] = None) -> str:
+        """Write all baselines (with their timing samples) to a JSON file."""
+        path = path or self.baseline_path or DEFAULT_BASELINE_PATH
+        data = {
+            "version": 1,
+            "updated": datetime.now().isoformat(),
+            "benchmarks": {
+                name: _result_to_dict(result)
+                for name, result in sorted(self._baselines.items())
+            },
+        }
+        tmp = f"{path}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2)
+            f.write("\n")
+        os.replace(tmp, path)
+        return path
+
     def check_regression(
-        self, name: str, current: BenchmarkResult, threshold_percent: float = 10.0
+        self,
+        name: str,
+        current: BenchmarkResult,
+        threshold_percent: float = 10.0,
+        alpha: float = 0.05,
     ) -> RegressionResult:
-        """Check for regression against baseline."""
+        """
+        Check for regression against baseline.
+
+        When both results carry timing samples, a regression needs a
+        one-sided Mann-Whitney U test significant at ``alpha`` *and* the
+        lower bound of the bootstrap CI of the median slowdown above
+        ``threshold_percent``. With thousands of samples the test alone
+        flags tiny shifts, so the effect size must clear the threshold
+        with confidence too. Otherwise the means are compared against the
+        threshold.
+        """
         baseline = self._baselines.get(name)
 
         if not baseline:
@@ -181,6 +520,32 @@ class BenchmarkRunner:
                 details="No baseline available",
             )
 
+        if len(baseline.samples_ms) >= 5 and len(current.samples_ms) >= 5:
+            reference = baseline.p50_ms or baseline.mean_ms
+            change = (current.p50_ms - reference) / reference * 100 if reference else 0
+            _, p_value = mann_whitney_u(baseline.samples_ms, current.samples_ms)
+            ci_low, ci_high = bootstrap_change_ci(
+                baseline.samples_ms, current.samples_ms
+            )
+            is_regression = p_value < alpha and ci_low > threshold_percent
+            status = "REGRESSION" if is_regression else "OK"
+            return RegressionResult(
+                benchmark_name=name,
+                baseline_mean_ms=baseline.mean_ms,
+                current_mean_ms=current.mean_ms,
+                change_percent=change,
+                is_regression=is_regression,
+                threshold_percent=threshold_percent,
+                details=(
+                    f"{status}: {change:+.1f}% median change "
+                    f"(CI {ci_low:+.1f}%..{ci_high:+.1f}%, p={p_value:.3g})"
+                ),
+                p_value=p_value,
+                method="mann_whitney",
+                change_ci_low=ci_low,
+                change_ci_high=ci_high,
+            )
+
         change = ((current.mean_ms - baseline.mean_ms) / baseline.mean_ms) * 100
         is_regression = change > threshold_percent
 
@@ -199,8 +564,8 @@ class BenchmarkRunner:
     ) -> Dict[str, List[BenchmarkResult]]:
         """Get benchmark results."""
         if name:
-            return {name: self._results.get(name, [])}
-        return dict(self._results)
+            return {name: list(self._results.get(name, []))}
+        return {name: list(results) for name, results in self._results.items()}
 
     def export_results(self) -> str:
         """Export all results to JSON."""
@@ -211,6 +576,7 @@ class BenchmarkRunner:
                 {
                     "category": r.category.value,
                     "success": r.success,
+                    "iterations": r.iterations,
                     "mean_ms": r.mean_ms,
                     "std_ms": r.std_ms,
                     "min_ms": r.min_ms,
@@ -218,8 +584,11 @@ class BenchmarkRunner:
                     "p50_ms": r.p50_ms,
                     "p90_ms": r.p90_ms,
                     "p99_ms": r.p99_ms,
+                    "ci_low_ms": r.ci_low_ms,
+                    "ci_high_ms": r.ci_high_ms,
                     "throughput": r.throughput,
                     "accuracy": r.accuracy,
+                    "memory_mb": r.memory_mb,
                     "timestamp": r.timestamp,
                 }
                 for r in results
@@ -315,19 +684,39 @@ class AccuracyBenchmarks:
 
 
 class PerformanceBenchmarks:
-    """Pre-defined performance benchmarks for agent components."""
+    """
+    Pre-defined performance benchmarks for agent components.
 
-    def __init__(self, runner: BenchmarkRunner):
+    ``config_defaults`` are applied to every BenchmarkConfig this class
+    builds (e.g. ``{"auto_calibrate": True, "isolate": True}``).
+    """
+
+    BUILTIN = ("memory_retrieval", "constraint_checking", "rag_retrieval")
+
+    def __init__(
+        self,
+        runner: BenchmarkRunner,
+        config_defaults: Optional[Dict[str, Any]] = None,
+    ):
         self.runner = runner
+        self.config_defaults = dict(config_defaults or {})
+
+    def _config(
+        self, name: str, category: BenchmarkCategory, iterations: int
+    ) -> BenchmarkConfig:
+        return BenchmarkConfig(
+            name=name,
+            category=category,
+            iterations=iterations,
+            **self.config_defaults,
+        )
 
     def benchmark_inference(
         self, engine: Any, premises: List[str], iterations: int = 100
     ) -> BenchmarkResult:
         """Benchmark inference engine performance."""
-        config = BenchmarkConfig(
-            name="inference_engine",
-            category=BenchmarkCategory.PERFORMANCE,
-            iterations=iterations,
+        config = self._config(
+            "inference_engine", BenchmarkCategory.PERFORMANCE, iterations
         )
 
         def run():
@@ -339,11 +728,7 @@ class PerformanceBenchmarks:
         self, memory: Any, query: str, iterations: int = 100
     ) -> BenchmarkResult:
         """Benchmark memory retrieval performance."""
-        config = BenchmarkConfig(
-            name="memory_retrieval",
-            category=BenchmarkCategory.LATENCY,
-            iterations=iterations,
-        )
+        config = self._config("memory_retrieval", BenchmarkCategory.LATENCY, iterations)
 
         def run():
             return memory.retrieve(query)
@@ -354,11 +739,7 @@ class PerformanceBenchmarks:
         self, planner: Any, goal: str, iterations: int = 50
     ) -> BenchmarkResult:
         """Benchmark planning performance."""
-        config = BenchmarkConfig(
-            name="planning",
-            category=BenchmarkCategory.PERFORMANCE,
-            iterations=iterations,
-        )
+        config = self._config("planning", BenchmarkCategory.PERFORMANCE, iterations)
 
         def run():
             return planner.plan(goal)
@@ -369,10 +750,8 @@ class PerformanceBenchmarks:
         self, engine: Any, context: Dict[str, Any], iterations: int = 200
     ) -> BenchmarkResult:
         """Benchmark constraint checking performance."""
-        config = BenchmarkConfig(
-            name="constraint_checking",
-            category=BenchmarkCategory.PERFORMANCE,
-            iterations=iterations,
+        config = self._config(
+            "constraint_checking", BenchmarkCategory.PERFORMANCE, iterations
         )
 
         def run():
@@ -384,25 +763,82 @@ class PerformanceBenchmarks:
         self, retriever: Any, query: str, iterations: int = 50
     ) -> BenchmarkResult:
         """Benchmark RAG retrieval performance."""
-        config = BenchmarkConfig(
-            name="rag_retrieval",
-            category=BenchmarkCategory.LATENCY,
-            iterations=iterations,
-        )
+        config = self._config("rag_retrieval", BenchmarkCategory.LATENCY, iterations)
 
         def run():
             return retriever.retrieve(query)
 
         return self.runner.run_benchmark(config, run)
 
+    def run_builtin(
+        self, names: Optional[Sequence[str]] = None, scale: int = 500
+    ) -> Dict[str, BenchmarkResult]:
+        """
+        Run the built-in benchmarks on deterministic synthetic fixtures.
+
+        ``scale`` is the number of memories / documents indexed.
+        """
+        from .constraint_system import ConstraintEngine, must, prefer
+        from .memory_system import MemorySystem, MemoryType
+        from .retrieval_augmentation import HybridRetriever
+
+        selected = [n for n in self.BUILTIN if names is None or n in names]
+        results: Dict[str, BenchmarkResult] = {}
+
+        if "memory_retrieval" in selected:
+            memory = MemorySystem()
+            for i in range(scale):
+                memory.store(
+                    f"memory {i} about topic{i % 20} and reasoning step {i % 7}",
+                    MemoryType.FACT,
+                    keywords=[f"topic{i % 20}", "reasoning"],
+                )
+            results["memory_retrieval"] = self.benchmark_memory_retrieval(
+                memory, "topic3 reasoning"
+            )
+
+        if "constraint_checking" in selected:
+            engine = ConstraintEngine()
+            for i in range(10):
+                engine.register_constraint(
+                    must(f"min_{i}", f"Min {i}")
+                    .field(f"metrics.m{i}")
+                    .greater_than(0.1)
+                    .build()
+                )
+                engine.register_constraint(
+                    prefer(f"max_{i}", f"Max {i}")
+                    .field(f"metrics.m{i}")
+                    .less_than(0.9)
+                    .build()
+                )
+            context = {"metrics": {f"m{i}": 0.5 for i in range(10)}}
+            results["constraint_checking"] = self.benchmark_constraint_checking(
+                engine, context
+            )
+
+        if "rag_retrieval" in selected:
+            retriever = HybridRetriever()
+            for i in range(scale):
+                retriever.add_document(
+                    f"doc{i}",
+                    f"document {i} discusses topic{i % 25} with evidence about "
+                    f"claim {i % 11} and related background material",
+                )
+            results["rag_retrieval"] = self.benchmark_retrieval_augmentation(
+                retriever, "topic3 evidence claim"
+            )
+
+        return results
+
 
 class BenchmarkSuite:
     """
     Complete benchmark suite for the agent system.
     """
 
-    def __init__(self):
-        self.runner = BenchmarkRunner()
+    def __init__(self, runner: Optional[BenchmarkRunner] = None):
+        self.runner = runner or BenchmarkRunner()
         self.accuracy = AccuracyBenchmarks()
         self.performance = PerformanceBenchmarks(self.runner)
         self._suite_results: List[Dict[str, Any]] = []
@@ -582,3 +1018,94 @@ def quick_benchmark(func: Callable, iterations: int = 100) -> Dict[str, float]:
         "p99_ms": result.p99_ms,
         "throughput": result.throughput or 0.0,
     }
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """
+    Run the built-in performance benchmarks and check them for regressions.
+
+    Returns 1 if any benchmark regressed against its stored baseline.
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m agents.core.benchmark_suite",
+        description="Run built-in performance benchmarks against baselines.",
+        epilog=(
+            "Baselines are machine-specific and not committed: run once with "
+            "--update-baseline on the machine that will check for regressions."
+        ),
+    )
+    parser.add_argument(
+        "--baseline",
+        default=DEFAULT_BASELINE_PATH,
+        help="baseline JSON file (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--update-baseline",
+        action="store_true",
+        help="store this run's results as the new baselines in --baseline",
+    )
+    parser.add_argument("--only", nargs="+", choices=PerformanceBenchmarks.BUILTIN)
+    parser.add_argument("--min-time", type=float, default=0.5)
+    parser.add_argument("--scale", type=int, default=500)
+    parser.add_argument("--threshold", type=float, default=10.0)
+    parser.add_argument("--alpha", type=float, default=0.05)
+    parser.add_argument("--isolate", action="store_true")
+    parser.add_argument("--disable-gc", action="store_true")
+    parser.add_argument("--json", dest="json_path")
+    args = parser.parse_args(argv)
+
+    if not args.update_baseline and not os.path.exists(args.baseline):
+        print(
+            f"No baselines at {args.baseline}; run with --update-baseline "
+            "to record them.",
+            file=sys.stderr,
+        )
+
+    runner = BenchmarkRunner(baseline_path=args.baseline)
+    performance = PerformanceBenchmarks(
+        runner,
+        config_defaults={
+            "auto_calibrate": True,
+            "min_time_seconds": args.min_time,
+            "isolate": args.isolate,
+            "disable_gc": args.disable_gc,
+        },
+    )
+    results = performance.run_builtin(args.only, scale=args.scale)
+
+    print(
+        f"{'benchmark':<22}{'iters':>8}{'p50 ms':>10}{'mean ms':>10}"
+        f"{'95% CI':>22}{'peak MB':>9}  status"
+    )
+    regressed = []
+    for name, result in results.items():
+        regression = runner.check_regression(
+            name, result, threshold_percent=args.threshold, alpha=args.alpha
+        )
+        if regression.is_regression:
+            regressed.append(name)
+        ci = f"[{result.ci_low_ms:.3f}, {result.ci_high_ms:.3f}]"
+        memory = f"{result.memory_mb:.2f}" if result.memory_mb is not None else "-"
+        print(
+            f"{name:<22}{result.iterations:>8}{result.p50_ms:>10.3f}"
+            f"{result.mean_ms:>10.3f}{ci:>22}{memory:>9}  {regression.details}"
+        )
+
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as f:
+            f.write(runner.export_results())
+
+    if args.update_baseline:
+        for name, result in results.items():
+            runner.set_baseline(name, result)
+        print(f"Baselines written to {runner.save_baselines(args.baseline)}")
+        return 0
+
+    if regressed:
+        print(f"Regressions: {', '.join(regressed)}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -6,13 +6,26 @@ Provides confidence calibration and adjustment:
 - Confidence adjustment based on history
 - Reliability diagrams
 - Expected calibration error
+
+Metrics are kept as streaming per-bin sums, so recording an outcome is O(1)
+and reading metrics is O(num_bins) however long the history. Calibrators
+refit on a bounded window of recent outcomes; fitting and batch calibration
+are vectorized with NumPy when it is installed.
 """
 
 import math
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - pure-Python fallback
+    np = None
+
+_EPSILON = 1e-15
 
 
 class CalibrationMethod(Enum):
@@ -60,116 +73,79 @@ class CalibrationMetrics:
     overall_accuracy: float
 
 
-class CalibrationTracker:
-    """Tracks predictions and outcomes for calibration analysis."""
+def _bin_index(confidence: float, num_bins: int) -> int:
+    """Map a confidence in [0, 1] to its bin; 1.0 falls in the last bin."""
+    return min(int(confidence * num_bins), num_bins - 1)
 
-    def __init__(self, num_bins: int = 10):
-        self._points: List[CalibrationPoint] = []
-        self._num_bins = num_bins
 
-    def record(
-        self,
-        predicted_confidence: float,
-        actual_outcome: bool,
-        category: str = "general",
-        metadata: Optional[Dict[str, Any]] = None,
-    ) -> None:
-        """Record a prediction and outcome."""
-        point = CalibrationPoint(
-            predicted_confidence=max(0.0, min(1.0, predicted_confidence)),
-            actual_outcome=actual_outcome,
-            category=category,
-            metadata=metadata or {},
-        )
-        self._points.append(point)
+def _sigmoid(z: float) -> float:
+    """Numerically stable logistic function."""
+    if z >= 0:
+        return 1.0 / (1.0 + math.exp(-z))
+    e = math.exp(z)
+    return e / (1.0 + e)
 
-    def get_metrics(self, category: Optional[str] = None) -> CalibrationMetrics:
-        """Calculate calibration metrics."""
-        points = self._points
-        if category:
-            points = [p for p in points if p.category == category]
 
-        if not points:
-            return CalibrationMetrics(
-                expected_calibration_error=0,
-                maximum_calibration_error=0,
-                brier_score=0,
-                log_loss=0,
-                reliability_diagram=[],
-                total_samples=0,
-                overall_accuracy=0,
-            )
+def _logit(confidence: float) -> float:
+    """Log-odds of a confidence, clamped away from 0 and 1."""
+    confidence = max(_EPSILON, min(1 - _EPSILON, confidence))
+    return math.log(confidence / (1 - confidence))
 
-        # Create bins
-        bins = self._create_bins(points)
 
-        # Calculate ECE (Expected Calibration Error)
-        n = len(points)
-        ece = sum((bin.count / n) * bin.gap for bin in bins if bin.count > 0)
+class _RunningBins:
+    """Streaming per-bin sums for one stream of predictions."""
 
-        # Calculate MCE (Maximum Calibration Error)
-        mce = max((bin.gap for bin in bins if bin.count > 0), default=0)
-
-        # Calculate Brier Score
-        brier = (
-            sum(
-                (p.predicted_confidence - (1.0 if p.actual_outcome else 0.0)) ** 2
-                for p in points
-            )
-            / n
-        )
-
-        # Calculate Log Loss
-        epsilon = 1e-15
-        log_loss_val = (
-            -sum(
-                (1.0 if p.actual_outcome else 0.0)
-                * math.log(max(p.predicted_confidence, epsilon))
-                + (0.0 if p.actual_outcome else 1.0)
-                * math.log(max(1 - p.predicted_confidence, epsilon))
-                for p in points
-            )
-            / n
-        )
-
-        # Overall accuracy
-        correct = sum(1 for p in points if p.actual_outcome)
-        accuracy = correct / n
+    __slots__ = (
+        "counts",
+        "confidence_sums",
+        "correct_counts",
+        "total",
+        "correct",
+        "brier_sum",
+        "log_loss_sum",
+    )
 
-        return CalibrationMetrics(
-            expected_calibration_error=ece,
-            maximum_calibration_error=mce,
-            brier_score=brier,
-            log_loss=log_loss_val,
-            reliability_diagram=bins,
-            total_samples=n,
-            overall_accuracy=accuracy,
-        )
+    def __init__(self, num_bins: int):
+        self.counts = [0] * num_bins
+        self.confidence_sums = [0.0] * num_bins
+        self.correct_counts = [0] * num_bins
+        self.total = 0
+        self.correct = 0
+        self.brier_sum = 0.0
+        self.log_loss_sum = 0.0
+
+    def add(self, confidence: float, outcome: bool) -> None:
+        """Fold one prediction into the running sums."""
+        idx = _bin_index(confidence, len(self.counts))
+        self.counts[idx] += 1
+        self.confidence_sums[idx] += confidence
+        self.total += 1
+        if outcome:
+            self.correct_counts[idx] += 1
+            self.correct += 1
+            self.brier_sum += (confidence - 1.0) ** 2
+            self.log_loss_sum -= math.log(max(confidence, _EPSILON))
+        else:
+            self.brier_sum += confidence**2
+            self.log_loss_sum -= math.log(max(1 - confidence, _EPSILON))
 
-    def _create_bins(self, points: List[CalibrationPoint]) -> List[CalibrationBin]:
-        """Create calibration bins."""
+    def to_metrics(self) -> CalibrationMetrics:
+        """Build metrics from the running sums in O(num_bins)."""
+        num_bins = len(self.counts)
+        bin_size = 1.0 / num_bins
         bins = []
-        bin_size = 1.0 / self._num_bins
-
-        for i in range(self._num_bins):
+        for i in range(num_bins):
             bin_start = i * bin_size
             bin_end = (i + 1) * bin_size
-
-            bin_points = [
-                p for p in points if bin_start <= p.predicted_confidence < bin_end
-            ]
-
-            if bin_points:
-                count = len(bin_points)
-                accuracy = sum(1 for p in bin_points if p.actual_outcome) / count
-                avg_conf = sum(p.predicted_confidence for p in bin_points) / count
+            count = self.counts[i]
+            if count:
+                accuracy = self.correct_counts[i] / count
+                avg_conf = self.confidence_sums[i] / count
                 gap = abs(accuracy - avg_conf)
             else:
-                count = 0
                 accuracy = 0
                 avg_conf = (bin_start + bin_end) / 2
                 gap = 0
-
             bins.append(
                 CalibrationBin(
                     bin_start=bin_start,
@@ -181,13 +157,88 @@ class CalibrationTracker:
                 )
             )
 
-        return bins
+        n = self.total
+        return CalibrationMetrics(
+            expected_calibration_error=sum(
+                (b.count / n) * b.gap for b in bins if b.count > 0
+            ),
+            maximum_calibration_error=max(
+                (b.gap for b in bins if b.count > 0), default=0
+            ),
+            brier_score=self.brier_sum / n,
+            log_loss=self.log_loss_sum / n,
+            reliability_diagram=bins,
+            total_samples=n,
+            overall_accuracy=self.correct / n,
+        )
+
+
+class CalibrationTracker:
+    """
+    Tracks predictions and outcomes for calibration analysis.
+
+    Metrics are computed from running per-bin sums kept overall and per
+    category, so reading them never rescans history. Only the most recent
+    ``max_points`` raw points are retained for get_points() (None keeps
+    everything, 0 keeps nothing).
+    """
+
+    def __init__(self, num_bins: int = 10, max_points: Optional[int] = 10_000):
+        self._num_bins = num_bins
+        self._points: Deque[CalibrationPoint] = deque(maxlen=max_points)
+        self._overall = _RunningBins(num_bins)
+        self._categories: Dict[str, _RunningBins] = {}
+
+    def record(
+        self,
+        predicted_confidence: float,
+        actual_outcome: bool,
+        category: str = "general",
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """Record a prediction and outcome."""
+        confidence = max(0.0, min(1.0, predicted_confidence))
+        self._overall.add(confidence, actual_outcome)
+        stats = self._categories.get(category)
+        if stats is None:
+            stats = self._categories[category] = _RunningBins(self._num_bins)
+        stats.add(confidence, actual_outcome)
+
+        if self._points.maxlen != 0:
+            self._points.append(
+                CalibrationPoint(
+                    predicted_confidence=confidence,
+                    actual_outcome=actual_outcome,
+                    category=category,
+                    metadata=metadata or {},
+                )
+            )
+
+    @property
+    def total_samples(self) -> int:
+        """Number of outcomes recorded, including points no longer retained."""
+        return self._overall.total
+
+    def get_metrics(self, category: Optional[str] = None) -> CalibrationMetrics:
+        """Calculate calibration metrics."""
+        stats = self._categories.get(category) if category else self._overall
+        if stats is None or stats.total == 0:
+            return CalibrationMetrics(
+                expected_calibration_error=0,
+                maximum_calibration_error=0,
+                brier_score=0,
+                log_loss=0,
+                reliability_diagram=[],
+                total_samples=0,
+                overall_accuracy=0,
+            )
+        return stats.to_metrics()
 
     def get_points(
         self, category: Optional[str] = None, limit: Optional[int] = None
     ) -> List[CalibrationPoint]:
-        """Get calibration points."""
-        points = self._points
+        """Get retained calibration points."""
+        points = list(self._points)
         if category:
             points = [p for p in points if p.category == category]
         if limit:
@@ -197,6 +248,92 @@ class CalibrationTracker:
     def clear(self) -> None:
         """Clear all calibration data."""
         self._points.clear()
+        self._overall = _RunningBins(self._num_bins)
+        self._categories.clear()
+
+
+def _logistic_terms(
+    x: Any, y: Any, w: Any, a: float, b: float
+) -> Tuple[float, Tuple[float, float], Tuple[float, float, float]]:
+    """
+    Weighted NLL of sigmoid(a * x + b) against targets y, with its gradient
+    and Hessian with respect to (a, b).
+    """
+    if np is not None:
+        p = 1.0 / (1.0 + np.exp(-np.clip(a * x + b, -500.0, 500.0)))
+        p = np.clip(p, _EPSILON, 1 - _EPSILON)
+        loss = -float(np.dot(w, y * np.log(p) + (1 - y) * np.log(1 - p)))
+        r = w * (p - y)
+        s = w * p * (1 - p)
+        return (
+            loss,
+            (float(np.dot(r, x)), float(r.sum())),
+            (float(np.dot(s, x * x)), float(np.dot(s, x)), float(s.sum())),
+        )
+
+    loss = ga = gb = haa = hab = hbb = 0.0
+    for xi, yi, wi in zip(x, y, w):
+        p = max(_EPSILON, min(1 - _EPSILON, _sigmoid(a * xi + b)))
+        loss -= wi * (yi * math.log(p) + (1 - yi) * math.log(1 - p))
+        r = wi * (p - yi)
+        s = wi * p * (1 - p)
+        ga += r * xi
+        gb += r
+        haa += s * xi * xi
+        hab += s * xi
+        hbb += s
+    return loss, (ga, gb), (haa, hab, hbb)
+
+
+def _fit_logistic(
+    x: List[float],
+    y: List[float],
+    weights: Optional[List[float]],
+    fit_intercept: bool,
+    initial: Tuple[float, float] = (1.0, 0.0),
+    max_iter: int = 50,
+) -> Tuple[float, float]:
+    """
+    Fit sigmoid(a * x + b) by damped Newton steps on the weighted NLL.
+
+    The objective is convex, so a handful of closed-form 2x2 (or 1-D when
+    the intercept is fixed at 0) Newton steps with step halving converges.
+    """
+    if weights is None:
+        weights = [1.0] * len(x)
+    if np is not None:
+        x, y, weights = (np.asarray(v, dtype=float) for v in (x, y, weights))
+
+    a, b = initial
+    loss, (ga, gb), (haa, hab, hbb) = _logistic_terms(x, y, weights, a, b)
+    ridge = 1e-9
+    for _ in range(max_iter):
+        if fit_intercept:
+            det = (haa + ridge) * (hbb + ridge) - hab * hab
+            if det <= 0:
+                break
+            da = ((hbb + ridge) * ga - hab * gb) / det
+            db = ((haa + ridge) * gb - hab * ga) / det
+        else:
+            da = ga / (haa + ridge)
+            db = 0.0
+
+        step = 1.0
+        while step > 1e-6:
+            na, nb = a - step * da, b - step * db
+            new_loss, grad, hess = _logistic_terms(x, y, weights, na, nb)
+            if new_loss <= loss + 1e-12:
+                break
+            step /= 2
+        else:
+            break
+
+        a, b = na, nb
+        improvement = loss - new_loss
+        loss, (ga, gb), (haa, hab, hbb) = new_loss, grad, hess
+        if improvement < 1e-10 * max(1.0, abs(loss)):
+            break
+    return a, b
 
 
 class PlattScaler:
@@ -207,31 +344,34 @@ class PlattScaler:
         self._b: float = 0.0  # Intercept
         self._fitted = False
 
-    def fit(self, predictions: List[float], outcomes: List[bool]) -> None:
-        """Fit the Platt scaler to data."""
+    def fit(
+        self,
+        predictions: List[float],
+        outcomes: List[bool],
+        weights: Optional[List[float]] = None,
+    ) -> None:
+        """
+        Fit the Platt scaler to data.
+
+        Uses Newton's method on Platt's smoothed targets, which keeps the
+        fit finite when the data are perfectly separable.
+        """
         if len(predictions) < 10:
             return
 
-        # Simple gradient descent for sigmoid parameters
-        a, b = 1.0, 0.0
-        learning_rate = 0.1
-
-        for _ in range(100):
-            grad_a, grad_b = 0.0, 0.0
-
-            for pred, out in zip(predictions, outcomes):
-                sigmoid = 1.0 / (1.0 + math.exp(-(a * pred + b)))
-                target = 1.0 if out else 0.0
-                error = sigmoid - target
-
-                grad_a += error * pred
-                grad_b += error
-
-            a -= learning_rate * grad_a / len(predictions)
-            b -= learning_rate * grad_b / len(predictions)
-
-        self._a = a
-        self._b = b
+        if weights is None:
+            n_pos = float(sum(1 for o in outcomes if o))
+            n_neg = len(outcomes) - n_pos
+        else:
+            n_pos = sum(w for w, o in zip(weights, outcomes) if o)
+            n_neg = sum(w for w, o in zip(weights, outcomes) if not o)
+        hi = (n_pos + 1.0) / (n_pos + 2.0)
+        lo = 1.0 / (n_neg + 2.0)
+        targets = [hi if o else lo for o in outcomes]
+
+        self._a, self._b = _fit_logistic(
+            predictions, targets, weights, fit_intercept=True
+        )
         self._fitted = True
 
     def calibrate(self, confidence: float) -> float:
@@ -239,58 +379,73 @@ class PlattScaler:
         if not self._fitted:
             return confidence
 
-        return 1.0 / (1.0 + math.exp(-(self._a * confidence + self._b)))
+        return _sigmoid(self._a * confidence + self._b)
 
     def calibrate_batch(self, confidences: List[float]) -> List[float]:
         """Apply Platt scaling to multiple confidences."""
-        return [self.calibrate(c) for c in confidences]
+        if not self._fitted:
+            return list(confidences)
+        if np is None:
+            return [self.calibrate(c) for c in confidences]
+        z = self._a * np.asarray(confidences, dtype=float) + self._b
+        return (1.0 / (1.0 + np.exp(-np.clip(z, -500.0, 500.0)))).tolist()
 
 
 class TemperatureScaler:
     """Temperature scaling for calibration adjustment."""
 
+    MIN_TEMPERATURE = 0.05
+    MAX_TEMPERATURE = 20.0
+
     def __init__(self, temperature: float = 1.0):
         self._temperature = temperature
 
-    def fit(self, predictions: List[float], outcomes: List[bool]) -> None:
-        """Fit the temperature parameter."""
+    def fit(
+        self,
+        predictions: List[float],
+        outcomes: List[bool],
+        weights: Optional[List[float]] = None,
+    ) -> None:
+        """
+        Fit the temperature parameter.
+
+        The NLL is convex in 1/T, so this is a one-parameter logistic fit on
+        the prediction logits, clamped to [MIN_TEMPERATURE, MAX_TEMPERATURE].
+        """
         if len(predictions) < 10:
             return
 
-        # Grid search for best temperature
-        best_temp = 1.0
-        best_loss = float("inf")
-
-        for temp in [0.5, 0.75, 1.0, 1.25, 1.5, 2.0, 3.0]:
-            self._temperature = temp
-            calibrated = self.calibrate_batch(predictions)
-
-            # Calculate NLL
-            epsilon = 1e-15
-            loss = -sum(
-                (1.0 if out else 0.0) * math.log(max(cal, epsilon))
-                + (0.0 if out else 1.0) * math.log(max(1 - cal, epsilon))
-                for cal, out in zip(calibrated, outcomes)
-            ) / len(predictions)
-
-            if loss < best_loss:
-                best_loss = loss
-                best_temp = temp
-
-        self._temperature = best_temp
+        if np is not None:
+            p = np.clip(np.asarray(predictions, dtype=float), _EPSILON, 1 - _EPSILON)
+            logits = np.log(p / (1 - p))
+        else:
+            logits = [_logit(p) for p in predictions]
+        targets = [1.0 if o else 0.0 for o in outcomes]
+
+        inverse, _ = _fit_logistic(
+            logits,
+            targets,
+            weights,
+            fit_intercept=False,
+            initial=(1.0 / self._temperature, 0.0),
+        )
+        inverse = max(
+            1.0 / self.MAX_TEMPERATURE, min(1.0 / self.MIN_TEMPERATURE, inverse)
+        )
+        self._temperature = 1.0 / inverse
 
     def calibrate(self, confidence: float) -> float:
         """Apply temperature scaling."""
         # Convert to logit, scale, convert back
-        epsilon = 1e-15
-        confidence = max(epsilon, min(1 - epsilon, confidence))
-        logit = math.log(confidence / (1 - confidence))
-        scaled_logit = logit / self._temperature
-        return 1.0 / (1.0 + math.exp(-scaled_logit))
+        return _sigmoid(_logit(confidence) / self._temperature)
 
     def calibrate_batch(self, confidences: List[float]) -> List[float]:
         """Apply temperature scaling to multiple confidences."""
-        return [self.calibrate(c) for c in confidences]
+        if np is None:
+            return [self.calibrate(c) for c in confidences]
+        p = np.clip(np.asarray(confidences, dtype=float), _EPSILON, 1 - _EPSILON)
+        scaled = np.log(p / (1 - p)) / self._temperature
+        return (1.0 / (1.0 + np.exp(-scaled))).tolist()
 
     @property
     def temperature(self) -> float:
@@ -305,25 +460,38 @@ class HistogramBinningCalibrator:
         self._num_bins = num_bins
         self._bin_accuracies: Dict[int, float] = {}
 
-    def fit(self, predictions: List[float], outcomes: List[bool]) -> None:
+    def fit(
+        self,
+        predictions: List[float],
+        outcomes: List[bool],
+        weights: Optional[List[float]] = None,
+    ) -> None:
         """Fit the histogram bins."""
-        bin_size = 1.0 / self._num_bins
-
-        for i in range(self._num_bins):
-            bin_start = i * bin_size
-            bin_end = (i + 1) * bin_size
-
-            bin_preds = [
-                (p, o)
-                for p, o in zip(predictions, outcomes)
-                if bin_start <= p < bin_end
-            ]
-
-            if bin_preds:
-                accuracy = sum(1 for _, o in bin_preds if o) / len(bin_preds)
-                self._bin_accuracies[i] = accuracy
+        n = self._num_bins
+        if np is not None:
+            p = np.clip(np.asarray(predictions, dtype=float), 0.0, 1.0)
+            w = np.ones(len(p)) if weights is None else np.asarray(weights, dtype=float)
+            idx = np.minimum((p * n).astype(int), n - 1)
+            totals = np.bincount(idx, weights=w, minlength=n).tolist()
+            hits = np.bincount(
+                idx, weights=w * np.asarray(outcomes, dtype=float), minlength=n
+            ).tolist()
+        else:
+            totals = [0.0] * n
+            hits = [0.0] * n
+            if weights is None:
+                weights = [1.0] * len(predictions)
+            for pred, out, wi in zip(predictions, outcomes, weights):
+                idx = _bin_index(max(0.0, min(1.0, pred)), n)
+                totals[idx] += wi
+                if out:
+                    hits[idx] += wi
+
+        for i in range(n):
+            if totals[i] > 0:
+                self._bin_accuracies[i] = hits[i] / totals[i]
             else:
-                self._bin_accuracies[i] = (bin_start + bin_end) / 2
+                self._bin_accuracies[i] = (i + 0.5) / n
 
     def calibrate(self, confidence: float) -> float:
         """Apply histogram binning calibration."""
@@ -332,17 +500,41 @@ class HistogramBinningCalibrator:
 
     def calibrate_batch(self, confidences: List[float]) -> List[float]:
         """Apply histogram binning to multiple confidences."""
-        return [self.calibrate(c) for c in confidences]
+        if np is None or not self._bin_accuracies:
+            return [self.calibrate(c) for c in confidences]
+        table = np.array([self._bin_accuracies[i] for i in range(self._num_bins)])
+        idx = np.minimum(
+            (np.asarray(confidences, dtype=float) * self._num_bins).astype(int),
+            self._num_bins - 1,
+        )
+        return table[idx].tolist()
 
 
 class ConfidenceAdjuster:
-    """Adjusts confidence based on historical calibration."""
+    """
+    Adjusts confidence based on historical calibration.
+
+    The calibrator is refit every ``refit_threshold`` outcomes on a bounded
+    window of the most recent ``fit_window`` outcomes, so refit cost does not
+    grow with history. With ``decay`` < 1 older outcomes in the window are
+    down-weighted by ``decay ** age``.
+    """
 
     def __init__(
-        self, method: CalibrationMethod = CalibrationMethod.TEMPERATURE_SCALING
+        self,
+        method: CalibrationMethod = CalibrationMethod.TEMPERATURE_SCALING,
+        fit_window: int = 1000,
+        decay: float = 1.0,
+        refit_threshold: int = 50,
     ):
+        if fit_window < 1:
+            raise ValueError("fit_window must be at least 1")
+        if not 0.0 < decay <= 1.0:
+            raise ValueError("decay must be in (0, 1]")
         self._method = method
-        self._tracker = CalibrationTracker()
+        self._tracker = CalibrationTracker(max_points=0)
+        self._window: Deque[Tuple[float, bool]] = deque(maxlen=fit_window)
+        self._decay = decay
 
         if method == CalibrationMethod.PLATT_SCALING:
             self._calibrator = PlattScaler()
@@ -353,30 +545,42 @@ class ConfidenceAdjuster:
         else:
             self._calibrator = TemperatureScaler()
 
-        self._last_fit_count = 0
-        self._refit_threshold = 50
+        self._since_fit = 0
+        self._refit_threshold = refit_threshold
+        self._fitted = False
+
+    @property
+    def is_fitted(self) -> bool:
+        """Whether the calibrator has been fit at least once."""
+        return self._fitted
 
     def record_outcome(
         self, predicted: float, actual: bool, category: str = "general"
     ) -> None:
         """Record an outcome for calibration."""
         self._tracker.record(predicted, actual, category)
+        self._window.append((max(0.0, min(1.0, predicted)), actual))
+        self._since_fit += 1
 
         # Refit if enough new data
-        if len(self._tracker._points) - self._last_fit_count >= self._refit_threshold:
+        if self._since_fit >= self._refit_threshold:
             self._refit()
 
     def _refit(self) -> None:
-        """Refit the calibrator with current data."""
-        points = self._tracker.get_points()
-        if len(points) < 20:
+        """Refit the calibrator on the recent window."""
+        n = len(self._window)
+        if n < 20:
             return
 
-        predictions = [p.predicted_confidence for p in points]
-        outcomes = [p.actual_outcome for p in points]
+        predictions = [p for p, _ in self._window]
+        outcomes = [o for _, o in self._window]
+        weights = None
+        if self._decay < 1.0:
+            weights = [self._decay ** (n - 1 - i) for i in range(n)]
 
-        self._calibrator.fit(predictions, outcomes)
-        self._last_fit_count = len(points)
+        self._calibrator.fit(predictions, outcomes, weights)
+        self._since_fit = 0
+        self._fitted = True
 
     def adjust(self, confidence: float) -> float:
         """Adjust a confidence value based on calibration."""
@@ -392,32 +596,59 @@ class ConfidenceAdjuster:
 
 
 class CategoryCalibrator:
-    """Separate calibration for different categories."""
+    """
+    Separate calibration for different categories.
+
+    Every outcome also feeds a pooled adjuster. Categories that have not
+    yet collected enough data for their own fit are calibrated with the
+    pooled fit, so thousands of sparse categories stay cheap and useful.
+    """
 
     def __init__(
-        self, method: CalibrationMethod = CalibrationMethod.TEMPERATURE_SCALING
+        self,
+        method: CalibrationMethod = CalibrationMethod.TEMPERATURE_SCALING,
+        fit_window: int = 1000,
+        category_fit_window: int = 200,
+        decay: float = 1.0,
     ):
         self._method = method
+        self._category_fit_window = category_fit_window
+        self._decay = decay
         self._adjusters: Dict[str, ConfidenceAdjuster] = {}
-        self._default_adjuster = ConfidenceAdjuster(method)
+        self._default_adjuster = ConfidenceAdjuster(method, fit_window, decay)
 
     def _get_adjuster(self, category: str) -> ConfidenceAdjuster:
         """Get adjuster for category."""
-        if category not in self._adjusters:
-            self._adjusters[category] = ConfidenceAdjuster(self._method)
-        return self._adjusters[category]
+        adjuster = self._adjusters.get(category)
+        if adjuster is None:
+            adjuster = self._adjusters[category] = ConfidenceAdjuster(
+                self._method, self._category_fit_window, self._decay
+            )
+        return adjuster
+
+    def _adjuster_for(self, category: str) -> ConfidenceAdjuster:
+        """Category adjuster once fitted, otherwise the pooled one."""
+        adjuster = self._adjusters.get(category)
+        if adjuster is not None and adjuster.is_fitted:
+            return adjuster
+        return self._default_adjuster
 
     def record_outcome(
         self, predicted: float, actual: bool, category: str = "general"
     ) -> None:
         """Record an outcome for a category."""
-        adjuster = self._get_adjuster(category)
-        adjuster.record_outcome(predicted, actual, category)
+        self._get_adjuster(category).record_outcome(predicted, actual, category)
+        self._default_adjuster.record_outcome(predicted, actual, category)
 
     def adjust(self, confidence: float, category: str = "general") -> float:
         """Adjust confidence for a category."""
-        adjuster = self._adjusters.get(category, self._default_adjuster)
-        return adjuster.adjust(confidence)
+        return self._adjuster_for(category).adjust(confidence)
+
+    def adjust_batch(
+        self, confidences: List[float], category: str = "general"
+    ) -> List[float]:
+        """Adjust multiple confidence values for a category."""
+        return self._adjuster_for(category).adjust_batch(confidences)
 
     def get_metrics(
         self, category: Optional[str] = None
@@ -443,16 +674,18 @@ class CalibrationSystem:
         self,
         method: CalibrationMethod = CalibrationMethod.TEMPERATURE_SCALING,
         per_category: bool = True,
+        fit_window: int = 1000,
+        history_limit: int = 10_000,
     ):
         self._method = method
         self._per_category = per_category
 
         if per_category:
-            self._calibrator = CategoryCalibrator(method)
+            self._calibrator = CategoryCalibrator(method, fit_window=fit_window)
         else:
-            self._calibrator = ConfidenceAdjuster(method)
+            self._calibrator = ConfidenceAdjuster(method, fit_window=fit_window)
 
-        self._history: List[Dict[str, Any]] = []
+        self._history: Deque[Dict[str, Any]] = deque(maxlen=history_limit)
 
     def record(
         self,
@@ -480,6 +713,14 @@ class CalibrationSystem:
             return self._calibrator.adjust(confidence, category)
         return self._calibrator.adjust(confidence)
 
+    def calibrate_batch(
+        self, confidences: List[float], category: str = "general"
+    ) -> List[float]:
+        """Calibrate many confidence values with one vectorized call."""
+        if self._per_category and isinstance(self._calibrator, CategoryCalibrator):
+            return self._calibrator.adjust_batch(confidences, category)
+        return self._calibrator.adjust_batch(confidences)
+
     def calibrate_with_bounds(
         self, confidence: float, category: str = "general", uncertainty: float = 0.1
     ) -> Tuple[float, float, float]:
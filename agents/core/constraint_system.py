@@ -9,10 +9,12 @@ Provides advanced constraint handling:
 - Conflict detection and resolution
 """
 
+import operator
 import re
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
+from functools import lru_cache
 from typing import Any, Callable, Dict, List, Optional, Tuple
 
 
@@ -104,6 +106,29 @@ class ConstraintCheckResult:
     escalation_request: Optional[EscalationRequest] = None
 
 
+@lru_cache(maxsize=1024)
+def _path_parts(field_path: str) -> Tuple[str, ...]:
+    """Split a dotted field path once and reuse the result."""
+    return tuple(field_path.split("."))
+
+
+def _resolve_path(context: Dict[str, Any], field_path: str) -> Any:
+    """Get a value from nested dicts by dotted path (None if absent)."""
+    value: Any = context
+    for part in _path_parts(field_path):
+        if isinstance(value, dict):
+            value = value.get(part)
+        else:
+            return None
+    return value
+
+
+@lru_cache(maxsize=256)
+def _compiled_pattern(pattern: str) -> "re.Pattern[str]":
+    """Compile a "matches" pattern once."""
+    return re.compile(pattern)
+
+
 class Constraint:
     """Base constraint with simple condition evaluation."""
 
@@ -189,14 +214,7 @@ class ValueConstraint(Constraint):
 
     def _get_value(self, context: Dict[str, Any]) -> Any:
         """Get value from context using field path."""
-        parts = self.field_path.split(".")
-        value = context
-        for part in parts:
-            if isinstance(value, dict):
-                value = value.get(part)
-            else:
-                return None
-        return value
+        return _resolve_path(context, self.field_path)
 
     def check(
         self, context: Dict[str, Any]
@@ -238,7 +256,9 @@ class ValueConstraint(Constraint):
         elif self.operator == "not_in":
             satisfied = actual not in self.expected_value
         elif self.operator == "matches":
-            satisfied = bool(re.match(str(self.expected_value), str(actual or "")))
+            satisfied = bool(
+                _compiled_pattern(str(self.expected_value)).match(str(actual or ""))
+            )
 
         if satisfied:
             return True, None
@@ -372,14 +392,7 @@ class TemporalConstraint(Constraint):
         self.deadline = deadline
 
     def _get_value(self, context: Dict[str, Any]) -> Any:
-        parts = self.field_path.split(".")
-        value = context
-        for part in parts:
-            if isinstance(value, dict):
-                value = value.get(part)
-            else:
-                return None
-        return value
+        return _resolve_path(context, self.field_path)
 
     def check(
         self, context: Dict[str, Any]
@@ -531,6 +544,167 @@ class ResourceConstraint(Constraint):
         return None
 
 
+# Pass/fail predicates for ValueConstraint operators (no violation objects)
+_VALUE_PREDICATES: Dict[str, Callable[[Any, Any], bool]] = {
+    "eq": operator.eq,
+    "ne": operator.ne,
+    "lt": operator.lt,
+    "le": operator.le,
+    "gt": operator.gt,
+    "ge": operator.ge,
+    "in": lambda actual, expected: actual in expected,
+    "not_in": lambda actual, expected: actual not in expected,
+    "matches": lambda actual, expected: bool(
+        _compiled_pattern(str(expected)).match(str(actual or ""))
+    ),
+}
+
+# Relative evaluation cost used to order plan steps
+_VALUE_OPERATOR_COST = {"in": 2.0, "not_in": 2.0, "matches": 4.0}
+_CONSTRAINT_COST = {"ResourceConstraint": 3.0, "TemporalConstraint": 4.0}
+_DEFAULT_CONSTRAINT_COST = 10.0  # eval()-based or custom check()
+
+
+class _OptionView:
+    """
+    Read-only view of an option layered over a shared context.
+
+    Compiled steps read top-level keys straight from the option or context;
+    the merged dict that check() expects is only built if a step needs it.
+    """
+
+    __slots__ = ("option", "context", "_merged")
+
+    def __init__(self, option: Dict[str, Any], context: Dict[str, Any]):
+        self.option = option
+        self.context = context
+        self._merged: Optional[Dict[str, Any]] = None
+
+    def resolve(self, parts: Tuple[str, ...]) -> Any:
+        head = parts[0]
+        value = self.option[head] if head in self.option else self.context.get(head)
+        for part in parts[1:]:
+            if isinstance(value, dict):
+                value = value.get(part)
+            else:
+                return None
+        return value
+
+    def merged(self) -> Dict[str, Any]:
+        if self._merged is None:
+            self._merged = {**self.context, **self.option}
+        return self._merged
+
+
+class _PlanStep:
+    """One constraint in a ConstraintPlan, with observed pass/fail counts."""
+
+    __slots__ = ("constraint", "index", "cost", "test", "evaluations", "failures")
+
+    def __init__(self, constraint: Constraint, index: int):
+        self.constraint = constraint
+        self.index = index  # Registration order
+        self.evaluations = 0
+        self.failures = 0
+
+        if type(constraint).check is ValueConstraint.check:
+            predicate = _VALUE_PREDICATES.get(constraint.operator)
+            parts = _path_parts(constraint.field_path)
+            self.cost = _VALUE_OPERATOR_COST.get(constraint.operator, 1.0) + 0.1 * len(
+                parts
+            )
+            if predicate is None:
+                self.test = lambda view: False
+            else:
+                # expected_value is read at call time so relaxations apply
+                self.test = lambda view: predicate(
+                    view.resolve(parts), constraint.expected_value
+                )
+        else:
+            self.cost = _constraint_cost(constraint)
+            self.test = lambda view: constraint.check(view.merged())[0]
+
+    @property
+    def rank(self) -> float:
+        """Expected cost per rejection; lower runs earlier."""
+        failure_rate = (self.failures + 1) / (self.evaluations + 2)
+        return self.cost / failure_rate
+
+    def passes(self, view: _OptionView) -> bool:
+        self.evaluations += 1
+        if self.test(view):
+            return True
+        self.failures += 1
+        return False
+
+
+def _constraint_cost(constraint: Constraint) -> float:
+    """Static cost estimate for constraints without a compiled predicate."""
+    if isinstance(constraint, CompositeConstraint):
+        return 1.0 + sum(_PlanStep(child, 0).cost for child in constraint.constraints)
+    return _CONSTRAINT_COST.get(type(constraint).__name__, _DEFAULT_CONSTRAINT_COST)
+
+
+class ConstraintPlan:
+    """
+    Compiled evaluation plan over the enabled constraints of an engine.
+
+    Steps run cheapest and most selective first (estimated cost divided by
+    the observed failure rate) and stop at the first deciding violation.
+    Value constraints read their fields through cached path accessors
+    without merging the option into the context; other constraints fall
+    back to check() on a lazily merged dict. The order is re-tuned after
+    every batch from the observed failure rates.
+    """
+
+    def __init__(self, constraints: List[Constraint]):
+        self.steps = [_PlanStep(c, i) for i, c in enumerate(constraints)]
+        self.reorder()
+
+    def reorder(self) -> None:
+        """Sort steps by rank (stable, so ties keep registration order)."""
+        self.steps.sort(key=lambda step: (step.rank, step.index))
+
+    def is_satisfied(self, option: Dict[str, Any], context: Dict[str, Any]) -> bool:
+        """True if the option violates no constraint."""
+        view = _OptionView(option, context)
+        return all(step.passes(view) for step in self.steps)
+
+    def check_options(
+        self, options: List[Dict[str, Any]], context: Dict[str, Any]
+    ) -> List[bool]:
+        """Satisfaction of each option, re-tuning step order afterwards."""
+        results = [self.is_satisfied(option, context) for option in options]
+        self.reorder()
+        return results
+
+    def relaxations_for(
+        self, option: Dict[str, Any], context: Dict[str, Any]
+    ) -> Optional[List[RelaxationPath]]:
+        """
+        Relaxation paths that would admit the option.
+
+        Returns None as soon as a hard constraint fails without its own
+        relaxation path (the option would need escalation); otherwise the
+        paths of all violated constraints in registration order.
+        """
+        view = _OptionView(option, context)
+        paths: List[Tuple[int, RelaxationPath]] = []
+        for step in self.steps:
+            if step.passes(view):
+                continue
+            constraint = step.constraint
+            path = constraint.get_relaxation_path(view.merged())
+            if constraint.constraint_type == ConstraintType.HARD and (
+                path is None or path.constraint_id != constraint.constraint_id
+            ):
+                return None
+            if path:
+                paths.append((step.index, path))
+        paths.sort(key=lambda item: item[0])
+        return [path for _, path in paths]
+
+
 class ConstraintEngine:
     """
     Main engine for constraint checking and management.
@@ -547,12 +721,22 @@ class ConstraintEngine:
         self._constraint_groups: Dict[str, List[str]] = {}
         self._relaxation_history: List[RelaxationPath] = []
         self._escalation_handlers: Dict[EscalationLevel, Callable] = {}
+        self._plan: Optional[ConstraintPlan] = None
+
+    def compile(self) -> ConstraintPlan:
+        """Get the evaluation plan, compiling it if constraints changed."""
+        if self._plan is None:
+            self._plan = ConstraintPlan(
+                [c for c in self._constraints.values() if c.enabled]
+            )
+        return self._plan
 
     def register_constraint(
         self, constraint: Constraint, group: Optional[str] = None
     ) -> None:
         """Register a constraint."""
         self._constraints[constraint.constraint_id] = constraint
+        self._plan = None
 
         if group:
             if group not in self._constraint_groups:
@@ -563,6 +747,7 @@ class ConstraintEngine:
         """Remove a constraint."""
         if constraint_id in self._constraints:
             del self._constraints[constraint_id]
+            self._plan = None
             # Remove from groups
             for group_ids in self._constraint_groups.values():
                 if constraint_id in group_ids:
@@ -574,6 +759,7 @@ class ConstraintEngine:
         """Enable a constraint."""
         if constraint_id in self._constraints:
             self._constraints[constraint_id].enabled = True
+            self._plan = None
             return True
         return False
 
@@ -581,6 +767,7 @@ class ConstraintEngine:
         """Disable a constraint temporarily."""
         if constraint_id in self._constraints:
             self._constraints[constraint_id].enabled = False
+            self._plan = None
             return True
         return False
 
@@ -623,12 +810,9 @@ class ConstraintEngine:
 
         if hard_violations:
             # Check if we can relax any
-            relaxable_hard = len(
-                [
-                    p
-                    for p in relaxation_paths
-                    if any(v.constraint_id == p.constraint_id for v in hard_violations)
-                ]
+            hard_ids = {v.constraint_id for v in hard_violations}
+            relaxable_hard = sum(
+                1 for p in relaxation_paths if p.constraint_id in hard_ids
             )
 
             if len(hard_violations) > relaxable_hard:
@@ -703,21 +887,29 @@ class ConstraintEngine:
 
         return False
 
-    def find_satisfying_options(
+    def check_options(
         self, options: List[Dict[str, Any]], context: Dict[str, Any]
-    ) -> List[Dict[str, Any]]:
-        """Filter options to only those satisfying constraints."""
-        satisfying = []
+    ) -> List[bool]:
+        """
+        Check many options against the enabled constraints in one pass.
 
-        for option in options:
-            # Merge option into context for checking
-            merged = {**context, **option}
-            result = self.check_all(merged, allow_relaxation=False)
+        Each option is layered over context (option keys win, as in
+        find_satisfying_options) and evaluated with the compiled plan.
 
-            if result.satisfied:
-                satisfying.append(option)
+        Returns:
+            One flag per option: True if it violates no constraint
+        """
+        return self.compile().check_options(options, context)
 
-        return satisfying
+    def find_satisfying_options(
+        self, options: List[Dict[str, Any]], context: Dict[str, Any]
+    ) -> List[Dict[str, Any]]:
+        """Filter options to only those satisfying constraints."""
+        return [
+            option
+            for option, ok in zip(options, self.check_options(options, context))
+            if ok
+        ]
 
     def find_best_option_with_relaxation(
         self, options: List[Dict[str, Any]], context: Dict[str, Any]
@@ -733,23 +925,23 @@ class ConstraintEngine:
             return satisfying[0], []
 
         # Try with relaxation
+        plan = self.compile()
         best_option = None
         best_relaxations: List[RelaxationPath] = []
         best_cost = float("inf")
 
         for option in options:
-            merged = {**context, **option}
-            result = self.check_all(merged, allow_relaxation=True)
-
-            if not result.needs_escalation and result.relaxation_paths:
+            paths = plan.relaxations_for(option, context)
+            if paths:
                 # Calculate total relaxation cost
-                total_cost = sum(p.cost for p in result.relaxation_paths)
+                total_cost = sum(p.cost for p in paths)
 
                 if total_cost < best_cost:
                     best_cost = total_cost
                     best_option = option
-                    best_relaxations = result.relaxation_paths
+                    best_relaxations = paths
 
+        plan.reorder()
         return best_option, best_relaxations
 
     def _create_escalation_request(
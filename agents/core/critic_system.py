@@ -8,6 +8,7 @@ Implements:
 - Confidence calibration based on critique
 """
 
+import asyncio
 import random
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
@@ -480,9 +481,24 @@ class DebateAgent:
         self, topic: str, context: Optional[Dict[str, Any]] = None
     ) -> DebatePosition:
         """Take a position on a topic."""
-        # Generate reasoning
-        reasoning = self.reasoning_fn(topic)
+        return self._record_position(topic, self.reasoning_fn(topic))
 
+    async def atake_position(
+        self, topic: str, context: Optional[Dict[str, Any]] = None
+    ) -> DebatePosition:
+        """
+        Async take_position().
+
+        Coroutine reasoning functions are awaited; plain ones run in a worker
+        thread so that several agents can reason at the same time.
+        """
+        if asyncio.iscoroutinefunction(self.reasoning_fn):
+            reasoning = await self.reasoning_fn(topic)
+        else:
+            reasoning = await asyncio.to_thread(self.reasoning_fn, topic)
+        return self._record_position(topic, reasoning)
+
+    def _record_position(self, topic: str, reasoning: str) -> DebatePosition:
         # Apply bias if devil's advocate
         if self.bias == "contrary":
             reasoning = f"However, consider the opposite: {reasoning}"
@@ -547,16 +563,61 @@ class DebateSystem:
         if len(self.agents) < 2:
             self.create_default_agents()
 
-        rounds: List[DebateRound] = []
-
         # Initial positions
         positions = [agent.take_position(topic, context) for agent in self.agents]
 
+        return self._run_rounds(topic, self.agents, positions)
+
+    async def debate_async(
+        self,
+        topic: str,
+        context: Optional[Dict[str, Any]] = None,
+        agent_timeout_s: Optional[float] = None,
+    ) -> DebateResult:
+        """
+        Run a debate with all initial positions generated concurrently.
+
+        Agents whose position takes longer than ``agent_timeout_s`` sit the
+        debate out; other errors propagate as in debate(). Rebuttal rounds
+        are local and run as in debate().
+        """
+        if len(self.agents) < 2:
+            self.create_default_agents()
+
+        async def bounded(agent: DebateAgent) -> DebatePosition:
+            if agent_timeout_s is None:
+                return await agent.atake_position(topic, context)
+            return await asyncio.wait_for(
+                agent.atake_position(topic, context), agent_timeout_s
+            )
+
+        results = await asyncio.gather(
+            *(bounded(agent) for agent in self.agents), return_exceptions=True
+        )
+        agents, positions = [], []
+        for agent, result in zip(self.agents, results):
+            if isinstance(result, asyncio.TimeoutError):
+                continue
+            if isinstance(result, BaseException):
+                raise result
+            agents.append(agent)
+            positions.append(result)
+
+        return self._run_rounds(topic, agents, positions)
+
+    def _run_rounds(
+        self,
+        topic: str,
+        agents: List[DebateAgent],
+        positions: List[DebatePosition],
+    ) -> DebateResult:
+        rounds: List[DebateRound] = []
+
         for round_num in range(self.max_rounds):
             rebuttals = {}
 
             # Each agent rebuts others
-            for i, agent in enumerate(self.agents):
+            for i, agent in enumerate(agents):
                 for j, other_position in enumerate(positions):
                     if i != j:
                         rebuttal = agent.rebut(other_position)
@@ -577,7 +638,7 @@ class DebateSystem:
             )
 
             # Update positions based on debate (simplified)
-            for i, agent in enumerate(self.agents):
+            for i, agent in enumerate(agents):
                 # Positions may shift slightly
                 if positions[i].confidence > 0.3:
                     positions[i].confidence -= 0.1 * random.random()
@@ -590,7 +651,11 @@ class DebateSystem:
             rounds=rounds,
             outcome=outcome,
             winning_position=winning,
-            consensus_confidence=sum(p.confidence for p in positions) / len(positions),
+            consensus_confidence=(
+                sum(p.confidence for p in positions) / len(positions)
+                if positions
+                else 0.0
+            ),
             key_agreements=agreements,
             key_disagreements=disagreements,
         )
@@ -6,14 +6,21 @@ Implements:
 - Evaluation harness with structured comparisons
 - Performance tracking across difficulty levels
 - Adaptive curriculum progression
+- Parallel, disk-cached evaluation with streamed, resumable JSONL reports
 """
 
+import hashlib
+import inspect
+import json
+import os
 import statistics
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, field
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from dataclasses import asdict, dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional, Set, Tuple
 
 
 class DifficultyLevel(Enum):
@@ -432,15 +439,213 @@ class Evaluator:
         return self._contains_match(predicted, expected)
 
 
+_STABLE_SCALARS = (type(None), bool, int, float, complex, str, bytes)
+
+
+def model_fingerprint(model_fn: Callable[..., Any]) -> str:
+    """
+    Identifier for a model function, used in result cache keys.
+
+    An explicit ``fingerprint`` attribute wins; otherwise the qualified name
+    and source code are hashed, so editing the function invalidates its
+    cached results. Captured state is hashed too: closure cell values,
+    default arguments, and the instance behind a bound method or callable
+    object. Scalars and containers of them hash by value; any other object
+    can only be hashed by ``id()``, which CPython reuses after garbage
+    collection and across processes. EvalHarness therefore never reads or
+    writes its disk cache for such models unless ``model_id`` is passed or
+    the model sets a ``fingerprint`` attribute.
+    """
+    return _model_fingerprint(model_fn)[0]
+
+
+@dataclass
+class _FingerprintState:
+    """Objects already visited, and whether every token hashed by value."""
+
+    seen: Set[int] = field(default_factory=set)
+    stable: bool = True
+
+
+def _model_fingerprint(model_fn: Callable[..., Any]) -> Tuple[str, bool]:
+    """(fingerprint, stable); unstable fingerprints contain an ``id()``."""
+    state = _FingerprintState()
+    fingerprint = _fingerprint(model_fn, state)
+    return fingerprint, state.stable
+
+
+def _fingerprint(model_fn: Callable[..., Any], state: _FingerprintState) -> str:
+    explicit = getattr(model_fn, "fingerprint", None)
+    if explicit:
+        return str(explicit)
+
+    target = getattr(model_fn, "__func__", model_fn)
+    qualname = getattr(target, "__qualname__", type(target).__qualname__)
+    name = f"{getattr(target, '__module__', '')}.{qualname}"
+    try:
+        source = inspect.getsource(target)
+    except (OSError, TypeError):
+        source = ""
+
+    state.seen.add(id(model_fn))
+    tokens = []
+    if hasattr(model_fn, "__self__"):
+        tokens.append(_state_token(model_fn.__self__, state))
+    elif not inspect.isfunction(target):
+        tokens.append(_identity_token(target, state))  # Callable object
+    for cell in getattr(target, "__closure__", None) or ():
+        try:
+            tokens.append(_state_token(cell.cell_contents, state))
+        except ValueError:
+            tokens.append("<empty>")
+    tokens.append(_state_token(getattr(target, "__defaults__", None), state))
+    tokens.append(_state_token(getattr(target, "__kwdefaults__", None), state))
+
+    payload = "\n".join([name, source, *tokens])
+    return hashlib.sha256(payload.encode()).hexdigest()[:16]
+
+
+def _state_token(value: Any, state: _FingerprintState) -> str:
+    """Hashable text for captured state: by value where stable, else identity."""
+    if isinstance(value, _STABLE_SCALARS):
+        return repr(value)
+    if id(value) in state.seen:
+        return _identity_token(value, state)
+    if isinstance(value, (tuple, list, frozenset, set)):
+        state.seen.add(id(value))
+        items = [_state_token(item, state) for item in value]
+        if isinstance(value, (frozenset, set)):
+            items.sort()
+        return f"{type(value).__name__}({', '.join(items)})"
+    if isinstance(value, dict):
+        state.seen.add(id(value))
+        items = sorted(
+            f"{_state_token(k, state)}: {_state_token(v, state)}"
+            for k, v in value.items()
+        )
+        return f"dict({', '.join(items)})"
+    if inspect.isfunction(value) or inspect.ismethod(value):
+        return f"fn:{_fingerprint(value, state)}"
+    return _identity_token(value, state)
+
+
+def _identity_token(value: Any, state: _FingerprintState) -> str:
+    state.stable = False
+    kind = type(value)
+    return f"{kind.__module__}.{kind.__qualname__}@{id(value):x}"
+
+
+def _result_to_dict(result: EvalResult) -> Dict[str, Any]:
+    return asdict(result)
+
+
+def _result_from_dict(data: Dict[str, Any]) -> EvalResult:
+    return EvalResult(**data)
+
+
+def _evaluate_shard(
+    model_fn: Callable[[str], Dict[str, Any]],
+    examples: List[EvalExample],
+    scoring_method: str,
+) -> List[EvalResult]:
+    """Pool worker: evaluate one shard of examples (must be picklable)."""
+    return Evaluator().evaluate(model_fn, examples, scoring_method)
+
+
+class EvalResultCache:
+    """
+    On-disk cache of EvalResults.
+
+    Keyed by model fingerprint, scoring method and the example's content, so
+    a changed example or model is re-evaluated. One small JSON file per
+    entry, written atomically, which keeps the cache safe to share between
+    worker processes and interrupted runs.
+    """
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(directory, exist_ok=True)
+
+    @staticmethod
+    def key(fingerprint: str, scoring_method: str, example: EvalExample) -> str:
+        content = json.dumps(
+            [
+                fingerprint,
+                scoring_method,
+                example.example_id,
+                example.input_text,
+                example.expected_output,
+            ],
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(content.encode()).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key[:2], f"{key}.json")
+
+    def get(self, key: str) -> Optional[EvalResult]:
+        try:
+            with open(self._path(key), encoding="utf-8") as f:
+                result = _result_from_dict(json.load(f))
+        except (OSError, ValueError, TypeError):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return result
+
+    def put(self, key: str, result: EvalResult) -> None:
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(_result_to_dict(result), f, default=str)
+        os.replace(tmp, path)
+
+    def stats(self) -> Dict[str, Any]:
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+        }
+
+
 class EvalHarness:
     """
     Complete evaluation harness.
+
+    With ``max_workers > 1`` examples are sharded across a thread pool (or a
+    process pool with ``use_processes``; model functions must then be
+    picklable). With ``store_dir`` set, results are cached on disk per
+    (model fingerprint, example), each run streams its results to
+    ``runs/<run_id>.jsonl`` as they complete, and a run interrupted part
+    way can be resumed by passing the same ``run_id`` with ``resume=True``.
+    Only the last ``history_limit`` reports are kept in memory; older runs
+    are compared from their stored summaries.
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        store_dir: Optional[str] = None,
+        max_workers: int = 1,
+        use_processes: bool = False,
+        chunk_size: int = 8,
+        history_limit: int = 20,
+    ):
         self.evaluator = Evaluator()
         self.datasets: Dict[str, Dataset] = {}
-        self.run_history: List[EvalReport] = []
+        self.run_history: Deque[EvalReport] = deque(maxlen=history_limit)
+        self.store_dir = store_dir
+        self.max_workers = max_workers
+        self.use_processes = use_processes
+        self.chunk_size = max(1, chunk_size)
+        self.cache: Optional[EvalResultCache] = None
+        if store_dir:
+            os.makedirs(os.path.join(store_dir, "runs"), exist_ok=True)
+            self.cache = EvalResultCache(os.path.join(store_dir, "cache"))
 
         # Register built-in datasets
         self.register_dataset(LogicDataset())
@@ -456,28 +661,45 @@ class EvalHarness:
         dataset_name: str,
         difficulty: Optional[DifficultyLevel] = None,
         scoring_method: str = "validity",
+        run_id: Optional[str] = None,
+        resume: bool = False,
+        model_id: Optional[str] = None,
     ) -> EvalReport:
-        """Run evaluation on a dataset."""
-        import hashlib
-
+        """
+        Run evaluation on a dataset.
+
+        ``model_id`` overrides the automatic model fingerprint used for
+        caching; without it, models whose captured state can only be
+        fingerprinted by identity bypass the disk cache. Report results are in dataset order regardless of the
+        order in which workers finish.
+        """
         if dataset_name not in self.datasets:
             raise ValueError(f"Unknown dataset: {dataset_name}")
 
         dataset = self.datasets[dataset_name]
         examples = dataset.get_examples(difficulty=difficulty)
 
+        if run_id is None:
+            run_id = hashlib.sha256(
+                f"{dataset_name}{datetime.now().isoformat()}".encode()
+            ).hexdigest()[:12]
+        stream_path = self._run_path(run_id, ".jsonl")
+
         # Run evaluation
-        results = self.evaluator.evaluate(model_fn, examples, scoring_method)
+        results = self._evaluate_examples(
+            model_fn,
+            examples,
+            scoring_method,
+            model_id,
+            stream_path=stream_path,
+            resume=resume,
+        )
 
         # Calculate aggregates
         aggregate = self._calculate_aggregates(results)
         by_difficulty = self._group_by_difficulty(results, examples)
         by_domain = self._group_by_domain(results, examples)
 
-        run_id = hashlib.sha256(
-            f"{dataset_name}{datetime.now().isoformat()}".encode()
-        ).hexdigest()[:12]
-
         report = EvalReport(
             run_id=run_id,
             timestamp=datetime.now().isoformat(),
@@ -488,9 +710,131 @@ class EvalHarness:
             by_domain=by_domain,
         )
 
+        if stream_path:
+            self._store_report(report, stream_path)
         self.run_history.append(report)
         return report
 
+    def iter_run_results(self, run_id: str) -> Iterator[EvalResult]:
+        """Stream a stored run's results without loading the whole run."""
+        path = self._run_path(run_id, ".jsonl")
+        if not path or not os.path.exists(path):
+            raise ValueError(f"Run not found: {run_id}")
+        yield from self._read_stream(path)
+
+    def _run_path(self, run_id: str, suffix: str) -> Optional[str]:
+        if not self.store_dir:
+            return None
+        return os.path.join(self.store_dir, "runs", f"{run_id}{suffix}")
+
+    def _evaluate_examples(
+        self,
+        model_fn: Callable[[str], Dict[str, Any]],
+        examples: List[EvalExample],
+        scoring_method: str,
+        fingerprint: Optional[str] = None,
+        stream_path: Optional[str] = None,
+        resume: bool = False,
+    ) -> List[EvalResult]:
+        """Evaluate examples using the cache, resume stream and worker pool."""
+        done: Dict[str, EvalResult] = {}
+        wanted = {e.example_id for e in examples}
+        if stream_path and resume and os.path.exists(stream_path):
+            for result in self._read_stream(stream_path):
+                if result.example_id in wanted:
+                    done[result.example_id] = result
+
+        cache = self.cache
+        if fingerprint is None:
+            fingerprint, stable = _model_fingerprint(model_fn)
+            if not stable:
+                cache = None  # An id() may belong to another model later
+        stream = None
+        if stream_path:
+            stream = open(stream_path, "a" if resume else "w", encoding="utf-8")
+
+        def record(result: EvalResult, cache_key: Optional[str] = None) -> None:
+            done[result.example_id] = result
+            if cache_key and cache and result.error is None:
+                cache.put(cache_key, result)
+            if stream:
+                stream.write(json.dumps(_result_to_dict(result), default=str) + "\n")
+                stream.flush()
+
+        try:
+            keys: Dict[str, str] = {}
+            todo: List[EvalExample] = []
+            for example in examples:
+                if example.example_id in done:
+                    continue
+                if cache:
+                    key = cache.key(fingerprint, scoring_method, example)
+                    cached = cache.get(key)
+                    if cached is not None:
+                        record(cached)
+                        continue
+                    keys[example.example_id] = key
+                todo.append(example)
+
+            shards = [
+                todo[i : i + self.chunk_size]
+                for i in range(0, len(todo), self.chunk_size)
+            ]
+            if self.max_workers <= 1 or len(shards) <= 1:
+                for shard in shards:
+                    for result in self.evaluator.evaluate(
+                        model_fn, shard, scoring_method
+                    ):
+                        record(result, keys.get(result.example_id))
+            else:
+                pool_cls = (
+                    ProcessPoolExecutor if self.use_processes else ThreadPoolExecutor
+                )
+                with pool_cls(max_workers=self.max_workers) as pool:
+                    futures = [
+                        pool.submit(_evaluate_shard, model_fn, shard, scoring_method)
+                        for shard in shards
+                    ]
+                    for future in as_completed(futures):
+                        for result in future.result():
+                            record(result, keys.get(result.example_id))
+        finally:
+            if stream:
+                stream.close()
+
+        return [done[e.example_id] for e in examples]
+
+    @staticmethod
+    def _read_stream(path: str) -> Iterator[EvalResult]:
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    yield _result_from_dict(json.loads(line))
+                except (ValueError, TypeError):
+                    # Line truncated by an interrupted run
+                    continue
+
+    def _store_report(self, report: EvalReport, stream_path: str) -> None:
+        """Rewrite the stream in dataset order and write the run summary."""
+        tmp = f"{stream_path}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            for result in report.results:
+                f.write(json.dumps(_result_to_dict(result), default=str) + "\n")
+        os.replace(tmp, stream_path)
+
+        summary = {
+            "run_id": report.run_id,
+            "timestamp": report.timestamp,
+            "total_examples": report.total_examples,
+            "aggregate_metrics": report.aggregate_metrics,
+            "by_difficulty": report.by_difficulty,
+            "by_domain": report.by_domain,
+        }
+        summary_path = self._run_path(report.run_id, ".json")
+        with open(f"{summary_path}.tmp", "w", encoding="utf-8") as f:
+            json.dump(summary, f, indent=2)
+        os.replace(f"{summary_path}.tmp", summary_path)
+
     def run_curriculum(
         self,
         model_fn: Callable[[str], Dict[str, Any]],
@@ -509,7 +853,7 @@ class EvalHarness:
             if not examples:
                 continue
 
-            results = self.evaluator.evaluate(model_fn, examples, "validity")
+            results = self._evaluate_examples(model_fn, examples, "validity")
             accuracy = sum(1 for r in results if r.correct) / len(results)
 
             level_result = {
@@ -536,9 +880,16 @@ class EvalHarness:
         }
 
     def compare_runs(self, run_id_1: str, run_id_2: str) -> Dict[str, Any]:
-        """Compare two evaluation runs."""
-        run1 = next((r for r in self.run_history if r.run_id == run_id_1), None)
-        run2 = next((r for r in self.run_history if r.run_id == run_id_2), None)
+        """
+        Compare two evaluation runs.
+
+        Runs no longer in ``run_history`` are read from their stored
+        summaries. When both runs are stored, ``example_changes`` lists the
+        examples that were fixed or regressed, streamed from the JSONL
+        reports.
+        """
+        run1 = self._load_run(run_id_1)
+        run2 = self._load_run(run_id_2)
 
         if not run1 or not run2:
             raise ValueError("Run not found")
@@ -572,8 +923,34 @@ class EvalHarness:
                     "delta": acc2 - acc1,
                 }
 
+        path1 = self._run_path(run_id_1, ".jsonl")
+        path2 = self._run_path(run_id_2, ".jsonl")
+        if path1 and path2 and os.path.exists(path1) and os.path.exists(path2):
+            before = {r.example_id: r.correct for r in self._read_stream(path1)}
+            fixed, regressed = [], []
+            for result in self._read_stream(path2):
+                was_correct = before.get(result.example_id)
+                if was_correct is False and result.correct:
+                    fixed.append(result.example_id)
+                elif was_correct and not result.correct:
+                    regressed.append(result.example_id)
+            comparison["example_changes"] = {"fixed": fixed, "regressed": regressed}
+
         return comparison
 
+    def _load_run(self, run_id: str) -> Optional[EvalReport]:
+        """A report from memory, or rebuilt (without results) from its summary."""
+        for report in self.run_history:
+            if report.run_id == run_id:
+                return report
+
+        path = self._run_path(run_id, ".json")
+        if not path or not os.path.exists(path):
+            return None
+        with open(path, encoding="utf-8") as f:
+            summary = json.load(f)
+        return EvalReport(results=[], **summary)
+
     def _calculate_aggregates(self, results: List[EvalResult]) -> Dict[str, float]:
         """Calculate aggregate metrics."""
         if not results:
@@ -7,8 +7,12 @@ Provides advanced adversarial verification and debate:
 - Multi-perspective debate
 - Confidence-weighted consensus
 - Argument quality scoring
+- Concurrent async debate rounds with per-agent timeouts
 """
 
+import asyncio
+import time
+from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
@@ -393,6 +397,109 @@ class AdversarialGenerator:
         )
 
 
+def _perspective_critique(agent: DebateAgent, position: str) -> str:
+    """Template critique of a position from an agent's perspective."""
+    if agent.perspective == "skeptic":
+        return f"From a skeptical view: What evidence supports '{position[:50]}'?"
+    elif agent.perspective == "advocate":
+        return f"To strengthen: '{position[:50]}' could be supported by..."
+    elif agent.perspective == "evidence_focused":
+        return f"Verification needed: '{position[:50]}' requires source citation"
+    else:
+        return f"Evaluation: '{position[:50]}' appears reasonable but needs refinement"
+
+
+def _placeholder_vote(agent: DebateAgent, positions: Dict[str, str]) -> DebateVote:
+    """Vote for the first position that is not the agent's own."""
+    # Simple voting logic - would be more sophisticated in practice
+    position_ids = list(positions.keys())
+    if not position_ids:
+        return DebateVote(
+            agent_id=agent.agent_id,
+            position_id="none",
+            confidence=0.0,
+            reasoning="No positions to vote on",
+        )
+
+    chosen = position_ids[0]
+    for pid in position_ids:
+        if pid != agent.agent_id:
+            chosen = pid
+            break
+
+    confidence = 0.7 + agent.confidence_bias
+
+    return DebateVote(
+        agent_id=agent.agent_id,
+        position_id=chosen,
+        confidence=max(0.1, min(1.0, confidence)),
+        reasoning=f"Based on {agent.perspective} perspective",
+    )
+
+
+def _tally_consensus(
+    votes: List[DebateVote], method: ConsensusMethod
+) -> ConsensusResult:
+    """Count votes and decide whether ``method`` reaches consensus."""
+    if not votes:
+        return ConsensusResult(
+            method=method,
+            reached=False,
+            winning_position=None,
+            agreement_level=0.0,
+            votes=[],
+            dissenting_views=[],
+        )
+
+    # Count votes per position
+    vote_counts: Dict[str, float] = {}
+    for vote in votes:
+        if method == ConsensusMethod.WEIGHTED:
+            vote_counts[vote.position_id] = (
+                vote_counts.get(vote.position_id, 0) + vote.confidence
+            )
+        else:
+            vote_counts[vote.position_id] = vote_counts.get(vote.position_id, 0) + 1
+
+    # Find winner
+    if not vote_counts:
+        return ConsensusResult(
+            method=method,
+            reached=False,
+            winning_position=None,
+            agreement_level=0.0,
+            votes=votes,
+            dissenting_views=[],
+        )
+
+    winner = max(vote_counts.keys(), key=lambda k: vote_counts[k])
+    total_votes = sum(vote_counts.values())
+    agreement = vote_counts[winner] / total_votes if total_votes > 0 else 0
+
+    # Check if consensus is reached
+    reached = False
+    if method == ConsensusMethod.UNANIMOUS:
+        reached = len(vote_counts) == 1
+    elif method == ConsensusMethod.SUPERMAJORITY:
+        reached = agreement >= 0.67
+    elif method == ConsensusMethod.MAJORITY:
+        reached = agreement > 0.5
+    elif method == ConsensusMethod.WEIGHTED:
+        reached = agreement >= 0.6
+
+    # Find dissenting views
+    dissenting = [vote.reasoning for vote in votes if vote.position_id != winner]
+
+    return ConsensusResult(
+        method=method,
+        reached=reached,
+        winning_position=winner if reached else None,
+        agreement_level=agreement,
+        votes=votes,
+        dissenting_views=dissenting,
+    )
+
+
 class MultiPerspectiveDebate:
     """Manages multi-perspective debate between agents."""
 
@@ -472,108 +579,17 @@ class MultiPerspectiveDebate:
 
     def _generate_critique(self, agent: DebateAgent, position: str) -> str:
         """Generate a critique from an agent's perspective."""
-        if agent.perspective == "skeptic":
-            return f"From a skeptical view: What evidence supports '{position[:50]}'?"
-        elif agent.perspective == "advocate":
-            return f"To strengthen: '{position[:50]}' could be supported by..."
-        elif agent.perspective == "evidence_focused":
-            return f"Verification needed: '{position[:50]}' requires source citation"
-        else:
-            return (
-                f"Evaluation: '{position[:50]}' appears reasonable but needs refinement"
-            )
+        return _perspective_critique(agent, position)
 
     def _agent_vote(self, agent: DebateAgent, positions: Dict[str, str]) -> DebateVote:
         """Agent votes for best position."""
-        # Simple voting logic - would be more sophisticated in practice
-        position_ids = list(positions.keys())
-        if not position_ids:
-            return DebateVote(
-                agent_id=agent.agent_id,
-                position_id="none",
-                confidence=0.0,
-                reasoning="No positions to vote on",
-            )
-
-        # Vote for first non-self position (placeholder)
-        chosen = position_ids[0]
-        for pid in position_ids:
-            if pid != agent.agent_id:
-                chosen = pid
-                break
-
-        confidence = 0.7 + agent.confidence_bias
-
-        return DebateVote(
-            agent_id=agent.agent_id,
-            position_id=chosen,
-            confidence=max(0.1, min(1.0, confidence)),
-            reasoning=f"Based on {agent.perspective} perspective",
-        )
+        return _placeholder_vote(agent, positions)
 
     def reach_consensus(
         self, method: ConsensusMethod = ConsensusMethod.WEIGHTED
     ) -> ConsensusResult:
         """Attempt to reach consensus among agents."""
-        if not self._votes:
-            return ConsensusResult(
-                method=method,
-                reached=False,
-                winning_position=None,
-                agreement_level=0.0,
-                votes=[],
-                dissenting_views=[],
-            )
-
-        # Count votes per position
-        vote_counts: Dict[str, float] = {}
-        for vote in self._votes:
-            if method == ConsensusMethod.WEIGHTED:
-                vote_counts[vote.position_id] = (
-                    vote_counts.get(vote.position_id, 0) + vote.confidence
-                )
-            else:
-                vote_counts[vote.position_id] = vote_counts.get(vote.position_id, 0) + 1
-
-        # Find winner
-        if not vote_counts:
-            return ConsensusResult(
-                method=method,
-                reached=False,
-                winning_position=None,
-                agreement_level=0.0,
-                votes=self._votes,
-                dissenting_views=[],
-            )
-
-        winner = max(vote_counts.keys(), key=lambda k: vote_counts[k])
-        total_votes = sum(vote_counts.values())
-        agreement = vote_counts[winner] / total_votes if total_votes > 0 else 0
-
-        # Check if consensus is reached
-        reached = False
-        if method == ConsensusMethod.UNANIMOUS:
-            reached = len(vote_counts) == 1
-        elif method == ConsensusMethod.SUPERMAJORITY:
-            reached = agreement >= 0.67
-        elif method == ConsensusMethod.MAJORITY:
-            reached = agreement > 0.5
-        elif method == ConsensusMethod.WEIGHTED:
-            reached = agreement >= 0.6
-
-        # Find dissenting views
-        dissenting = [
-            vote.reasoning for vote in self._votes if vote.position_id != winner
-        ]
-
-        return ConsensusResult(
-            method=method,
-            reached=reached,
-            winning_position=winner if reached else None,
-            agreement_level=agreement,
-            votes=self._votes,
-            dissenting_views=dissenting,
-        )
+        return _tally_consensus(self._votes, method)
 
 
 class ConfidenceAdjuster:
@@ -666,6 +682,199 @@ class ConfidenceAdjuster:
         return current, adjustments
 
 
+class AsyncDebateAgent(ABC):
+    """
+    A debate participant backed by async calls (e.g. a model endpoint).
+
+    ``critique`` and ``vote`` are awaited concurrently with every other
+    agent's calls in the same round, so implementations must not depend on
+    the order in which agents are served.
+    """
+
+    def __init__(self, profile: DebateAgent):
+        self.profile = profile
+
+    @property
+    def agent_id(self) -> str:
+        return self.profile.agent_id
+
+    @abstractmethod
+    async def critique(self, topic: str, target_id: str, position: str) -> str:
+        """Critique another participant's position."""
+        pass
+
+    @abstractmethod
+    async def vote(self, topic: str, positions: Dict[str, str]) -> DebateVote:
+        """Vote for the strongest position."""
+        pass
+
+
+class StubDebateAgent(AsyncDebateAgent):
+    """
+    Deterministic local agent for tests and benchmarks.
+
+    Produces the same template critiques and placeholder votes as
+    MultiPerspectiveDebate, optionally after a simulated ``latency_s``.
+    ``preferred_position`` makes the agent always vote for that position
+    when it is on the table.
+    """
+
+    def __init__(
+        self,
+        profile: DebateAgent,
+        latency_s: float = 0.0,
+        preferred_position: Optional[str] = None,
+    ):
+        super().__init__(profile)
+        self.latency_s = latency_s
+        self.preferred_position = preferred_position
+        self.calls = 0
+
+    async def _respond(self) -> None:
+        self.calls += 1
+        if self.latency_s > 0:
+            await asyncio.sleep(self.latency_s)
+
+    async def critique(self, topic: str, target_id: str, position: str) -> str:
+        await self._respond()
+        return _perspective_critique(self.profile, position)
+
+    async def vote(self, topic: str, positions: Dict[str, str]) -> DebateVote:
+        await self._respond()
+        vote = _placeholder_vote(self.profile, positions)
+        if self.preferred_position in positions:
+            vote.position_id = self.preferred_position
+        return vote
+
+
+@dataclass
+class AsyncDebateResult:
+    """Outcome of an AsyncDebateEngine run."""
+
+    topic: str
+    rounds: List[Dict[str, Any]]
+    consensus: ConsensusResult
+    stopped_early: bool
+    timed_out: Dict[str, int] = field(default_factory=dict)  # agent_id -> rounds
+
+
+class AsyncDebateEngine:
+    """
+    Runs debate rounds with every agent's critiques and vote in flight at once.
+
+    A round costs roughly one agent round-trip instead of one per agent and
+    target. Each agent's turn is bounded by ``agent_timeout_s``; agents that
+    time out or raise are left out of that round's votes. Votes accumulate
+    across rounds exactly as in MultiPerspectiveDebate, and with
+    ``early_stop`` the debate ends after the first round at which
+    ``reach_consensus`` would succeed.
+    """
+
+    def __init__(
+        self,
+        agents: Optional[List[AsyncDebateAgent]] = None,
+        agent_timeout_s: Optional[float] = 10.0,
+        consensus_method: ConsensusMethod = ConsensusMethod.WEIGHTED,
+        early_stop: bool = True,
+    ):
+        self.agents: List[AsyncDebateAgent] = list(agents or [])
+        self.agent_timeout_s = agent_timeout_s
+        self.consensus_method = consensus_method
+        self.early_stop = early_stop
+
+    def add_agent(self, agent: AsyncDebateAgent) -> None:
+        """Add an agent to the debate."""
+        self.agents.append(agent)
+
+    async def _agent_turn(
+        self, agent: AsyncDebateAgent, topic: str, positions: Dict[str, str]
+    ) -> Tuple[List[Dict[str, str]], DebateVote]:
+        targets = [
+            (pid, text) for pid, text in positions.items() if pid != agent.agent_id
+        ]
+        results = await asyncio.gather(
+            *(agent.critique(topic, pid, text) for pid, text in targets),
+            agent.vote(topic, positions),
+        )
+        critiques = [
+            {"target": pid, "critique": critique}
+            for (pid, _), critique in zip(targets, results)
+        ]
+        return critiques, results[-1]
+
+    async def _bounded_turn(
+        self, agent: AsyncDebateAgent, topic: str, positions: Dict[str, str]
+    ) -> Tuple[List[Dict[str, str]], DebateVote]:
+        turn = self._agent_turn(agent, topic, positions)
+        if self.agent_timeout_s is None:
+            return await turn
+        return await asyncio.wait_for(turn, self.agent_timeout_s)
+
+    async def conduct_round(
+        self, topic: str, positions: Dict[str, str], round_number: int = 1
+    ) -> Dict[str, Any]:
+        """
+        Conduct one round concurrently.
+
+        Returns the same fields as MultiPerspectiveDebate.conduct_round plus
+        ``round``, ``timed_out``, ``errors`` and ``duration_ms``.
+        """
+        start = time.perf_counter()
+        turns = await asyncio.gather(
+            *(self._bounded_turn(agent, topic, positions) for agent in self.agents),
+            return_exceptions=True,
+        )
+
+        round_results: Dict[str, Any] = {
+            "round": round_number,
+            "topic": topic,
+            "positions": positions,
+            "critiques": {},
+            "votes": [],
+            "timed_out": [],
+            "errors": {},
+        }
+        for agent, turn in zip(self.agents, turns):
+            if isinstance(turn, asyncio.TimeoutError):
+                round_results["timed_out"].append(agent.agent_id)
+            elif isinstance(turn, BaseException):
+                round_results["errors"][agent.agent_id] = str(turn) or repr(turn)
+            else:
+                critiques, vote = turn
+                round_results["critiques"][agent.agent_id] = critiques
+                round_results["votes"].append(vote)
+        round_results["duration_ms"] = (time.perf_counter() - start) * 1000
+        return round_results
+
+    async def run(
+        self, topic: str, positions: Dict[str, str], rounds: int = 1
+    ) -> AsyncDebateResult:
+        """Run up to ``rounds`` rounds, stopping early once consensus holds."""
+        votes: List[DebateVote] = []
+        round_results: List[Dict[str, Any]] = []
+        timed_out: Dict[str, int] = {}
+        consensus = _tally_consensus(votes, self.consensus_method)
+
+        for round_number in range(1, rounds + 1):
+            result = await self.conduct_round(topic, positions, round_number)
+            round_results.append(result)
+            votes.extend(result["votes"])
+            for agent_id in result["timed_out"]:
+                timed_out[agent_id] = timed_out.get(agent_id, 0) + 1
+
+            consensus = _tally_consensus(votes, self.consensus_method)
+            if self.early_stop and consensus.reached:
+                break
+
+        return AsyncDebateResult(
+            topic=topic,
+            rounds=round_results,
+            consensus=consensus,
+            stopped_early=len(round_results) < rounds,
+            timed_out=timed_out,
+        )
+
+
 class EnhancedDebateSystem:
     """
     Complete enhanced debate system integrating all components.
@@ -676,10 +885,22 @@ class EnhancedDebateSystem:
         self.adversarial_generator = AdversarialGenerator()
         self.debate = MultiPerspectiveDebate()
         self.confidence_adjuster = ConfidenceAdjuster()
+        self.agent_backends: Dict[str, AsyncDebateAgent] = {}
 
         # Add standard debate agents
         self.debate.add_standard_agents()
 
+    def set_agent_backend(self, backend: AsyncDebateAgent) -> None:
+        """
+        Back a debate agent with async calls for debate_claim_async().
+
+        Agents without a backend use StubDebateAgent, which reproduces the
+        synchronous critiques and votes.
+        """
+        if all(a.agent_id != backend.agent_id for a in self.debate.agents):
+            self.debate.add_agent(backend.profile)
+        self.agent_backends[backend.agent_id] = backend
+
     def analyze_argument(
         self, claim: str, premises: List[str], evidence: Optional[List[str]] = None
     ) -> Dict[str, Any]:
@@ -742,11 +963,7 @@ class EnhancedDebateSystem:
         """
         Conduct a debate on a claim.
         """
-        positions = {
-            "proponent": claim,
-        }
-        if opposing_arguments:
-            positions["opponent"] = f"Counter to: {claim}"
+        positions = self._claim_positions(claim, opposing_arguments)
 
         debate_results = []
         for round_num in range(rounds):
@@ -769,6 +986,59 @@ class EnhancedDebateSystem:
             },
         }
 
+    async def debate_claim_async(
+        self,
+        claim: str,
+        supporting_arguments: List[str],
+        opposing_arguments: Optional[List[str]] = None,
+        rounds: int = 1,
+        agent_timeout_s: Optional[float] = 10.0,
+        early_stop: bool = True,
+    ) -> Dict[str, Any]:
+        """
+        Conduct a debate on a claim with concurrent rounds.
+
+        Same result shape as debate_claim(), plus ``stopped_early`` and
+        ``timed_out`` (agent_id -> rounds missed). Votes are tallied per
+        call rather than added to ``self.debate``.
+        """
+        positions = self._claim_positions(claim, opposing_arguments)
+        engine = AsyncDebateEngine(
+            [
+                self.agent_backends.get(agent.agent_id) or StubDebateAgent(agent)
+                for agent in self.debate.agents
+            ],
+            agent_timeout_s=agent_timeout_s,
+            early_stop=early_stop,
+        )
+        result = await engine.run(claim, positions, rounds)
+        consensus = result.consensus
+
+        return {
+            "claim": claim,
+            "rounds_conducted": len(result.rounds),
+            "debate_rounds": result.rounds,
+            "stopped_early": result.stopped_early,
+            "timed_out": result.timed_out,
+            "consensus": {
+                "reached": consensus.reached,
+                "method": consensus.method.value,
+                "winner": consensus.winning_position,
+                "agreement_level": consensus.agreement_level,
+                "dissenting_views": consensus.dissenting_views,
+            },
+        }
+
+    def _claim_positions(
+        self, claim: str, opposing_arguments: Optional[List[str]]
+    ) -> Dict[str, str]:
+        positions = {
+            "proponent": claim,
+        }
+        if opposing_arguments:
+            positions["opponent"] = f"Counter to: {claim}"
+        return positions
+
     def get_recommendation(
         self, analysis: Dict[str, Any], threshold: float = 0.6
     ) -> str:
@@ -9,11 +9,31 @@ Implements pluggable utility-based decision scoring with:
 - Integration with plan state and feedback loops
 """
 
+import heapq
+import operator
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Any, Callable, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - pure-Python batch fallback
+    np = None
+
+# Comparison operators available to declarative (batch-compilable) constraints
+_COMPARISONS: Dict[str, Callable[[Any, Any], Any]] = {
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+    "==": operator.eq,
+    "!=": operator.ne,
+}
+
+# Upper bounds of the LOW, MEDIUM and HIGH risk bands
+_RISK_BAND_EDGES = (0.25, 0.5, 0.75)
 
 
 class RiskLevel(Enum):
@@ -88,6 +108,49 @@ class Constraint:
     description: str = ""
     relaxable: bool = True  # Can be relaxed in fallback mode
 
+    # Declarative form (set by Constraint.compare); lets batch scoring
+    # evaluate the constraint as one vectorized comparison
+    key: Optional[str] = None
+    op: Optional[str] = None
+    threshold: Optional[float] = None
+
+    @classmethod
+    def compare(
+        cls,
+        name: str,
+        key: str,
+        op: str,
+        threshold: float,
+        constraint_type: ConstraintType = ConstraintType.HARD,
+        penalty: float = 0.0,
+        description: str = "",
+        relaxable: bool = True,
+    ) -> "Constraint":
+        """
+        Build a numeric comparison constraint ``option[key] <op> threshold``.
+
+        A missing value never satisfies the constraint.
+        """
+        if op not in _COMPARISONS:
+            raise ValueError(f"Unsupported comparison operator: {op}")
+        compare = _COMPARISONS[op]
+
+        def check(option: Dict[str, Any]) -> bool:
+            value = option.get(key)
+            return value is not None and bool(compare(value, threshold))
+
+        return cls(
+            name=name,
+            constraint_type=constraint_type,
+            check_fn=check,
+            penalty=penalty,
+            description=description or f"{key} {op} {threshold}",
+            relaxable=relaxable,
+            key=key,
+            op=op,
+            threshold=threshold,
+        )
+
     def evaluate(self, option: Dict[str, Any]) -> Tuple[bool, float]:
         """Evaluate constraint, return (satisfied, penalty)."""
         satisfied = self.check_fn(option)
@@ -137,6 +200,142 @@ class DecisionResult:
     timestamp: str = field(default_factory=lambda: datetime.now().isoformat())
 
 
+@dataclass
+class OptionBatch:
+    """
+    Struct-of-arrays view of many options for batch scoring.
+
+    All columns have one entry per option. ``evidence_factor`` is the 0-1
+    evidence multiplier applied to utility (defaults to 1.0) and
+    ``citation_ratio`` the fraction of cited inputs (defaults to 0.0).
+    ``columns`` holds extra per-option fields, such as metadata keys,
+    that constraints may reference.
+    """
+
+    raw_value: Sequence[float]
+    cost: Sequence[float]
+    risk_score: Sequence[float]
+    evidence_factor: Optional[Sequence[float]] = None
+    citation_ratio: Optional[Sequence[float]] = None
+    columns: Dict[str, Sequence[Any]] = field(default_factory=dict)
+    options: Optional[List[DecisionOption]] = None
+
+    def __len__(self) -> int:
+        return len(self.raw_value)
+
+    @classmethod
+    def from_options(
+        cls,
+        options: Sequence[DecisionOption],
+        profile: "RoleProfile",
+        column_keys: Sequence[str] = (),
+    ) -> "OptionBatch":
+        """
+        Build a batch from DecisionOption objects under a role profile.
+
+        Inputs count as cited by their ``is_cited`` flag, as in scalar
+        scoring; DecisionModel.evaluate_batch() validates citations first.
+        """
+        evidence, ratios = [], []
+        for option in options:
+            inputs = option.inputs.values()
+            cited = [inp for inp in inputs if inp.is_cited]
+            evidence.append(_evidence_factor(len(option.inputs), cited, profile))
+            ratios.append(len(cited) / len(option.inputs) if option.inputs else 0.0)
+
+        return cls(
+            raw_value=[o.raw_value for o in options],
+            cost=[o.cost for o in options],
+            risk_score=[o.risk_score for o in options],
+            evidence_factor=evidence,
+            citation_ratio=ratios,
+            columns={
+                key: [o.metadata.get(key, getattr(o, key, None)) for o in options]
+                for key in column_keys
+            },
+            options=list(options),
+        )
+
+    def row(self, index: int) -> Dict[str, Any]:
+        """Materialize one option as the dict Constraint.check_fn expects."""
+        if self.options is not None:
+            return _option_dict(self.options[index])
+        risk_score = self.risk_score[index]
+        return {
+            "cost": self.cost[index],
+            "risk_score": risk_score,
+            "risk_level": _risk_level(risk_score),
+            "raw_value": self.raw_value[index],
+            **{key: values[index] for key, values in self.columns.items()},
+        }
+
+
+@dataclass
+class BatchEvaluation:
+    """Result of DecisionModel.evaluate_batch."""
+
+    utilities: List[float]  # -inf for infeasible options
+    feasible: List[bool]
+    top_indices: List[int]  # Best first, feasible options only
+    top_options: List[DecisionOption] = field(default_factory=list)
+    blocked_counts: Dict[str, int] = field(default_factory=dict)
+    relaxed: bool = False
+
+    @property
+    def selected_index(self) -> Optional[int]:
+        """Index of the best feasible option, if any."""
+        return self.top_indices[0] if self.top_indices else None
+
+
+def _risk_level(score: float) -> RiskLevel:
+    """Map a risk score to its risk band."""
+    if score < _RISK_BAND_EDGES[0]:
+        return RiskLevel.LOW
+    elif score < _RISK_BAND_EDGES[1]:
+        return RiskLevel.MEDIUM
+    elif score < _RISK_BAND_EDGES[2]:
+        return RiskLevel.HIGH
+    else:
+        return RiskLevel.CRITICAL
+
+
+def _count_true(mask: Any) -> int:
+    """Number of True entries in a boolean vector."""
+    return int(np.count_nonzero(mask)) if np is not None else sum(mask)
+
+
+def _option_dict(option: DecisionOption) -> Dict[str, Any]:
+    """The flat view of an option that constraints are evaluated against."""
+    return {
+        "option_id": option.option_id,
+        "name": option.name,
+        "cost": option.cost,
+        "risk_score": option.risk_score,
+        "risk_level": option.risk_level,
+        "raw_value": option.raw_value,
+        **option.metadata,
+    }
+
+
+def _evidence_factor(
+    input_count: int, cited_inputs: List[ScoredInput], profile: "RoleProfile"
+) -> float:
+    """Evidence quality factor (0-1) shared by scalar and batch scoring."""
+    if not input_count:
+        return profile.low_confidence_multiplier
+
+    # Average citation quality across inputs
+    if not cited_inputs:
+        return 1.0 - (profile.uncited_penalty * profile.evidence_weight)
+
+    avg_quality = sum(inp.citation_quality for inp in cited_inputs) / len(cited_inputs)
+
+    if avg_quality < profile.citation_threshold:
+        return profile.low_confidence_multiplier
+
+    return min(1.0, avg_quality)
+
+
 @dataclass
 class RoleProfile:
     """Profile defining decision preferences for a role."""
@@ -303,22 +502,8 @@ class StandardUtilityFunction(UtilityFunction):
         self, option: DecisionOption, profile: RoleProfile
     ) -> float:
         """Compute evidence quality factor (0-1)."""
-        if not option.inputs:
-            return profile.low_confidence_multiplier
-
-        # Average citation quality across inputs
         cited_inputs = [inp for inp in option.inputs.values() if inp.is_cited]
-        if not cited_inputs:
-            return 1.0 - (profile.uncited_penalty * profile.evidence_weight)
-
-        avg_quality = sum(inp.citation_quality for inp in cited_inputs) / len(
-            cited_inputs
-        )
-
-        if avg_quality < profile.citation_threshold:
-            return profile.low_confidence_multiplier
-
-        return min(1.0, avg_quality)
+        return _evidence_factor(len(option.inputs), cited_inputs, profile)
 
     def _citation_bonus(self, option: DecisionOption, profile: RoleProfile) -> float:
         """Compute citation bonus for tie-breaking."""
@@ -328,6 +513,51 @@ class StandardUtilityFunction(UtilityFunction):
         cited_count = sum(1 for inp in option.inputs.values() if inp.is_cited)
         return cited_count / len(option.inputs) * profile.evidence_weight
 
+    def compute_batch(
+        self, batch: OptionBatch, penalties: Any, profile: RoleProfile
+    ) -> Any:
+        """
+        Vectorized compute() over an OptionBatch.
+
+        Args:
+            batch: Options as columns
+            penalties: Per-option sum of soft-constraint penalties
+            profile: Role profile supplying the weights
+
+        Returns:
+            NumPy array of utilities (a list without NumPy); hard-constraint
+            handling is left to the caller
+        """
+        wv = self._bound_weight(profile.value_weight)
+        wc = self._bound_weight(profile.cost_weight)
+        wr = self._bound_weight(profile.risk_weight)
+        bonus = (
+            0.1 * profile.evidence_weight if profile.prefer_validated_options else 0.0
+        )
+        n = len(batch)
+        evidence = batch.evidence_factor or [1.0] * n
+        ratios = batch.citation_ratio or [0.0] * n
+
+        if np is not None:
+            utility = (
+                np.asarray(batch.raw_value, dtype=float) * wv
+                - np.asarray(batch.cost, dtype=float) * wc
+                - np.asarray(batch.risk_score, dtype=float) * wr
+            ) * np.asarray(evidence, dtype=float)
+            return utility - penalties + np.asarray(ratios, dtype=float) * bonus
+
+        return [
+            (v * wv - c * wc - r * wr) * e - p + q * bonus
+            for v, c, r, e, p, q in zip(
+                batch.raw_value,
+                batch.cost,
+                batch.risk_score,
+                evidence,
+                penalties,
+                ratios,
+            )
+        ]
+
 
 class DecisionModel:
     """
@@ -381,15 +611,7 @@ class DecisionModel:
 
     def compute_risk_level(self, option: DecisionOption) -> RiskLevel:
         """Compute risk level from risk score."""
-        score = option.risk_score
-        if score < 0.25:
-            return RiskLevel.LOW
-        elif score < 0.5:
-            return RiskLevel.MEDIUM
-        elif score < 0.75:
-            return RiskLevel.HIGH
-        else:
-            return RiskLevel.CRITICAL
+        return _risk_level(option.risk_score)
 
     def evaluate_options(
         self,
@@ -530,6 +752,151 @@ class DecisionModel:
             critic_invoked=critic_invoked,
         )
 
+    def evaluate_batch(
+        self,
+        options: Union[OptionBatch, Sequence[DecisionOption]],
+        k: int = 10,
+        allow_relaxation: bool = True,
+    ) -> BatchEvaluation:
+        """
+        Score many options at once and return the top k.
+
+        Batch counterpart of evaluate_options() for large candidate sets
+        (evaluate_options() remains the reference implementation). Utilities
+        match what evaluate_options() would compute; constraints built with
+        Constraint.compare() are evaluated as vectorized comparisons, others
+        fall back to calling check_fn per option. Selection bookkeeping
+        (critic flags, fallbacks, decision history) is left to callers, who
+        can pass the top options through evaluate_options(). Citations are
+        validated as in evaluate_options(), so option warnings and input
+        ``is_cited`` flags are updated the same way.
+
+        Args:
+            options: DecisionOption objects or a prebuilt OptionBatch
+            k: Number of best feasible options to return
+            allow_relaxation: Drop relaxable constraints if all are blocked
+
+        Returns:
+            BatchEvaluation with per-option utilities and the top-k indices
+        """
+        if not isinstance(self.utility_fn, StandardUtilityFunction):
+            raise TypeError("evaluate_batch requires a StandardUtilityFunction")
+
+        if isinstance(options, OptionBatch):
+            batch = options
+        else:
+            for option in options:
+                self._validate_citations(option)
+                option.risk_level = self.compute_risk_level(option)
+            keys = {c.key for c in self.constraints if c.key is not None}
+            batch = OptionBatch.from_options(options, self.profile, sorted(keys))
+
+        n = len(batch)
+        satisfied = {c.name: self._constraint_mask(c, batch) for c in self.constraints}
+        hard = [c for c in self.constraints if c.constraint_type == ConstraintType.HARD]
+        soft = [c for c in self.constraints if c.constraint_type != ConstraintType.HARD]
+
+        feasible = self._all_satisfied([satisfied[c.name] for c in hard], n)
+        penalties = self._penalty_sum(soft, satisfied, n)
+        relaxed = False
+        if allow_relaxation and n and not any(feasible):
+            # Mirror _relax_constraints: only non-relaxable hard constraints
+            # still apply, and soft penalties are dropped
+            strict = [satisfied[c.name] for c in hard if not c.relaxable]
+            feasible = self._all_satisfied(strict, n)
+            penalties = self._penalty_sum([], satisfied, n)
+            relaxed = True
+
+        utilities = self.utility_fn.compute_batch(batch, penalties, self.profile)
+        if np is not None:
+            utilities = np.where(feasible, utilities, -np.inf)
+            top = self._top_k_indices(utilities, k)
+            utilities, feasible = utilities.tolist(), feasible.tolist()
+        else:
+            utilities = [
+                u if ok else float("-inf") for u, ok in zip(utilities, feasible)
+            ]
+            top = heapq.nsmallest(
+                k,
+                (i for i in range(n) if feasible[i]),
+                key=lambda i: (-utilities[i], i),
+            )
+
+        top_options = []
+        if batch.options is not None:
+            for i in top:
+                option = batch.options[i]
+                option.utility_score = utilities[i]
+                option.risk_level = _risk_level(option.risk_score)
+                top_options.append(option)
+
+        return BatchEvaluation(
+            utilities=utilities,
+            feasible=list(feasible),
+            top_indices=top,
+            top_options=top_options,
+            blocked_counts={c.name: n - _count_true(satisfied[c.name]) for c in hard},
+            relaxed=relaxed,
+        )
+
+    def _constraint_mask(self, constraint: Constraint, batch: OptionBatch) -> Any:
+        """Per-option satisfaction of one constraint as a boolean vector."""
+        n = len(batch)
+        values = None
+        if constraint.key is not None:
+            values = batch.columns.get(constraint.key)
+            if values is None and constraint.key in ("cost", "risk_score", "raw_value"):
+                values = getattr(batch, constraint.key)
+
+        if values is not None and np is not None:
+            try:
+                column = np.array(
+                    [np.nan if v is None else v for v in values], dtype=float
+                )
+            except (TypeError, ValueError):
+                column = None  # Non-numeric values: evaluate per option
+            if column is not None:
+                compare = _COMPARISONS[constraint.op]
+                return compare(column, constraint.threshold) & ~np.isnan(column)
+
+        mask = [bool(constraint.check_fn(batch.row(i))) for i in range(n)]
+        return np.array(mask, dtype=bool) if np is not None else mask
+
+    @staticmethod
+    def _all_satisfied(masks: List[Any], n: int) -> Any:
+        """Logical AND of boolean vectors (all True when there are none)."""
+        if np is not None:
+            result = np.ones(n, dtype=bool)
+            for mask in masks:
+                result &= mask
+            return result
+        return [all(mask[i] for mask in masks) for i in range(n)]
+
+    @staticmethod
+    def _penalty_sum(soft: List[Constraint], satisfied: Dict[str, Any], n: int) -> Any:
+        """Per-option total penalty from violated soft constraints."""
+        if np is not None:
+            total = np.zeros(n)
+            for constraint in soft:
+                total += np.where(satisfied[constraint.name], 0.0, constraint.penalty)
+            return total
+        return [
+            sum(c.penalty for c in soft if not satisfied[c.name][i]) for i in range(n)
+        ]
+
+    @staticmethod
+    def _top_k_indices(utilities: Any, k: int) -> List[int]:
+        """Indices of the k best finite utilities, ties broken by position."""
+        candidates = np.flatnonzero(np.isfinite(utilities))
+        if k <= 0 or candidates.size == 0:
+            return []
+        if candidates.size > k:
+            values = utilities[candidates]
+            kth = np.partition(values, values.size - k)[values.size - k]
+            candidates = candidates[values >= kth]
+        order = np.lexsort((candidates, -utilities[candidates]))
+        return candidates[order][:k].tolist()
+
     def _validate_citations(self, option: DecisionOption) -> None:
         """Validate citations for option inputs."""
         for input_name, scored_input in option.inputs.items():
@@ -552,15 +919,7 @@ class DecisionModel:
         option.constraint_penalties.clear()
         option.blocked_by.clear()
 
-        option_dict = {
-            "option_id": option.option_id,
-            "name": option.name,
-            "cost": option.cost,
-            "risk_score": option.risk_score,
-            "risk_level": option.risk_level,
-            "raw_value": option.raw_value,
-            **option.metadata,
-        }
+        option_dict = _option_dict(option)
 
         for constraint in self.constraints:
             satisfied, penalty = constraint.evaluate(option_dict)
@@ -586,15 +945,7 @@ class DecisionModel:
             option.constraint_penalties.clear()
             option.blocked_by.clear()
 
-            option_dict = {
-                "option_id": option.option_id,
-                "name": option.name,
-                "cost": option.cost,
-                "risk_score": option.risk_score,
-                "risk_level": option.risk_level,
-                "raw_value": option.raw_value,
-                **option.metadata,
-            }
+            option_dict = _option_dict(option)
 
             blocked = False
             for constraint in hard_constraints:
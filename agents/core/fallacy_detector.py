@@ -6,11 +6,39 @@ Implements comprehensive fallacy database with 25+ patterns:
 - Presumption fallacies (false dilemma, begging question, etc.)
 - Ambiguity fallacies (equivocation, etc.)
 - Formal fallacies (affirming consequent, denying antecedent)
+
+The database is loaded from data/fallacies.json once per process into a
+shared, immutable FallacyIndex whose indicator phrases are compiled into a
+single word-boundary regex.
 """
 
-from dataclasses import dataclass
+import json
+import re
+from bisect import bisect_right
+from dataclasses import dataclass, field, replace
 from enum import Enum
-from typing import Dict, List, Optional
+from functools import lru_cache
+from itertools import accumulate
+from pathlib import Path
+from types import MappingProxyType
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Pattern,
+    Sequence,
+    Set,
+    Tuple,
+)
+
+DATA_FILE = Path(__file__).parent.parent.parent / "data" / "fallacies.json"
+
+_WORD_CHAR = re.compile(r"\w")
+# Joins batched texts; never part of an indicator and never a word character
+_BATCH_SEPARATOR = "\0"
 
 
 class FallacyCategory(Enum):
@@ -30,7 +58,7 @@ class FallacySeverity(Enum):
     MINOR = "minor"
 
 
-@dataclass
+@dataclass(frozen=True)
 class FallacyPattern:
     """Structured fallacy definition."""
 
@@ -39,290 +67,431 @@ class FallacyPattern:
     category: FallacyCategory
     severity: FallacySeverity
     description: str
-    pattern_indicators: List[str]
+    pattern_indicators: Sequence[str]
     example: str
 
 
+def _trie_regex(phrases: Iterable[str]) -> str:
+    """
+    Regex matching any of ``phrases``, factored into a prefix trie.
+
+    At each position only one branch can match, so the cost does not grow
+    with the number of phrases; longer phrases are tried before their
+    prefixes.
+    """
+    trie: Dict[str, Any] = {}
+    for phrase in phrases:
+        node = trie
+        for char in phrase:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def emit(node: Dict[str, Any]) -> str:
+        branches = [
+            re.escape(char) + emit(child)
+            for char, child in sorted(node.items())
+            if char
+        ]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+        return f"(?:{body})?" if "" in node else body
+
+    return emit(trie)
+
+
+@dataclass(frozen=True)
+class FallacyIndex:
+    """
+    Immutable fallacy database with a compiled indicator matcher.
+
+    Every indicator phrase is part of one trie-factored alternation that is
+    tried at each word start of the lowercased text, longest phrase first,
+    so scanning a text is a single pass whatever the number of fallacies and
+    indicators. Phrases match whole words only: "or" does not match inside
+    "for".
+    """
+
+    fallacies: Mapping[str, FallacyPattern]
+    _ordered: Tuple[FallacyPattern, ...] = field(repr=False)
+    _pattern: Optional[Pattern] = field(repr=False)
+    # Lowercased phrase -> positions (in _ordered) of the fallacies it signals
+    _owners: Mapping[str, Tuple[int, ...]] = field(repr=False)
+
+    @classmethod
+    def build(cls, fallacies: Iterable[FallacyPattern]) -> "FallacyIndex":
+        """Compile an index; later patterns with the same id win."""
+        by_id = {
+            fallacy.id: replace(
+                fallacy, pattern_indicators=tuple(fallacy.pattern_indicators)
+            )
+            for fallacy in fallacies
+        }
+        ordered = tuple(by_id.values())
+
+        owners: Dict[str, Set[int]] = {}
+        for position, fallacy in enumerate(ordered):
+            for phrase in fallacy.pattern_indicators:
+                if phrase:
+                    owners.setdefault(phrase.lower(), set()).add(position)
+
+        # Only the longest phrase at a word start is reported, so it also
+        # signals every phrase that is a whole-word prefix of it
+        closed = {}
+        for phrase in owners:
+            positions: Set[int] = set()
+            for prefix, owned in owners.items():
+                if phrase.startswith(prefix) and not _WORD_CHAR.match(
+                    phrase, len(prefix)
+                ):
+                    positions |= owned
+            closed[phrase] = tuple(sorted(positions))
+
+        pattern = None
+        if closed:
+            pattern = re.compile(rf"(?<!\w)(?=({_trie_regex(closed)})(?!\w))")
+
+        return cls(
+            fallacies=MappingProxyType(by_id),
+            _ordered=ordered,
+            _pattern=pattern,
+            _owners=MappingProxyType(closed),
+        )
+
+    def match(self, text: str) -> List[FallacyPattern]:
+        """Fallacies with an indicator in ``text``, in database order."""
+        return self.match_batch([text])[0]
+
+    def match_batch(self, texts: Sequence[str]) -> List[List[FallacyPattern]]:
+        """``match`` for each text, scanning all of them in one pass."""
+        lowered = [text.lower() for text in texts]
+        hits: List[Set[int]] = [set() for _ in lowered]
+        if self._pattern is not None and lowered:
+            starts = list(
+                accumulate(
+                    (len(text) + len(_BATCH_SEPARATOR) for text in lowered[:-1]),
+                    initial=0,
+                )
+            )
+            for m in self._pattern.finditer(_BATCH_SEPARATOR.join(lowered)):
+                hits[bisect_right(starts, m.start()) - 1].update(
+                    self._owners[m.group(1)]
+                )
+        return [[self._ordered[i] for i in sorted(found)] for found in hits]
+
+
+@lru_cache(maxsize=None)
+def load_fallacy_index(path: Path = DATA_FILE) -> FallacyIndex:
+    """
+    Load and compile a fallacy database, once per process per path.
+
+    Falls back to the built-in database if ``path`` does not exist.
+    """
+    if not path.exists():
+        return FallacyIndex.build(_builtin_fallacies().values())
+
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    return FallacyIndex.build(
+        FallacyPattern(
+            id=entry["id"],
+            name=entry["name"],
+            category=FallacyCategory(entry["category"]),
+            severity=FallacySeverity(entry["severity"]),
+            description=entry["description"],
+            pattern_indicators=tuple(entry["pattern_indicators"]),
+            example=entry["example"],
+        )
+        for entry in data.values()
+    )
+
+
+def _builtin_fallacies() -> Dict[str, FallacyPattern]:
+    """Fallback fallacy database if the JSON file is not available."""
+    return {
+        # RELEVANCE FALLACIES
+        "ad_hominem": FallacyPattern(
+            id="ad_hominem",
+            name="Ad Hominem",
+            category=FallacyCategory.RELEVANCE,
+            severity=FallacySeverity.MAJOR,
+            description="Attacking the person instead of their argument",
+            pattern_indicators=[
+                "you're wrong because",
+                "coming from you",
+                "can't trust",
+                "you're just",
+            ],
+            example="You can't trust his economic policy because he's wealthy",
+        ),
+        "appeal_to_authority": FallacyPattern(
+            id="appeal_to_authority",
+            name="Appeal to Authority",
+            category=FallacyCategory.RELEVANCE,
+            severity=FallacySeverity.MODERATE,
+            description="Citing irrelevant or unqualified authority",
+            pattern_indicators=[
+                "expert says",
+                "authority claims",
+                "famous person believes",
+                "celebrity",
+            ],
+            example="This diet works because a celebrity uses it",
+        ),
+        "appeal_to_emotion": FallacyPattern(
+            id="appeal_to_emotion",
+            name="Appeal to Emotion",
+            category=FallacyCategory.RELEVANCE,
+            severity=FallacySeverity.MODERATE,
+            description="Using emotion instead of logic",
+            pattern_indicators=[
+                "think of the children",
+                "how would you feel",
+                "imagine if",
+                "scary",
+            ],
+            example="We must ban this because it's scary",
+        ),
+        "appeal_to_popularity": FallacyPattern(
+            id="appeal_to_popularity",
+            name="Appeal to Popularity (Bandwagon)",
+            category=FallacyCategory.RELEVANCE,
+            severity=FallacySeverity.MODERATE,
+            description="Arguing something is true because many people believe it",
+            pattern_indicators=[
+                "everyone believes",
+                "most people think",
+                "popular opinion",
+                "majority",
+            ],
+            example="This must be true because everyone believes it",
+        ),
+        "red_herring": FallacyPattern(
+            id="red_herring",
+            name="Red Herring",
+            category=FallacyCategory.RELEVANCE,
+            severity=FallacySeverity.MODERATE,
+            description="Introducing irrelevant information to distract",
+            pattern_indicators=[
+                "but what about",
+                "the real issue is",
+                "speaking of",
+                "let's talk about",
+            ],
+            example="Climate change? What about immigration!",
+        ),
+        "straw_man": FallacyPattern(
+            id="straw_man",
+            name="Straw Man",
+            category=FallacyCategory.RELEVANCE,
+            severity=FallacySeverity.MAJOR,
+            description="Misrepresenting opponent's argument to make it easier to attack",
+            pattern_indicators=[
+                "so you're saying",
+                "you want to",
+                "you believe",
+                "your position is",
+            ],
+            example="You support environmental protection, so you want to destroy the economy",
+        ),
+        "tu_quoque": FallacyPattern(
+            id="tu_quoque",
+            name="Tu Quoque (You Too)",
+            category=FallacyCategory.RELEVANCE,
+            severity=FallacySeverity.MODERATE,
+            description="Deflecting criticism by accusing the critic of the same thing",
+            pattern_indicators=[
+                "but you also",
+                "you do it too",
+                "you're guilty",
+                "hypocrite",
+            ],
+            example="You can't criticize my smoking when you drink alcohol",
+        ),
+        # PRESUMPTION FALLACIES
+        "false_dilemma": FallacyPattern(
+            id="false_dilemma",
+            name="False Dilemma",
+            category=FallacyCategory.PRESUMPTION,
+            severity=FallacySeverity.MAJOR,
+            description="Presenting only two options when more exist",
+            pattern_indicators=[
+                "either",
+                "or",
+                "only two",
+                "must choose",
+                "one or the other",
+            ],
+            example="Either support the war or hate your country",
+        ),
+        "begging_question": FallacyPattern(
+            id="begging_question",
+            name="Begging the Question",
+            category=FallacyCategory.PRESUMPTION,
+            severity=FallacySeverity.MAJOR,
+            description="Circular reasoning - conclusion assumed in premise",
+            pattern_indicators=[
+                "obviously",
+                "clearly",
+                "of course",
+                "it's evident",
+            ],
+            example="God exists because the Bible says so, and the Bible is true because God wrote it",
+        ),
+        "hasty_generalization": FallacyPattern(
+            id="hasty_generalization",
+            name="Hasty Generalization",
+            category=FallacyCategory.PRESUMPTION,
+            severity=FallacySeverity.MODERATE,
+            description="Drawing broad conclusion from insufficient evidence",
+            pattern_indicators=["all", "every", "always", "never", "none"],
+            example="I met two rude people from that city, so everyone there is rude",
+        ),
+        "slippery_slope": FallacyPattern(
+            id="slippery_slope",
+            name="Slippery Slope",
+            category=FallacyCategory.PRESUMPTION,
+            severity=FallacySeverity.MODERATE,
+            description="Claiming small step leads to extreme outcome without justification",
+            pattern_indicators=[
+                "will lead to",
+                "next thing",
+                "inevitable",
+                "cascade",
+                "then eventually",
+            ],
+            example="If we allow same-sex marriage, people will marry animals",
+        ),
+        "composition": FallacyPattern(
+            id="composition",
+            name="Fallacy of Composition",
+            category=FallacyCategory.PRESUMPTION,
+            severity=FallacySeverity.MODERATE,
+            description="Assuming what's true of parts is true of the whole",
+            pattern_indicators=[
+                "each",
+                "therefore all",
+                "every part",
+                "so the whole",
+            ],
+            example="Each brick is light, therefore the wall is light",
+        ),
+        "division": FallacyPattern(
+            id="division",
+            name="Fallacy of Division",
+            category=FallacyCategory.PRESUMPTION,
+            severity=FallacySeverity.MODERATE,
+            description="Assuming what's true of the whole is true of parts",
+            pattern_indicators=[
+                "the whole",
+                "therefore each",
+                "all together",
+                "so every part",
+            ],
+            example="The team is strong, therefore every player is strong",
+        ),
+        "loaded_question": FallacyPattern(
+            id="loaded_question",
+            name="Loaded Question",
+            category=FallacyCategory.PRESUMPTION,
+            severity=FallacySeverity.MODERATE,
+            description="Question contains unjustified assumption",
+            pattern_indicators=[
+                "when did you stop",
+                "why do you",
+                "how long have you",
+            ],
+            example="When did you stop cheating on tests?",
+        ),
+        # AMBIGUITY FALLACIES
+        "equivocation": FallacyPattern(
+            id="equivocation",
+            name="Equivocation",
+            category=FallacyCategory.AMBIGUITY,
+            severity=FallacySeverity.MAJOR,
+            description="Using same word with different meanings",
+            pattern_indicators=[
+                "depends on",
+                "meaning",
+                "definition",
+                "what you mean by",
+            ],
+            example="A feather is light; light travels fast; therefore a feather travels fast",
+        ),
+        "amphiboly": FallacyPattern(
+            id="amphiboly",
+            name="Amphiboly",
+            category=FallacyCategory.AMBIGUITY,
+            severity=FallacySeverity.MINOR,
+            description="Ambiguous grammar creates confusion",
+            pattern_indicators=["could mean", "unclear", "ambiguous"],
+            example="I saw the man with binoculars (who had binoculars?)",
+        ),
+        "accent": FallacyPattern(
+            id="accent",
+            name="Fallacy of Accent",
+            category=FallacyCategory.AMBIGUITY,
+            severity=FallacySeverity.MINOR,
+            description="Changing emphasis changes meaning inappropriately",
+            pattern_indicators=["emphasized", "stressed", "highlighted"],
+            example="We should not speak ILL of our friends (vs. speak ill of our FRIENDS)",
+        ),
+        # FORMAL FALLACIES
+        "affirming_consequent": FallacyPattern(
+            id="affirming_consequent",
+            name="Affirming the Consequent",
+            category=FallacyCategory.FORMAL,
+            severity=FallacySeverity.MAJOR,
+            description="If P then Q; Q; therefore P (invalid)",
+            pattern_indicators=["if", "then", "therefore"],
+            example="If it rains, the ground is wet; the ground is wet; therefore it rained",
+        ),
+        "denying_antecedent": FallacyPattern(
+            id="denying_antecedent",
+            name="Denying the Antecedent",
+            category=FallacyCategory.FORMAL,
+            severity=FallacySeverity.MAJOR,
+            description="If P then Q; not P; therefore not Q (invalid)",
+            pattern_indicators=["if", "then", "not", "therefore"],
+            example="If it rains, the ground is wet; it's not raining; therefore the ground is dry",
+        ),
+        "post_hoc": FallacyPattern(
+            id="post_hoc",
+            name="Post Hoc Ergo Propter Hoc",
+            category=FallacyCategory.FORMAL,
+            severity=FallacySeverity.MAJOR,
+            description="Assuming causation from temporal sequence",
+            pattern_indicators=[
+                "after",
+                "then",
+                "caused by",
+                "because",
+                "since then",
+            ],
+            example="I wore my lucky socks and won the game; the socks caused the win",
+        ),
+        "non_sequitur": FallacyPattern(
+            id="non_sequitur",
+            name="Non Sequitur",
+            category=FallacyCategory.FORMAL,
+            severity=FallacySeverity.MAJOR,
+            description="Conclusion doesn't follow from premises",
+            pattern_indicators=["therefore", "thus", "hence", "so"],
+            example="He's tall; therefore he must be good at basketball",
+        ),
+    }
+
+
 class FallacyDetector:
     """Pattern-based fallacy detection system."""
 
-    def __init__(self):
-        self.fallacies = self._init_fallacy_database()
-
-    def _init_fallacy_database(self) -> Dict[str, FallacyPattern]:
-        """Initialize comprehensive fallacy database."""
-        return {
-            # RELEVANCE FALLACIES
-            "ad_hominem": FallacyPattern(
-                id="ad_hominem",
-                name="Ad Hominem",
-                category=FallacyCategory.RELEVANCE,
-                severity=FallacySeverity.MAJOR,
-                description="Attacking the person instead of their argument",
-                pattern_indicators=[
-                    "you're wrong because",
-                    "coming from you",
-                    "can't trust",
-                    "you're just",
-                ],
-                example="You can't trust his economic policy because he's wealthy",
-            ),
-            "appeal_to_authority": FallacyPattern(
-                id="appeal_to_authority",
-                name="Appeal to Authority",
-                category=FallacyCategory.RELEVANCE,
-                severity=FallacySeverity.MODERATE,
-                description="Citing irrelevant or unqualified authority",
-                pattern_indicators=[
-                    "expert says",
-                    "authority claims",
-                    "famous person believes",
-                    "celebrity",
-                ],
-                example="This diet works because a celebrity uses it",
-            ),
-            "appeal_to_emotion": FallacyPattern(
-                id="appeal_to_emotion",
-                name="Appeal to Emotion",
-                category=FallacyCategory.RELEVANCE,
-                severity=FallacySeverity.MODERATE,
-                description="Using emotion instead of logic",
-                pattern_indicators=[
-                    "think of the children",
-                    "how would you feel",
-                    "imagine if",
-                    "scary",
-                ],
-                example="We must ban this because it's scary",
-            ),
-            "appeal_to_popularity": FallacyPattern(
-                id="appeal_to_popularity",
-                name="Appeal to Popularity (Bandwagon)",
-                category=FallacyCategory.RELEVANCE,
-                severity=FallacySeverity.MODERATE,
-                description="Arguing something is true because many people believe it",
-                pattern_indicators=[
-                    "everyone believes",
-                    "most people think",
-                    "popular opinion",
-                    "majority",
-                ],
-                example="This must be true because everyone believes it",
-            ),
-            "red_herring": FallacyPattern(
-                id="red_herring",
-                name="Red Herring",
-                category=FallacyCategory.RELEVANCE,
-                severity=FallacySeverity.MODERATE,
-                description="Introducing irrelevant information to distract",
-                pattern_indicators=[
-                    "but what about",
-                    "the real issue is",
-                    "speaking of",
-                    "let's talk about",
-                ],
-                example="Climate change? What about immigration!",
-            ),
-            "straw_man": FallacyPattern(
-                id="straw_man",
-                name="Straw Man",
-                category=FallacyCategory.RELEVANCE,
-                severity=FallacySeverity.MAJOR,
-                description="Misrepresenting opponent's argument to make it easier to attack",
-                pattern_indicators=[
-                    "so you're saying",
-                    "you want to",
-                    "you believe",
-                    "your position is",
-                ],
-                example="You support environmental protection, so you want to destroy the economy",
-            ),
-            "tu_quoque": FallacyPattern(
-                id="tu_quoque",
-                name="Tu Quoque (You Too)",
-                category=FallacyCategory.RELEVANCE,
-                severity=FallacySeverity.MODERATE,
-                description="Deflecting criticism by accusing the critic of the same thing",
-                pattern_indicators=[
-                    "but you also",
-                    "you do it too",
-                    "you're guilty",
-                    "hypocrite",
-                ],
-                example="You can't criticize my smoking when you drink alcohol",
-            ),
-            # PRESUMPTION FALLACIES
-            "false_dilemma": FallacyPattern(
-                id="false_dilemma",
-                name="False Dilemma",
-                category=FallacyCategory.PRESUMPTION,
-                severity=FallacySeverity.MAJOR,
-                description="Presenting only two options when more exist",
-                pattern_indicators=[
-                    "either",
-                    "or",
-                    "only two",
-                    "must choose",
-                    "one or the other",
-                ],
-                example="Either support the war or hate your country",
-            ),
-            "begging_question": FallacyPattern(
-                id="begging_question",
-                name="Begging the Question",
-                category=FallacyCategory.PRESUMPTION,
-                severity=FallacySeverity.MAJOR,
-                description="Circular reasoning - conclusion assumed in premise",
-                pattern_indicators=[
-                    "obviously",
-                    "clearly",
-                    "of course",
-                    "it's evident",
-                ],
-                example="God exists because the Bible says so, and the Bible is true because God wrote it",
-            ),
-            "hasty_generalization": FallacyPattern(
-                id="hasty_generalization",
-                name="Hasty Generalization",
-                category=FallacyCategory.PRESUMPTION,
-                severity=FallacySeverity.MODERATE,
-                description="Drawing broad conclusion from insufficient evidence",
-                pattern_indicators=["all", "every", "always", "never", "none"],
-                example="I met two rude people from that city, so everyone there is rude",
-            ),
-            "slippery_slope": FallacyPattern(
-                id="slippery_slope",
-                name="Slippery Slope",
-                category=FallacyCategory.PRESUMPTION,
-                severity=FallacySeverity.MODERATE,
-                description="Claiming small step leads to extreme outcome without justification",
-                pattern_indicators=[
-                    "will lead to",
-                    "next thing",
-                    "inevitable",
-                    "cascade",
-                    "then eventually",
-                ],
-                example="If we allow same-sex marriage, people will marry animals",
-            ),
-            "composition": FallacyPattern(
-                id="composition",
-                name="Fallacy of Composition",
-                category=FallacyCategory.PRESUMPTION,
-                severity=FallacySeverity.MODERATE,
-                description="Assuming what's true of parts is true of the whole",
-                pattern_indicators=[
-                    "each",
-                    "therefore all",
-                    "every part",
-                    "so the whole",
-                ],
-                example="Each brick is light, therefore the wall is light",
-            ),
-            "division": FallacyPattern(
-                id="division",
-                name="Fallacy of Division",
-                category=FallacyCategory.PRESUMPTION,
-                severity=FallacySeverity.MODERATE,
-                description="Assuming what's true of the whole is true of parts",
-                pattern_indicators=[
-                    "the whole",
-                    "therefore each",
-                    "all together",
-                    "so every part",
-                ],
-                example="The team is strong, therefore every player is strong",
-            ),
-            "loaded_question": FallacyPattern(
-                id="loaded_question",
-                name="Loaded Question",
-                category=FallacyCategory.PRESUMPTION,
-                severity=FallacySeverity.MODERATE,
-                description="Question contains unjustified assumption",
-                pattern_indicators=[
-                    "when did you stop",
-                    "why do you",
-                    "how long have you",
-                ],
-                example="When did you stop cheating on tests?",
-            ),
-            # AMBIGUITY FALLACIES
-            "equivocation": FallacyPattern(
-                id="equivocation",
-                name="Equivocation",
-                category=FallacyCategory.AMBIGUITY,
-                severity=FallacySeverity.MAJOR,
-                description="Using same word with different meanings",
-                pattern_indicators=[
-                    "depends on",
-                    "meaning",
-                    "definition",
-                    "what you mean by",
-                ],
-                example="A feather is light; light travels fast; therefore a feather travels fast",
-            ),
-            "amphiboly": FallacyPattern(
-                id="amphiboly",
-                name="Amphiboly",
-                category=FallacyCategory.AMBIGUITY,
-                severity=FallacySeverity.MINOR,
-                description="Ambiguous grammar creates confusion",
-                pattern_indicators=["could mean", "unclear", "ambiguous"],
-                example="I saw the man with binoculars (who had binoculars?)",
-            ),
-            "accent": FallacyPattern(
-                id="accent",
-                name="Fallacy of Accent",
-                category=FallacyCategory.AMBIGUITY,
-                severity=FallacySeverity.MINOR,
-                description="Changing emphasis changes meaning inappropriately",
-                pattern_indicators=["emphasized", "stressed", "highlighted"],
-                example="We should not speak ILL of our friends (vs. speak ill of our FRIENDS)",
-            ),
-            # FORMAL FALLACIES
-            "affirming_consequent": FallacyPattern(
-                id="affirming_consequent",
-                name="Affirming the Consequent",
-                category=FallacyCategory.FORMAL,
-                severity=FallacySeverity.MAJOR,
-                description="If P then Q; Q; therefore P (invalid)",
-                pattern_indicators=["if", "then", "therefore"],
-                example="If it rains, the ground is wet; the ground is wet; therefore it rained",
-            ),
-            "denying_antecedent": FallacyPattern(
-                id="denying_antecedent",
-                name="Denying the Antecedent",
-                category=FallacyCategory.FORMAL,
-                severity=FallacySeverity.MAJOR,
-                description="If P then Q; not P; therefore not Q (invalid)",
-                pattern_indicators=["if", "then", "not", "therefore"],
-                example="If it rains, the ground is wet; it's not raining; therefore the ground is dry",
-            ),
-            "post_hoc": FallacyPattern(
-                id="post_hoc",
-                name="Post Hoc Ergo Propter Hoc",
-                category=FallacyCategory.FORMAL,
-                severity=FallacySeverity.MAJOR,
-                description="Assuming causation from temporal sequence",
-                pattern_indicators=[
-                    "after",
-                    "then",
-                    "caused by",
-                    "because",
-                    "since then",
-                ],
-                example="I wore my lucky socks and won the game; the socks caused the win",
-            ),
-            "non_sequitur": FallacyPattern(
-                id="non_sequitur",
-                name="Non Sequitur",
-                category=FallacyCategory.FORMAL,
-                severity=FallacySeverity.MAJOR,
-                description="Conclusion doesn't follow from premises",
-                pattern_indicators=["therefore", "thus", "hence", "so"],
-                example="He's tall; therefore he must be good at basketball",
-            ),
-        }
+    def __init__(self, data_file: Optional[Path] = None):
+        """
+        Args:
+            data_file: JSON fallacy database (default: data/fallacies.json)
+        """
+        self._index = load_fallacy_index(DATA_FILE if data_file is None else data_file)
+        self.fallacies = self._index.fallacies
 
     def detect(
         self, argument: str, premises: List[str], conclusion: str
@@ -338,15 +507,26 @@ class FallacyDetector:
         Returns:
             List of detected fallacy patterns
         """
-        detected = []
-        text = f"{' '.join(premises)} {conclusion}".lower()
+        return self._index.match(f"{' '.join(premises)} {conclusion}")
+
+    def detect_batch(
+        self, arguments: Iterable[Tuple[str, List[str], str]]
+    ) -> List[List[FallacyPattern]]:
+        """
+        Detect fallacies in many arguments with a single scan.
 
-        for fallacy_id, fallacy in self.fallacies.items():
-            # Check if any pattern indicators are present
-            if any(indicator in text for indicator in fallacy.pattern_indicators):
-                detected.append(fallacy)
+        Args:
+            arguments: (argument, premises, conclusion) triples, as for detect
 
-        return detected
+        Returns:
+            Detected fallacy patterns for each argument, in order
+        """
+        return self._index.match_batch(
+            [
+                f"{' '.join(premises)} {conclusion}"
+                for _, premises, conclusion in arguments
+            ]
+        )
 
     def get_by_category(self, category: FallacyCategory) -> List[FallacyPattern]:
         """Get all fallacies in a category."""
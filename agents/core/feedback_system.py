@@ -9,6 +9,7 @@ Provides adaptive learning from decision outcomes:
 - Performance trend analysis
 """
 
+import itertools
 import json
 import statistics
 from collections import defaultdict
@@ -110,6 +111,87 @@ class PerformanceTrend:
     avg_outcome_score: float
     decision_count: int
     trend_direction: str  # "improving", "declining", "stable"
+    score_std: float = 0.0
+
+
+# Rollup bucket sizes maintained by OutcomeTracker, and how many of the most
+# recent buckets of each size are retained.
+ROLLUP_GRANULARITIES = ("minute", "hour", "day")
+DEFAULT_ROLLUP_RETENTION = {"minute": 120, "hour": 24 * 7, "day": 90}
+
+_TREND_GRANULARITY = {"minutely": "minute", "hourly": "hour", "daily": "day"}
+
+
+def _bucket_index(moment: datetime, granularity: str) -> int:
+    """Calendar-aligned bucket number of a (naive, local) timestamp."""
+    day = moment.toordinal()
+    if granularity == "day":
+        return day
+    hour = day * 24 + moment.hour
+    if granularity == "hour":
+        return hour
+    return hour * 60 + moment.minute
+
+
+def _bucket_start(index: int, granularity: str) -> datetime:
+    """Inverse of _bucket_index: the first instant of a bucket."""
+    if granularity == "day":
+        return datetime.fromordinal(index)
+    if granularity == "hour":
+        return datetime.fromordinal(index // 24) + timedelta(hours=index % 24)
+    return datetime.fromordinal(index // 1440) + timedelta(minutes=index % 1440)
+
+
+def _parse_timestamp(timestamp: str) -> datetime:
+    """Parse a record timestamp, falling back to now if it is malformed."""
+    try:
+        return datetime.fromisoformat(timestamp)
+    except (TypeError, ValueError):
+        return datetime.now()
+
+
+@dataclass
+class OutcomeRollup:
+    """Pre-aggregated outcome statistics for one time bucket and scope."""
+
+    count: int = 0
+    success_count: int = 0
+    confidence_sum: float = 0.0
+    score_count: int = 0
+    score_sum: float = 0.0
+    score_sq_sum: float = 0.0
+
+    def add(self, record: DecisionRecord, sign: int = 1) -> None:
+        """Fold a completed record in (sign=1) or back out (sign=-1)."""
+        self.count += sign
+        if record.outcome == OutcomeType.SUCCESS:
+            self.success_count += sign
+        self.confidence_sum += sign * record.confidence
+        if record.outcome_score is not None:
+            self.score_count += sign
+            self.score_sum += sign * record.outcome_score
+            self.score_sq_sum += sign * record.outcome_score**2
+
+    @property
+    def success_rate(self) -> float:
+        return self.success_count / self.count if self.count else 0.0
+
+    @property
+    def avg_confidence(self) -> float:
+        return self.confidence_sum / self.count if self.count else 0.0
+
+    @property
+    def avg_score(self) -> float:
+        return self.score_sum / self.score_count if self.score_count else 0.0
+
+    @property
+    def score_std(self) -> float:
+        """Sample standard deviation of outcome scores."""
+        n = self.score_count
+        if n < 2:
+            return 0.0
+        variance = (self.score_sq_sum - self.score_sum**2 / n) / (n - 1)
+        return max(0.0, variance) ** 0.5
 
 
 class WeightManager:
@@ -316,13 +398,30 @@ class ConfidenceCalibrator:
 
 
 class OutcomeTracker:
-    """Tracks and analyzes decision outcomes."""
+    """
+    Tracks and analyzes decision outcomes.
 
-    def __init__(self, max_records: int = 10000):
+    Completed outcomes are also folded into per-minute, per-hour and per-day
+    rollups (overall, per decision type and per chosen option), so trend
+    queries read O(buckets) instead of scanning records. Each granularity
+    keeps only its most recent ``rollup_retention[granularity]`` buckets.
+    """
+
+    def __init__(
+        self,
+        max_records: int = 10000,
+        rollup_retention: Optional[Dict[str, int]] = None,
+    ):
         self.max_records = max_records
+        self.rollup_retention = {**DEFAULT_ROLLUP_RETENTION, **(rollup_retention or {})}
         self._records: Dict[str, DecisionRecord] = {}
         self._by_type: Dict[str, List[str]] = defaultdict(list)
         self._by_option: Dict[str, List[str]] = defaultdict(list)
+        # granularity -> bucket index -> (scope, key) -> rollup
+        self._rollups: Dict[str, Dict[int, Dict[Tuple[str, str], OutcomeRollup]]] = {
+            granularity: {} for granularity in ROLLUP_GRANULARITIES
+        }
+        self._newest_bucket: Dict[str, int] = {}
 
     def record_decision(self, record: DecisionRecord) -> None:
         """Record a new decision."""
@@ -347,14 +446,96 @@ class OutcomeTracker:
             return False
 
         record = self._records[record_id]
+        if record.outcome is not None:
+            self._update_rollups(record, -1)
         record.outcome = outcome
         record.outcome_score = outcome_score
         record.outcome_details = details
         record.outcome_timestamp = datetime.now().isoformat()
         record.duration_ms = duration_ms
+        self._update_rollups(record, 1)
 
         return True
 
+    def _update_rollups(self, record: DecisionRecord, sign: int) -> None:
+        """Add (or, with sign=-1, remove) a completed record's contribution."""
+        moment = _parse_timestamp(record.timestamp)
+        scopes = (
+            ("all", ""),
+            ("type", record.decision_type),
+            ("option", record.chosen_option),
+        )
+        for granularity in ROLLUP_GRANULARITIES:
+            index = _bucket_index(moment, granularity)
+            buckets = self._rollups[granularity]
+            bucket = buckets.get(index)
+            if bucket is None:
+                if sign < 0:
+                    continue
+                newest = max(self._newest_bucket.get(granularity, index), index)
+                cutoff = newest - self.rollup_retention[granularity]
+                if index <= cutoff:
+                    continue  # older than the retention window
+                if newest != self._newest_bucket.get(granularity):
+                    self._newest_bucket[granularity] = newest
+                    self._prune_rollups(granularity, cutoff)
+                bucket = buckets[index] = {}
+
+            for scope in scopes:
+                rollup = bucket.get(scope)
+                if rollup is None:
+                    rollup = bucket[scope] = OutcomeRollup()
+                rollup.add(record, sign)
+
+    def _prune_rollups(self, granularity: str, cutoff: int) -> None:
+        """Drop buckets at or before cutoff (at most the retention count)."""
+        buckets = self._rollups[granularity]
+        for index in [i for i in buckets if i <= cutoff]:
+            del buckets[index]
+
+    def get_rollups(
+        self,
+        granularity: str,
+        count: int,
+        decision_type: Optional[str] = None,
+        option: Optional[str] = None,
+        now: Optional[datetime] = None,
+    ) -> List[Tuple[datetime, OutcomeRollup]]:
+        """
+        Get non-empty rollups for the most recent buckets, newest first.
+
+        Args:
+            granularity: "minute", "hour" or "day"
+            count: Number of buckets to look back, including the current one
+            decision_type: Restrict to one decision type
+            option: Restrict to one chosen option
+            now: Reference time (defaults to datetime.now())
+
+        Returns:
+            List of (bucket start, rollup) pairs
+        """
+        if granularity not in self._rollups:
+            raise ValueError(f"Unknown granularity: {granularity}")
+        if decision_type is not None and option is not None:
+            raise ValueError("Filter by decision_type or option, not both")
+        scope = (
+            ("type", decision_type)
+            if decision_type is not None
+            else ("option", option)
+            if option is not None
+            else ("all", "")
+        )
+
+        buckets = self._rollups[granularity]
+        current = _bucket_index(now or datetime.now(), granularity)
+        results = []
+        for index in range(current, current - count, -1):
+            bucket = buckets.get(index)
+            rollup = bucket.get(scope) if bucket else None
+            if rollup is not None and rollup.count > 0:
+                results.append((_bucket_start(index, granularity), rollup))
+        return results
+
     def get_record(self, record_id: str) -> Optional[DecisionRecord]:
         """Get a decision record."""
         return self._records.get(record_id)
@@ -417,16 +598,27 @@ class OutcomeTracker:
         }
 
     def _prune_oldest(self, count: int) -> None:
-        """Remove oldest records."""
-        sorted_ids = sorted(
-            self._records.keys(), key=lambda rid: self._records[rid].timestamp
-        )
+        """
+        Remove the oldest records (in insertion order).
 
-        for rid in sorted_ids[:count]:
-            record = self._records.pop(rid, None)
-            if record:
-                self._by_type[record.decision_type].remove(rid)
-                self._by_option[record.chosen_option].remove(rid)
+        Rollups are unaffected; they age out by their own retention.
+        """
+        stale_types, stale_options = set(), set()
+        for rid in list(itertools.islice(self._records, count)):
+            record = self._records.pop(rid)
+            stale_types.add(record.decision_type)
+            stale_options.add(record.chosen_option)
+
+        for index, keys in (
+            (self._by_type, stale_types),
+            (self._by_option, stale_options),
+        ):
+            for key in keys:
+                remaining = [rid for rid in index[key] if rid in self._records]
+                if remaining:
+                    index[key] = remaining
+                else:
+                    del index[key]
 
 
 class TrendAnalyzer:
@@ -435,52 +627,52 @@ class TrendAnalyzer:
     def __init__(self, tracker: OutcomeTracker):
         self.tracker = tracker
 
-    def get_hourly_trend(self, hours: int = 24) -> List[PerformanceTrend]:
+    def get_minute_trend(
+        self, minutes: int = 60, decision_type: Optional[str] = None
+    ) -> List[PerformanceTrend]:
+        """Get per-minute performance trends."""
+        return self._get_trends("minutely", minutes, decision_type)
+
+    def get_hourly_trend(
+        self, hours: int = 24, decision_type: Optional[str] = None
+    ) -> List[PerformanceTrend]:
         """Get hourly performance trends."""
-        return self._get_trends("hourly", hours)
+        return self._get_trends("hourly", hours, decision_type)
 
-    def get_daily_trend(self, days: int = 7) -> List[PerformanceTrend]:
+    def get_daily_trend(
+        self, days: int = 7, decision_type: Optional[str] = None
+    ) -> List[PerformanceTrend]:
         """Get daily performance trends."""
-        return self._get_trends("daily", days)
-
-    def _get_trends(self, period: str, count: int) -> List[PerformanceTrend]:
-        """Calculate trends for a time period."""
-        now = datetime.now()
-        trends = []
-
-        for i in range(count):
-            if period == "hourly":
-                start = now - timedelta(hours=i + 1)
-                end = now - timedelta(hours=i)
-            else:  # daily
-                start = now - timedelta(days=i + 1)
-                end = now - timedelta(days=i)
-
-            # Get records in this period
-            records = [
-                r
-                for r in self.tracker._records.values()
-                if r.outcome is not None
-                and start.isoformat() <= r.timestamp <= end.isoformat()
-            ]
-
-            if not records:
-                continue
+        return self._get_trends("daily", days, decision_type)
 
-            scores = [r.outcome_score for r in records if r.outcome_score is not None]
-            confidences = [r.confidence for r in records]
-            success_count = sum(1 for r in records if r.outcome == OutcomeType.SUCCESS)
-
-            trends.append(
-                PerformanceTrend(
-                    period=period,
-                    success_rate=success_count / len(records),
-                    avg_confidence=sum(confidences) / len(confidences),
-                    avg_outcome_score=sum(scores) / len(scores) if scores else 0,
-                    decision_count=len(records),
-                    trend_direction="stable",  # Will be calculated
-                )
+    def _get_trends(
+        self,
+        period: str,
+        count: int,
+        decision_type: Optional[str] = None,
+        now: Optional[datetime] = None,
+    ) -> List[PerformanceTrend]:
+        """
+        Calculate trends for a time period from the tracker's rollups.
+
+        Periods are calendar-aligned buckets, newest (current, partial)
+        bucket first; empty buckets are skipped.
+        """
+        rollups = self.tracker.get_rollups(
+            _TREND_GRANULARITY[period], count, decision_type=decision_type, now=now
+        )
+        trends = [
+            PerformanceTrend(
+                period=period,
+                success_rate=rollup.success_rate,
+                avg_confidence=rollup.avg_confidence,
+                avg_outcome_score=rollup.avg_score,
+                decision_count=rollup.count,
+                trend_direction="stable",  # Will be calculated
+                score_std=rollup.score_std,
             )
+            for _, rollup in rollups
+        ]
 
         # Calculate trend directions
         for i in range(len(trends) - 1):
@@ -488,13 +680,9 @@ class TrendAnalyzer:
             previous = trends[i + 1].avg_outcome_score
 
             if current > previous * 1.1:
-                trends[i] = PerformanceTrend(
-                    **{**trends[i].__dict__, "trend_direction": "improving"}
-                )
+                trends[i].trend_direction = "improving"
             elif current < previous * 0.9:
-                trends[i] = PerformanceTrend(
-                    **{**trends[i].__dict__, "trend_direction": "declining"}
-                )
+                trends[i].trend_direction = "declining"
 
         return trends
 
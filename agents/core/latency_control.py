@@ -6,8 +6,15 @@ Provides latency management and timeout control:
 - Adaptive timeout adjustment
 - Latency tracking and alerts
 - Circuit breaker patterns
+- Enforced deadlines (worker pool, asyncio) with cooperative cancellation
+- Hedged requests and ordered fallback chains for tail latency
 """
 
+import asyncio
+import concurrent.futures
+import contextvars
+import functools
+import inspect
 import statistics
 import threading
 import time
@@ -15,7 +22,13 @@ from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Any, Callable, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+# Size of the shared pool used to run sync callables under a deadline
+DEFAULT_WORKER_THREADS = 8
+
+# Measurements required before a component's p95 is trusted as hedge delay
+DEFAULT_HEDGE_MIN_SAMPLES = 20
 
 
 class TimeoutPolicy(Enum):
@@ -75,6 +88,152 @@ class LatencyStats:
     p99_ms: float
     success_rate: float
     budget_exceeded_rate: float
+    p95_ms: float = 0.0
+
+
+@dataclass
+class FallbackStep:
+    """
+    One tier of a fallback chain, e.g. primary -> cheaper model -> cache.
+
+    ``component`` names the circuit breaker, budget and latency stats used
+    for this tier. Set ``hedge`` for idempotent tiers that may be hedged.
+    """
+
+    component: str
+    func: Callable[[], Any]
+    hedge: bool = False
+
+
+class FallbackExhaustedError(Exception):
+    """Raised when every tier of a fallback chain failed or was skipped."""
+
+    def __init__(self, message: str, errors: Dict[str, Exception]):
+        super().__init__(message)
+        self.errors = errors
+
+
+class OperationCancelledError(Exception):
+    """Raised by CancellationToken.raise_if_cancelled once cancelled."""
+
+    pass
+
+
+class CancellationToken:
+    """
+    Cooperative cancellation signal for long-running work.
+
+    Threads cannot be interrupted, so when a deadline passes the controller
+    cancels the token and the running engine is expected to poll it
+    (``raise_if_cancelled``) between units of work and stop early.
+    """
+
+    def __init__(self, timeout_ms: Optional[float] = None):
+        self._event = threading.Event()
+        self._reason: Optional[str] = None
+        self._deadline = (
+            time.monotonic() + timeout_ms / 1000 if timeout_ms is not None else None
+        )
+
+    def cancel(self, reason: str = "cancelled") -> None:
+        """Request cancellation."""
+        if not self._event.is_set():
+            self._reason = reason
+            self._event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        """True once cancelled explicitly or past the deadline."""
+        if self._event.is_set():
+            return True
+        if self._deadline is not None and time.monotonic() >= self._deadline:
+            self.cancel("deadline exceeded")
+            return True
+        return False
+
+    @property
+    def reason(self) -> Optional[str]:
+        return self._reason
+
+    def remaining_ms(self) -> Optional[float]:
+        """Milliseconds left before the deadline, or None if unbounded."""
+        if self._deadline is None:
+            return None
+        return max(0.0, (self._deadline - time.monotonic()) * 1000)
+
+    def raise_if_cancelled(self) -> None:
+        """Raise OperationCancelledError if cancellation was requested."""
+        if self.cancelled:
+            raise OperationCancelledError(self._reason or "cancelled")
+
+
+_current_token: contextvars.ContextVar[Optional[CancellationToken]] = (
+    contextvars.ContextVar("latency_cancellation_token", default=None)
+)
+
+
+def current_cancellation_token() -> Optional[CancellationToken]:
+    """Return the token of the deadline-bounded call running in this context."""
+    return _current_token.get()
+
+
+def _run_with_token(token: CancellationToken, func: Callable[[], Any]) -> Any:
+    """Run func with token installed as the current cancellation token."""
+    reset = _current_token.set(token)
+    try:
+        return func()
+    finally:
+        _current_token.reset(reset)
+
+
+_shared_executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+_shared_executor_lock = threading.Lock()
+
+
+def get_shared_executor() -> concurrent.futures.ThreadPoolExecutor:
+    """Return the process-wide worker pool for deadline-bounded sync calls."""
+    global _shared_executor
+    with _shared_executor_lock:
+        if _shared_executor is None:
+            _shared_executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=DEFAULT_WORKER_THREADS,
+                thread_name_prefix="latency-worker",
+            )
+        return _shared_executor
+
+
+def _submit_with_token(
+    pool: concurrent.futures.Executor,
+    func: Callable[[], Any],
+    token: CancellationToken,
+) -> concurrent.futures.Future:
+    """Submit func so it runs with token as its current cancellation token."""
+    context = contextvars.copy_context()
+    return pool.submit(context.run, _run_with_token, token, func)
+
+
+def run_with_deadline(
+    func: Callable[[], Any],
+    timeout_ms: float,
+    token: Optional[CancellationToken] = None,
+    executor: Optional[concurrent.futures.Executor] = None,
+) -> Any:
+    """
+    Run a sync callable on the worker pool and wait at most timeout_ms.
+
+    On expiry the token is cancelled and TimeoutError is raised; the worker
+    keeps running until func polls the token or returns.
+    """
+    token = token or CancellationToken()
+    future = _submit_with_token(executor or get_shared_executor(), func, token)
+    try:
+        return future.result(timeout=timeout_ms / 1000)
+    except concurrent.futures.TimeoutError:
+        if future.done():
+            raise  # func raised TimeoutError itself
+        token.cancel("deadline exceeded")
+        future.cancel()
+        raise TimeoutError(f"Call exceeded {timeout_ms:.1f}ms deadline") from None
 
 
 class LatencyTracker:
@@ -124,16 +283,20 @@ class LatencyTracker:
                 else sorted_durations[-1],
                 success_rate=sum(successes) / n,
                 budget_exceeded_rate=sum(exceeded) / n,
+                p95_ms=sorted_durations[int(n * 0.95)]
+                if n >= 20
+                else sorted_durations[-1],
             )
 
     def get_all_stats(self) -> Dict[str, LatencyStats]:
         """Get stats for all tracked components."""
         result = {}
         with self._lock:
-            for component in self._measurements:
-                stats = self.get_stats(component)
-                if stats:
-                    result[component] = stats
+            components = list(self._measurements)
+        for component in components:
+            stats = self.get_stats(component)
+            if stats:
+                result[component] = stats
         return result
 
     def get_recent(self, component: str, limit: int = 10) -> List[LatencyMeasurement]:
@@ -388,15 +551,30 @@ class LatencyController:
     Main controller for latency management.
 
     Combines timeout management, circuit breaking, and monitoring.
+    Sync callables run on a shared worker pool so deadlines are enforced;
+    pass ``enforce_timeouts=False`` to run them inline (measured only).
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        executor: Optional[concurrent.futures.Executor] = None,
+        enforce_timeouts: bool = True,
+        hedge_min_samples: int = DEFAULT_HEDGE_MIN_SAMPLES,
+    ):
         self._tracker = LatencyTracker()
         self._circuit_breaker = CircuitBreaker()
         self._adaptive_timeout = AdaptiveTimeout(base_timeout_ms=5000)
         self._monitor = LatencyMonitor(self._tracker)
 
         self._budgets: Dict[str, LatencyBudget] = {}
+        self._executor = executor
+        self._enforce_timeouts = enforce_timeouts
+        self._hedge_min_samples = hedge_min_samples
+
+        # Per-component hedging / fallback counters
+        self._hedge_counts: Dict[str, Dict[str, int]] = {}
+        self._fallback_counts: Dict[str, Dict[str, int]] = {}
+        self._metrics_lock = threading.Lock()
 
     def set_budget(self, budget: LatencyBudget) -> None:
         """Set latency budget for a component."""
@@ -408,90 +586,383 @@ class LatencyController:
         component: str,
         func: Callable[[], Any],
         timeout_ms: Optional[float] = None,
+        token: Optional[CancellationToken] = None,
     ) -> Tuple[Any, LatencyMeasurement]:
-        """Execute a function with timeout and tracking."""
-        # Check circuit breaker
-        can_execute, circuit_state = self._circuit_breaker.can_execute(component)
-        if not can_execute:
-            measurement = LatencyMeasurement(
-                component=component,
-                duration_ms=0,
-                success=False,
-                metadata={"circuit_open": True},
-            )
-            raise CircuitOpenError(f"Circuit breaker open for {component}")
+        """
+        Execute a function with an enforced deadline and tracking.
 
-        # Get timeout
-        budget = self._budgets.get(component)
-        if timeout_ms is None:
-            timeout_ms = self._adaptive_timeout.get_timeout(component)
-            if budget:
-                timeout_ms = min(timeout_ms, budget.max_ms)
+        ``func`` runs on the worker pool; long-running work should poll
+        ``current_cancellation_token()`` (or the token passed here) so it
+        stops once the deadline has passed.
+        """
+        return self._execute(component, func, timeout_ms, token, handle_timeout=True)
+
+    def _execute(
+        self,
+        component: str,
+        func: Callable[[], Any],
+        timeout_ms: Optional[float],
+        token: Optional[CancellationToken],
+        handle_timeout: bool,
+    ) -> Tuple[Any, LatencyMeasurement]:
+        """Shared sync execution path; retries call it with handle_timeout=False."""
+        budget = self._check_circuit(component)
+        timeout_ms = self._resolve_timeout(component, budget, timeout_ms)
 
         # Execute with timing
         start = time.perf_counter()
         try:
-            result = self._execute_with_timeout_internal(func, timeout_ms)
-            duration_ms = (time.perf_counter() - start) * 1000
+            result = self._execute_with_timeout_internal(func, timeout_ms, token)
+        except TimeoutError:
+            measurement = self._record_timeout(component, start)
+            # Handle timeout based on policy
+            if budget and handle_timeout:
+                return self._handle_timeout(budget, func, measurement)
+            raise
+        except Exception as e:
+            self._record_error(component, start, e)
+            raise
 
-            budget_exceeded = budget and duration_ms > budget.max_ms
+        return result, self._record_success(component, budget, start)
 
-            measurement = LatencyMeasurement(
-                component=component,
-                duration_ms=duration_ms,
-                success=True,
-                budget_exceeded=budget_exceeded,
-            )
+    async def execute_with_timeout_async(
+        self,
+        component: str,
+        func: Callable[[], Any],
+        timeout_ms: Optional[float] = None,
+    ) -> Tuple[Any, LatencyMeasurement]:
+        """
+        Async variant of execute_with_timeout using ``asyncio.wait_for``.
 
-            self._tracker.record(measurement)
-            self._adaptive_timeout.record_latency(component, duration_ms, True)
-            self._circuit_breaker.record_success(component)
+        ``func`` is a zero-argument callable returning an awaitable (e.g. an
+        ``async def`` function). Plain sync callables are run in the default
+        executor. On timeout the awaitable is cancelled.
+        """
+        return await self._execute_async(component, func, timeout_ms, True)
 
-            return result, measurement
+    async def _execute_async(
+        self,
+        component: str,
+        func: Callable[[], Any],
+        timeout_ms: Optional[float],
+        handle_timeout: bool,
+    ) -> Tuple[Any, LatencyMeasurement]:
+        budget = self._check_circuit(component)
+        timeout_ms = self._resolve_timeout(component, budget, timeout_ms)
 
-        except TimeoutError:
-            duration_ms = (time.perf_counter() - start) * 1000
+        start = time.perf_counter()
+        try:
+            result = await asyncio.wait_for(_as_awaitable(func), timeout_ms / 1000)
+        except asyncio.TimeoutError:
+            measurement = self._record_timeout(component, start)
+            if budget and handle_timeout:
+                return await self._handle_timeout_async(budget, func, measurement)
+            raise TimeoutError(f"Timeout for {component}") from None
+        except Exception as e:
+            self._record_error(component, start, e)
+            raise
 
-            measurement = LatencyMeasurement(
-                component=component,
-                duration_ms=duration_ms,
-                success=False,
-                budget_exceeded=True,
-                metadata={"timeout": True},
-            )
+        return result, self._record_success(component, budget, start)
 
-            self._tracker.record(measurement)
-            self._adaptive_timeout.record_latency(component, duration_ms, False)
-            self._circuit_breaker.record_failure(component)
+    def execute_hedged(
+        self,
+        component: str,
+        func: Callable[[], Any],
+        timeout_ms: Optional[float] = None,
+        hedge_after_ms: Optional[float] = None,
+    ) -> Tuple[Any, LatencyMeasurement]:
+        """
+        Execute an idempotent call, launching one backup if it runs long.
+
+        The backup starts after ``hedge_after_ms`` (default: the component's
+        tracked p95, once enough samples exist) and whichever invocation
+        finishes first wins; the loser's token is cancelled. Without enough
+        history the call simply runs unhedged under its deadline.
+        """
+        return self._execute_hedged(
+            component, func, timeout_ms, hedge_after_ms, handle_timeout=True
+        )
+
+    def _execute_hedged(
+        self,
+        component: str,
+        func: Callable[[], Any],
+        timeout_ms: Optional[float],
+        hedge_after_ms: Optional[float],
+        handle_timeout: bool,
+    ) -> Tuple[Any, LatencyMeasurement]:
+        budget = self._check_circuit(component)
+        timeout_ms = self._resolve_timeout(component, budget, timeout_ms)
+        if hedge_after_ms is None:
+            hedge_after_ms = self._hedge_delay(component)
 
-            # Handle timeout based on policy
-            if budget:
+        outcome = {"hedged": False, "backup_won": False}
+        start = time.perf_counter()
+        try:
+            result = self._run_hedged(func, timeout_ms, hedge_after_ms, outcome)
+        except TimeoutError:
+            self._count_hedge(component, outcome)
+            measurement = self._record_timeout(component, start)
+            if budget and handle_timeout:
                 return self._handle_timeout(budget, func, measurement)
             raise
-
         except Exception as e:
-            duration_ms = (time.perf_counter() - start) * 1000
+            self._count_hedge(component, outcome)
+            self._record_error(component, start, e)
+            raise
+
+        self._count_hedge(component, outcome)
+        measurement = self._record_success(component, budget, start)
+        measurement.metadata.update(outcome)
+        return result, measurement
+
+    def execute_with_fallbacks(
+        self,
+        name: str,
+        steps: Sequence[FallbackStep],
+    ) -> Tuple[Any, LatencyMeasurement]:
+        """
+        Try each tier of a fallback chain in order until one succeeds.
+
+        The overall deadline is the LatencyBudget registered under ``name``
+        (if any); each tier gets the smaller of its own timeout and the time
+        left. Tiers whose circuit breaker is open are skipped without being
+        called. The returned measurement's ``served_by`` metadata names the
+        tier that answered.
+        """
+        overall = self._budgets.get(name)
+        deadline = (
+            time.monotonic() + overall.max_ms / 1000 if overall is not None else None
+        )
+        errors: Dict[str, Exception] = {}
+        start = time.perf_counter()
+
+        for step in steps:
+            step_budget = self._budgets.get(step.component)
+            timeout_ms = self._resolve_timeout(step.component, step_budget, None)
+            if deadline is not None:
+                remaining_ms = (deadline - time.monotonic()) * 1000
+                if remaining_ms <= 0:
+                    errors[step.component] = TimeoutError("overall budget exhausted")
+                    break
+                timeout_ms = min(timeout_ms, remaining_ms)
+
+            try:
+                if step.hedge:
+                    result, _ = self._execute_hedged(
+                        step.component,
+                        step.func,
+                        timeout_ms,
+                        None,
+                        handle_timeout=False,
+                    )
+                else:
+                    result, _ = self._execute(
+                        step.component,
+                        step.func,
+                        timeout_ms,
+                        None,
+                        handle_timeout=False,
+                    )
+            except Exception as e:  # includes CircuitOpenError and TimeoutError
+                errors[step.component] = e
+                continue
 
+            self._count_fallback(name, step.component)
             measurement = LatencyMeasurement(
-                component=component,
-                duration_ms=duration_ms,
+                component=name,
+                duration_ms=(time.perf_counter() - start) * 1000,
+                success=True,
+                budget_exceeded=False,
+                metadata={"served_by": step.component, "skipped": list(errors)},
+            )
+            self._tracker.record(measurement)
+            return result, measurement
+
+        self._count_fallback(name, None)
+        self._tracker.record(
+            LatencyMeasurement(
+                component=name,
+                duration_ms=(time.perf_counter() - start) * 1000,
                 success=False,
-                metadata={"error": str(e)},
+                budget_exceeded=any(
+                    isinstance(e, TimeoutError) for e in errors.values()
+                ),
+                metadata={"errors": {k: str(v) for k, v in errors.items()}},
             )
+        )
+        raise FallbackExhaustedError(
+            f"All {len(steps)} fallback tiers failed for {name}", errors
+        )
+
+    def get_hedge_metrics(self, component: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Hedging metrics: hedge rate (calls that launched a backup) and win
+        rate (hedged calls the backup answered first).
+        """
+        with self._metrics_lock:
+            counts = (
+                [self._hedge_counts.get(component, {})]
+                if component
+                else list(self._hedge_counts.values())
+            )
+            requests = sum(c.get("requests", 0) for c in counts)
+            hedged = sum(c.get("hedged", 0) for c in counts)
+            wins = sum(c.get("backup_wins", 0) for c in counts)
+        return {
+            "requests": requests,
+            "hedged": hedged,
+            "backup_wins": wins,
+            "hedge_rate": hedged / requests if requests else 0.0,
+            "win_rate": wins / hedged if hedged else 0.0,
+        }
+
+    def get_fallback_metrics(self, name: str) -> Dict[str, int]:
+        """How often each tier served a fallback chain (``exhausted`` = none)."""
+        with self._metrics_lock:
+            return dict(self._fallback_counts.get(name, {}))
+
+    def _hedge_delay(self, component: str) -> Optional[float]:
+        """Tracked p95 for the component, or None without enough history."""
+        stats = self._tracker.get_stats(component)
+        if stats is None or stats.count < self._hedge_min_samples:
+            return None
+        return stats.p95_ms
 
-            self._tracker.record(measurement)
-            self._circuit_breaker.record_failure(component)
+    def _run_hedged(
+        self,
+        func: Callable[[], Any],
+        timeout_ms: float,
+        hedge_after_ms: Optional[float],
+        outcome: Dict[str, bool],
+    ) -> Any:
+        """Run func with an optional delayed backup; first success wins."""
+        pool = self._executor or get_shared_executor()
+        deadline = time.monotonic() + timeout_ms / 1000
+        tokens = [CancellationToken()]
+        futures = [_submit_with_token(pool, func, tokens[0])]
+
+        if hedge_after_ms is not None and hedge_after_ms < timeout_ms:
+            done, _ = concurrent.futures.wait(futures, timeout=hedge_after_ms / 1000)
+            if not done:
+                tokens.append(CancellationToken())
+                futures.append(_submit_with_token(pool, func, tokens[1]))
+                outcome["hedged"] = True
+
+        pending = set(futures)
+        last_error: Optional[BaseException] = None
+        while pending:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            done, pending = concurrent.futures.wait(
+                pending,
+                timeout=remaining,
+                return_when=concurrent.futures.FIRST_COMPLETED,
+            )
+            for future in done:
+                error = future.exception()
+                if error is None:
+                    outcome["backup_won"] = futures.index(future) > 0
+                    for token in tokens:
+                        token.cancel("hedge lost")
+                    return future.result()
+                last_error = error
+
+        for token in tokens:
+            token.cancel("deadline exceeded")
+        if last_error is not None and not pending:
+            raise last_error
+        raise TimeoutError(f"Call exceeded {timeout_ms:.1f}ms deadline")
+
+    def _count_hedge(self, component: str, outcome: Dict[str, bool]) -> None:
+        with self._metrics_lock:
+            counts = self._hedge_counts.setdefault(
+                component, {"requests": 0, "hedged": 0, "backup_wins": 0}
+            )
+            counts["requests"] += 1
+            counts["hedged"] += int(outcome["hedged"])
+            counts["backup_wins"] += int(outcome["backup_won"])
+
+    def _count_fallback(self, name: str, served_by: Optional[str]) -> None:
+        with self._metrics_lock:
+            counts = self._fallback_counts.setdefault(name, {})
+            key = served_by or "exhausted"
+            counts[key] = counts.get(key, 0) + 1
+
+    def _check_circuit(self, component: str) -> Optional[LatencyBudget]:
+        """Raise if the circuit is open; return the component's budget."""
+        can_execute, circuit_state = self._circuit_breaker.can_execute(component)
+        if not can_execute:
+            raise CircuitOpenError(f"Circuit breaker open for {component}")
+        return self._budgets.get(component)
 
-            raise
+    def _resolve_timeout(
+        self,
+        component: str,
+        budget: Optional[LatencyBudget],
+        timeout_ms: Optional[float],
+    ) -> float:
+        """Pick the explicit timeout, else adaptive timeout capped by budget."""
+        if timeout_ms is None:
+            timeout_ms = self._adaptive_timeout.get_timeout(component)
+            if budget:
+                timeout_ms = min(timeout_ms, budget.max_ms)
+        return timeout_ms
+
+    def _record_success(
+        self, component: str, budget: Optional[LatencyBudget], start: float
+    ) -> LatencyMeasurement:
+        duration_ms = (time.perf_counter() - start) * 1000
+        measurement = LatencyMeasurement(
+            component=component,
+            duration_ms=duration_ms,
+            success=True,
+            budget_exceeded=bool(budget and duration_ms > budget.max_ms),
+        )
+        self._tracker.record(measurement)
+        self._adaptive_timeout.record_latency(component, duration_ms, True)
+        self._circuit_breaker.record_success(component)
+        return measurement
+
+    def _record_timeout(self, component: str, start: float) -> LatencyMeasurement:
+        duration_ms = (time.perf_counter() - start) * 1000
+        measurement = LatencyMeasurement(
+            component=component,
+            duration_ms=duration_ms,
+            success=False,
+            budget_exceeded=True,
+            metadata={"timeout": True},
+        )
+        self._tracker.record(measurement)
+        self._adaptive_timeout.record_latency(component, duration_ms, False)
+        self._circuit_breaker.record_failure(component)
+        return measurement
+
+    def _record_error(
+        self, component: str, start: float, error: Exception
+    ) -> LatencyMeasurement:
+        duration_ms = (time.perf_counter() - start) * 1000
+        measurement = LatencyMeasurement(
+            component=component,
+            duration_ms=duration_ms,
+            success=False,
+            metadata={"error": str(error)},
+        )
+        self._tracker.record(measurement)
+        self._circuit_breaker.record_failure(component)
+        return measurement
 
     def _execute_with_timeout_internal(
-        self, func: Callable[[], Any], timeout_ms: float
+        self,
+        func: Callable[[], Any],
+        timeout_ms: float,
+        token: Optional[CancellationToken] = None,
     ) -> Any:
-        """Execute function with timeout."""
-        # Simple synchronous execution
-        # For real timeout, would need threading or async
-        result = func()
-        return result
+        """Execute function, raising TimeoutError once timeout_ms elapses."""
+        if not self._enforce_timeouts:
+            return _run_with_token(token or CancellationToken(timeout_ms), func)
+        return run_with_deadline(func, timeout_ms, token, self._executor)
 
     def _handle_timeout(
         self,
@@ -507,10 +978,9 @@ class LatencyController:
             for i in range(budget.retry_count):
                 time.sleep(budget.retry_delay_ms / 1000)
                 try:
-                    result, new_measurement = self.execute_with_timeout(
-                        budget.name, func, budget.max_ms
+                    return self._execute(
+                        budget.name, func, budget.max_ms, None, handle_timeout=False
                     )
-                    return result, new_measurement
                 except TimeoutError:
                     continue
             raise TimeoutError(f"Timeout after {budget.retry_count} retries")
@@ -527,6 +997,29 @@ class LatencyController:
 
         raise TimeoutError(f"Timeout for {budget.name}")
 
+    async def _handle_timeout_async(
+        self,
+        budget: LatencyBudget,
+        func: Callable[[], Any],
+        measurement: LatencyMeasurement,
+    ) -> Tuple[Any, LatencyMeasurement]:
+        """Async counterpart of _handle_timeout."""
+        if budget.policy == TimeoutPolicy.RETRY:
+            for i in range(budget.retry_count):
+                await asyncio.sleep(budget.retry_delay_ms / 1000)
+                try:
+                    return await self._execute_async(
+                        budget.name, func, budget.max_ms, handle_timeout=False
+                    )
+                except TimeoutError:
+                    continue
+            raise TimeoutError(f"Timeout after {budget.retry_count} retries")
+
+        if budget.policy == TimeoutPolicy.FALLBACK and budget.fallback:
+            return await _as_awaitable(budget.fallback), measurement
+
+        return self._handle_timeout(budget, func, measurement)
+
     def get_stats(self, component: Optional[str] = None) -> Dict[str, LatencyStats]:
         """Get latency statistics."""
         if component:
@@ -547,6 +1040,20 @@ class LatencyController:
         self._monitor.add_alert_callback(callback)
 
 
+async def _as_awaitable(func: Callable[[], Any]) -> Any:
+    """Call func and await its result, offloading plain sync callables."""
+    if inspect.iscoroutinefunction(func):
+        return await func()
+    if not callable(func):
+        raise TypeError("func must be callable")
+    loop = asyncio.get_running_loop()
+    context = contextvars.copy_context()
+    result = await loop.run_in_executor(None, context.run, func)
+    if inspect.isawaitable(result):
+        return await result
+    return result
+
+
 class CircuitOpenError(Exception):
     """Raised when circuit breaker is open."""
 
@@ -562,18 +1069,41 @@ def create_latency_controller() -> LatencyController:
 
 
 def with_timeout(timeout_ms: float):
-    """Decorator for adding timeout to functions."""
+    """
+    Decorator bounding a function's wall-clock time.
+
+    Sync functions run on the shared worker pool and the caller gets
+    TimeoutError as soon as timeout_ms elapses (the function can poll
+    ``current_cancellation_token()`` to stop early). Coroutine functions are
+    wrapped with ``asyncio.wait_for`` and cancelled on timeout.
+    """
 
     def decorator(func):
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                try:
+                    return await asyncio.wait_for(
+                        func(*args, **kwargs), timeout_ms / 1000
+                    )
+                except asyncio.TimeoutError:
+                    raise TimeoutError(
+                        f"{func.__name__} exceeded {timeout_ms}ms limit"
+                    ) from None
+
+            return async_wrapper
+
+        @functools.wraps(func)
         def wrapper(*args, **kwargs):
-            start = time.perf_counter()
-            result = func(*args, **kwargs)
-            elapsed = (time.perf_counter() - start) * 1000
-            if elapsed > timeout_ms:
-                raise TimeoutError(
-                    f"Function took {elapsed:.1f}ms, exceeding {timeout_ms}ms limit"
+            try:
+                return run_with_deadline(
+                    functools.partial(func, *args, **kwargs), timeout_ms
                 )
-            return result
+            except TimeoutError as exc:
+                raise TimeoutError(
+                    f"{func.__name__} exceeded {timeout_ms}ms limit"
+                ) from exc
 
         return wrapper
 
@@ -34,7 +34,7 @@ ROADMAP (not in current scope):
 
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Dict, List, Literal, Optional, Tuple
+from typing import Any, Dict, Iterable, List, Literal, Optional, Tuple
 
 # Internal engine imports
 from agents.core.categorical_engine import (
@@ -236,26 +236,57 @@ class LogicOrchestrator:
         Raises:
             ValueError: If argument is malformed
         """
-        result = LogicAnalysisResult(notes=[])
-
-        # Step 1: Route to primary engine based on argument type
-        if argument.argument_type == ArgumentType.CATEGORICAL:
-            result = self._analyze_categorical(argument, result)
-        elif argument.argument_type == ArgumentType.PROPOSITIONAL:
-            result = self._analyze_propositional(argument, result)
-        elif argument.argument_type == ArgumentType.MIXED:
-            result = self._analyze_mixed(argument, result)
-        else:
-            # Unknown type - try to infer or return partial analysis
-            result = self._analyze_unknown(argument, result)
+        return self.analyze_batch([argument])[0]
 
-        # Step 2: Always run fallacy detection
-        result = self._detect_fallacies(argument, result)
+    def analyze_batch(
+        self, arguments: Iterable[StructuredArgument]
+    ) -> List[LogicAnalysisResult]:
+        """
+        Analyze several structured arguments.
 
-        # Step 3: Calculate overall confidence
-        result.confidence = self._calculate_confidence(result)
+        Each argument is routed as in analyze(); fallacy detection for the
+        whole batch runs as a single scan of the fallacy index.
 
-        return result
+        Args:
+            arguments: StructuredArguments to analyze
+
+        Returns:
+            One LogicAnalysisResult per argument, in order
+        """
+        arguments = list(arguments)
+        detected = self._fallacy_detector.detect_batch(
+            (
+                " ".join(argument.premises) + " " + argument.conclusion,
+                argument.premises,
+                argument.conclusion,
+            )
+            for argument in arguments
+        )
+
+        results = []
+        for argument, fallacies in zip(arguments, detected):
+            result = LogicAnalysisResult(notes=[])
+
+            # Step 1: Route to primary engine based on argument type
+            if argument.argument_type == ArgumentType.CATEGORICAL:
+                result = self._analyze_categorical(argument, result)
+            elif argument.argument_type == ArgumentType.PROPOSITIONAL:
+                result = self._analyze_propositional(argument, result)
+            elif argument.argument_type == ArgumentType.MIXED:
+                result = self._analyze_mixed(argument, result)
+            else:
+                # Unknown type - try to infer or return partial analysis
+                result = self._analyze_unknown(argument, result)
+
+            # Step 2: Always run fallacy detection
+            result = self._detect_fallacies(argument, result, fallacies)
+
+            # Step 3: Calculate overall confidence
+            result.confidence = self._calculate_confidence(result)
+
+            results.append(result)
+
+        return results
 
     def analyze_text(self, raw_text: str) -> LogicAnalysisResult:
         """
@@ -509,20 +540,25 @@ class LogicOrchestrator:
         return result
 
     def _detect_fallacies(
-        self, argument: StructuredArgument, result: LogicAnalysisResult
+        self,
+        argument: StructuredArgument,
+        result: LogicAnalysisResult,
+        fallacies: Optional[List[FallacyPattern]] = None,
     ) -> LogicAnalysisResult:
         """
         Run fallacy detection on the argument.
 
         This is always run regardless of argument type, as fallacies
-        can appear in any form of reasoning.
+        can appear in any form of reasoning. ``fallacies`` are the
+        detector's results if already computed by a batch scan.
         """
-        # Run fallacy detector with structured argument
-        fallacies = self._fallacy_detector.detect(
-            argument=" ".join(argument.premises) + " " + argument.conclusion,
-            premises=argument.premises,
-            conclusion=argument.conclusion,
-        )
+        if fallacies is None:
+            # Run fallacy detector with structured argument
+            fallacies = self._fallacy_detector.detect(
+                argument=" ".join(argument.premises) + " " + argument.conclusion,
+                premises=argument.premises,
+                conclusion=argument.conclusion,
+            )
         result.fallacies = fallacies
 
         if result.fallacies:
@@ -0,0 +1,288 @@
+"""
+Pattern Scanner - Shared Multi-Pattern Matching Engine
+
+Compiles the keyword and regex rules of a detector once and answers, per
+input, which rules hit, with results identical to running every pattern
+independently (``re.search``/``re.finditer`` per regex, ``keyword in text``
+per keyword):
+
+- Keywords, together with the literals each regex requires (``pretend you
+  are`` for ``(?i)pretend you are``), form one literal table. It is matched
+  in a single pass by an Aho-Corasick automaton when the optional
+  ``pyahocorasick`` package is installed, and otherwise by one C-level
+  substring test per distinct literal against one lowercased copy of the
+  text.
+- Each regex is compiled once and only runs when one of its required
+  literals occurs in the text, so the usual benign input skips nearly all
+  of them. Regexes without a usable literal always run.
+
+The scanner is rebuilt lazily on the next scan after rules change.
+"""
+
+import re
+from dataclasses import dataclass, field
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Pattern, Set, Tuple
+
+try:
+    import ahocorasick
+except ImportError:  # pragma: no cover - substring-test fallback
+    ahocorasick = None
+
+try:
+    from re import _constants as _sre
+    from re import _parser as _sre_parse
+except ImportError:  # pragma: no cover - Python < 3.11
+    import sre_constants as _sre
+    import sre_parse as _sre_parse
+
+# Shorter literals are too common to be worth a prefilter
+MIN_LITERAL_LENGTH = 3
+
+_REPEATS = {
+    op
+    for op in (
+        getattr(_sre, "MAX_REPEAT", None),
+        getattr(_sre, "MIN_REPEAT", None),
+        getattr(_sre, "POSSESSIVE_REPEAT", None),
+    )
+    if op is not None
+}
+
+
+@dataclass
+class RegexHit:
+    """One regex match."""
+
+    pattern: str
+    start: int
+    end: int
+    text: str
+
+
+@dataclass
+class ScanResult:
+    """Per-rule hits of one scan, in rule pattern/keyword order."""
+
+    keywords: Dict[str, List[str]] = field(default_factory=dict)
+    matches: Dict[str, List[RegexHit]] = field(default_factory=dict)
+
+    @property
+    def rule_ids(self) -> Set[str]:
+        return set(self.keywords) | set(self.matches)
+
+    def matched_patterns(self, rule_id: str) -> List[str]:
+        """Distinct patterns of ``rule_id`` that matched, in rule order."""
+        return list(dict.fromkeys(hit.pattern for hit in self.matches.get(rule_id, [])))
+
+
+def _best(requirements: List[FrozenSet[str]]) -> Optional[FrozenSet[str]]:
+    usable = [r for r in requirements if min(map(len, r)) >= MIN_LITERAL_LENGTH]
+    # Prefer long literals, then few alternatives
+    return max(usable, key=lambda r: (min(map(len, r)), -len(r)), default=None)
+
+
+def _requirements(items: Iterable[Tuple[Any, Any]]) -> List[FrozenSet[str]]:
+    """Any-of literal sets that every match of the parsed sequence contains."""
+    requirements: List[FrozenSet[str]] = []
+    run: List[str] = []
+
+    def flush():
+        if run:
+            requirements.append(frozenset(["".join(run)]))
+            run.clear()
+
+    for op, av in items:
+        if op is _sre.LITERAL:
+            run.append(chr(av))
+            continue
+        flush()
+        if op is _sre.SUBPATTERN:
+            _group, add_flags, del_flags, sub = av
+            if not (add_flags or del_flags):
+                requirements.extend(_requirements(sub))
+        elif op is _sre.BRANCH:
+            options: Set[str] = set()
+            for alternative in av[1]:
+                best = _best(_requirements(alternative))
+                if best is None:
+                    break
+                options |= best
+            else:
+                requirements.append(frozenset(options))
+        elif op in _REPEATS:
+            low, _high, sub = av
+            if low >= 1:
+                requirements.extend(_requirements(sub))
+    flush()
+    return requirements
+
+
+def required_literals(compiled: Pattern) -> Optional[FrozenSet[str]]:
+    """
+    Literals of which at least one occurs in every string ``compiled``
+    matches (lowercased if it ignores case), or None if there is no set
+    worth testing.
+    """
+    if not isinstance(compiled.pattern, str):
+        return None
+    try:
+        parsed = _sre_parse.parse(compiled.pattern, compiled.flags)
+    except Exception:  # pragma: no cover - compiled patterns always parse
+        return None
+    best = _best(_requirements(parsed))
+    if best is None or not compiled.flags & re.IGNORECASE:
+        return best
+    # Case-insensitive literals are compared against str.lower(), which
+    # agrees with re's case folding only for ASCII
+    if not all(literal.isascii() for literal in best):
+        return None
+    return frozenset(literal.lower() for literal in best)
+
+
+def max_width(compiled: Pattern) -> Optional[int]:
+    """Longest string ``compiled`` can match, or None if it is unbounded."""
+    _low, high = _sre_parse.parse(compiled.pattern, compiled.flags).getwidth()
+    return None if high >= _sre.MAXREPEAT else high
+
+
+@dataclass
+class _Regex:
+    rule_id: str
+    source: str
+    compiled: Pattern
+    literals: Optional[FrozenSet[str]]
+    folded: bool
+
+
+class _LiteralTable:
+    """Distinct literals matched against one haystack in a single pass."""
+
+    def __init__(self, literals: Set[str]):
+        self.literals = sorted(literals)
+        self.automaton = None
+        if ahocorasick is not None and self.literals:
+            self.automaton = ahocorasick.Automaton()
+            for literal in self.literals:
+                if literal:
+                    self.automaton.add_word(literal, literal)
+            self.automaton.make_automaton()
+
+    def present(self, haystack: str) -> Set[str]:
+        if self.automaton is None:
+            return {literal for literal in self.literals if literal in haystack}
+        found = {literal for _end, literal in self.automaton.iter(haystack)}
+        if "" in self.literals:
+            found.add("")
+        return found
+
+
+class PatternScanner:
+    """
+    Compiled multi-pattern matcher for a set of keyword/regex rules.
+
+    Args:
+        flags: ``re`` flags applied to every regex (e.g. ``re.IGNORECASE``)
+        ignore_case_keywords: compare keywords as ``keyword.lower() in
+            text.lower()`` rather than ``keyword in text``
+    """
+
+    def __init__(self, flags: int = 0, ignore_case_keywords: bool = True):
+        self.flags = flags
+        self.ignore_case_keywords = ignore_case_keywords
+        self._rules: Dict[str, Tuple[List[str], List[str]]] = {}
+        self._compiled: Optional[Tuple[Any, ...]] = None
+
+    def __len__(self) -> int:
+        return len(self._rules)
+
+    def __contains__(self, rule_id: str) -> bool:
+        return rule_id in self._rules
+
+    def add_rule(
+        self,
+        rule_id: str,
+        patterns: Iterable[str] = (),
+        keywords: Iterable[str] = (),
+    ) -> None:
+        """Add or replace a rule; the scanner recompiles on its next scan."""
+        self._rules[rule_id] = (list(patterns), list(keywords))
+        self._compiled = None
+
+    def remove_rule(self, rule_id: str) -> None:
+        if self._rules.pop(rule_id, None) is not None:
+            self._compiled = None
+
+    def clear(self) -> None:
+        self._rules.clear()
+        self._compiled = None
+
+    def compile(self) -> None:
+        """Build the literal tables and regexes now instead of on first scan."""
+        if self._compiled is not None:
+            return
+        regexes: List[_Regex] = []
+        keywords: List[Tuple[str, str, str]] = []
+        folded: Set[str] = set()
+        exact: Set[str] = set()
+
+        for rule_id, (patterns, rule_keywords) in self._rules.items():
+            for source in patterns:
+                compiled = re.compile(source, self.flags)
+                literals = required_literals(compiled)
+                is_folded = bool(compiled.flags & re.IGNORECASE)
+                if literals is not None:
+                    (folded if is_folded else exact).update(literals)
+                regexes.append(_Regex(rule_id, source, compiled, literals, is_folded))
+            for keyword in rule_keywords:
+                key = keyword.lower() if self.ignore_case_keywords else keyword
+                (folded if self.ignore_case_keywords else exact).add(key)
+                keywords.append((rule_id, keyword, key))
+
+        self._compiled = (
+            regexes,
+            keywords,
+            _LiteralTable(folded) if folded else None,
+            _LiteralTable(exact) if exact else None,
+        )
+
+    def scan(self, text: str, find_all: bool = True, pos: int = 0) -> ScanResult:
+        """
+        Scan ``text`` once for every rule.
+
+        With ``find_all`` each regex reports all ``re.finditer`` matches;
+        otherwise only its first match, as ``re.search`` would. Regexes start
+        matching at ``pos`` (``\\b`` and lookbehinds still see the text
+        before it); keywords are always tested against the whole text.
+        """
+        self.compile()
+        regexes, keywords, folded_table, exact_table = self._compiled
+        folded = folded_table.present(text.lower()) if folded_table else set()
+        exact = exact_table.present(text) if exact_table else set()
+        ascii_text = text.isascii()
+        result = ScanResult()
+
+        for rule_id, keyword, key in keywords:
+            if key in (folded if self.ignore_case_keywords else exact):
+                result.keywords.setdefault(rule_id, []).append(keyword)
+
+        for regex in regexes:
+            if regex.literals is not None:
+                if regex.folded:
+                    if ascii_text and regex.literals.isdisjoint(folded):
+                        continue
+                elif regex.literals.isdisjoint(exact):
+                    continue
+            if find_all:
+                hits = [
+                    RegexHit(regex.source, m.start(), m.end(), m.group())
+                    for m in regex.compiled.finditer(text, pos)
+                ]
+            else:
+                m = regex.compiled.search(text, pos)
+                hits = (
+                    [RegexHit(regex.source, m.start(), m.end(), m.group())] if m else []
+                )
+            if hits:
+                result.matches.setdefault(regex.rule_id, []).extend(hits)
+
+        return result
@@ -15,6 +15,8 @@ from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any, Callable, Dict, List, Optional
 
+from .latency_control import CancellationToken, current_cancellation_token
+
 
 class ChunkingStrategy(Enum):
     """Strategies for document chunking."""
@@ -699,11 +701,18 @@ class HybridRetriever:
         mode: RetrievalMode = RetrievalMode.HYBRID,
         expand_query: bool = True,
         rerank: bool = True,
+        cancellation_token: Optional[CancellationToken] = None,
     ) -> RetrievalResult:
-        """Retrieve relevant documents."""
+        """
+        Retrieve relevant documents.
+
+        Polls the cancellation token (or the current deadline's token) between
+        stages and while scoring, raising OperationCancelledError if cancelled.
+        """
         import time
 
         start_time = time.time()
+        token = cancellation_token or current_cancellation_token()
 
         # Query expansion
         expansion = None
@@ -714,9 +723,12 @@ class HybridRetriever:
         if mode == RetrievalMode.DENSE:
             documents = self._dense_retrieve(query, top_k * 2)
         elif mode == RetrievalMode.SPARSE:
-            documents = self._sparse_retrieve(query, expansion, top_k * 2)
+            documents = self._sparse_retrieve(query, expansion, top_k * 2, token)
         else:  # HYBRID
-            documents = self._hybrid_retrieve(query, expansion, top_k * 2)
+            documents = self._hybrid_retrieve(query, expansion, top_k * 2, token)
+
+        if token is not None:
+            token.raise_if_cancelled()
 
         # Rerank if enabled
         if rerank and documents:
@@ -742,7 +754,11 @@ class HybridRetriever:
         return []
 
     def _sparse_retrieve(
-        self, query: str, expansion: Optional[QueryExpansion], top_k: int
+        self,
+        query: str,
+        expansion: Optional[QueryExpansion],
+        top_k: int,
+        token: Optional[CancellationToken] = None,
     ) -> List[RetrievedDocument]:
         """Sparse retrieval using BM25."""
         query_tokens = query.lower().split()
@@ -753,7 +769,9 @@ class HybridRetriever:
 
         # Score all documents
         scores = []
-        for doc_id in self._documents:
+        for i, doc_id in enumerate(self._documents):
+            if token is not None and i % 256 == 0:
+                token.raise_if_cancelled()
             score = self.bm25.score(doc_id, query_tokens)
             scores.append((doc_id, score))
 
@@ -776,12 +794,16 @@ class HybridRetriever:
         return results
 
     def _hybrid_retrieve(
-        self, query: str, expansion: Optional[QueryExpansion], top_k: int
+        self,
+        query: str,
+        expansion: Optional[QueryExpansion],
+        top_k: int,
+        token: Optional[CancellationToken] = None,
     ) -> List[RetrievedDocument]:
         """Hybrid retrieval with reciprocal rank fusion."""
         # Get results from both methods
         dense_results = self._dense_retrieve(query, top_k)
-        sparse_results = self._sparse_retrieve(query, expansion, top_k)
+        sparse_results = self._sparse_retrieve(query, expansion, top_k, token)
 
         # Compute RRF scores
         rrf_scores: Dict[str, float] = {}
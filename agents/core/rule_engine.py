@@ -14,6 +14,8 @@ from datetime import datetime
 from enum import Enum
 from typing import Any, Dict, List, Optional, Set
 
+from .latency_control import CancellationToken, current_cancellation_token
+
 
 class ProofStatus(Enum):
     """Status of a proof attempt."""
@@ -253,13 +255,23 @@ class RuleEngine:
             return rule
         return None
 
-    def forward_chain(self, max_iterations: int = 100) -> List[Predicate]:
+    def forward_chain(
+        self,
+        max_iterations: int = 100,
+        cancellation_token: Optional[CancellationToken] = None,
+    ) -> List[Predicate]:
         """
         Forward chaining inference.
 
         Derives all possible conclusions from current facts and rules.
         Returns list of newly derived facts.
+
+        The cancellation token (or the one installed by a deadline-bounded
+        LatencyController call) is polled per rule; on cancellation
+        OperationCancelledError is raised and facts from completed iterations
+        are kept.
         """
+        token = cancellation_token or current_cancellation_token()
         derived = []
         iterations = 0
 
@@ -267,6 +279,8 @@ class RuleEngine:
             new_facts = []
 
             for rule in self.rules:
+                if token is not None:
+                    token.raise_if_cancelled()
                 # Try to match all antecedents
                 bindings = self._match_antecedents(rule.antecedents, {})
 
@@ -13,7 +13,9 @@ import re
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Any, Callable, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from .pattern_scanner import PatternScanner, max_width
 
 
 class ErrorSeverity(Enum):
@@ -156,19 +158,32 @@ class PIIDetector:
         }
 
         self.redaction_placeholder = "[REDACTED]"
-
-    def detect(self, text: str) -> List[Tuple[str, str, int, int]]:
+        self._scanner = PatternScanner(flags=re.IGNORECASE)
+        self._scanned_patterns: Dict[str, str] = {}
+
+    @property
+    def scanner(self) -> PatternScanner:
+        """Compiled scanner, rebuilt when ``patterns`` has been changed."""
+        if self._scanned_patterns != self.patterns:
+            self._scanner.clear()
+            for pii_type, pattern in self.patterns.items():
+                self._scanner.add_rule(pii_type, [pattern])
+            self._scanned_patterns = dict(self.patterns)
+        return self._scanner
+
+    def detect(self, text: str, pos: int = 0) -> List[Tuple[str, str, int, int]]:
         """
-        Detect PII in text.
+        Detect PII in text, starting at index ``pos``.
 
         Returns:
             List of (pii_type, matched_text, start, end)
         """
         findings = []
+        scan = self.scanner.scan(text, pos=pos)
 
-        for pii_type, pattern in self.patterns.items():
-            for match in re.finditer(pattern, text, re.IGNORECASE):
-                findings.append((pii_type, match.group(), match.start(), match.end()))
+        for pii_type in self.patterns:
+            for hit in scan.matches.get(pii_type, []):
+                findings.append((pii_type, hit.text, hit.start, hit.end))
 
         return findings
 
@@ -180,18 +195,34 @@ class PIIDetector:
             (redacted_text, list of pii types found)
         """
         findings = self.detect(text)
+        redacted = self.apply_redactions(text, findings)
+        return redacted, list({pii_type for pii_type, *_ in findings})
 
-        # Sort by position (reverse) to maintain indices
-        findings.sort(key=lambda x: x[2], reverse=True)
-
-        redacted = text
-        types_found = set()
-
-        for pii_type, matched, start, end in findings:
-            redacted = redacted[:start] + self.redaction_placeholder + redacted[end:]
-            types_found.add(pii_type)
+    def apply_redactions(
+        self,
+        text: str,
+        findings: List[Tuple[str, str, int, int]],
+        start: int = 0,
+        end: Optional[int] = None,
+    ) -> str:
+        """
+        Replace the findings in ``text[start:end]`` with the placeholder.
 
-        return redacted, list(types_found)
+        Built in one pass over the findings in position order; overlapping
+        findings are merged into a single placeholder.
+        """
+        end = len(text) if end is None else end
+        pieces = []
+        pos = start
+        for _pii_type, _matched, match_start, match_end in sorted(
+            findings, key=lambda f: f[2]
+        ):
+            if match_start >= pos:
+                pieces.append(text[pos:match_start])
+                pieces.append(self.redaction_placeholder)
+            pos = max(pos, match_end)
+        pieces.append(text[pos:end])
+        return "".join(pieces)
 
 
 class ContentPolicyChecker:
@@ -219,38 +250,57 @@ class ContentPolicyChecker:
             (r"\b(all|every)\s+\w+\s+(are|is)\s+\w+\b", "stereotype"),
         ]
 
+        self._scanner = PatternScanner(flags=re.IGNORECASE)
+        self._scanned_rules: Tuple[list, list] = ([], [])
+
+    @property
+    def scanner(self) -> PatternScanner:
+        """Compiled scanner, rebuilt when the pattern lists have been changed."""
+        rules = (self.harmful_patterns, self.bias_patterns)
+        if self._scanned_rules != rules:
+            self._scanner.clear()
+            for kind, patterns in zip(("harmful", "bias"), rules):
+                for i, (pattern, _label) in enumerate(patterns):
+                    self._scanner.add_rule(f"{kind}:{i}", [pattern])
+            self._scanned_rules = (list(rules[0]), list(rules[1]))
+        return self._scanner
+
     def check(self, content: str) -> List[PolicyViolation]:
         """Check content against policies."""
         violations = []
+        scan = self.scanner.scan(content)
 
-        # Check harmful content
-        for pattern, category in self.harmful_patterns:
-            for match in re.finditer(pattern, content, re.IGNORECASE):
-                violations.append(
-                    PolicyViolation(
-                        violation_type=PolicyType.HARMFUL_CONTENT,
-                        description=f"Potentially harmful content: {category}",
-                        severity=ErrorSeverity.CRITICAL,
-                        location=match.group(),
-                        auto_fixable=False,
-                    )
-                )
-
-        # Check bias
-        for pattern, bias_type in self.bias_patterns:
-            for match in re.finditer(pattern, content, re.IGNORECASE):
-                violations.append(
-                    PolicyViolation(
-                        violation_type=PolicyType.BIAS,
-                        description=f"Potential bias detected: {bias_type}",
-                        severity=ErrorSeverity.WARNING,
-                        location=match.group(),
-                        auto_fixable=False,
-                    )
-                )
+        for kind, patterns in (
+            ("harmful", self.harmful_patterns),
+            ("bias", self.bias_patterns),
+        ):
+            for i in range(len(patterns)):
+                rule_id = f"{kind}:{i}"
+                for hit in scan.matches.get(rule_id, []):
+                    violations.append(self._violation(rule_id, hit.text))
 
         return violations
 
+    def _violation(self, rule_id: str, location: str) -> PolicyViolation:
+        kind, index = rule_id.split(":")
+        if kind == "harmful":
+            category = self.harmful_patterns[int(index)][1]
+            return PolicyViolation(
+                violation_type=PolicyType.HARMFUL_CONTENT,
+                description=f"Potentially harmful content: {category}",
+                severity=ErrorSeverity.CRITICAL,
+                location=location,
+                auto_fixable=False,
+            )
+        bias_type = self.bias_patterns[int(index)][1]
+        return PolicyViolation(
+            violation_type=PolicyType.BIAS,
+            description=f"Potential bias detected: {bias_type}",
+            severity=ErrorSeverity.WARNING,
+            location=location,
+            auto_fixable=False,
+        )
+
 
 class InputSanitizer:
     """
@@ -366,6 +416,157 @@ class OutputGuard:
 
         return is_safe, sanitized, warnings
 
+    def stream(
+        self, sink: Optional[Callable[[str], None]] = None, max_window: int = 64
+    ) -> "StreamingOutputGuard":
+        """Create a streaming guard with this guard's detectors and settings."""
+        return StreamingOutputGuard(
+            sink=sink,
+            pii_detector=self.pii_detector,
+            policy_checker=self.policy_checker,
+            block_on_pii=self.block_on_pii,
+            block_on_harmful=self.block_on_harmful,
+            max_window=max_window,
+        )
+
+
+class StreamingOutputGuard:
+    """
+    Guards a token stream before emission.
+
+    Sits between the model stream and a sink such as
+    ``ui_hooks.StreamHandler.stream_token``. Only a carry-over window as
+    long as the longest pattern match is held back; everything before it is
+    scanned, redacted and released on each ``feed``, so matches that span
+    token boundaries are still caught. Patterns with unbounded repeats are
+    assumed to match at most ``max_window`` characters. The window follows
+    the detectors' pattern sets, so patterns added mid-stream are covered.
+
+    Once a harmful-content match is found the stream is blocked and nothing
+    further is released.
+    """
+
+    def __init__(
+        self,
+        sink: Optional[Callable[[str], None]] = None,
+        pii_detector: Optional[PIIDetector] = None,
+        policy_checker: Optional[ContentPolicyChecker] = None,
+        block_on_pii: bool = True,
+        block_on_harmful: bool = True,
+        max_window: int = 64,
+    ):
+        self.sink = sink
+        self.pii_detector = pii_detector or PIIDetector()
+        self.policy_checker = policy_checker or ContentPolicyChecker()
+        self.block_on_pii = block_on_pii
+        self.block_on_harmful = block_on_harmful
+        self.max_window = max_window
+        self._window_patterns: Optional[Tuple[str, ...]] = None
+        self._window = 0
+
+        self.blocked = False
+        self.pii_count = 0
+        self.pii_types: Set[str] = set()
+        self.violations: List[PolicyViolation] = []
+        # Released text kept as lookbehind context, then the held-back tail
+        self._buffer = ""
+        self._released = 0
+
+    def feed(self, token: str) -> str:
+        """Add a token; returns (and sends to the sink) the text now safe."""
+        if self.blocked:
+            return ""
+        self._buffer += token
+        return self._drain(final=False)
+
+    def close(self) -> str:
+        """End of stream: release the held-back tail."""
+        if self.blocked:
+            return ""
+        released = self._drain(final=True)
+        self._buffer = ""
+        self._released = 0
+        return released
+
+    @property
+    def window(self) -> int:
+        """Characters held back, recomputed when the pattern sets change."""
+        patterns = tuple(self.pii_detector.patterns.values()) + tuple(
+            pattern
+            for pattern, _ in self.policy_checker.harmful_patterns
+            + self.policy_checker.bias_patterns
+        )
+        if patterns != self._window_patterns:
+            widths = [max_width(re.compile(p, re.IGNORECASE)) for p in patterns]
+            limit = self.max_window
+            # One extra character so a trailing \b sees what follows the match
+            self._window = max((min(w or limit, limit) for w in widths), default=0) + 1
+            self._window_patterns = patterns
+        return self._window
+
+    @property
+    def warnings(self) -> List[str]:
+        """Warnings in the format of ``OutputGuard.check``."""
+        warnings = []
+        if self.pii_count:
+            action = "redacted from" if self.block_on_pii else "detected in"
+            warnings.append(f"PII {action} output: {self.pii_count} instances")
+        for v in self.violations:
+            if v.severity == ErrorSeverity.CRITICAL and self.block_on_harmful:
+                warnings.append(f"Blocked: {v.description}")
+            else:
+                warnings.append(f"Policy warning: {v.description}")
+        return warnings
+
+    def _drain(self, final: bool) -> str:
+        buffer, start, window = self._buffer, self._released, self.window
+        cut = len(buffer) if final else len(buffer) - window
+        if cut <= start:
+            return ""
+
+        findings = self.pii_detector.detect(buffer, pos=start)
+        scan = self.policy_checker.scanner.scan(buffer, pos=start)
+        policy_hits = [
+            (rule_id, hit) for rule_id, hits in scan.matches.items() for hit in hits
+        ]
+
+        # Never split a match: resuming the scan at the cut must see it whole
+        spans = [(f[2], f[3]) for f in findings]
+        spans += [(hit.start, hit.end) for _, hit in policy_hits]
+        for span_start, span_end in sorted(spans, reverse=True):
+            if span_start < cut < span_end:
+                cut = span_start
+        if cut <= start:
+            return ""
+
+        for rule_id, hit in sorted(policy_hits, key=lambda h: h[1].start):
+            if hit.start >= cut:
+                continue
+            violation = self.policy_checker._violation(rule_id, hit.text)
+            self.violations.append(violation)
+            if violation.severity == ErrorSeverity.CRITICAL and self.block_on_harmful:
+                self.blocked = True
+        if self.blocked:
+            self._buffer = ""
+            return ""
+
+        released_findings = [f for f in findings if f[2] < cut]
+        self.pii_count += len(released_findings)
+        self.pii_types.update(f[0] for f in released_findings)
+        if self.block_on_pii:
+            released = self.pii_detector.apply_redactions(
+                buffer, released_findings, start, cut
+            )
+        else:
+            released = buffer[start:cut]
+
+        keep = max(cut - window, 0)
+        self._buffer = buffer[keep:]
+        self._released = cut - keep
+        if released and self.sink is not None:
+            self.sink(released)
+        return released
+
 
 class ToolArgsSanitizer:
     """
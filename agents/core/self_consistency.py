@@ -6,14 +6,17 @@ Provides multi-sample self-consistency:
 - Vote/rerank with majority or logit-based scoring
 - Hallucination reduction through consensus
 - Chain-of-Verification (CoVe) patterns
+- Adaptive sampling: concurrent chain producers with sequential early stopping
 """
 
+import asyncio
 import hashlib
 import math
 import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Callable, Dict, List, Optional, Tuple
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 
 
 class VotingMethod(Enum):
@@ -135,6 +138,49 @@ class AnswerNormalizer:
         return normalized
 
 
+class VoteTally:
+    """
+    Running per-answer vote counts for adaptive sampling.
+
+    Chains are added as they arrive; ``posterior_agreement()`` is the
+    sequential test statistic used to decide whether sampling can stop.
+    """
+
+    def __init__(self, normalizer: AnswerNormalizer):
+        self.normalizer = normalizer
+        self.counts: Dict[str, int] = {}
+        self.total = 0
+
+    def add(self, chain: ReasoningChain) -> str:
+        """Count a chain's conclusion and return its normalized answer."""
+        answer = self.normalizer.normalize(chain.conclusion)
+        self.counts[answer] = self.counts.get(answer, 0) + 1
+        self.total += 1
+        return answer
+
+    def leader(self) -> Tuple[str, int, int]:
+        """Leading answer with its count and the runner-up's count."""
+        if not self.counts:
+            return "", 0, 0
+        ranked = sorted(self.counts.items(), key=lambda x: x[1], reverse=True)
+        runner_up = ranked[1][1] if len(ranked) > 1 else 0
+        return ranked[0][0], ranked[0][1], runner_up
+
+    def posterior_agreement(self) -> float:
+        """
+        Posterior probability that the leading answer is the true majority.
+
+        With a uniform prior on the leader's share p among the two top
+        answers, p | votes ~ Beta(a + 1, b + 1) for leader count a and
+        runner-up count b, and P(p > 1/2) = P(Binomial(a + b + 1, 1/2) <= a).
+        """
+        _, a, b = self.leader()
+        if a == 0:
+            return 0.0
+        n = a + b + 1
+        return sum(math.comb(n, i) for i in range(a + 1)) / 2**n
+
+
 class SelfConsistencyVoter:
     """
     Aggregates multiple reasoning chains through voting.
@@ -230,6 +276,14 @@ class SelfConsistencyVoter:
         self._set_cached(cache_key, result)
         return result
 
+    def new_tally(self) -> VoteTally:
+        """Start an incremental tally using this voter's normalizer."""
+        return VoteTally(self.normalizer)
+
+    def should_terminate(self, tally: VoteTally) -> bool:
+        """True once the leader's posterior agreement passes the threshold."""
+        return tally.posterior_agreement() >= self.early_termination_threshold
+
     def _compute_cache_key(self, chains: List[ReasoningChain]) -> str:
         """Compute cache key from chain fingerprints."""
         fps = sorted(c.fingerprint() for c in chains)
@@ -723,6 +777,44 @@ class SelfConsistencyConfig:
     temperature: float = 0.7
     enable_verification: bool = True
     max_latency_ms: float = 5000.0
+    # Adaptive sampling: producers in flight at once, and the posterior
+    # agreement at which the remaining producers are cancelled.
+    max_concurrency: int = 2
+    early_termination_threshold: float = 0.95
+
+
+@dataclass
+class SamplingReport:
+    """What an adaptive run sampled and what early stopping saved."""
+
+    requested: int
+    launched: int = 0
+    completed: int = 0
+    failed: int = 0
+    cancelled: int = 0  # in flight when sampling stopped
+    early_stopped: bool = False
+    posterior_agreement: float = 0.0
+
+    @property
+    def chains_saved(self) -> int:
+        """Chains that were never started."""
+        return self.requested - self.launched
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "requested": self.requested,
+            "launched": self.launched,
+            "completed": self.completed,
+            "failed": self.failed,
+            "cancelled": self.cancelled,
+            "chains_saved": self.chains_saved,
+            "early_stopped": self.early_stopped,
+            "posterior_agreement": self.posterior_agreement,
+        }
+
+
+ChainProducer = Callable[[int], ReasoningChain]
+AsyncChainProducer = Callable[[int], Awaitable[ReasoningChain]]
 
 
 class SelfConsistencyPipeline:
@@ -737,9 +829,16 @@ class SelfConsistencyPipeline:
         self.voter = SelfConsistencyVoter(
             method=self.config.voting_method,
             consensus_threshold=self.config.consensus_threshold,
+            early_termination_threshold=self.config.early_termination_threshold,
         )
         self.verifier = ChainOfVerification()
         self.hallucination_detector = HallucinationDetector()
+        self._sampling_totals = {
+            "runs": 0,
+            "requested": 0,
+            "launched": 0,
+            "early_stopped": 0,
+        }
 
     def process(
         self, chains: List[ReasoningChain], context: Optional[Dict[str, Any]] = None
@@ -751,7 +850,156 @@ class SelfConsistencyPipeline:
         """
         # Step 1: Vote for best answer
         consistency_result = self.voter.aggregate(chains)
+        return self._finish(consistency_result, context)
 
+    def process_adaptive(
+        self,
+        producer: ChainProducer,
+        context: Optional[Dict[str, Any]] = None,
+        num_samples: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """
+        Sample chains on a thread pool, stopping once the vote is settled.
+
+        ``producer(i)`` generates the i-th chain. Up to
+        ``config.max_concurrency`` producers run at once; each finished chain
+        updates a VoteTally, and as soon as the leader's posterior agreement
+        reaches ``config.early_termination_threshold`` no further producers
+        are started and queued ones are cancelled (running threads are left
+        to finish in the background and their chains are discarded).
+
+        Returns the process() result plus ``sampling`` (SamplingReport dict).
+        """
+        requested = num_samples or self.config.num_samples
+        report = SamplingReport(requested=requested)
+        tally = self.voter.new_tally()
+        chains: Dict[int, ReasoningChain] = {}
+
+        executor = ThreadPoolExecutor(
+            max_workers=max(1, self.config.max_concurrency),
+            thread_name_prefix="self-consistency",
+        )
+        pending: Dict[Any, int] = {}
+        try:
+            while True:
+                while (
+                    not report.early_stopped
+                    and report.launched < requested
+                    and len(pending) < max(1, self.config.max_concurrency)
+                ):
+                    pending[executor.submit(producer, report.launched)] = (
+                        report.launched
+                    )
+                    report.launched += 1
+                if not pending:
+                    break
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    index = pending.pop(future)
+                    if future.exception() is not None:
+                        report.failed += 1
+                        continue
+                    self._accept(future.result(), index, chains, tally, report)
+                if report.early_stopped:
+                    report.cancelled = len(pending)
+                    break
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        return self._finish_adaptive(chains, context, report)
+
+    async def process_adaptive_async(
+        self,
+        producer: AsyncChainProducer,
+        context: Optional[Dict[str, Any]] = None,
+        num_samples: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """
+        Async process_adaptive(): producers are coroutines.
+
+        In-flight producers are cancelled when sampling stops early.
+        """
+        requested = num_samples or self.config.num_samples
+        report = SamplingReport(requested=requested)
+        tally = self.voter.new_tally()
+        chains: Dict[int, ReasoningChain] = {}
+
+        pending: Dict[asyncio.Task, int] = {}
+        try:
+            while True:
+                while (
+                    not report.early_stopped
+                    and report.launched < requested
+                    and len(pending) < max(1, self.config.max_concurrency)
+                ):
+                    task = asyncio.ensure_future(producer(report.launched))
+                    pending[task] = report.launched
+                    report.launched += 1
+                if not pending:
+                    break
+                done, _ = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    index = pending.pop(task)
+                    if task.exception() is not None:
+                        report.failed += 1
+                        continue
+                    self._accept(task.result(), index, chains, tally, report)
+                if report.early_stopped:
+                    report.cancelled = len(pending)
+                    break
+        finally:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+        return self._finish_adaptive(chains, context, report)
+
+    def sampling_stats(self) -> Dict[str, Any]:
+        """Cumulative chains-saved metrics across adaptive runs."""
+        totals = dict(self._sampling_totals)
+        totals["chains_saved"] = totals["requested"] - totals["launched"]
+        totals["savings_rate"] = totals["chains_saved"] / max(1, totals["requested"])
+        return totals
+
+    def _accept(
+        self,
+        chain: ReasoningChain,
+        index: int,
+        chains: Dict[int, ReasoningChain],
+        tally: VoteTally,
+        report: SamplingReport,
+    ) -> None:
+        """Fold a finished chain into the tally and apply the stopping rule."""
+        chains[index] = chain
+        tally.add(chain)
+        report.completed += 1
+        report.posterior_agreement = tally.posterior_agreement()
+        if report.completed < report.requested and self.voter.should_terminate(tally):
+            report.early_stopped = True
+
+    def _finish_adaptive(
+        self,
+        chains: Dict[int, ReasoningChain],
+        context: Optional[Dict[str, Any]],
+        report: SamplingReport,
+    ) -> Dict[str, Any]:
+        self._sampling_totals["runs"] += 1
+        self._sampling_totals["requested"] += report.requested
+        self._sampling_totals["launched"] += report.launched
+        self._sampling_totals["early_stopped"] += int(report.early_stopped)
+
+        # Aggregate in producer order so ties resolve as in process().
+        ordered = [chains[i] for i in sorted(chains)]
+        result = self._finish(self.voter.aggregate(ordered), context)
+        result["sampling"] = report.to_dict()
+        return result
+
+    def _finish(
+        self, consistency_result: ConsistencyResult, context: Optional[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """Verify, hallucination-check and score a voting result."""
         # Step 2: Verify the winning answer
         verification = None
         if self.config.enable_verification:
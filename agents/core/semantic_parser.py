@@ -7,12 +7,33 @@ Better parsing/grounding with:
 - Domain ontology integration
 - Confidence calibration
 - Fallback strategies when parsing fails
+
+Pattern tables are compiled once per process into shared PatternSets; the
+sentence grammar is a single combined regex. logic.grounding.SemanticParser
+uses the same engine for quantifier and modality detection.
 """
 
 import re
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Dict, List, Optional, Set
+from functools import lru_cache
+from typing import (
+    Any,
+    Dict,
+    Hashable,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
+
+from ..utils.lru import LRUCache
+
+_CONJUNCTIONS = re.compile(r"\s+(?:and|but|or)\s+", re.IGNORECASE)
+_WORDS = re.compile(r"\b\w+\b")
 
 
 class QuantifierType(Enum):
@@ -104,6 +125,79 @@ class DomainOntology:
         )
 
 
+class PatternSet:
+    """
+    Ordered regex rules compiled into one alternation of named groups.
+
+    - match(): the first rule, in order, matching at the start of the text,
+      as trying each rule's ``match`` in turn would, found by a single match
+      of the combined regex
+    - search(): the label of the first rule, in order, matching anywhere in
+      the text. A combined scan would find the leftmost match rather than
+      the highest-priority one (and is slower than a few literal-prefixed
+      searches), so the compiled rules are searched in order.
+    - matches_any(): whether any rule matches anywhere in the text
+
+    Rules must not use named groups or numbered backreferences.
+    """
+
+    def __init__(
+        self, rules: Sequence[Tuple[str, Hashable]], flags: int = re.IGNORECASE
+    ):
+        self.rules = tuple(rules)
+        self._compiled = tuple(
+            (re.compile(pattern, flags), label) for pattern, label in self.rules
+        )
+        # Rule i is the named group "_i" with its own groups right after it;
+        # being outermost, it is the match's lastindex
+        self._by_group: Dict[int, Tuple[Hashable, int, int]] = {}
+        alternatives = []
+        group = 1
+        for index, (compiled, label) in enumerate(self._compiled):
+            self._by_group[group] = (label, group, group + compiled.groups)
+            alternatives.append(f"(?P<_{index}>{compiled.pattern})")
+            group += 1 + compiled.groups
+        self._combined = re.compile("|".join(alternatives) or "(?!)", flags)
+
+    def match(self, text: str) -> Optional[Tuple[Hashable, Tuple[Any, ...]]]:
+        """(label, groups) of the first rule matching at the start of text."""
+        m = self._combined.match(text)
+        if m is None:
+            return None
+        label, start, end = self._by_group[m.lastindex]
+        return label, m.groups()[start:end]
+
+    def search(self, text: str, default: Any = None) -> Any:
+        """Label of the highest-priority rule matching anywhere in text."""
+        for compiled, label in self._compiled:
+            if compiled.search(text):
+                return label
+        return default
+
+    def matches_any(self, text: str) -> bool:
+        """Whether any rule matches anywhere in text."""
+        return any(compiled.search(text) for compiled, _ in self._compiled)
+
+
+@lru_cache(maxsize=None)
+def compile_pattern_set(
+    rules: Tuple[Tuple[str, Hashable], ...], flags: int = re.IGNORECASE
+) -> PatternSet:
+    """Compile a rule table once per process."""
+    return PatternSet(rules, flags)
+
+
+def keyword_rules(keywords: Mapping[str, Hashable]) -> Tuple[Tuple[str, Hashable], ...]:
+    """Whole-word rules for a {keyword: label} table, in table order."""
+    return tuple(
+        (rf"\b{re.escape(keyword)}\b", label) for keyword, label in keywords.items()
+    )
+
+
+class ParseCache(LRUCache):
+    """Thread-safe LRU cache of parse results keyed by stripped text."""
+
+
 class EnhancedSemanticParser:
     """
     Enhanced semantic parser with confidence calibration
@@ -161,25 +255,27 @@ class EnhancedSemanticParser:
         (r"^(.+?)\s+because\s+(.+)$", "because"),
     ]
 
-    def __init__(self, ontology: Optional[DomainOntology] = None):
+    def __init__(
+        self, ontology: Optional[DomainOntology] = None, cache_size: int = 1024
+    ):
         self.ontology = ontology
-        self.parse_cache: Dict[str, ParseResult] = {}
+        self.parse_cache = ParseCache(max_entries=cache_size)
         self._compile_patterns()
 
     def _compile_patterns(self) -> None:
-        """Compile regex patterns for efficiency."""
-        self.compiled_quantifiers = {
-            re.compile(p, re.IGNORECASE): q for p, q in self.QUANTIFIER_PATTERNS.items()
-        }
-        self.compiled_modality = {
-            re.compile(p, re.IGNORECASE): m for p, m in self.MODALITY_PATTERNS.items()
-        }
-        self.compiled_negation = [
-            re.compile(p, re.IGNORECASE) for p in self.NEGATION_PATTERNS
-        ]
-        self.compiled_sentences = [
-            (re.compile(p, re.IGNORECASE), name) for p, name in self.SENTENCE_PATTERNS
-        ]
+        """Compile each pattern table into one shared PatternSet."""
+        self.compiled_quantifiers = compile_pattern_set(
+            tuple(self.QUANTIFIER_PATTERNS.items())
+        )
+        self.compiled_modality = compile_pattern_set(
+            tuple(self.MODALITY_PATTERNS.items())
+        )
+        self.compiled_negation = compile_pattern_set(
+            tuple((p, True) for p in self.NEGATION_PATTERNS)
+        )
+        self.compiled_sentences = compile_pattern_set(
+            tuple((p, name) for p, name in self.SENTENCE_PATTERNS)
+        )
 
     def parse(self, text: str) -> ParseResult:
         """
@@ -193,9 +289,20 @@ class EnhancedSemanticParser:
         text = text.strip()
 
         # Check cache
-        if text in self.parse_cache:
-            return self.parse_cache[text]
+        result = self.parse_cache.get(text)
+        if result is None:
+            result = self._parse_uncached(text)
+            self.parse_cache.put(text, result)
+        return result
+
+    def parse_batch(self, texts: Iterable[str]) -> List[ParseResult]:
+        """Parse many texts, each distinct (stripped) text only once."""
+        stripped = [text.strip() for text in texts]
+        parsed = {text: self.parse(text) for text in dict.fromkeys(stripped)}
+        return [parsed[text] for text in stripped]
 
+    def _parse_uncached(self, text: str) -> ParseResult:
+        """Run the parsing cascade on stripped text."""
         parse_path = []
 
         # Strategy 1: Pattern matching
@@ -203,7 +310,6 @@ class EnhancedSemanticParser:
         if result.success and result.confidence >= ParseConfidence.HIGH.value:
             parse_path.append("pattern_match")
             result.parse_path = parse_path
-            self.parse_cache[text] = result
             return result
 
         # Strategy 2: Compositional parsing
@@ -211,7 +317,6 @@ class EnhancedSemanticParser:
         result = self._try_compositional(text)
         if result.success and result.confidence >= ParseConfidence.MEDIUM.value:
             result.parse_path = parse_path
-            self.parse_cache[text] = result
             return result
 
         # Strategy 3: Fallback extraction
@@ -219,20 +324,20 @@ class EnhancedSemanticParser:
         result = self._fallback_parse(text)
         result.fallback_used = True
         result.parse_path = parse_path
-        self.parse_cache[text] = result
         return result
 
     def _try_pattern_match(self, text: str) -> ParseResult:
         """Try to match against known sentence patterns."""
-        for pattern, pattern_name in self.compiled_sentences:
-            match = pattern.match(text)
-            if match:
-                return self._handle_pattern(pattern_name, match, text)
+        # One match of the combined grammar picks the first pattern that fits
+        matched = self.compiled_sentences.match(text)
+        if matched:
+            pattern_name, groups = matched
+            return self._handle_pattern(pattern_name, groups, text)
 
         return ParseResult(success=False, frames=[], confidence=0.0)
 
     def _handle_pattern(
-        self, pattern_name: str, match: re.Match, original: str
+        self, pattern_name: str, groups: Tuple[Any, ...], original: str
     ) -> ParseResult:
         """Handle a matched pattern."""
         quantifier = self._detect_quantifier(original)
@@ -241,8 +346,8 @@ class EnhancedSemanticParser:
 
         if pattern_name == "universal_copula":
             # All X are Y
-            subject_class = match.group(2)
-            predicate_class = match.group(3)
+            subject_class = groups[1]
+            predicate_class = groups[2]
             frame = SemanticFrame(
                 predicate="IsA",
                 arguments={"subject": subject_class, "class": predicate_class},
@@ -259,8 +364,8 @@ class EnhancedSemanticParser:
 
         elif pattern_name == "existential_copula":
             # Some X are Y
-            subject_class = match.group(2)
-            predicate_class = match.group(3)
+            subject_class = groups[1]
+            predicate_class = groups[2]
             frame = SemanticFrame(
                 predicate="IsA",
                 arguments={"subject": subject_class, "class": predicate_class},
@@ -277,8 +382,8 @@ class EnhancedSemanticParser:
 
         elif pattern_name in ("simple_copula", "plural_copula"):
             # X is/are Y
-            subject = match.group(1)
-            predicate = match.group(2)
+            subject = groups[0]
+            predicate = groups[1]
             frame = SemanticFrame(
                 predicate="IsA",
                 arguments={"subject": subject, "class": predicate},
@@ -295,8 +400,8 @@ class EnhancedSemanticParser:
 
         elif pattern_name == "conditional":
             # If X then Y
-            antecedent = match.group(1)
-            consequent = match.group(2)
+            antecedent = groups[0]
+            consequent = groups[1]
 
             # Recursively parse antecedent and consequent
             ant_result = self.parse(antecedent)
@@ -332,8 +437,8 @@ class EnhancedSemanticParser:
 
         elif pattern_name == "causal":
             # X causes Y
-            cause = match.group(1)
-            effect = match.group(2)
+            cause = groups[0]
+            effect = groups[1]
             frame = SemanticFrame(
                 predicate="Causes",
                 arguments={"cause": cause, "effect": effect},
@@ -357,7 +462,7 @@ class EnhancedSemanticParser:
     def _try_compositional(self, text: str) -> ParseResult:
         """Try compositional parsing by breaking into clauses."""
         # Split on conjunctions
-        conjuncts = re.split(r"\s+(?:and|but|or)\s+", text, flags=re.IGNORECASE)
+        conjuncts = _CONJUNCTIONS.split(text)
 
         if len(conjuncts) > 1:
             frames = []
@@ -382,7 +487,7 @@ class EnhancedSemanticParser:
     def _fallback_parse(self, text: str) -> ParseResult:
         """Fallback parsing when other strategies fail."""
         # Extract key terms
-        words = re.findall(r"\b\w+\b", text)
+        words = _WORDS.findall(text)
 
         if not words:
             return ParseResult(
@@ -437,24 +542,15 @@ class EnhancedSemanticParser:
 
     def _detect_quantifier(self, text: str) -> QuantifierType:
         """Detect quantifier in text."""
-        for pattern, quant_type in self.compiled_quantifiers.items():
-            if pattern.search(text):
-                return quant_type
-        return QuantifierType.GENERIC
+        return self.compiled_quantifiers.search(text, QuantifierType.GENERIC)
 
     def _detect_modality(self, text: str) -> ModalityType:
         """Detect modality in text."""
-        for pattern, modal_type in self.compiled_modality.items():
-            if pattern.search(text):
-                return modal_type
-        return ModalityType.NONE
+        return self.compiled_modality.search(text, ModalityType.NONE)
 
     def _detect_negation(self, text: str) -> bool:
         """Detect if text contains negation."""
-        for pattern in self.compiled_negation:
-            if pattern.search(text):
-                return True
-        return False
+        return self.compiled_negation.matches_any(text)
 
     def get_parse_confidence(self, text: str) -> float:
         """Get confidence for parsing a text."""
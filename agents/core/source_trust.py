@@ -10,10 +10,16 @@ Provides source reliability and recency modeling:
 
 import math
 from abc import ABC, abstractmethod
+from array import array
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - pure-Python propagation fallback
+    np = None
 
 
 class TrustLevel(Enum):
@@ -287,6 +293,145 @@ class TrustCalculator:
         )
 
 
+class CitationGraph:
+    """
+    Citation network in compressed sparse row (CSR) form.
+
+    Row ``v`` of the matrix lists the sources citing ``v``, so one sparse
+    matrix-vector product gathers every source's incoming trust. Nodes and
+    citations are appended to flat edge buffers; citations added since the
+    CSR arrays were last read are merged into them on the next read, without
+    re-sorting the existing rows. Out-degrees count every cited source,
+    registered or not, as ``len(Source.cited_sources)``.
+    """
+
+    def __init__(self):
+        self.ids: List[str] = []
+        self.index: Dict[str, int] = {}
+        self.out_degree: List[int] = []
+        self.version = 0
+        self._citing = array("q")
+        self._cited = array("q")
+        # Citations whose citing source is not registered yet
+        self._pending: Dict[str, List[int]] = {}
+        self._csr: Optional[Tuple[Any, Any, Any]] = None
+        self._csr_nodes = 0
+        self._csr_edges = 0
+
+    @classmethod
+    def from_sources(cls, sources: Dict[str, Source]) -> "CitationGraph":
+        """Build the graph of citations between the given sources."""
+        graph = cls()
+        for sid, source in sources.items():
+            graph.add_node(sid, len(source.cited_sources))
+        for sid, source in sources.items():
+            cited = graph.index[sid]
+            for citing_id in source.cited_by:
+                citing = graph.index.get(citing_id)
+                if citing is not None:
+                    graph._citing.append(citing)
+                    graph._cited.append(cited)
+        return graph
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @property
+    def edge_count(self) -> int:
+        return len(self._citing)
+
+    def add_node(self, source_id: str, out_degree: int = 0) -> int:
+        """Add a source (no-op if present) and return its index."""
+        if source_id in self.index:
+            return self.index[source_id]
+        idx = len(self.ids)
+        self.ids.append(source_id)
+        self.index[source_id] = idx
+        self.out_degree.append(out_degree)
+        for cited in self._pending.pop(source_id, []):
+            self._citing.append(idx)
+            self._cited.append(cited)
+        self._changed()
+        return idx
+
+    def add_edge(self, citing_id: str, cited_id: str) -> None:
+        """Record that ``citing_id`` cites the registered ``cited_id``."""
+        cited = self.index[cited_id]
+        citing = self.index.get(citing_id)
+        if citing is None:
+            self._pending.setdefault(citing_id, []).append(cited)
+            return
+        self._citing.append(citing)
+        self._cited.append(cited)
+        self._changed()
+
+    def set_out_degree(self, source_id: str, out_degree: int) -> None:
+        idx = self.index[source_id]
+        if self.out_degree[idx] != out_degree:
+            self.out_degree[idx] = out_degree
+            self.version += 1
+
+    def _changed(self) -> None:
+        self.version += 1
+
+    def csr(self) -> Tuple[Any, Any, Any]:
+        """
+        ``(indptr, indices, nonempty_rows)``: the citing sources of row ``v``
+        are ``indices[indptr[v]:indptr[v + 1]]``. NumPy arrays when NumPy is
+        available, lists otherwise.
+        """
+        n = len(self.ids)
+        if (
+            self._csr is not None
+            and self._csr_nodes == n
+            and self._csr_edges == len(self._citing)
+        ):
+            return self._csr
+        if np is not None:
+            self._csr = self._merge_csr(n)
+        else:
+            self._csr = self._build_csr_python(n)
+        self._csr_nodes = n
+        self._csr_edges = len(self._citing)
+        return self._csr
+
+    def _merge_csr(self, n: int) -> Tuple[Any, Any, Any]:
+        # Slicing copies the buffers, so they stay appendable
+        start = self._csr_edges if self._csr is not None else 0
+        cited = np.frombuffer(self._cited[start:], dtype=np.int64)
+        citing = np.frombuffer(self._citing[start:], dtype=np.int64)
+        order = np.argsort(cited, kind="stable")
+        cited, citing = cited[order], citing[order]
+        counts = np.bincount(cited, minlength=n)
+
+        if self._csr is None:
+            indices = citing
+            indptr = np.zeros(n + 1, dtype=np.int64)
+        else:
+            old_indptr, old_indices, _ = self._csr
+            indptr = np.empty(n + 1, dtype=np.int64)
+            indptr[: len(old_indptr)] = old_indptr
+            indptr[len(old_indptr) :] = old_indptr[-1]
+            # New citations go to the end of their row
+            indices = np.insert(old_indices, indptr[cited + 1], citing)
+        indptr[1:] += np.cumsum(counts)
+        return indptr, indices, np.flatnonzero(np.diff(indptr))
+
+    def _build_csr_python(self, n: int) -> Tuple[Any, Any, Any]:
+        counts = [0] * n
+        for cited in self._cited:
+            counts[cited] += 1
+        indptr = [0] * (n + 1)
+        for v in range(n):
+            indptr[v + 1] = indptr[v] + counts[v]
+        fill = indptr[:-1]
+        indices = [0] * len(self._citing)
+        for citing, cited in zip(self._citing, self._cited):
+            indices[fill[cited]] = citing
+            fill[cited] += 1
+        return indptr, indices, [v for v in range(n) if counts[v]]
+
+
 class TrustPropagator:
     """Propagates trust through citation networks."""
 
@@ -295,45 +440,102 @@ class TrustPropagator:
         damping_factor: float = 0.85,
         max_iterations: int = 100,
         tolerance: float = 1e-6,
+        redistribute_dangling: bool = False,
     ):
         self.damping_factor = damping_factor
         self.max_iterations = max_iterations
         self.tolerance = tolerance
+        # Spread the trust of sources that cite nothing over all sources in
+        # proportion to base trust, instead of letting it leak out.
+        self.redistribute_dangling = redistribute_dangling
+        self.last_iterations = 0
 
     def propagate(self, sources: Dict[str, Source]) -> Dict[str, float]:
         """Propagate trust through citation network (PageRank-style)."""
-        n = len(sources)
-        if n == 0:
+        if not sources:
             return {}
+        graph = CitationGraph.from_sources(sources)
+        base = [sources[sid].base_trust for sid in graph.ids]
+        trust = self.propagate_graph(graph, base)
+        return dict(zip(graph.ids, (float(t) for t in trust)))
 
-        # Initialize with base trust
-        trust = {sid: s.base_trust for sid, s in sources.items()}
+    def propagate_graph(
+        self,
+        graph: CitationGraph,
+        base: Sequence[float],
+        initial: Optional[Sequence[float]] = None,
+    ) -> List[float]:
+        """
+        Power iteration ``t = (1 - d) * base + d * A t`` over the CSR graph,
+        where ``A`` divides each source's trust evenly over its citations.
+
+        ``initial`` warm-starts the iteration (e.g. from the previous trust
+        vector); sources beyond its length start from their base trust.
+        """
+        n = len(graph)
+        if n == 0:
+            self.last_iterations = 0
+            return []
+        start = list(initial[:n]) if initial is not None else []
+        start.extend(base[len(start) :])
+        if np is not None:
+            return self._iterate_numpy(graph, base, start).tolist()
+        return self._iterate_python(graph, base, start)
+
+    def _iterate_numpy(self, graph: CitationGraph, base, start) -> Any:
+        indptr, indices, nonempty = graph.csr()
+        d = self.damping_factor
+        base = np.asarray(base, dtype=float)
+        trust = np.asarray(start, dtype=float)
+        out_degree = np.asarray(graph.out_degree, dtype=float)
+        inv_out = np.divide(
+            1.0, out_degree, out=np.zeros_like(out_degree), where=out_degree > 0
+        )
+        dangling = out_degree == 0
+        teleport = (1 - d) * base
+        base_total = base.sum()
+        starts = indptr[nonempty]
 
+        self.last_iterations = 0
         for _ in range(self.max_iterations):
-            new_trust: Dict[str, float] = {}
-            max_delta = 0.0
-
-            for sid, source in sources.items():
-                # Base trust component
-                base = (1 - self.damping_factor) * source.base_trust
-
-                # Trust from citing sources
-                citation_sum = 0.0
-                for citing_id in source.cited_by:
-                    if citing_id in sources:
-                        citing = sources[citing_id]
-                        out_degree = len(citing.cited_sources)
-                        if out_degree > 0:
-                            citation_sum += trust[citing_id] / out_degree
-
-                new_trust[sid] = base + self.damping_factor * citation_sum
-                max_delta = max(max_delta, abs(new_trust[sid] - trust[sid]))
-
+            self.last_iterations += 1
+            flow = trust * inv_out
+            new_trust = teleport.copy()
+            if len(indices):
+                new_trust[nonempty] += d * np.add.reduceat(flow[indices], starts)
+            if self.redistribute_dangling and base_total > 0:
+                new_trust += d * trust[dangling].sum() * base / base_total
+            max_delta = float(np.max(np.abs(new_trust - trust)))
             trust = new_trust
-
             if max_delta < self.tolerance:
                 break
+        return trust
 
+    def _iterate_python(self, graph: CitationGraph, base, start) -> List[float]:
+        indptr, indices, nonempty = graph.csr()
+        d = self.damping_factor
+        n = len(graph)
+        inv_out = [1.0 / k if k > 0 else 0.0 for k in graph.out_degree]
+        dangling = [i for i, k in enumerate(graph.out_degree) if k == 0]
+        teleport = [(1 - d) * b for b in base]
+        base_total = sum(base)
+        trust = list(start)
+
+        self.last_iterations = 0
+        for _ in range(self.max_iterations):
+            self.last_iterations += 1
+            flow = [t * w for t, w in zip(trust, inv_out)]
+            new_trust = list(teleport)
+            for v in nonempty:
+                incoming = sum(flow[u] for u in indices[indptr[v] : indptr[v + 1]])
+                new_trust[v] += d * incoming
+            if self.redistribute_dangling and base_total > 0:
+                spread = d * sum(trust[u] for u in dangling) / base_total
+                new_trust = [t + spread * b for t, b in zip(new_trust, base)]
+            max_delta = max(abs(new_trust[i] - trust[i]) for i in range(n))
+            trust = new_trust
+            if max_delta < self.tolerance:
+                break
         return trust
 
 
@@ -417,7 +619,17 @@ class ConflictResolver:
 
 
 class SourceRegistry:
-    """Registry for managing sources."""
+    """
+    Registry for managing sources.
+
+    The citation graph is maintained incrementally by ``register_source``
+    and ``add_citation``, and trust scores are cached: propagation reruns
+    only when the graph or some source's base trust changed since the last
+    run, and a recorded verification only rescores that one source. Cached
+    scores keep the recency computed when they were scored. Changes made to
+    ``Source`` objects directly, rather than through the registry, require
+    ``invalidate()``.
+    """
 
     def __init__(self):
         self.sources: Dict[str, Source] = {}
@@ -425,10 +637,35 @@ class SourceRegistry:
         self.trust_calculator = TrustCalculator()
         self.trust_propagator = TrustPropagator()
         self.conflict_resolver = ConflictResolver(self.trust_calculator)
+        self._graph: Optional[CitationGraph] = CitationGraph()
+        self._trust_vector: Optional[List[float]] = None
+        self._propagated_version = -1
+        self._scores: Dict[str, TrustScore] = {}
+        self._stale_scores: Set[str] = set()
+
+    @property
+    def citation_graph(self) -> CitationGraph:
+        """The CSR citation graph, rebuilt from the sources if invalidated."""
+        if self._graph is None:
+            self._graph = CitationGraph.from_sources(self.sources)
+            self._trust_vector = None
+            self._propagated_version = -1
+        return self._graph
+
+    def invalidate(self):
+        """Drop the citation graph and all cached scores."""
+        self._graph = None
+        self._scores = {}
+        self._stale_scores.clear()
 
     def register_source(self, source: Source):
         """Register a source."""
+        replacing = source.source_id in self.sources
         self.sources[source.source_id] = source
+        if replacing or source.cited_sources or source.cited_by:
+            self.invalidate()
+        elif self._graph is not None:
+            self._graph.add_node(source.source_id)
 
     def get_source(self, source_id: str) -> Optional[Source]:
         """Get a source by ID."""
@@ -446,34 +683,51 @@ class SourceRegistry:
                 source.correct_count += 1
             else:
                 source.incorrect_count += 1
+            self._stale_scores.add(source_id)
 
     def add_citation(self, citing_id: str, cited_id: str):
         """Record a citation between sources."""
         citing = self.sources.get(citing_id)
         cited = self.sources.get(cited_id)
+        new_edge = cited is not None and citing_id not in cited.cited_by
 
         if citing:
             citing.cited_sources.add(cited_id)
         if cited:
             cited.cited_by.add(citing_id)
             cited.total_citations += 1
+            self._stale_scores.add(cited_id)
+
+        if self._graph is not None:
+            if citing:
+                self._graph.set_out_degree(citing_id, len(citing.cited_sources))
+            if new_edge:
+                self._graph.add_edge(citing_id, cited_id)
 
     def compute_trust_scores(self) -> Dict[str, TrustScore]:
         """Compute trust scores for all sources."""
-        # First propagate trust
-        propagated = self.trust_propagator.propagate(self.sources)
+        graph = self.citation_graph
+        base = [self.sources[sid].base_trust for sid in graph.ids]
 
-        # Update base trust with propagated values
-        for sid, trust in propagated.items():
-            if sid in self.sources:
+        # First propagate trust, unless nothing it depends on has changed
+        if graph.version != self._propagated_version or base != self._trust_vector:
+            propagated = self.trust_propagator.propagate_graph(
+                graph, base, initial=self._trust_vector
+            )
+            # Update base trust with propagated values
+            for sid, trust in zip(graph.ids, propagated):
                 self.sources[sid].base_trust = trust
+            self._trust_vector = propagated
+            self._propagated_version = graph.version
+            self._scores = {}
 
-        # Compute final scores
-        scores = {}
+        # Compute final scores for new and changed sources
         for sid, source in self.sources.items():
-            scores[sid] = self.trust_calculator.compute_trust(source)
+            if sid not in self._scores or sid in self._stale_scores:
+                self._scores[sid] = self.trust_calculator.compute_trust(source)
+        self._stale_scores.clear()
 
-        return scores
+        return dict(self._scores)
 
     def resolve_conflict(self, claim_ids: List[str]) -> ConflictResolution:
         """Resolve conflict between claims."""
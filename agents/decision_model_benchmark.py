@@ -0,0 +1,148 @@
+"""
+Decision Model Benchmark - Scalar vs Batch Scoring
+
+Times DecisionModel.evaluate_options() (the scalar reference path) against
+DecisionModel.evaluate_batch() for growing candidate counts, and reports the
+option count at which the batch path becomes faster. The batch path is timed
+both on DecisionOption objects (including the struct-of-arrays conversion)
+and on a prebuilt OptionBatch, as a planner producing columns would call it.
+
+Usage:
+    python agents/decision_model_benchmark.py
+    python agents/decision_model_benchmark.py --sizes 10 100 1000 --repeat 20
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from agents.core.decision_model import (
+    Citation,
+    Constraint,
+    ConstraintType,
+    DecisionModel,
+    DecisionOption,
+    OptionBatch,
+    ScoredInput,
+)
+
+DEFAULT_SIZES = [1, 5, 10, 25, 50, 100, 250, 1000, 5000]
+
+
+def make_options(n: int, seed: int = 0) -> List[DecisionOption]:
+    """Planner-like candidates with one cited input and a metadata field."""
+    rng = random.Random(seed)
+    return [
+        DecisionOption(
+            option_id=f"action_{i}",
+            name=f"Action {i}",
+            description="",
+            inputs={
+                "value": ScoredInput(
+                    "value",
+                    1.0,
+                    citations=[Citation(f"src{i}", "fact", "", rng.uniform(0.4, 1.0))],
+                )
+            },
+            raw_value=rng.uniform(0, 2),
+            cost=rng.uniform(0, 1),
+            risk_score=rng.uniform(0, 1),
+            metadata={"latency_ms": rng.uniform(0, 500)},
+        )
+        for i in range(n)
+    ]
+
+
+def make_model() -> DecisionModel:
+    model = DecisionModel()
+    model.add_constraint(Constraint.compare("budget", "cost", "<=", 0.9))
+    model.add_constraint(Constraint.compare("risk_cap", "risk_score", "<", 0.95))
+    model.add_constraint(
+        Constraint.compare(
+            "latency", "latency_ms", "<", 300, ConstraintType.SOFT, penalty=0.2
+        )
+    )
+    return model
+
+
+def best_time_ms(func: Callable[[], Any], repeat: int) -> float:
+    """Best-of-N wall time in milliseconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def benchmark(sizes: List[int], repeat: int, k: int) -> List[Dict[str, Any]]:
+    rows = []
+    for n in sizes:
+        options = make_options(n)
+        model = make_model()
+        scalar_ms = best_time_ms(lambda: model.evaluate_options(options), repeat)
+        batch_ms = best_time_ms(lambda: model.evaluate_batch(options, k=k), repeat)
+        columns = OptionBatch.from_options(options, model.profile, ["latency_ms"])
+        columns.options = None
+        soa_ms = best_time_ms(lambda: model.evaluate_batch(columns, k=k), repeat)
+        rows.append(
+            {
+                "options": n,
+                "scalar_ms": scalar_ms,
+                "batch_ms": batch_ms,
+                "soa_ms": soa_ms,
+                "speedup": scalar_ms / batch_ms if batch_ms else 0.0,
+                "soa_speedup": scalar_ms / soa_ms if soa_ms else 0.0,
+            }
+        )
+    return rows
+
+
+def crossover(rows: List[Dict[str, Any]], column: str = "batch_ms") -> Optional[int]:
+    """Smallest size from which the given batch timing stays below scalar."""
+    point = None
+    for row in reversed(rows):
+        if row[column] >= row["scalar_ms"]:
+            break
+        point = row["options"]
+    return point
+
+
+def format_table(rows: List[Dict[str, Any]]) -> str:
+    lines = [
+        "| Options | Scalar (ms) | Batch (ms) | Speedup | Batch SoA (ms) | SoA Speedup |",
+        "|---------|-------------|------------|---------|----------------|-------------|",
+    ]
+    for row in rows:
+        lines.append(
+            f"| {row['options']} | {row['scalar_ms']:.3f} | {row['batch_ms']:.3f} | "
+            f"{row['speedup']:.1f}x | {row['soa_ms']:.3f} | {row['soa_speedup']:.1f}x |"
+        )
+    return "\n".join(lines)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Decision model batch benchmark")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--k", type=int, default=10)
+    args = parser.parse_args()
+
+    rows = benchmark(args.sizes, args.repeat, args.k)
+    print(format_table(rows))
+    print()
+    for label, column in (("objects", "batch_ms"), ("prebuilt OptionBatch", "soa_ms")):
+        point = crossover(rows, column)
+        if point is None:
+            print(f"Batch scoring ({label}) was not faster at any measured size.")
+        else:
+            print(f"Crossover ({label}): batch is faster from {point} options upward.")
+
+
+if __name__ == "__main__":
+    main()
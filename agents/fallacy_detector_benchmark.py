@@ -0,0 +1,183 @@
+"""
+Fallacy Detector Benchmark - Indicator Loops vs Compiled Fallacy Index
+
+Scores a corpus of short arguments with FallacyDetector, comparing:
+
+- legacy: lowercase the joined text and test every indicator of every
+  fallacy with a substring check, as before the compiled index
+- detect: one scan of the shared FallacyIndex per argument
+- detect_batch: one scan of the whole corpus
+
+Indicators now match whole words only; the index is checked against a
+per-indicator word-boundary loop, and the arguments whose verdicts changed
+because of substring hits ("or" inside "for", "so" inside "also") are
+counted. Detector construction (shared index vs rebuilding the database per
+instance) is timed as well.
+
+Usage:
+    python agents/fallacy_detector_benchmark.py
+    python agents/fallacy_detector_benchmark.py --arguments 20000 --repeat 5
+"""
+
+import argparse
+import os
+import random
+import re
+import sys
+import time
+from typing import Any, Callable, Dict, List, Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from agents.core.fallacy_detector import (
+    FallacyDetector,
+    FallacyIndex,
+    _builtin_fallacies,
+)
+
+SENTENCES = [
+    "The sky is blue",
+    "Water reflects light",
+    "All men are mortal",
+    "Socrates is a man",
+    "Therefore Socrates is mortal",
+    "If it rains then the ground is wet",
+    "The ground is wet",
+    "Either you support us or you are against us",
+    "Everyone believes the new policy works",
+    "You can't trust a politician's economic plan",
+    "Think of the children before voting",
+    "The expert says the bridge is safe",
+    "This will lead to higher taxes for everyone",
+    "Sales rose after the advertising campaign",
+    "The committee also reviewed the budget for more details",
+    "Each engineer is competent so the whole team is competent",
+    "Obviously the forecast is correct",
+    "The majority of reviewers approved the change",
+    "When did you stop ignoring the evidence",
+    "The data shows a steady improvement in quality",
+]
+
+Argument = Tuple[str, List[str], str]
+
+
+def make_corpus(size: int, seed: int = 0) -> List[Argument]:
+    rng = random.Random(seed)
+    corpus = []
+    for _ in range(size):
+        premises = rng.sample(SENTENCES, rng.randint(1, 3))
+        conclusion = rng.choice(SENTENCES)
+        corpus.append((" ".join(premises + [conclusion]), premises, conclusion))
+    return corpus
+
+
+def legacy_detect(fallacies: Dict[str, Any], argument: Argument) -> List[str]:
+    _, premises, conclusion = argument
+    text = f"{' '.join(premises)} {conclusion}".lower()
+    return [
+        fallacy_id
+        for fallacy_id, fallacy in fallacies.items()
+        if any(indicator in text for indicator in fallacy.pattern_indicators)
+    ]
+
+
+def word_boundary_detect(fallacies: Dict[str, Any], argument: Argument) -> List[str]:
+    _, premises, conclusion = argument
+    text = f"{' '.join(premises)} {conclusion}"
+    return [
+        fallacy_id
+        for fallacy_id, fallacy in fallacies.items()
+        if any(
+            re.search(rf"(?<!\w){re.escape(indicator)}(?!\w)", text, re.IGNORECASE)
+            for indicator in fallacy.pattern_indicators
+        )
+    ]
+
+
+def best_time_ms(func: Callable[[], Any], repeat: int) -> float:
+    """Best-of-N wall time in milliseconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def benchmark(size: int, repeat: int) -> Dict[str, Any]:
+    corpus = make_corpus(size)
+    detector = FallacyDetector()
+    fallacies = detector.fallacies
+
+    detected = [[f.id for f in found] for found in detector.detect_batch(corpus)]
+    identical = detected == [
+        word_boundary_detect(fallacies, argument) for argument in corpus
+    ] and detected == [
+        [f.id for f in detector.detect(*argument)] for argument in corpus
+    ]
+    changed = sum(
+        ids != legacy_detect(fallacies, argument)
+        for ids, argument in zip(detected, corpus)
+    )
+
+    return {
+        "arguments": size,
+        "fallacies": len(fallacies),
+        "legacy_ms": best_time_ms(
+            lambda: [legacy_detect(fallacies, a) for a in corpus], repeat
+        ),
+        "detect_ms": best_time_ms(
+            lambda: [detector.detect(*a) for a in corpus], repeat
+        ),
+        "batch_ms": best_time_ms(lambda: detector.detect_batch(corpus), repeat),
+        "legacy_init_us": best_time_ms(_builtin_fallacies, repeat * 20) * 1000,
+        "index_build_us": best_time_ms(
+            lambda: FallacyIndex.build(fallacies.values()), repeat
+        )
+        * 1000,
+        "init_us": best_time_ms(FallacyDetector, repeat * 20) * 1000,
+        "identical": identical,
+        "changed": changed,
+    }
+
+
+def format_report(result: Dict[str, Any]) -> str:
+    n = result["arguments"]
+    lines = [
+        f"Corpus: {n} arguments, {result['fallacies']} fallacies",
+        "",
+        "| Path | Total (ms) | Per argument (us) | Speedup |",
+        "|------|------------|-------------------|---------|",
+    ]
+    for label, key in (
+        ("legacy substring loop", "legacy_ms"),
+        ("detect (index)", "detect_ms"),
+        ("detect_batch (index)", "batch_ms"),
+    ):
+        ms = result[key]
+        lines.append(
+            f"| {label} | {ms:.1f} | {ms * 1000 / n:.2f} | "
+            f"{result['legacy_ms'] / ms:.1f}x |"
+        )
+    lines += [
+        "",
+        f"Detector construction: legacy database rebuild "
+        f"{result['legacy_init_us']:.1f} us, shared index {result['init_us']:.2f} us "
+        f"(one-off compile {result['index_build_us']:.0f} us)",
+        f"Index matches word-boundary loop: {'yes' if result['identical'] else 'NO'}",
+        f"Arguments whose verdict changed vs substring matching: {result['changed']}",
+    ]
+    return "\n".join(lines)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Fallacy detector benchmark")
+    parser.add_argument("--arguments", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(format_report(benchmark(args.arguments, args.repeat)))
+
+
+if __name__ == "__main__":
+    main()
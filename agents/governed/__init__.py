@@ -6,6 +6,8 @@ Provides runtime enforcement of governance policies:
 - ConstraintLoader: Profile loading with integrity hashing (§1.5)
 - PlanValidator: Natural language plan validation (§1.6)
 - ExecutionProxy: Sandboxed execution with policy enforcement
+- DecisionCache: Policy-hash-bound cache of governance decisions
+- AuditSink: Durable, hash-chained JSONL audit trail
 - GovernedCodingAgent: Complete governed agent implementation
 
 Usage:
@@ -21,8 +23,10 @@ Usage:
     result = agent.execute_task("read file test.py")
 """
 
+from .audit_sink import AuditSink, AuditVerification, read_audit_log, verify_audit_log
 from .constraint_loader import (
     ActionPolicy,
+    CompiledProfile,
     ConstraintLoader,
     InheritanceError,
     LoadedProfile,
@@ -31,6 +35,7 @@ from .constraint_loader import (
     ProfileNotFoundError,
     ProfileValidationError,
 )
+from .decision_cache import DecisionCache
 from .execution_proxy import (
     ActionRequest,
     ActionResult,
@@ -70,12 +75,20 @@ __all__ = [
     # Constraint Loader
     "ConstraintLoader",
     "LoadedProfile",
+    "CompiledProfile",
     "LoaderError",
     "ProfileNotFoundError",
     "ProfileValidationError",
     "InheritanceError",
     "ProfileConflictError",
     "ActionPolicy",
+    # Audit Sink
+    "AuditSink",
+    "AuditVerification",
+    "read_audit_log",
+    "verify_audit_log",
+    # Decision Cache
+    "DecisionCache",
     # Execution Proxy
     "ExecutionProxy",
     "ExecutionMode",
@@ -0,0 +1,459 @@
+"""
+Durable audit sink for governance decisions.
+
+Append-only JSONL audit trail written by a background thread:
+- Records are batched and fsynced every ``batch_size`` records or
+  ``flush_interval`` seconds, whichever comes first
+- Segments rotate by size (``audit-000001.jsonl``, ``audit-000002.jsonl``, ...)
+- Every record carries a sequence number, the previous record's hash and
+  its own SHA-256 hash, chaining the whole trail across segments so that
+  edits, deletions and reordering are detectable with verify_audit_log()
+
+A sink reopened on an existing directory resumes the chain; a torn final
+line left by a crash (never acknowledged by an fsync) is truncated first.
+Only one sink per directory and prefix may be open in a process; owners that
+write to the same trail share it through AuditSink.shared().
+"""
+
+import atexit
+import hashlib
+import json
+import os
+import queue
+import threading
+import time
+import weakref
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+GENESIS_HASH = "0" * 64
+
+# Open sinks by (resolved log_dir, prefix); one writer per trail
+_open_sinks: Dict[Tuple[Path, str], "AuditSink"] = {}
+_open_sinks_lock = threading.RLock()
+
+
+def _record_hash(body: Dict[str, Any]) -> str:
+    canonical = json.dumps(body, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def _sink_key(log_dir: Path, prefix: str) -> Tuple[Path, str]:
+    return Path(log_dir).resolve(), prefix
+
+
+def _segments(log_dir: Path, prefix: str) -> List[Path]:
+    return sorted(log_dir.glob(f"{prefix}-[0-9][0-9][0-9][0-9][0-9][0-9].jsonl"))
+
+
+@dataclass
+class _Barrier:
+    """Queue marker: sync everything before it, then signal."""
+
+    event: threading.Event
+    stop: bool = False
+
+
+@dataclass
+class AuditVerification:
+    """Result of verifying an audit trail's hash chain."""
+
+    valid: bool
+    records: int
+    last_hash: str
+    error: Optional[str] = None
+    segment: Optional[str] = None
+    line: Optional[int] = None
+
+
+class AuditSink:
+    """
+    Background, batched, hash-chained JSONL audit writer.
+
+    Usage:
+        sink = AuditSink(Path("sandbox/.audit"))
+        sink.write({"action_type": "subprocess", "target": "ls", ...})
+        sink.flush()  # block until durable
+        sink.close()
+
+        report = verify_audit_log(Path("sandbox/.audit"))
+
+    Several owners of one trail (e.g. proxies on the same sandbox) use
+    ``AuditSink.shared(log_dir)``; each calls ``close()`` once, and the sink
+    shuts down when the last owner does.
+    """
+
+    def __init__(
+        self,
+        log_dir: Path,
+        prefix: str = "audit",
+        batch_size: int = 64,
+        flush_interval: float = 1.0,
+        max_bytes: int = 10 * 1024 * 1024,
+    ):
+        """
+        Initialize the sink and start its writer thread.
+
+        Args:
+            log_dir: Directory for audit segments (created if missing).
+            prefix: Segment file name prefix.
+            batch_size: Fsync after this many unsynced records.
+            flush_interval: Fsync unsynced records after this many seconds.
+            max_bytes: Start a new segment once the current one reaches this size.
+
+        Raises:
+            ValueError: If a sink is already open on ``log_dir`` and ``prefix``.
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        self.log_dir = Path(log_dir)
+        self.prefix = prefix
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_bytes = max_bytes
+
+        self._key = _sink_key(self.log_dir, prefix)
+        self._owners = 1
+        with _open_sinks_lock:
+            if self._key in _open_sinks:
+                raise ValueError(
+                    f"An AuditSink is already open on {self._key[0]} "
+                    f"(prefix {prefix!r}); use AuditSink.shared() to share it"
+                )
+            _open_sinks[self._key] = self
+        try:
+            self.log_dir.mkdir(parents=True, exist_ok=True)
+            self._segment_index, self._seq, self._last_hash = self._resume()
+            self._file = open(self._segment_path(), "a", encoding="utf-8")
+        except BaseException:
+            with _open_sinks_lock:
+                del _open_sinks[self._key]
+            raise
+
+        self._queue: "queue.Queue[Any]" = queue.Queue()
+        self._closed = False
+        self._writer_died = False
+        self._error: Optional[BaseException] = None
+        self._written = 0
+        self._syncs = 0
+        self._rotations = 0
+
+        self._thread = threading.Thread(
+            target=self._run, name=f"audit-sink-{prefix}", daemon=True
+        )
+        self._thread.start()
+        atexit.register(_close_at_exit, weakref.ref(self))
+
+    # ==================== Public API ====================
+
+    @classmethod
+    def shared(
+        cls, log_dir: Path, prefix: str = "audit", **options: Any
+    ) -> "AuditSink":
+        """
+        Return the sink open on ``log_dir``, opening one if there is none.
+
+        Each call adds an owner; the sink is closed when every owner has
+        called ``close()``. ``options`` are the constructor's and only
+        apply when a new sink is opened.
+        """
+        with _open_sinks_lock:
+            sink = _open_sinks.get(_sink_key(log_dir, prefix))
+            if sink is not None:
+                sink._owners += 1
+                return sink
+            return cls(log_dir, prefix, **options)
+
+    def write(self, record: Dict[str, Any]) -> None:
+        """Queue a record; it is chained and written by the background thread."""
+        if self._closed:
+            raise RuntimeError("AuditSink is closed")
+        self._queue.put(dict(record))
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until every record written so far is fsynced.
+
+        Returns:
+            False if the timeout expired first, or if the writer thread has
+            died and queued records will never be written.
+
+        Raises:
+            Exception: The first error the writer thread hit; records it
+                could not persist were dropped.
+        """
+        if self._thread.is_alive():
+            barrier = _Barrier(threading.Event())
+            self._queue.put(barrier)
+            # A dying writer releases queued barriers after setting the flag,
+            # so a barrier queued too late for that is never waited on
+            if not self._writer_died and not barrier.event.wait(timeout):
+                return False
+        self._raise_error()
+        return not self._writer_died
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """
+        Flush, stop the writer thread and close the current segment.
+
+        For a shared sink, only the last owner's call closes it; earlier
+        calls just flush.
+        """
+        with _open_sinks_lock:
+            if self._closed:
+                return
+            self._owners -= 1
+            if self._owners <= 0:
+                self._shutdown(timeout)
+                return
+        self.flush(timeout)
+
+    @property
+    def last_hash(self) -> str:
+        """Hash of the last record written to disk (not necessarily synced)."""
+        return self._last_hash
+
+    @property
+    def current_segment(self) -> Path:
+        return self._segment_path()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return writer statistics for monitoring."""
+        return {
+            "records_written": self._written,
+            "pending": self._queue.qsize(),
+            "syncs": self._syncs,
+            "rotations": self._rotations,
+            "segment": self._segment_path().name,
+            "last_seq": self._seq,
+            "error": str(self._error) if self._error else None,
+            "writer_alive": self._thread.is_alive(),
+        }
+
+    def __enter__(self) -> "AuditSink":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def _shutdown(self, timeout: Optional[float]) -> None:
+        # Unregistered only once closed, so no second writer can open the
+        # trail while this one drains
+        with _open_sinks_lock:
+            if self._closed:
+                return
+            self._closed = True
+            try:
+                if self._thread.is_alive():
+                    barrier = _Barrier(threading.Event(), stop=True)
+                    self._queue.put(barrier)
+                    barrier.event.wait(timeout)
+                    self._thread.join(timeout)
+            finally:
+                if _open_sinks.get(self._key) is self:
+                    del _open_sinks[self._key]
+        self._raise_error()
+
+    # ==================== Writer Thread ====================
+
+    def _run(self) -> None:
+        try:
+            self._write_loop()
+        except BaseException as exc:
+            # Never die silently: keep the cause and release waiting flushes
+            if self._error is None:
+                self._error = exc
+            self._writer_died = True
+            self._release_barriers()
+            raise
+
+    def _write_loop(self) -> None:
+        unsynced = 0
+        last_sync = time.monotonic()
+        while True:
+            timeout = None
+            if unsynced:
+                timeout = max(0.0, self.flush_interval - (time.monotonic() - last_sync))
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                item = None
+
+            try:
+                if isinstance(item, dict):
+                    self._append(item)
+                    unsynced += 1
+                    # Drain whatever else is queued into the same batch
+                    while unsynced < self.batch_size:
+                        try:
+                            item = self._queue.get_nowait()
+                        except queue.Empty:
+                            item = None
+                            break
+                        if not isinstance(item, dict):
+                            break
+                        self._append(item)
+                        unsynced += 1
+
+                if unsynced and (
+                    isinstance(item, _Barrier)
+                    or unsynced >= self.batch_size
+                    or time.monotonic() - last_sync >= self.flush_interval
+                ):
+                    self._sync()
+                    unsynced = 0
+                    last_sync = time.monotonic()
+            except Exception as exc:
+                # The record being written (or the unsynced batch) is lost;
+                # flush() and close() re-raise the first such error
+                if self._error is None:
+                    self._error = exc
+                unsynced = 0
+
+            if isinstance(item, _Barrier):
+                item.event.set()
+                if item.stop:
+                    self._file.close()
+                    return
+
+    def _append(self, record: Dict[str, Any]) -> None:
+        if self._file.tell() >= self.max_bytes:
+            self._rotate()
+        # Chain state only advances once the record is serialized
+        seq = self._seq + 1
+        body = {**record, "seq": seq, "prev_hash": self._last_hash}
+        record_hash = _record_hash(body)
+        body["hash"] = record_hash
+        line = json.dumps(body, sort_keys=True, default=str) + "\n"
+        self._file.write(line)
+        self._seq, self._last_hash = seq, record_hash
+        self._written += 1
+
+    def _release_barriers(self) -> None:
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                return
+            if isinstance(item, _Barrier):
+                item.event.set()
+
+    def _sync(self) -> None:
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._syncs += 1
+
+    def _rotate(self) -> None:
+        self._sync()
+        self._file.close()
+        self._segment_index += 1
+        self._file = open(self._segment_path(), "a", encoding="utf-8")
+        self._rotations += 1
+
+    # ==================== Helpers ====================
+
+    def _segment_path(self, index: Optional[int] = None) -> Path:
+        index = self._segment_index if index is None else index
+        return self.log_dir / f"{self.prefix}-{index:06d}.jsonl"
+
+    def _resume(self) -> Tuple[int, int, str]:
+        """Find the newest segment and the chain state at its end."""
+        segments = _segments(self.log_dir, self.prefix)
+        for path in reversed(segments):
+            index = int(path.stem.rsplit("-", 1)[1])
+            last = _truncate_torn_tail(path)
+            if last is not None:
+                return index, last["seq"], last["hash"]
+        if segments:
+            return int(segments[-1].stem.rsplit("-", 1)[1]), 0, GENESIS_HASH
+        return 1, 0, GENESIS_HASH
+
+    def _raise_error(self) -> None:
+        if self._error is not None:
+            raise self._error
+
+
+def _close_at_exit(ref: "weakref.ref[AuditSink]") -> None:
+    sink = ref()
+    if sink is not None:
+        try:
+            sink._shutdown(timeout=5.0)
+        except Exception:
+            pass
+
+
+def _truncate_torn_tail(path: Path) -> Optional[Dict[str, Any]]:
+    """Drop a partial final line and return the last complete record, if any."""
+    with open(path, "rb+") as f:
+        f.seek(0, os.SEEK_END)
+        size = f.tell()
+        # Scan back in blocks for the last newline
+        block = 4096
+        end = size
+        tail = b""
+        while end > 0:
+            start = max(0, end - block)
+            f.seek(start)
+            tail = f.read(end - start) + tail
+            end = start
+            if tail.count(b"\n") >= 2 or (end == 0 and b"\n" in tail):
+                break
+        if not tail.endswith(b"\n"):
+            cut = tail.rfind(b"\n") + 1
+            f.truncate(size - len(tail) + cut)
+            tail = tail[:cut]
+        lines = tail.splitlines()
+        if not lines:
+            return None
+        return json.loads(lines[-1])
+
+
+def read_audit_log(log_dir: Path, prefix: str = "audit") -> Iterator[Dict[str, Any]]:
+    """Stream every record of an audit trail in order, one line at a time."""
+    for path in _segments(Path(log_dir), prefix):
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+
+
+def verify_audit_log(log_dir: Path, prefix: str = "audit") -> AuditVerification:
+    """
+    Verify the hash chain of an audit trail without loading it into memory.
+
+    Returns:
+        AuditVerification; on failure, ``segment`` and ``line`` locate the
+        first record that does not chain.
+    """
+    previous = GENESIS_HASH
+    count = 0
+    for path in _segments(Path(log_dir), prefix):
+        with open(path, "r", encoding="utf-8") as f:
+            for line_no, line in enumerate(f, start=1):
+                if not line.strip():
+                    continue
+                error = None
+                try:
+                    body = json.loads(line)
+                except json.JSONDecodeError:
+                    body, error = {}, "Malformed record"
+                claimed = body.pop("hash", None)
+                if error is None and body.get("seq") != count + 1:
+                    error = f"Expected seq {count + 1}, got {body.get('seq')}"
+                if error is None and body.get("prev_hash") != previous:
+                    error = "Broken chain: prev_hash mismatch"
+                if error is None and _record_hash(body) != claimed:
+                    error = "Record hash mismatch"
+                if error is not None:
+                    return AuditVerification(
+                        valid=False,
+                        records=count,
+                        last_hash=previous,
+                        error=error,
+                        segment=path.name,
+                        line=line_no,
+                    )
+                previous = claimed
+                count += 1
+    return AuditVerification(valid=True, records=count, last_hash=previous)
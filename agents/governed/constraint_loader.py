@@ -3,15 +3,26 @@ Constraint profile loader with inheritance and SHA-256 integrity hashing.
 
 Loads JSON policy files, resolves inheritance chains, and computes
 cryptographic hashes for tamper detection. Uses Python standard library only.
+
+Each loaded profile carries an immutable CompiledProfile (path-glob matchers
+and command lookup tables) shared by every consumer. Policy files are
+re-read only when their mtime or size changes and re-parsed only when their
+content hash changes, so refresh() can hot-reload edited profiles cheaply.
 """
 
+import fnmatch
 import hashlib
 import json
+import os
+import re
+import threading
+import time
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from types import MappingProxyType
+from typing import Any, Dict, FrozenSet, List, Mapping, Optional, Tuple
 
 
 class LoaderError(Exception):
@@ -57,6 +68,80 @@ def _utc_now() -> datetime:
     return datetime.now(timezone.utc)
 
 
+class GlobMatcher:
+    """A list of fnmatch patterns compiled into one regex."""
+
+    __slots__ = ("patterns", "_regex")
+
+    def __init__(self, patterns: Tuple[str, ...]):
+        self.patterns = patterns
+        # Every translated pattern ends in \Z, so any branch is a full match
+        self._regex = (
+            re.compile(
+                "|".join(fnmatch.translate(os.path.normcase(p)) for p in patterns)
+            )
+            if patterns
+            else None
+        )
+
+    def matches(self, value: str) -> bool:
+        """Same result as fnmatch.fnmatch(value, p) for any of the patterns."""
+        return bool(self._regex and self._regex.match(os.path.normcase(value)))
+
+    def __repr__(self) -> str:
+        return f"GlobMatcher({list(self.patterns)!r})"
+
+
+_DECISIONS = ("deny", "escalate", "allow")
+
+
+@dataclass(frozen=True)
+class CompiledProfile:
+    """
+    Immutable lookup tables derived from resolved permissions.
+
+    ``file_rules[(decision, operation)]`` matches relative paths and
+    ``commands[decision]`` holds subprocess command names, for decision in
+    deny/escalate/allow.
+    """
+
+    file_rules: Mapping[Tuple[str, str], GlobMatcher]
+    commands: Mapping[str, FrozenSet[str]]
+
+    @classmethod
+    def from_permissions(cls, permissions: Dict[str, Any]) -> "CompiledProfile":
+        file_permissions = permissions.get("file_operations", {})
+        file_rules: Dict[Tuple[str, str], GlobMatcher] = {}
+        for decision in _DECISIONS:
+            for operation, patterns in file_permissions.get(decision, {}).items():
+                if isinstance(patterns, list):
+                    file_rules[(decision, operation)] = GlobMatcher(
+                        tuple(p for p in patterns if isinstance(p, str))
+                    )
+
+        subprocess_permissions = permissions.get("subprocess", {})
+        commands = {
+            decision: frozenset(
+                c
+                for c in subprocess_permissions.get(decision, {}).get("commands", [])
+                if isinstance(c, str)
+            )
+            for decision in _DECISIONS
+        }
+        return cls(
+            file_rules=MappingProxyType(file_rules),
+            commands=MappingProxyType(commands),
+        )
+
+    def file_decision(self, operation: str, path: str) -> Optional[str]:
+        """First of deny/escalate/allow whose patterns match path, or None."""
+        for decision in _DECISIONS:
+            matcher = self.file_rules.get((decision, operation))
+            if matcher is not None and matcher.matches(path):
+                return decision
+        return None
+
+
 @dataclass
 class LoadedProfile:
     """A loaded and validated constraint profile with integrity hash."""
@@ -68,6 +153,11 @@ class LoadedProfile:
     inheritance_chain: List[str]
     integrity_hash: str
     loaded_at: datetime = field(default_factory=_utc_now)
+    # Snapshot of resolved_permissions compiled at construction
+    compiled: CompiledProfile = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.compiled = CompiledProfile.from_permissions(self.resolved_permissions)
 
     def to_audit_record(self) -> Dict[str, Any]:
         """Generate audit-friendly representation."""
@@ -88,17 +178,21 @@ class ConstraintLoader:
         loader = ConstraintLoader(Path("runtime/governance/"))
         profile = loader.load("coding_agent_profile")
         print(profile.integrity_hash)  # SHA-256 of resolved profile
+
+        # Later: pick up edits to the policy files
+        profile = loader.refresh(profile)
     """
 
     MAX_INHERITANCE_DEPTH = 10
     REQUIRED_METADATA_KEYS = {"profile_id", "version"}
 
-    def __init__(self, governance_dir: Path):
+    def __init__(self, governance_dir: Path, reload_interval: float = 1.0):
         """
         Initialize loader with governance directory.
 
         Args:
             governance_dir: Path to directory containing JSON policy files.
+            reload_interval: Minimum seconds between file checks in refresh().
 
         Raises:
             ProfileNotFoundError: If governance directory doesn't exist.
@@ -111,8 +205,15 @@ class ConstraintLoader:
             raise ProfileNotFoundError(f"Path is not a directory: {governance_dir}")
 
         self.governance_dir = governance_dir
-        self._cache: Dict[str, Dict[str, Any]] = {}
+        self.reload_interval = reload_interval
+        # file name -> ((mtime_ns, size), content hash, parsed data)
+        self._cache: Dict[str, Tuple[Tuple[int, int], str, Dict[str, Any]]] = {}
         self._active_profile: Optional[LoadedProfile] = None
+        self._lock = threading.RLock()
+        self._last_check: Dict[str, float] = {}
+        # profile_id -> ids of the files its inheritance chain was read from
+        self._sources: Dict[str, Tuple[str, ...]] = {}
+        self.last_reload_error: Optional[LoaderError] = None
 
     @property
     def active_hash(self) -> Optional[str]:
@@ -133,22 +234,7 @@ class ConstraintLoader:
             ProfileNotFoundError: If file doesn't exist.
             ProfileValidationError: If JSON is invalid.
         """
-        # Check cache first
-        if profile_id in self._cache:
-            return self._cache[profile_id]
-
-        file_path = self.governance_dir / f"{profile_id}.json"
-
-        if not file_path.exists():
-            raise ProfileNotFoundError(f"Profile not found: {file_path}")
-
-        try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-        except json.JSONDecodeError as e:
-            raise ProfileValidationError(f"Invalid JSON in {file_path}: {e}")
-        except OSError as e:
-            raise ProfileNotFoundError(f"Cannot read {file_path}: {e}")
+        data = self._read_json(f"{profile_id}.json")
 
         # Basic structure validation
         if not isinstance(data, dict):
@@ -166,9 +252,59 @@ class ConstraintLoader:
                 f"Profile {profile_id} missing required metadata: {missing_keys}"
             )
 
-        self._cache[profile_id] = data
         return data
 
+    def _stamp(self, file_name: str) -> Optional[Tuple[int, int]]:
+        try:
+            stat = os.stat(self.governance_dir / file_name)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def _read_json(self, file_name: str) -> Any:
+        """
+        Read a JSON policy file, reusing the cached parse while unchanged.
+
+        The file is re-read only if its mtime or size changed, and re-parsed
+        only if its content hash changed; unchanged files return the very
+        same object.
+        """
+        file_path = self.governance_dir / file_name
+        stamp = self._stamp(file_name)
+        if stamp is None:
+            raise ProfileNotFoundError(f"Profile not found: {file_path}")
+
+        cached = self._cache.get(file_name)
+        if cached is not None and cached[0] == stamp:
+            return cached[2]
+
+        try:
+            raw = file_path.read_bytes()
+        except OSError as e:
+            raise ProfileNotFoundError(f"Cannot read {file_path}: {e}")
+        content_hash = hashlib.sha256(raw).hexdigest()
+        if cached is not None and cached[1] == content_hash:
+            self._cache[file_name] = (stamp, content_hash, cached[2])
+            return cached[2]
+
+        try:
+            data = json.loads(raw.decode("utf-8"))
+        except (json.JSONDecodeError, UnicodeDecodeError) as e:
+            raise ProfileValidationError(f"Invalid JSON in {file_path}: {e}")
+
+        self._cache[file_name] = (stamp, content_hash, data)
+        return data
+
+    def load_document(self, name: str) -> Any:
+        """
+        Load another JSON policy document (e.g. "governance_matrix").
+
+        Returns the same object as the previous call while the file is
+        unchanged, so consumers can detect reloads by identity.
+        """
+        with self._lock:
+            return self._read_json(f"{name}.json")
+
     def _resolve_inheritance(
         self, profile_id: str, visited: Optional[List[str]] = None
     ) -> List[Dict[str, Any]]:
@@ -322,8 +458,14 @@ class ConstraintLoader:
             InheritanceError: If inheritance chain is invalid.
             ProfileConflictError: If conflicting rules detected.
         """
+        with self._lock:
+            return self._load(profile_id, check_conflicts)
+
+    def _load(self, profile_id: str, check_conflicts: bool) -> LoadedProfile:
         # Resolve inheritance chain
-        chain = self._resolve_inheritance(profile_id)
+        visited: List[str] = []
+        chain = self._resolve_inheritance(profile_id, visited)
+        self._sources[profile_id] = tuple(visited)
         chain_ids = [p["metadata"]["profile_id"] for p in chain]
 
         # Merge profiles from base to derived
@@ -359,6 +501,15 @@ class ConstraintLoader:
 
         integrity_hash = self._compute_hash(resolved_data)
 
+        active = self._active_profile
+        if (
+            active is not None
+            and active.profile_id == profile_id
+            and active.integrity_hash == integrity_hash
+        ):
+            # Unchanged: keep sharing the already compiled profile
+            return active
+
         loaded = LoadedProfile(
             profile_id=profile_id,
             version=version,
@@ -368,9 +519,62 @@ class ConstraintLoader:
             integrity_hash=integrity_hash,
         )
 
+        # Single reference assignment: readers see the old or the new profile
         self._active_profile = loaded
         return loaded
 
+    def refresh(self, profile: Optional[LoadedProfile] = None) -> LoadedProfile:
+        """
+        Hot-reload a profile if any file in its inheritance chain changed.
+
+        Files are checked at most once per ``reload_interval``. If the
+        resolved profile is unchanged, or the edited files do not load
+        (e.g. caught mid-write), the given profile is returned and the
+        error is kept in ``last_reload_error``.
+
+        Args:
+            profile: Profile to refresh (defaults to the active profile).
+
+        Returns:
+            The current profile: the same object if nothing changed, else a
+            newly compiled one that has also become the active profile.
+        """
+        profile = profile or self._active_profile
+        if profile is None:
+            raise LoaderError("No profile loaded")
+        profile_id = profile.profile_id
+
+        with self._lock:
+            now = time.monotonic()
+            last = self._last_check.get(profile_id)
+            if last is None or now - last >= self.reload_interval:
+                self._last_check[profile_id] = now
+                if self._sources_changed(profile_id):
+                    try:
+                        self._load(profile_id, check_conflicts=True)
+                        self.last_reload_error = None
+                    except LoaderError as e:
+                        self.last_reload_error = e
+
+            # Another holder may already have swapped in a newer profile
+            active = self._active_profile
+            if (
+                active is not None
+                and active.profile_id == profile_id
+                and active.integrity_hash != profile.integrity_hash
+            ):
+                return active
+            return profile
+
+    def _sources_changed(self, profile_id: str) -> bool:
+        """Whether any file of the profile's chain changed on disk. Caller holds lock."""
+        sources = self._sources.get(profile_id, (profile_id,))
+        for source in sources:
+            cached = self._cache.get(f"{source}.json")
+            if cached is None or cached[0] != self._stamp(f"{source}.json"):
+                return True
+        return False
+
     def verify_integrity(self, profile: LoadedProfile) -> bool:
         """
         Verify that a loaded profile's hash still matches source files.
@@ -381,15 +585,17 @@ class ConstraintLoader:
         Returns:
             True if integrity verified, False if files changed.
         """
-        # Clear cache to force re-read from disk
-        self._cache.clear()
+        with self._lock:
+            # Clear cache to force re-read from disk
+            self._cache.clear()
 
-        try:
-            fresh = self.load(profile.profile_id, check_conflicts=False)
-            return fresh.integrity_hash == profile.integrity_hash
-        except LoaderError:
-            return False
+            try:
+                fresh = self._load(profile.profile_id, check_conflicts=False)
+                return fresh.integrity_hash == profile.integrity_hash
+            except LoaderError:
+                return False
 
     def clear_cache(self) -> None:
         """Clear the profile cache, forcing re-read on next load."""
-        self._cache.clear()
+        with self._lock:
+            self._cache.clear()
@@ -0,0 +1,77 @@
+"""
+Decision cache for governance checks.
+
+Plan validation and execution-proxy command checks are pure functions of
+the loaded profile and the normalized action, and coding-agent runs repeat
+the same actions constantly. DecisionCache memoizes those decisions in a
+bounded LRU that is bound to the profile's integrity hash: a lookup under a
+different hash drops every entry, so a decision never outlives the policy
+it was made under.
+
+One cache can be shared by a PlanValidator and an ExecutionProxy; each
+caller namespaces its keys.
+"""
+
+from typing import Any, Callable, Dict, Hashable, Optional
+
+from ..utils.lru import LRUCache
+
+
+class DecisionCache(LRUCache):
+    """
+    Thread-safe LRU cache of policy decisions keyed by policy hash.
+
+    Usage:
+        cache = DecisionCache()
+        validator = PlanValidator(matrix, profile, root, decision_cache=cache)
+        proxy = ExecutionProxy(profile, root, decision_cache=cache)
+
+        cache.stats()["hit_rate"]
+    """
+
+    def __init__(self, max_entries: int = 4096):
+        super().__init__(max_entries)
+        self._policy_hash: Optional[str] = None
+        self._invalidations = 0
+
+    @property
+    def policy_hash(self) -> Optional[str]:
+        """Hash of the profile the cached decisions were made under."""
+        return self._policy_hash
+
+    def get_or_compute(
+        self, policy_hash: Optional[str], key: Hashable, compute: Callable[[], Any]
+    ) -> Any:
+        """
+        Return the decision for key under policy_hash, computing it on a miss.
+
+        Args:
+            policy_hash: Integrity hash of the profile in force
+            key: Namespaced, normalized action
+            compute: Zero-argument function producing the decision
+        """
+        with self._lock:
+            self._bind(policy_hash)
+        # Entries are keyed by policy too, so a rebind racing with this
+        # lookup can never serve another policy's decision
+        return self._get_or_compute(
+            (policy_hash, key),
+            compute,
+            # The profile may have changed while computing
+            store_if=lambda _: self._policy_hash == policy_hash,
+        )[0]
+
+    def _stats(self) -> Dict[str, Any]:
+        return {
+            **super()._stats(),
+            "invalidations": self._invalidations,
+            "policy_hash": self._policy_hash,
+        }
+
+    def _bind(self, policy_hash: Optional[str]) -> None:
+        """Drop every entry if the policy changed. Caller holds lock."""
+        if policy_hash != self._policy_hash:
+            if self._entries:
+                self._entries.clear()
+                self._invalidations += 1
+            self._policy_hash = policy_hash
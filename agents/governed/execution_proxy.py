@@ -12,17 +12,19 @@ Strictness B: Semi-open subprocess + restricted writes
 - push, pip install, network: blocked
 """
 
-import fnmatch
 import re
 import subprocess
 import uuid
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Set, Union
+from typing import Any, Callable, Deque, Dict, List, Optional, Pattern, Set, Union
 
+from .audit_sink import AuditSink
 from .constraint_loader import LoadedProfile
+from .decision_cache import DecisionCache
 
 
 def _utc_now() -> datetime:
@@ -97,6 +99,21 @@ class AuditEntry:
     success: bool
     details: Dict[str, Any] = field(default_factory=dict)
 
+    def to_record(self) -> Dict[str, Any]:
+        """JSON-serializable record for the audit trail."""
+        return {
+            "correlation_id": self.correlation_id,
+            "timestamp": self.timestamp.isoformat(),
+            "action_type": self.action_type.value,
+            "target": self.target,
+            "decision": self.decision.value,
+            "reason": self.reason,
+            "policy_hash": self.policy_hash,
+            "executed": self.executed,
+            "success": self.success,
+            "details": self.details,
+        }
+
 
 class ExecutionProxy:
     """
@@ -118,6 +135,9 @@ class ExecutionProxy:
 
         # Subprocess
         result = proxy.run_command(["pytest", "tests/"])
+
+    Command decisions are memoized per (profile hash, command) in a
+    DecisionCache, which can be shared with a PlanValidator.
     """
 
     # Read-only commands always allowed
@@ -206,6 +226,9 @@ class ExecutionProxy:
         mode: ExecutionMode = ExecutionMode.LIVE,
         approval_callback: Optional[Callable[[ActionRequest], bool]] = None,
         log_dir: Optional[Path] = None,
+        decision_cache: Optional[DecisionCache] = None,
+        audit_sink: Optional[AuditSink] = None,
+        max_recent_entries: int = 1000,
     ):
         """
         Initialize execution proxy.
@@ -216,19 +239,28 @@ class ExecutionProxy:
             mode: Execution mode (LIVE, DRY_RUN, MOCK).
             approval_callback: Function to call for escalated actions.
             log_dir: Directory for audit logs (defaults to sandbox_root/.audit/).
+            decision_cache: Cache of command decisions, e.g. one shared with
+                the PlanValidator. A private cache is created if omitted.
+            audit_sink: Durable audit trail. In LIVE mode the sink shared
+                by every proxy writing to log_dir is used if omitted.
+            max_recent_entries: Size of the in-memory recent-entries ring.
         """
         self.profile = profile
         self.sandbox_root = sandbox_root.resolve()
         self.mode = mode
         self.approval_callback = approval_callback
         self.log_dir = log_dir or (sandbox_root / ".audit")
+        self.decision_cache = (
+            decision_cache if decision_cache is not None else DecisionCache()
+        )
 
-        self._audit_log: List[AuditEntry] = []
+        self._audit_log: Deque[AuditEntry] = deque(maxlen=max_recent_entries)
         self._friction_log: Dict[str, int] = {}  # Track denials for tuning
 
-        # Ensure log directory exists
-        if mode == ExecutionMode.LIVE:
-            self.log_dir.mkdir(parents=True, exist_ok=True)
+        # Durable, hash-chained audit trail (written in the background)
+        if audit_sink is None and mode == ExecutionMode.LIVE:
+            audit_sink = AuditSink.shared(self.log_dir)
+        self.audit_sink = audit_sink
 
     def _is_in_sandbox(self, path: Path) -> bool:
         """Check if path is within sandbox root."""
@@ -240,19 +272,21 @@ class ExecutionProxy:
         except (OSError, ValueError):
             return False
 
-    def _match_patterns(self, value: str, patterns: List[str]) -> bool:
-        """Check if value matches any glob patterns."""
+    def _match_regex_patterns(self, value: str, patterns: List[Pattern]) -> bool:
+        """Check if value matches any compiled regex patterns."""
         for pattern in patterns:
-            if fnmatch.fnmatch(value, pattern):
+            if pattern.search(value):
                 return True
         return False
 
-    def _match_regex_patterns(self, value: str, patterns: List[str]) -> bool:
-        """Check if value matches any regex patterns."""
-        for pattern in patterns:
-            if re.search(pattern, value, re.IGNORECASE):
-                return True
-        return False
+    @classmethod
+    def _blocked_regexes(cls) -> List[Pattern]:
+        """BLOCKED_PATTERNS, compiled once per class."""
+        compiled = cls.__dict__.get("_compiled_blocked")
+        if compiled is None:
+            compiled = [re.compile(p, re.IGNORECASE) for p in cls.BLOCKED_PATTERNS]
+            cls._compiled_blocked = compiled
+        return compiled
 
     def _get_command_base(self, cmd: Union[str, List[str]]) -> str:
         """Extract base command from command string or list."""
@@ -262,9 +296,14 @@ class ExecutionProxy:
             cmd_str = cmd
         return cmd_str.strip()
 
-    def _check_file_policy(self, action_type: ActionType, path: Path) -> Decision:
-        """Check policy for file operations."""
-        permissions = self.profile.resolved_permissions.get("file_operations", {})
+    def _check_file_policy(
+        self,
+        action_type: ActionType,
+        path: Path,
+        profile: Optional[LoadedProfile] = None,
+    ) -> Decision:
+        """Check policy for file operations against the compiled profile."""
+        profile = profile or self.profile
         path_str = str(path)
         # Use resolved paths to handle symlinks
         try:
@@ -285,29 +324,10 @@ class ExecutionProxy:
         }
         action_key = action_map.get(action_type, "read")
 
-        # Check deny first (deny takes precedence)
-        deny_section = permissions.get("deny", {})
-        deny_patterns = deny_section.get(action_key, [])
-        if isinstance(deny_patterns, list) and self._match_patterns(
-            relative_path, deny_patterns
-        ):
-            return Decision.DENY
-
-        # Check escalate
-        escalate_section = permissions.get("escalate", {})
-        escalate_patterns = escalate_section.get(action_key, [])
-        if isinstance(escalate_patterns, list) and self._match_patterns(
-            relative_path, escalate_patterns
-        ):
-            return Decision.ESCALATE
-
-        # Check allow
-        allow_section = permissions.get("allow", {})
-        allow_patterns = allow_section.get(action_key, [])
-        if isinstance(allow_patterns, list) and self._match_patterns(
-            relative_path, allow_patterns
-        ):
-            return Decision.ALLOW
+        # Deny takes precedence over escalate, escalate over allow
+        decision = profile.compiled.file_decision(action_key, relative_path)
+        if decision is not None:
+            return Decision(decision)
 
         # Default: deny for writes, allow for reads
         if action_type in (
@@ -318,14 +338,28 @@ class ExecutionProxy:
             return Decision.DENY
         return Decision.ALLOW
 
-    def _check_subprocess_policy(self, cmd: str) -> Decision:
-        """Check policy for subprocess commands."""
+    def _check_subprocess_policy(
+        self, cmd: str, profile: Optional[LoadedProfile] = None
+    ) -> Decision:
+        """Check policy for subprocess commands, using the decision cache."""
+        profile = profile or self.profile
+        cmd = cmd.strip()
+        return self.decision_cache.get_or_compute(
+            profile.integrity_hash,
+            ("command", cmd),
+            lambda: self._evaluate_subprocess_policy(cmd, profile),
+        )
+
+    def _evaluate_subprocess_policy(
+        self, cmd: str, profile: Optional[LoadedProfile] = None
+    ) -> Decision:
+        """Check policy for subprocess commands, uncached."""
         cmd_lower = cmd.lower().strip()
         cmd_parts = cmd_lower.split()
         base_cmd = cmd_parts[0] if cmd_parts else ""
 
         # Check blocked patterns first
-        if self._match_regex_patterns(cmd, self.BLOCKED_PATTERNS):
+        if self._match_regex_patterns(cmd, self._blocked_regexes()):
             return Decision.DENY
 
         # Check explicit blocks
@@ -347,21 +381,19 @@ class ExecutionProxy:
             return Decision.ALLOW
 
         # Check profile permissions
-        permissions = self.profile.resolved_permissions.get("subprocess", {})
+        commands = (profile or self.profile).compiled.commands
 
         # Check deny
-        deny_cmds = permissions.get("deny", {}).get("commands", [])
+        deny_cmds = commands["deny"]
         if base_cmd in deny_cmds or cmd_lower in deny_cmds:
             return Decision.DENY
 
         # Check allow
-        allow_cmds = permissions.get("allow", {}).get("commands", [])
-        if base_cmd in allow_cmds:
+        if base_cmd in commands["allow"]:
             return Decision.ALLOW
 
         # Check escalate
-        escalate_cmds = permissions.get("escalate", {}).get("commands", [])
-        if base_cmd in escalate_cmds:
+        if base_cmd in commands["escalate"]:
             return Decision.ESCALATE
 
         # Default: escalate unknown commands
@@ -383,25 +415,8 @@ class ExecutionProxy:
             key = f"{entry.action_type.value}:{entry.target}"
             self._friction_log[key] = self._friction_log.get(key, 0) + 1
 
-        # Write to disk in LIVE mode
-        if self.mode == ExecutionMode.LIVE and self.log_dir.exists():
-            log_file = self.log_dir / f"audit_{_utc_now().strftime('%Y%m%d')}.jsonl"
-            import json
-
-            with open(log_file, "a", encoding="utf-8") as f:
-                record = {
-                    "correlation_id": entry.correlation_id,
-                    "timestamp": entry.timestamp.isoformat(),
-                    "action_type": entry.action_type.value,
-                    "target": entry.target,
-                    "decision": entry.decision.value,
-                    "reason": entry.reason,
-                    "policy_hash": entry.policy_hash,
-                    "executed": entry.executed,
-                    "success": entry.success,
-                    "details": entry.details,
-                }
-                f.write(json.dumps(record) + "\n")
+        if self.audit_sink is not None:
+            self.audit_sink.write(entry.to_record())
 
     def _validate_and_execute(
         self,
@@ -409,8 +424,10 @@ class ExecutionProxy:
         decision: Decision,
         reason: str,
         executor: Callable[[], Any],
+        profile: Optional[LoadedProfile] = None,
     ) -> ActionResult:
         """Validate decision and execute if allowed."""
+        profile = profile or self.profile
         allowed = decision == Decision.ALLOW
 
         # Handle escalation
@@ -426,7 +443,7 @@ class ExecutionProxy:
             decision=decision,
             allowed=allowed,
             reason=reason,
-            policy_hash=self.profile.integrity_hash,
+            policy_hash=profile.integrity_hash,
         )
 
         # Execute if allowed and in LIVE mode
@@ -450,7 +467,7 @@ class ExecutionProxy:
                 target=request.target,
                 decision=decision,
                 reason=reason,
-                policy_hash=self.profile.integrity_hash,
+                policy_hash=profile.integrity_hash,
                 executed=result.executed,
                 success=result.error is None,
                 details=request.details,
@@ -472,6 +489,8 @@ class ExecutionProxy:
         Returns:
             ActionResult with file contents or error.
         """
+        # One profile snapshot per action, even if a reload swaps it meanwhile
+        profile = self.profile
         if not self._is_in_sandbox(path):
             request = ActionRequest(
                 action_type=ActionType.FILE_READ,
@@ -483,7 +502,7 @@ class ExecutionProxy:
                 decision=Decision.DENY,
                 allowed=False,
                 reason="Read denied: path outside sandbox",
-                policy_hash=self.profile.integrity_hash,
+                policy_hash=profile.integrity_hash,
             )
 
         request = ActionRequest(
@@ -492,13 +511,13 @@ class ExecutionProxy:
             details={"encoding": encoding},
         )
 
-        decision = self._check_file_policy(ActionType.FILE_READ, path)
+        decision = self._check_file_policy(ActionType.FILE_READ, path, profile)
         reason = f"File read: {path.name}"
 
         def executor():
             return path.read_text(encoding=encoding)
 
-        return self._validate_and_execute(request, decision, reason, executor)
+        return self._validate_and_execute(request, decision, reason, executor, profile)
 
     def write_file(
         self,
@@ -519,6 +538,7 @@ class ExecutionProxy:
         Returns:
             ActionResult indicating success or denial.
         """
+        profile = self.profile
         # Must be in sandbox
         if not self._is_in_sandbox(path):
             request = ActionRequest(
@@ -531,7 +551,7 @@ class ExecutionProxy:
                 decision=Decision.DENY,
                 allowed=False,
                 reason=f"Write denied: path outside sandbox ({self.sandbox_root})",
-                policy_hash=self.profile.integrity_hash,
+                policy_hash=profile.integrity_hash,
             )
 
         action_type = (
@@ -543,7 +563,7 @@ class ExecutionProxy:
             details={"encoding": encoding, "size": len(content)},
         )
 
-        decision = self._check_file_policy(action_type, path)
+        decision = self._check_file_policy(action_type, path, profile)
         reason = f"File {'create' if action_type == ActionType.FILE_CREATE else 'write'}: {path.name}"
 
         def executor():
@@ -552,7 +572,7 @@ class ExecutionProxy:
             path.write_text(content, encoding=encoding)
             return {"written": len(content)}
 
-        return self._validate_and_execute(request, decision, reason, executor)
+        return self._validate_and_execute(request, decision, reason, executor, profile)
 
     def delete_file(self, path: Path) -> ActionResult:
         """
@@ -564,6 +584,7 @@ class ExecutionProxy:
         Returns:
             ActionResult indicating success or denial.
         """
+        profile = self.profile
         if not self._is_in_sandbox(path):
             request = ActionRequest(
                 action_type=ActionType.FILE_DELETE, target=str(path)
@@ -573,19 +594,19 @@ class ExecutionProxy:
                 decision=Decision.DENY,
                 allowed=False,
                 reason="Delete denied: path outside sandbox",
-                policy_hash=self.profile.integrity_hash,
+                policy_hash=profile.integrity_hash,
             )
 
         request = ActionRequest(action_type=ActionType.FILE_DELETE, target=str(path))
 
-        decision = self._check_file_policy(ActionType.FILE_DELETE, path)
+        decision = self._check_file_policy(ActionType.FILE_DELETE, path, profile)
         reason = f"File delete: {path.name}"
 
         def executor():
             path.unlink()
             return {"deleted": True}
 
-        return self._validate_and_execute(request, decision, reason, executor)
+        return self._validate_and_execute(request, decision, reason, executor, profile)
 
     # ==================== Subprocess Operations ====================
 
@@ -608,6 +629,7 @@ class ExecutionProxy:
         Returns:
             ActionResult with command output or denial.
         """
+        profile = self.profile
         cmd_str = self._get_command_base(cmd)
 
         # Validate cwd is in sandbox
@@ -622,7 +644,7 @@ class ExecutionProxy:
                 decision=Decision.DENY,
                 allowed=False,
                 reason="Subprocess denied: cwd outside sandbox",
-                policy_hash=self.profile.integrity_hash,
+                policy_hash=profile.integrity_hash,
             )
 
         request = ActionRequest(
@@ -634,7 +656,7 @@ class ExecutionProxy:
             },
         )
 
-        decision = self._check_subprocess_policy(cmd_str)
+        decision = self._check_subprocess_policy(cmd_str, profile)
         reason = f"Subprocess: {cmd_str[:50]}{'...' if len(cmd_str) > 50 else ''}"
 
         def executor():
@@ -652,13 +674,19 @@ class ExecutionProxy:
                 "stderr": result.stderr if capture_output else None,
             }
 
-        return self._validate_and_execute(request, decision, reason, executor)
+        return self._validate_and_execute(request, decision, reason, executor, profile)
 
     # ==================== Reporting ====================
 
-    def get_audit_log(self) -> List[AuditEntry]:
-        """Get in-memory audit log."""
-        return self._audit_log.copy()
+    def get_audit_log(self, limit: Optional[int] = None) -> List[AuditEntry]:
+        """
+        Get the most recent audit entries, oldest first.
+
+        Only the last ``max_recent_entries`` are kept in memory; the full
+        trail is in the audit sink (see ``audit_sink.read_audit_log``).
+        """
+        entries = list(self._audit_log)
+        return entries[-limit:] if limit else entries
 
     def get_friction_report(self) -> Dict[str, int]:
         """
@@ -672,6 +700,11 @@ class ExecutionProxy:
         )
 
     def clear_logs(self) -> None:
-        """Clear in-memory audit and friction logs."""
+        """Clear in-memory audit and friction logs (the durable trail is kept)."""
         self._audit_log.clear()
         self._friction_log.clear()
+
+    def close(self) -> None:
+        """Flush and close (or, if shared, release) the audit sink."""
+        if self.audit_sink is not None:
+            self.audit_sink.close()
@@ -20,7 +20,8 @@ from enum import Enum
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
-from .constraint_loader import ConstraintLoader, LoadedProfile
+from .constraint_loader import ConstraintLoader, LoadedProfile, LoaderError
+from .decision_cache import DecisionCache
 from .execution_proxy import ActionResult, ExecutionMode, ExecutionProxy
 from .persona_lock import AgentType, PersonaContext, PersonaLock
 from .plan_validator import PlanValidator, ValidationResult
@@ -128,6 +129,7 @@ class GovernedCodingAgent:
         validator: PlanValidator,
         sandbox_root: Path,
         governance_dir: Path,
+        loader: Optional[ConstraintLoader] = None,
     ):
         """
         Initialize governed agent.
@@ -142,6 +144,8 @@ class GovernedCodingAgent:
             validator: Plan validator for pre-execution checks (§1.6).
             sandbox_root: Root directory of sandbox.
             governance_dir: Directory containing governance policies.
+            loader: Loader the profile came from. If given, edited policy
+                files are hot-reloaded before each task.
         """
         # §1.2 Persona Lock - immutable after creation
         self._persona = persona  # Private to prevent modification
@@ -150,6 +154,7 @@ class GovernedCodingAgent:
         self._validator = validator
         self._sandbox_root = sandbox_root
         self._governance_dir = governance_dir
+        self._loader = loader
 
         # Violation tracking (§7.1)
         self._violations: List[Violation] = []
@@ -203,12 +208,18 @@ class GovernedCodingAgent:
         )
 
         # Load governance matrix for plan validation
-        matrix_path = governance_dir / "governance_matrix.json"
-        with open(matrix_path, "r", encoding="utf-8") as f:
-            governance_matrix = json.load(f)
+        governance_matrix = loader.load_document("governance_matrix")
+
+        # Governance decisions shared by the proxy and the validator
+        decision_cache = DecisionCache()
 
         # Initialize execution proxy
-        executor = ExecutionProxy(profile=profile, sandbox_root=sandbox_root, mode=mode)
+        executor = ExecutionProxy(
+            profile=profile,
+            sandbox_root=sandbox_root,
+            mode=mode,
+            decision_cache=decision_cache,
+        )
 
         # Initialize plan validator (§1.6 Plan-Before-Action)
         validator = PlanValidator(
@@ -216,6 +227,7 @@ class GovernedCodingAgent:
             profile=profile,
             sandbox_root=sandbox_root,
             strict_mode=True,
+            decision_cache=decision_cache,
         )
 
         return cls(
@@ -225,6 +237,7 @@ class GovernedCodingAgent:
             validator=validator,
             sandbox_root=sandbox_root,
             governance_dir=governance_dir,
+            loader=loader,
         )
 
     @property
@@ -298,6 +311,31 @@ class GovernedCodingAgent:
             self._execution_history.append(self._active_context)
             self._active_context = None
 
+    def _refresh_policy(self) -> None:
+        """
+        Hot-reload edited policy files between tasks.
+
+        The loader only returns a new profile or matrix object when the
+        files changed; the swap happens before the task starts, so every
+        check within one task sees the same policy. Files that fail to load
+        (e.g. mid-edit) leave the current policy in force.
+        """
+        if self._loader is None:
+            return
+
+        profile = self._loader.refresh(self._profile)
+        if profile is not self._profile:
+            self._executor.profile = profile
+            self._validator.profile = profile
+            self._profile = profile
+
+        try:
+            self._validator.governance_matrix = self._loader.load_document(
+                "governance_matrix"
+            )
+        except LoaderError:
+            pass
+
     def execute_task(self, task_description: str) -> Dict[str, Any]:
         """
         Execute a task with constitutional governance.
@@ -320,6 +358,7 @@ class GovernedCodingAgent:
             - constraint_hash: governance policy hash
             - violations: list of violations (if any)
         """
+        self._refresh_policy()
         plan_id = str(uuid.uuid4())[:8]
 
         # Create execution context (§1.5 Constraint Binding)
@@ -434,27 +473,22 @@ class GovernedCodingAgent:
 
     def get_audit_log(self) -> List[Dict[str, Any]]:
         """
-        Get audit log from execution proxy.
+        Get recent audit entries from execution proxy.
 
         Returns:
-            List of audit entries from all executed actions.
+            List of the most recent audit entries (bounded; the full
+            trail is in the proxy's audit sink).
         """
         entries = self._executor.get_audit_log()
         return [
-            {
-                "correlation_id": e.correlation_id,
-                "timestamp": e.timestamp.isoformat(),
-                "action_type": e.action_type.value,
-                "target": e.target,
-                "decision": e.decision.value,
-                "reason": e.reason,
-                "policy_hash": e.policy_hash,
-                "executed": e.executed,
-                "success": e.success,
-            }
+            {key: value for key, value in e.to_record().items() if key != "details"}
             for e in entries
         ]
 
+    def close(self) -> None:
+        """Flush and close the execution proxy's durable audit trail."""
+        self._executor.close()
+
     def verify_persona_integrity(self) -> bool:
         """
         Verify persona has not been tampered with (§1.2).
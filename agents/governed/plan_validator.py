@@ -12,15 +12,17 @@ Validation stages:
 4. Approval routing - allow, escalate, or block with rationale
 """
 
+import fnmatch
 import hashlib
 import json
-import fnmatch
 import re
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Pattern, Tuple
+
+from .decision_cache import DecisionCache
 
 
 def _utc_now() -> datetime:
@@ -169,6 +171,9 @@ class PlanValidator:
         if outcome.result == ValidationResult.APPROVED:
             for call in outcome.approved_calls:
                 proxy.execute(call)
+
+    Governance decisions are memoized per (profile hash, normalized action)
+    in a DecisionCache, which can be shared with an ExecutionProxy.
     """
 
     # Patterns indicating bypass/evasion attempts
@@ -269,20 +274,49 @@ class PlanValidator:
         profile: Any,  # LoadedProfile
         sandbox_root: Path,
         strict_mode: bool = True,
+        decision_cache: Optional[DecisionCache] = None,
     ):
         """
         Initialize plan validator.
 
         Args:
-            governance_matrix: Loaded governance matrix JSON.
+            governance_matrix: Loaded governance matrix JSON. Decisions are
+                cached per matrix object; call ``decision_cache.clear()``
+                after editing it in place.
             profile: Loaded constraint profile.
             sandbox_root: Root directory of sandbox.
             strict_mode: If True, unknown actions are blocked. If False, escalated.
+            decision_cache: Cache of governance decisions, e.g. one shared
+                with the ExecutionProxy. A private cache is created if omitted.
         """
         self.governance_matrix = governance_matrix
         self.profile = profile
         self.sandbox_root = sandbox_root.resolve()
         self.strict_mode = strict_mode
+        self.decision_cache = (
+            decision_cache if decision_cache is not None else DecisionCache()
+        )
+        self._matrix_ref: Optional[Dict[str, Any]] = None
+        self._matrix_hash = ""
+
+    @classmethod
+    def _pattern_tables(
+        cls,
+    ) -> Tuple[List[Tuple[Pattern, str]], List[Tuple[ActionCategory, Pattern, str]]]:
+        """BYPASS_PATTERNS and ACTION_PATTERNS, compiled once per class."""
+        tables = cls.__dict__.get("_compiled_tables")
+        if tables is None:
+            bypass = [
+                (re.compile(pattern), reason) for pattern, reason in cls.BYPASS_PATTERNS
+            ]
+            actions = [
+                (category, re.compile(pattern, re.IGNORECASE), operation)
+                for category, patterns in cls.ACTION_PATTERNS.items()
+                for pattern, operation in patterns
+            ]
+            tables = (bypass, actions)
+            cls._compiled_tables = tables
+        return tables
 
     def _detect_bypass(self, text: str) -> Optional[str]:
         """
@@ -292,8 +326,8 @@ class PlanValidator:
             Reason string if bypass detected, None otherwise.
         """
         text_lower = text.lower()
-        for pattern, reason in self.BYPASS_PATTERNS:
-            if re.search(pattern, text_lower):
+        for pattern, reason in self._pattern_tables()[0]:
+            if pattern.search(text_lower):
                 return reason
         return None
 
@@ -308,24 +342,22 @@ class PlanValidator:
         seen: set[Tuple[ActionCategory, str, str]] = set()
         text = step.description.lower()
 
-        for category, patterns in self.ACTION_PATTERNS.items():
-            for pattern, operation in patterns:
-                matches = re.finditer(pattern, text, re.IGNORECASE)
-                for match in matches:
-                    target = match.group(1) if match.lastindex else ""
-                    key = (category, operation, target)
-                    if key in seen:
-                        continue
-                    seen.add(key)
-                    actions.append(
-                        ExtractedAction(
-                            category=category,
-                            operation=operation,
-                            target=target,
-                            original_text=step.description,
-                            confidence=0.8 if target else 0.5,
-                        )
+        for category, pattern, operation in self._pattern_tables()[1]:
+            for match in pattern.finditer(text):
+                target = match.group(1) if match.lastindex else ""
+                key = (category, operation, target)
+                if key in seen:
+                    continue
+                seen.add(key)
+                actions.append(
+                    ExtractedAction(
+                        category=category,
+                        operation=operation,
+                        target=target,
+                        original_text=step.description,
+                        confidence=0.8 if target else 0.5,
                     )
+                )
 
         # If no actions extracted, mark as unknown
         if not actions:
@@ -341,15 +373,48 @@ class PlanValidator:
 
         return actions
 
+    def _decision_key(self, action: ExtractedAction) -> Tuple[Any, ...]:
+        """Namespaced cache key holding everything _check_governance reads."""
+        if self.governance_matrix is not self._matrix_ref:
+            canonical = json.dumps(self.governance_matrix, sort_keys=True, default=str)
+            self._matrix_hash = hashlib.sha256(canonical.encode()).hexdigest()
+            self._matrix_ref = self.governance_matrix
+        # Only write/create checks look at the original step text
+        context = (
+            action.original_text.lower()
+            if action.category
+            in (ActionCategory.FILE_WRITE, ActionCategory.FILE_CREATE)
+            else ""
+        )
+        return (
+            "plan",
+            self._matrix_hash,
+            self.strict_mode,
+            action.category,
+            action.operation,
+            action.target,
+            context,
+        )
+
     def _check_governance(
         self, action: ExtractedAction
     ) -> Tuple[ValidationResult, str]:
         """
-        Check an action against the governance matrix.
+        Check an action against the governance matrix, using the decision cache.
 
         Returns:
             (result, reason) tuple.
         """
+        return self.decision_cache.get_or_compute(
+            getattr(self.profile, "integrity_hash", None),
+            self._decision_key(action),
+            lambda: self._evaluate_governance(action),
+        )
+
+    def _evaluate_governance(
+        self, action: ExtractedAction
+    ) -> Tuple[ValidationResult, str]:
+        """Check an action against the governance matrix, uncached."""
         matrix = self.governance_matrix.get("action_matrix", {})
 
         # Map action categories to matrix sections
@@ -0,0 +1,188 @@
+"""
+Tests for the durable, hash-chained audit sink.
+
+All imports are relative to the governed module.
+"""
+
+import time
+from pathlib import Path
+
+import pytest
+
+from ..audit_sink import AuditSink, read_audit_log, verify_audit_log
+from ..constraint_loader import LoadedProfile
+from ..execution_proxy import ExecutionMode, ExecutionProxy
+
+
+def write_records(sink, start, count):
+    for i in range(start, start + count):
+        sink.write({"target": f"file_{i}.py", "decision": "allow"})
+
+
+def test_records_are_chained_across_rotated_segments(tmp_path):
+    with AuditSink(tmp_path, max_bytes=600) as sink:
+        write_records(sink, 0, 20)
+        assert sink.flush()
+        assert sink.stats()["rotations"] > 0
+
+    records = list(read_audit_log(tmp_path))
+    assert [r["target"] for r in records] == [f"file_{i}.py" for i in range(20)]
+    assert [r["seq"] for r in records] == list(range(1, 21))
+    assert len(list(tmp_path.glob("audit-*.jsonl"))) > 1
+
+    report = verify_audit_log(tmp_path)
+    assert report.valid
+    assert report.records == 20
+    assert report.last_hash == records[-1]["hash"]
+
+
+@pytest.mark.parametrize("tamper", ["edit", "delete"])
+def test_tampering_is_detected(tmp_path, tamper):
+    with AuditSink(tmp_path) as sink:
+        write_records(sink, 0, 5)
+
+    segment = tmp_path / "audit-000001.jsonl"
+    lines = segment.read_text().splitlines(keepends=True)
+    if tamper == "edit":
+        lines[2] = lines[2].replace("allow", "deny")
+    else:
+        del lines[2]
+    segment.write_text("".join(lines))
+
+    report = verify_audit_log(tmp_path)
+    assert not report.valid
+    assert report.records == 2
+    assert (report.segment, report.line) == ("audit-000001.jsonl", 3)
+
+
+def test_reopened_sink_resumes_chain_after_torn_write(tmp_path):
+    with AuditSink(tmp_path) as sink:
+        write_records(sink, 0, 3)
+    segment = tmp_path / "audit-000001.jsonl"
+    with open(segment, "a", encoding="utf-8") as f:
+        f.write('{"target": "half-writ')
+
+    with AuditSink(tmp_path) as sink:
+        write_records(sink, 3, 2)
+
+    assert [r["seq"] for r in read_audit_log(tmp_path)] == [1, 2, 3, 4, 5]
+    assert verify_audit_log(tmp_path).valid
+
+
+def test_interval_fsync_without_explicit_flush(tmp_path):
+    sink = AuditSink(tmp_path, batch_size=1000, flush_interval=0.05)
+    write_records(sink, 0, 3)
+
+    deadline = time.monotonic() + 5
+    while sink.stats()["syncs"] == 0 and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    assert sink.stats()["syncs"] >= 1
+    assert len((tmp_path / "audit-000001.jsonl").read_text().splitlines()) == 3
+    sink.close()
+    with pytest.raises(RuntimeError):
+        sink.write({})
+
+
+def test_proxy_keeps_bounded_recent_entries_and_full_trail(tmp_path):
+    profile = LoadedProfile(
+        profile_id="test",
+        version="1.0.0",
+        resolved_permissions={},
+        resolved_constraints={},
+        inheritance_chain=["test"],
+        integrity_hash="abc123",
+    )
+    for i in range(5):
+        (tmp_path / f"f{i}.txt").write_text(str(i))
+    proxy = ExecutionProxy(
+        profile=profile,
+        sandbox_root=tmp_path,
+        mode=ExecutionMode.LIVE,
+        max_recent_entries=3,
+    )
+
+    for i in range(5):
+        assert proxy.read_file(tmp_path / f"f{i}.txt").result == str(i)
+    proxy.close()
+
+    assert [Path(e.target).name for e in proxy.get_audit_log()] == [
+        "f2.txt",
+        "f3.txt",
+        "f4.txt",
+    ]
+    assert len(proxy.get_audit_log(limit=1)) == 1
+    records = list(read_audit_log(tmp_path / ".audit"))
+    assert len(records) == 5
+    assert all(r["policy_hash"] == "abc123" for r in records)
+    assert records[0]["details"] == {"encoding": "utf-8"}
+    assert verify_audit_log(tmp_path / ".audit").valid
+
+
+def test_proxies_on_one_sandbox_share_a_single_chain(tmp_path):
+    profile = LoadedProfile(
+        profile_id="test",
+        version="1.0.0",
+        resolved_permissions={},
+        resolved_constraints={},
+        inheritance_chain=["test"],
+        integrity_hash="abc123",
+    )
+    (tmp_path / "f.txt").write_text("x")
+    proxies = [
+        ExecutionProxy(profile=profile, sandbox_root=tmp_path, mode=ExecutionMode.LIVE)
+        for _ in range(2)
+    ]
+    assert proxies[0].audit_sink is proxies[1].audit_sink
+    with pytest.raises(ValueError):
+        AuditSink(tmp_path / ".audit")
+
+    for _ in range(3):
+        for proxy in proxies:
+            proxy.read_file(tmp_path / "f.txt")
+    proxies[0].close()
+    proxies[1].read_file(tmp_path / "f.txt")  # Still open for the last owner
+    proxies[1].close()
+
+    report = verify_audit_log(tmp_path / ".audit")
+    assert report.valid
+    assert report.records == 7
+    with AuditSink(tmp_path / ".audit") as reopened:
+        assert reopened.stats()["last_seq"] == 7
+
+
+def test_unserializable_record_is_reported_and_chain_stays_valid(tmp_path):
+    sink = AuditSink(tmp_path)
+    sink.write({"target": "a.py"})
+    sink.write({"details": {1: "mixed", "key": "types"}})  # Unsortable keys
+    sink.write({"target": "b.py"})
+
+    with pytest.raises(TypeError):
+        sink.flush()
+    assert sink.stats()["writer_alive"]
+    with pytest.raises(TypeError):
+        sink.close()
+
+    assert [r["target"] for r in read_audit_log(tmp_path)] == ["a.py", "b.py"]
+    assert verify_audit_log(tmp_path).valid
+
+
+def test_flush_reports_a_dead_writer(tmp_path, monkeypatch):
+    class WriterCrash(BaseException):
+        pass
+
+    def crash(record):
+        raise WriterCrash()
+
+    monkeypatch.setattr("threading.excepthook", lambda args: None)
+    sink = AuditSink(tmp_path)
+    monkeypatch.setattr(sink, "_append", crash)
+    sink.write({"target": "a.py"})
+    sink._thread.join(5)
+
+    assert not sink.stats()["writer_alive"]
+    with pytest.raises(WriterCrash):
+        sink.flush()
+    sink._error = None  # Even with the cause cleared, records were dropped
+    assert sink.flush() is False
+    sink.close()
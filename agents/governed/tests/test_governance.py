@@ -5,12 +5,17 @@ Tests:
 - Constraint loading and hashing
 - Execution proxy behavior
 - Plan validator
+- Decision cache
+- Compiled profiles and hot reload
 - Persona locking
 
 All imports are relative to the governed module.
 """
 
+import dataclasses
+import fnmatch
 import json
+import os
 import shutil
 import tempfile
 from datetime import datetime, timezone
@@ -20,17 +25,20 @@ import pytest
 
 from ..constraint_loader import (
     ConstraintLoader,
+    GlobMatcher,
     InheritanceError,
     LoadedProfile,
     ProfileNotFoundError,
     ProfileValidationError,
 )
+from ..decision_cache import DecisionCache
 from ..execution_proxy import (
     ActionType,
     Decision,
     ExecutionMode,
     ExecutionProxy,
 )
+from ..governed_agent import GovernedCodingAgent
 from ..persona_lock import (
     AgentType,
     PersonaContext,
@@ -419,6 +427,231 @@ class TestPlanValidator:
         assert actions[0].target == "test.py"
 
 
+# ==================== Decision Cache Tests ====================
+
+
+class TestDecisionCache:
+    """Tests for cached governance decisions."""
+
+    @pytest.fixture
+    def components(self, governance_dir, temp_sandbox):
+        """Validator and proxy sharing one decision cache."""
+        profile = ConstraintLoader(governance_dir).load("coding_agent_profile")
+        matrix = json.loads((governance_dir / "governance_matrix.json").read_text())
+        cache = DecisionCache()
+        validator = PlanValidator(
+            governance_matrix=matrix,
+            profile=profile,
+            sandbox_root=temp_sandbox,
+            decision_cache=cache,
+        )
+        proxy = ExecutionProxy(
+            profile=profile,
+            sandbox_root=temp_sandbox,
+            mode=ExecutionMode.DRY_RUN,
+            decision_cache=cache,
+        )
+        return validator, proxy, cache
+
+    def test_repeated_steps_hit_cache(self, components):
+        """Recurring actions reuse decisions identical to uncached checks."""
+        validator, _, cache = components
+        plan = Plan.from_text(
+            "1. read test.py\n2. write runtime/out.txt\n3. run `ls -la`\n"
+            "4. modify my constraint file\n5. read test.py"
+        )
+
+        first = validator.validate(plan)
+        second = validator.validate(plan)
+
+        assert second.result == first.result
+        assert second.rationale == first.rationale
+        for step in plan.steps:
+            for action in validator._extract_actions(step):
+                assert validator._check_governance(
+                    action
+                ) == validator._evaluate_governance(action)
+        stats = cache.stats()
+        assert stats["cache_misses"] == 4
+        assert stats["hit_rate"] > 0.5
+
+    def test_cache_shared_with_proxy(self, components):
+        """Proxy command checks are cached alongside plan decisions."""
+        validator, proxy, cache = components
+        validator.validate_text("read test.py")
+
+        assert proxy.run_command("git add .").decision == Decision.ESCALATE
+        assert proxy.run_command(" git add . ").decision == Decision.ESCALATE
+        assert proxy.run_command("rm -rf /").decision == Decision.DENY
+        assert cache.stats()["cache_hits"] == 1
+        assert len(cache) == 3
+
+    def test_profile_hash_change_invalidates(self, components):
+        """Swapping the profile drops decisions made under the old hash."""
+        validator, proxy, cache = components
+        validator.validate_text("read test.py")
+        proxy.run_command("ls")
+        assert len(cache) == 2
+
+        reloaded = dataclasses.replace(proxy.profile, integrity_hash="new-hash")
+        validator.profile = reloaded
+        validator.validate_text("read test.py")
+
+        stats = cache.stats()
+        assert stats["invalidations"] == 1
+        assert stats["policy_hash"] == "new-hash"
+        assert len(cache) == 1
+
+    def test_lru_eviction(self):
+        """The least recently used decision is evicted when full."""
+        cache = DecisionCache(max_entries=2)
+        cache.get_or_compute("h", "a", lambda: 1)
+        cache.get_or_compute("h", "b", lambda: 2)
+        cache.get_or_compute("h", "a", lambda: 0)
+        cache.get_or_compute("h", "c", lambda: 3)
+
+        assert cache.get_or_compute("h", "a", lambda: 0) == 1
+        assert cache.get_or_compute("h", "b", lambda: 9) == 9
+        assert cache.stats()["evictions"] == 2
+        with pytest.raises(ValueError):
+            DecisionCache(max_entries=0)
+
+    def test_patterns_compiled_once_per_class(self):
+        """Pattern tables are built per class, honouring subclass overrides."""
+
+        class StrictValidator(PlanValidator):
+            BYPASS_PATTERNS = [(r"\bplease\b", "Suspiciously polite")]
+
+        assert PlanValidator._pattern_tables() is PlanValidator._pattern_tables()
+        bypass, _ = StrictValidator._pattern_tables()
+        assert [reason for _, reason in bypass] == ["Suspiciously polite"]
+        assert ExecutionProxy._blocked_regexes() is ExecutionProxy._blocked_regexes()
+
+
+# ==================== Hot Reload Tests ====================
+
+
+def edit_profile(governance_dir, profile_id, edit):
+    """Rewrite a profile file and make sure its mtime moves."""
+    path = governance_dir / f"{profile_id}.json"
+    data = json.loads(path.read_text())
+    edit(data)
+    mtime = path.stat().st_mtime_ns
+    path.write_text(json.dumps(data))
+    os.utime(path, ns=(mtime + 10**9, mtime + 10**9))
+
+
+class TestProfileHotReload:
+    """Tests for compiled profiles and hot reloading."""
+
+    def test_glob_matcher_agrees_with_fnmatch(self):
+        """One combined regex gives the same answers as fnmatch per pattern."""
+        patterns = ["*.py", "runtime/**", "**/*.secret", "[abc]?.md", ".env*"]
+        matcher = GlobMatcher(tuple(patterns))
+        paths = [
+            "test.py",
+            "runtime/a/b.txt",
+            "x/y.secret",
+            "a1.md",
+            "d1.md",
+            ".env.local",
+            "src/main.rs",
+            "",
+        ]
+
+        for path in paths:
+            expected = any(fnmatch.fnmatch(path, p) for p in patterns)
+            assert matcher.matches(path) == expected, path
+        assert not GlobMatcher(()).matches("test.py")
+
+    def test_compiled_tables_are_immutable(self, governance_dir):
+        """Consumers share frozen lookup tables."""
+        compiled = (
+            ConstraintLoader(governance_dir).load("coding_agent_profile").compiled
+        )
+
+        assert compiled.commands["deny"] == frozenset({"rm -rf", "sudo"})
+        assert compiled.file_decision("delete", "any/file.py") == "deny"
+        assert compiled.file_decision("read", "src/app.py") == "allow"
+        assert compiled.file_decision("read", "notes.md") is None
+        with pytest.raises(TypeError):
+            compiled.commands["allow"] = frozenset()
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            compiled.commands = {}
+
+    def test_refresh_without_changes_keeps_profile(self, governance_dir):
+        """Unchanged files are neither re-read nor recompiled."""
+        loader = ConstraintLoader(governance_dir, reload_interval=0)
+        profile = loader.load("coding_agent_profile")
+
+        os.utime(governance_dir / "base_profile.json")
+        assert loader.refresh(profile) is profile
+        assert loader.load("coding_agent_profile") is profile
+
+    def test_refresh_picks_up_edited_parent(self, governance_dir, temp_sandbox):
+        """Editing any file in the chain swaps in a newly compiled profile."""
+        loader = ConstraintLoader(governance_dir, reload_interval=0)
+        profile = loader.load("coding_agent_profile")
+        proxy = ExecutionProxy(profile, temp_sandbox, mode=ExecutionMode.DRY_RUN)
+        target = temp_sandbox / "notes.md"
+        assert proxy.write_file(target, "hi").decision == Decision.DENY
+
+        edit_profile(
+            governance_dir,
+            "base_profile",
+            lambda d: d["permissions"]["file_operations"]["allow"].update(
+                {"create": ["*.md"]}
+            ),
+        )
+        reloaded = loader.refresh(profile)
+
+        assert reloaded is not profile
+        assert reloaded.integrity_hash != profile.integrity_hash
+        assert loader.active_hash == reloaded.integrity_hash
+        assert loader.refresh(profile) is reloaded
+        proxy.profile = reloaded
+        assert proxy.write_file(target, "hi").decision == Decision.ALLOW
+
+    def test_refresh_is_throttled_and_survives_bad_edits(self, governance_dir):
+        """Half-written files keep the current profile in force."""
+        loader = ConstraintLoader(governance_dir, reload_interval=3600)
+        profile = loader.load("coding_agent_profile")
+        assert loader.refresh(profile) is profile
+
+        path = governance_dir / "coding_agent_profile.json"
+        path.write_text('{"metadata": ')
+        assert loader.refresh(profile) is profile  # Not checked yet
+        assert loader.last_reload_error is None
+
+        loader.reload_interval = 0
+        assert loader.refresh(profile) is profile
+        assert isinstance(loader.last_reload_error, ProfileValidationError)
+
+    def test_agent_reloads_policy_between_tasks(self, governance_dir, temp_sandbox):
+        """The agent swaps the reloaded profile into every component."""
+        agent = GovernedCodingAgent.create(
+            agent_id="reload-agent",
+            sandbox_root=temp_sandbox,
+            governance_dir=governance_dir,
+            mode=ExecutionMode.MOCK,
+            persist_persona=False,
+        )
+        agent._loader.reload_interval = 0
+        original = agent.constraint_hash
+
+        edit_profile(
+            governance_dir,
+            "coding_agent_profile",
+            lambda d: d["metadata"].update({"version": "1.1.0"}),
+        )
+        result = agent.execute_task("read test.py")
+
+        assert result["constraint_hash"] != original
+        assert agent._executor.profile is agent._validator.profile
+        assert agent._executor.profile.version == "1.1.0"
+        assert agent.persona.constraint_hash == original
+
+
 # ==================== Persona Lock Tests ====================
 
 
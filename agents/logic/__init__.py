@@ -19,6 +19,7 @@ from .reasoning_agent import (
     ReasoningAgent,
     ReasoningStep,
 )
+from .result_cache import ResultCache
 
 __all__ = [
     "KnowledgeBase",
@@ -32,4 +33,5 @@ __all__ = [
     "FormalArgument",
     "ArgumentBuilder",
     "ArgumentFormatter",
+    "ResultCache",
 ]
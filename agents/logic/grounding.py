@@ -15,6 +15,8 @@ from dataclasses import dataclass
 from enum import Enum
 from typing import Dict, List, Optional, Set
 
+from agents.core.semantic_parser import compile_pattern_set, keyword_rules
+
 
 class QuantifierType(Enum):
     """Types of quantification in natural language."""
@@ -126,6 +128,11 @@ class SemanticParser:
             "causes": ModalityType.CAUSAL,
         }
 
+        # Whole-word matchers from the semantic parser engine, built from the
+        # tables above at construction
+        self._quantifiers = compile_pattern_set(keyword_rules(self.quantifier_patterns))
+        self._modalities = compile_pattern_set(keyword_rules(self.modality_patterns))
+
     def parse(self, statement: str) -> ParseResult:
         """
         Parse natural language statement to logical form.
@@ -256,17 +263,11 @@ class SemanticParser:
 
     def _detect_quantifier(self, statement: str) -> QuantifierType:
         """Detect quantifier in statement."""
-        for pattern, quant_type in self.quantifier_patterns.items():
-            if pattern in statement:
-                return quant_type
-        return QuantifierType.GENERIC  # Default
+        return self._quantifiers.search(statement, QuantifierType.GENERIC)
 
     def _detect_modality(self, statement: str) -> Optional[ModalityType]:
         """Detect modal operators in statement."""
-        for pattern, mod_type in self.modality_patterns.items():
-            if pattern in statement:
-                return mod_type
-        return None
+        return self._modalities.search(statement)
 
     def _parse_universal(self, statement: str, assumptions: List[str]) -> ParseResult:
         """
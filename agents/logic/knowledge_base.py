@@ -93,6 +93,8 @@ class KnowledgeBase:
         self.rules: List[Dict[str, Any]] = []
         self.ontology: Dict[str, Set[str]] = {}  # Concept relationships
         self.inference_cache: Dict[str, ValidationResult] = {}
+        # Incremented on every mutation so callers can detect stale derived state
+        self.version: int = 0
 
     def add_fact(
         self,
@@ -121,6 +123,7 @@ class KnowledgeBase:
         )
 
         self.facts[fact.fact_id] = fact
+        self._mark_changed()
         return fact.fact_id
 
     def query(self, question: str) -> List[Fact]:
@@ -237,12 +240,19 @@ class KnowledgeBase:
                 "type": rule_type,
             }
         )
+        self._mark_changed()
 
     def add_to_ontology(self, concept: str, related_concepts: List[str]):
         """Add concept relationships to the ontology."""
         if concept not in self.ontology:
             self.ontology[concept] = set()
         self.ontology[concept].update(related_concepts)
+        self._mark_changed()
+
+    def _mark_changed(self) -> None:
+        """Bump the version stamp and drop validations computed on old facts."""
+        self.version += 1
+        self.inference_cache.clear()
 
     def get_related_concepts(self, concept: str) -> Set[str]:
         """Get all concepts related to a given concept."""
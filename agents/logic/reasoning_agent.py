@@ -6,6 +6,7 @@ Backend: Machine learning (extended thinking, tool use)
 Frontend: Logic-based knowledge system (formal reasoning, argument chains)
 """
 
+import copy
 import time
 from dataclasses import dataclass, field
 from datetime import datetime
@@ -30,6 +31,7 @@ from .knowledge_base import (
     LogicalStatement,
     LogicType,
 )
+from .result_cache import ResultCache
 
 
 @dataclass
@@ -295,6 +297,9 @@ class ReasoningAgent:
         reasoning_depth: int = 3,
         logic_weight: float = 0.75,
         verbose: bool = False,
+        enable_cache: bool = True,
+        cache_size: int = 256,
+        cache_ttl_seconds: float = 300.0,
     ):
         self.name = name
         self.system_prompt = system_prompt
@@ -317,6 +322,13 @@ class ReasoningAgent:
         )
         self.feedback = FeedbackLoop()
 
+        # Result cache keyed on normalized inputs + knowledge base version
+        self.result_cache: Optional[ResultCache] = (
+            ResultCache(max_entries=cache_size, ttl_seconds=cache_ttl_seconds)
+            if enable_cache
+            else None
+        )
+
     def reason(
         self,
         query: str,
@@ -325,7 +337,81 @@ class ReasoningAgent:
     ) -> Dict[str, Any]:
         """
         Execute extended reasoning on a query.
+
+        Results are cached per (query, context, options) and knowledge base
+        version, so ``add_knowledge`` invalidates earlier answers. Each call
+        returns an independent copy that callers may mutate.
+
+        Cache hits are recorded in the latency tracker and feedback loop like
+        computed answers, marked ``cached``. They do not consult or update the
+        circuit breaker, since serving a stored answer never touches the
+        reasoning pipeline it protects.
         """
+        if self.result_cache is None:
+            return self._reason_uncached(query, context, options)
+
+        start_time = time.time()
+
+        key = ResultCache.make_key(query, context, options, self.knowledge_base.version)
+
+        def compute():
+            result = self._reason_uncached(query, context, options)
+            return result, list(self.reasoning_chain)
+
+        (result, chain), from_cache = self.result_cache.get_or_compute(
+            key,
+            compute,
+            # Never cache circuit-breaker rejections
+            cache_if=lambda entry: "error" not in entry[0],
+        )
+        if from_cache:
+            self.reasoning_chain = list(chain)
+            self._record_cache_hit(query, result, start_time)
+        return copy.deepcopy(result)
+
+    def _record_cache_hit(
+        self, query: str, result: Dict[str, Any], start_time: float
+    ) -> None:
+        """Feedback and latency bookkeeping for an answer served from cache."""
+        self.feedback.record_decision(
+            decision_type="reasoning_conclusion",
+            chosen_option=result["conclusion"],
+            alternatives=[],
+            scores={},
+            confidence=result["formal_argument"].overall_confidence,
+            context={
+                "query": query,
+                "steps": len(self.reasoning_chain),
+                "cached": True,
+            },
+        )
+        self.latency.record(
+            LatencyMeasurement(
+                component="reasoning_agent",
+                duration_ms=(time.time() - start_time) * 1000,
+                success=True,
+                metadata={"cached": True},
+            )
+        )
+
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Get result cache hit/miss statistics."""
+        if self.result_cache is None:
+            return {"enabled": False}
+        return {"enabled": True, **self.result_cache.stats()}
+
+    def clear_cache(self) -> None:
+        """Drop all cached reasoning results."""
+        if self.result_cache is not None:
+            self.result_cache.clear()
+
+    def _reason_uncached(
+        self,
+        query: str,
+        context: Optional[str],
+        options: Optional[List[str]],
+    ) -> Dict[str, Any]:
+        """Run the full reasoning pipeline without consulting the cache."""
         # Circuit Breaker Check
         can_execute, cb_state = self.circuit_breaker.can_execute("reasoning_agent")
         if not can_execute:
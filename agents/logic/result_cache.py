@@ -0,0 +1,153 @@
+"""
+Result Cache for Reasoning Calls
+
+Bounded LRU + TTL cache with single-flight coalescing. Used by
+ReasoningAgent to avoid recomputing identical (query, context, options)
+requests against an unchanged knowledge base.
+"""
+
+import re
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Hashable, Optional, Sequence, Tuple
+
+from agents.utils.lru import LRUCache
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_text(text: Optional[str]) -> str:
+    """Collapse whitespace so trivially different inputs share a cache key."""
+    if not text:
+        return ""
+    return _WHITESPACE.sub(" ", text).strip()
+
+
+@dataclass
+class _Flight:
+    """A computation in progress that concurrent callers can wait on."""
+
+    event: threading.Event = field(default_factory=threading.Event)
+    value: Any = None
+    error: Optional[BaseException] = None
+
+
+class ResultCache(LRUCache):
+    """
+    Thread-safe LRU cache with per-entry TTL and single-flight coalescing.
+
+    When several threads request the same missing key at once, only the first
+    computes the value; the rest wait for it and share the result.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 256,
+        ttl_seconds: float = 300.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        super().__init__(max_entries)
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+
+        self._in_flight: Dict[Hashable, _Flight] = {}
+        self._coalesced = 0
+        self._expirations = 0
+
+    @staticmethod
+    def make_key(
+        query: str,
+        context: Optional[str],
+        options: Optional[Sequence[str]],
+        version: Hashable,
+    ) -> Tuple[Hashable, ...]:
+        """Build a cache key from normalized inputs and a state version stamp."""
+        normalized_options = (
+            tuple(normalize_text(o) for o in options) if options is not None else None
+        )
+        return (
+            normalize_text(query),
+            normalize_text(context),
+            normalized_options,
+            version,
+        )
+
+    def get_or_compute(
+        self,
+        key: Hashable,
+        compute: Callable[[], Any],
+        cache_if: Optional[Callable[[Any], bool]] = None,
+    ) -> Tuple[Any, bool]:
+        """
+        Return the cached value for key, computing it at most once.
+
+        Args:
+            key: Cache key
+            compute: Zero-argument function producing the value on a miss
+            cache_if: Optional predicate; results failing it are returned
+                but not stored
+
+        Returns:
+            (value, from_cache) where from_cache is True for hits and for
+            callers that waited on another thread's computation
+        """
+        with self._lock:
+            value, found = self._lookup(key)
+            if found:
+                self._hits += 1
+                return value, True
+
+            flight = self._in_flight.get(key)
+            leader = flight is None
+            if leader:
+                flight = _Flight()
+                self._in_flight[key] = flight
+                self._misses += 1
+            else:
+                self._coalesced += 1
+
+        if not leader:
+            flight.event.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.value, True
+
+        try:
+            value = compute()
+        except BaseException as exc:
+            flight.error = exc
+            raise
+        else:
+            flight.value = value
+            if cache_if is None or cache_if(value):
+                with self._lock:
+                    self._store(key, value)
+            return value, False
+        finally:
+            with self._lock:
+                self._in_flight.pop(key, None)
+            flight.event.set()
+
+    def _stats(self) -> Dict[str, Any]:
+        return {
+            **super()._stats(),
+            "coalesced": self._coalesced,
+            "expirations": self._expirations,
+        }
+
+    def _lookup(self, key: Hashable) -> Tuple[Any, bool]:
+        """Find a live entry and mark it most recently used. Caller holds lock."""
+        entry, found = super()._lookup(key)
+        if not found:
+            return None, False
+        value, stored_at = entry
+        if self._clock() - stored_at > self.ttl_seconds:
+            del self._entries[key]
+            self._expirations += 1
+            return None, False
+        return value, True
+
+    def _store(self, key: Hashable, value: Any) -> None:
+        """Insert a timestamped entry and enforce the size bound."""
+        super()._store(key, (value, self._clock()))
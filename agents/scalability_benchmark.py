@@ -0,0 +1,126 @@
+"""
+Scalability Benchmark - 4x vs 8x vs 16x vs 32x Architectures
+
+Non-interactive companion to scalability_demo.py. Measures per-query latency
+for each architecture (all layers active), the throughput of the batched
+``execute_many`` API, and prints a markdown table in the format used by
+SCALABILITY_ANALYSIS.md.
+
+Usage:
+    python agents/scalability_benchmark.py
+    python agents/scalability_benchmark.py --batch 256 --processes
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+from typing import Any, Dict, List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from agents.tools.extended_thinking import ExtendedThinkingTool
+
+# Logic weights recommended per architecture in SCALABILITY_ANALYSIS.md
+ARCHITECTURES = [(4, 0.60), (8, 0.75), (16, 0.82), (32, 0.88)]
+
+QUERY = (
+    'A study claims: "Companies using AI increase productivity by 40%." '
+    "Sample size: 50 companies. Duration: 6 months. Selection: self-reported "
+    "volunteers. Control group: none. Funding: AI vendor. "
+    "How should we interpret this claim?"
+)
+OPTIONS = [
+    "Claim is valid - 40% improvement is significant",
+    "Claim is questionable - sample bias and no control group",
+    "Claim is invalid - vendor funding creates conflict of interest",
+    "Cannot determine - need more information",
+]
+
+
+def benchmark_architecture(
+    layers: int,
+    logic_weight: float,
+    iterations: int,
+    batch: int,
+    use_processes: bool,
+) -> Dict[str, Any]:
+    """Time sequential execute() calls and one execute_many() batch."""
+    tool = ExtendedThinkingTool(
+        layers=layers, logic_weight=logic_weight, history_limit=batch
+    )
+
+    timings: List[float] = []
+    result: Dict[str, Any] = {}
+    for _ in range(iterations):
+        start = time.perf_counter()
+        result = tool.execute(query=QUERY, options=OPTIONS, depth=layers)
+        timings.append((time.perf_counter() - start) * 1000)
+
+    queries = [
+        {"query": f"{QUERY} (variant {i})", "options": OPTIONS, "depth": layers}
+        for i in range(batch)
+    ]
+    start = time.perf_counter()
+    tool.execute_many(queries, use_processes=use_processes)
+    batch_seconds = time.perf_counter() - start
+
+    consensus = result["thinking_chain"][-1]["details"]
+    return {
+        "layers": layers,
+        "logic_weight": logic_weight,
+        "mean_ms": statistics.mean(timings),
+        "p95_ms": sorted(timings)[int(0.95 * (len(timings) - 1))],
+        "batch_qps": batch / batch_seconds if batch_seconds else 0.0,
+        "confidence": result["confidence"],
+        "logic_layers": consensus["num_logic_layers"],
+        "logic_agreement": consensus["logic_agreement"],
+    }
+
+
+def format_table(rows: List[Dict[str, Any]]) -> str:
+    """Render results as a markdown table (confidence gain relative to 4x)."""
+    baseline = rows[0]["confidence"] if rows else 0.0
+    lines = [
+        "| Architecture | Layers | Time (ms) | p95 (ms) | Batch q/s | Confidence | "
+        "Gain vs 4x | Logic Weight | Logic Layers |",
+        "|--------------|--------|-----------|----------|-----------|------------|"
+        "------------|--------------|--------------|",
+    ]
+    for row in rows:
+        gain = (
+            "Baseline"
+            if row["layers"] == rows[0]["layers"]
+            else f"{(row['confidence'] - baseline) / baseline:+.0%}"
+        )
+        lines.append(
+            f"| **{row['layers']}x** | {row['layers']} | {row['mean_ms']:.3f} | "
+            f"{row['p95_ms']:.3f} | {row['batch_qps']:.0f} | {row['confidence']:.1%} | "
+            f"{gain} | {row['logic_weight']:.2f} | {row['logic_layers']} |"
+        )
+    return "\n".join(lines)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Extended thinking scalability benchmark"
+    )
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--batch", type=int, default=128)
+    parser.add_argument(
+        "--processes", action="store_true", help="Use a process pool for execute_many"
+    )
+    args = parser.parse_args()
+
+    rows = [
+        benchmark_architecture(
+            layers, logic_weight, args.iterations, args.batch, args.processes
+        )
+        for layers, logic_weight in ARCHITECTURES
+    ]
+    print(format_table(rows))
+
+
+if __name__ == "__main__":
+    main()
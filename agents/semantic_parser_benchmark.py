@@ -0,0 +1,208 @@
+"""
+Semantic Parser Benchmark - Sequential Patterns vs Combined Grammar
+
+Parses a stream of argument sentences with EnhancedSemanticParser,
+comparing:
+
+- legacy: every sentence pattern tried in turn with ``pattern.match`` and
+  every quantifier/modality/negation pattern with ``pattern.search``, as
+  before the combined PatternSets
+- combined: one match of the combined grammar, one scan per detection table
+- parse_batch: combined grammar, distinct sentences parsed once per batch
+
+Caches are cleared before each run so parsing itself is measured; results
+are checked to be identical to the legacy parser's.
+
+Usage:
+    python agents/semantic_parser_benchmark.py
+    python agents/semantic_parser_benchmark.py --sentences 20000 --repeat 5
+"""
+
+import argparse
+import os
+import random
+import re
+import sys
+import time
+from typing import Any, Callable, Dict, List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from agents.core.semantic_parser import (
+    EnhancedSemanticParser,
+    ModalityType,
+    ParseResult,
+    QuantifierType,
+    create_logic_ontology,
+)
+
+SENTENCES = [
+    "All men are mortal",
+    "Socrates is a man",
+    "Some birds are flightless",
+    "Every student must submit the assignment",
+    "Dogs are loyal",
+    "If it rains, then the ground is wet",
+    "If the model is biased then the output is unfair",
+    "Smoking causes cancer",
+    "Most swans are white",
+    "Few politicians never lie",
+    "The proposition is valid and the argument is sound",
+    "The data is noisy but the model is accurate",
+    "Rain implies clouds",
+    "He left because it was late",
+    "We should probably reconsider the whole plan",
+    "No reptiles are mammals",
+    "The claim might not hold without more evidence",
+    "Alice believes that the deduction is correct",
+    "Each premise is true",
+    "The reasoning seems fine to me",
+]
+
+# Sentences recur with a long-tailed frequency, as in real argument streams
+WEIGHTS = [1.0 / (rank + 1) for rank in range(len(SENTENCES))]
+
+
+def make_stream(length: int, seed: int = 0) -> List[str]:
+    rng = random.Random(seed)
+    return rng.choices(SENTENCES, weights=WEIGHTS, k=length)
+
+
+class LegacySemanticParser(EnhancedSemanticParser):
+    """Per-pattern loops and an unbounded dict cache."""
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.legacy_cache: Dict[str, ParseResult] = {}
+        self.legacy_sentences = [
+            (re.compile(p, re.IGNORECASE), name) for p, name in self.SENTENCE_PATTERNS
+        ]
+
+    def parse(self, text: str) -> ParseResult:
+        text = text.strip()
+        if text in self.legacy_cache:
+            return self.legacy_cache[text]
+        result = self._parse_uncached(text)
+        self.legacy_cache[text] = result
+        return result
+
+    def _try_pattern_match(self, text: str) -> ParseResult:
+        for pattern, pattern_name in self.legacy_sentences:
+            match = pattern.match(text)
+            if match:
+                return self._handle_pattern(pattern_name, match.groups(), text)
+        return ParseResult(success=False, frames=[], confidence=0.0)
+
+    def _detect_quantifier(self, text: str) -> QuantifierType:
+        for pattern, quant_type in self.QUANTIFIER_PATTERNS.items():
+            if re.search(pattern, text, re.IGNORECASE):
+                return quant_type
+        return QuantifierType.GENERIC
+
+    def _detect_modality(self, text: str) -> ModalityType:
+        for pattern, modal_type in self.MODALITY_PATTERNS.items():
+            if re.search(pattern, text, re.IGNORECASE):
+                return modal_type
+        return ModalityType.NONE
+
+    def _detect_negation(self, text: str) -> bool:
+        return any(
+            re.search(pattern, text, re.IGNORECASE)
+            for pattern in self.NEGATION_PATTERNS
+        )
+
+    def clear_cache(self) -> None:
+        self.legacy_cache.clear()
+
+
+def best_time_ms(func: Callable[[], Any], repeat: int) -> float:
+    """Best-of-N wall time in milliseconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def benchmark(length: int, repeat: int) -> Dict[str, Any]:
+    stream = make_stream(length)
+    ontology = create_logic_ontology()
+    legacy = LegacySemanticParser(ontology)
+    parser = EnhancedSemanticParser(ontology)
+
+    identical = [legacy.parse(s) for s in SENTENCES] == [
+        parser.parse(s) for s in SENTENCES
+    ]
+
+    def uncached(target: EnhancedSemanticParser) -> Callable[[], None]:
+        def run() -> None:
+            for sentence in SENTENCES:
+                target.clear_cache()
+                target.parse(sentence)
+
+        return run
+
+    def stream_run(target: EnhancedSemanticParser, batch: bool) -> Callable[[], None]:
+        def run() -> None:
+            target.clear_cache()
+            if batch:
+                target.parse_batch(stream)
+            else:
+                for sentence in stream:
+                    target.parse(sentence)
+
+        return run
+
+    return {
+        "sentences": length,
+        "distinct": len(set(stream)),
+        "legacy_parse_us": best_time_ms(uncached(legacy), repeat * 20)
+        * 1000
+        / len(SENTENCES),
+        "parse_us": best_time_ms(uncached(parser), repeat * 20) * 1000 / len(SENTENCES),
+        "legacy_stream_ms": best_time_ms(stream_run(legacy, False), repeat),
+        "stream_ms": best_time_ms(stream_run(parser, False), repeat),
+        "batch_ms": best_time_ms(stream_run(parser, True), repeat),
+        "identical": identical,
+        "cache": parser.parse_cache.stats(),
+    }
+
+
+def format_report(result: Dict[str, Any]) -> str:
+    lines = [
+        f"Uncached parse: legacy {result['legacy_parse_us']:.1f} us, "
+        f"combined {result['parse_us']:.1f} us per sentence "
+        f"({result['legacy_parse_us'] / result['parse_us']:.1f}x)",
+        "",
+        f"Stream: {result['sentences']} sentences, {result['distinct']} distinct",
+        "",
+        "| Path | Total (ms) | Speedup |",
+        "|------|------------|---------|",
+    ]
+    for label, key in (
+        ("legacy, dict cache", "legacy_stream_ms"),
+        ("combined, LRU cache", "stream_ms"),
+        ("parse_batch", "batch_ms"),
+    ):
+        ms = result[key]
+        lines.append(f"| {label} | {ms:.2f} | {result['legacy_stream_ms'] / ms:.1f}x |")
+    lines += [
+        "",
+        f"Results identical to legacy: {'yes' if result['identical'] else 'NO'}",
+        f"Cache: {result['cache']}",
+    ]
+    return "\n".join(lines)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Semantic parser benchmark")
+    parser.add_argument("--sentences", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(format_report(benchmark(args.sentences, args.repeat)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""Tests for streaming, bounded-memory output capture in BashTool."""
+
+import asyncio
+import os
+import signal
+import time
+
+import pytest
+
+from agents.tools.bash import BashTool, BoundedOutput
+from agents.tools.security import CommandSecurityPolicy
+
+
+def make_tool(tmp_path, **kwargs):
+    policy = CommandSecurityPolicy(
+        allowed_commands={"cat", "head", "ls", "sleep", "yes"},
+        allowed_paths=[str(tmp_path)],
+    )
+    return BashTool(security_policy=policy, **kwargs)
+
+
+def run(tool, command, tmp_path):
+    return asyncio.run(tool.execute(command, working_directory=str(tmp_path)))
+
+
+def test_bounded_output_keeps_head_and_tail():
+    output = BoundedOutput(max_bytes=10)
+    for i in range(100):
+        output.append(f"{i:03d}".encode())
+
+    assert output.total_bytes == 300
+    assert bytes(output.head) == b"00000"
+    assert bytes(output.tail) == b"98099"
+    assert output.render() == "00000\n[... 290 bytes elided ...]\n98099"
+
+
+def test_small_output_is_unchanged(tmp_path):
+    (tmp_path / "a.txt").write_text("hello\nworld\n")
+    tool = make_tool(tmp_path)
+
+    assert run(tool, "cat a.txt", tmp_path) == "hello\nworld"
+    assert run(tool, "ls missing", tmp_path).startswith("ls:")
+    assert run(tool, "ls missing", tmp_path).endswith("[Exit code: 2]")
+
+
+def test_large_output_is_truncated_to_budget(tmp_path):
+    tool = make_tool(tmp_path, max_output_bytes=1024)
+
+    result = run(tool, "yes line | head -c 2000000", tmp_path)
+
+    assert result.startswith("line\nline")
+    assert "[... 1998976 bytes elided ...]" in result
+    assert len(result) < 1200
+
+
+def test_progress_callback_sees_output_before_exit(tmp_path):
+    (tmp_path / "a.txt").write_text("first\n")
+    seen = []
+
+    async def progress(stream, text):
+        seen.append((stream, text, time.monotonic()))
+
+    tool = make_tool(tmp_path, progress_callback=progress)
+    start = time.monotonic()
+    result = run(tool, "cat a.txt; sleep 1; cat a.txt", tmp_path)
+    end = time.monotonic()
+
+    assert result == "first\nfirst"
+    assert seen[0][:2] == ("stdout", "first\n")
+    assert seen[0][2] - start < end - start - 0.5
+    assert "".join(text for _, text, _ in seen) == "first\nfirst\n"
+
+
+@pytest.mark.skipif(os.name != "posix", reason="process groups are POSIX-only")
+def test_timeout_kills_process_group_and_keeps_partial_output(tmp_path):
+    (tmp_path / "a.txt").write_text("partial\n")
+    tool = make_tool(tmp_path, timeout=1)
+
+    start = time.monotonic()
+    result = run(tool, "cat a.txt; sleep 30 | cat", tmp_path)
+
+    assert time.monotonic() - start < 10
+    assert result == "Error: Command timed out after 1 seconds\npartial"
+
+
+def test_failing_progress_callback_is_reported_not_fatal(tmp_path):
+    (tmp_path / "a.txt").write_text("first\n")
+    calls = []
+
+    def progress(stream, text):
+        calls.append(text)
+        raise RuntimeError("boom")
+
+    tool = make_tool(tmp_path, progress_callback=progress)
+    result = run(tool, "cat a.txt; sleep 0.2; cat a.txt", tmp_path)
+
+    assert result == "first\nfirst\n[Progress callback failed: RuntimeError: boom]"
+    assert calls == ["first\n"]
+
+
+@pytest.mark.skipif(os.name != "posix", reason="process groups are POSIX-only")
+def test_cancelled_execute_kills_process(tmp_path, monkeypatch):
+    (tmp_path / "a.txt").write_text("partial\n")
+    processes = []
+    create = asyncio.create_subprocess_shell
+
+    async def recording_create(*args, **kwargs):
+        processes.append(await create(*args, **kwargs))
+        return processes[-1]
+
+    monkeypatch.setattr(asyncio, "create_subprocess_shell", recording_create)
+    tool = make_tool(tmp_path)
+
+    async def cancel_midway():
+        task = asyncio.create_task(
+            tool.execute("cat a.txt; sleep 30 | cat", str(tmp_path))
+        )
+        await asyncio.sleep(0.5)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    start = time.monotonic()
+    asyncio.run(cancel_midway())
+
+    assert time.monotonic() - start < 10
+    assert processes[0].returncode == -signal.SIGKILL
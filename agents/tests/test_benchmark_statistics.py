@@ -0,0 +1,192 @@
+"""Tests for the statistical benchmark runner in agents.core.benchmark_suite."""
+
+import multiprocessing
+import random
+import statistics
+
+import pytest
+
+from agents.core.benchmark_suite import (
+    BenchmarkCategory,
+    BenchmarkConfig,
+    BenchmarkResult,
+    BenchmarkRunner,
+    bootstrap_change_ci,
+    bootstrap_ci,
+    main,
+    mann_whitney_u,
+    percentile,
+)
+
+
+def synthetic_result(name, samples):
+    ordered = sorted(samples)
+    return BenchmarkResult(
+        name=name,
+        category=BenchmarkCategory.PERFORMANCE,
+        success=True,
+        iterations=len(samples),
+        mean_ms=statistics.fmean(samples),
+        std_ms=statistics.stdev(samples),
+        min_ms=ordered[0],
+        max_ms=ordered[-1],
+        p50_ms=percentile(ordered, 50),
+        p90_ms=percentile(ordered, 90),
+        p99_ms=percentile(ordered, 99),
+        samples_ms=list(samples),
+    )
+
+
+def noisy(center, n=60, seed=1):
+    rng = random.Random(seed)
+    return [rng.gauss(center, center * 0.05) for _ in range(n)]
+
+
+def test_percentile_interpolates_instead_of_using_max():
+    values = list(range(1, 11))
+    assert percentile(values, 50) == pytest.approx(5.5)
+    assert percentile(values, 99) == pytest.approx(9.91)
+    assert percentile([], 50) == 0.0
+
+
+def test_mann_whitney_detects_shift_direction():
+    baseline, slower = noisy(10.0), noisy(12.0, seed=2)
+
+    _, p_slower = mann_whitney_u(baseline, slower)
+    _, p_faster = mann_whitney_u(slower, baseline)
+    _, p_same = mann_whitney_u(baseline, noisy(10.0, seed=3))
+
+    assert p_slower < 1e-6
+    assert p_faster > 0.99
+    assert p_same > 0.01
+    assert mann_whitney_u([1.0] * 5, [1.0] * 5)[1] == pytest.approx(1.0)
+
+
+def test_bootstrap_ci_brackets_mean_and_is_deterministic():
+    samples = noisy(5.0, n=200)
+    low, high = bootstrap_ci(samples)
+
+    assert low < statistics.fmean(samples) < high
+    assert bootstrap_ci(samples) == (low, high)
+
+
+def test_auto_calibration_and_bounded_samples():
+    runner = BenchmarkRunner()
+    config = BenchmarkConfig(
+        name="calibrated",
+        category=BenchmarkCategory.PERFORMANCE,
+        iterations=10,
+        auto_calibrate=True,
+        min_time_seconds=0.05,
+        max_iterations=5000,
+        max_samples=100,
+        bootstrap_resamples=100,
+    )
+
+    result = runner.run_benchmark(config, lambda: sum(range(50)))
+
+    assert 10 < result.iterations <= 5000
+    assert len(result.samples_ms) == 100
+    assert result.ci_low_ms <= result.ci_high_ms
+    assert result.min_ms <= result.p50_ms <= result.p99_ms <= result.max_ms
+
+
+def test_tracemalloc_peak_and_gc_restored():
+    import gc
+
+    runner = BenchmarkRunner()
+    config = BenchmarkConfig(
+        name="alloc",
+        category=BenchmarkCategory.MEMORY,
+        iterations=3,
+        disable_gc=True,
+    )
+
+    result = runner.run_benchmark(config, lambda: bytearray(2 * 1024 * 1024))
+
+    assert result.memory_mb >= 1.9
+    assert gc.isenabled()
+
+
+@pytest.mark.skipif(
+    "fork" not in multiprocessing.get_all_start_methods(), reason="needs fork"
+)
+def test_isolated_run_reports_from_child():
+    runner = BenchmarkRunner()
+    config = BenchmarkConfig(
+        name="isolated",
+        category=BenchmarkCategory.PERFORMANCE,
+        iterations=20,
+        isolate=True,
+    )
+
+    result = runner.run_benchmark(config, lambda: sum(range(100)))
+
+    assert result.iterations == 20
+    assert result.metadata["isolated"]
+
+
+def test_regression_uses_mann_whitney_when_samples_exist():
+    runner = BenchmarkRunner()
+    runner.set_baseline("op", synthetic_result("op", noisy(10.0)))
+
+    slower = runner.check_regression("op", synthetic_result("op", noisy(13.0, seed=4)))
+    similar = runner.check_regression("op", synthetic_result("op", noisy(10.2, seed=5)))
+
+    assert slower.method == "mann_whitney"
+    assert slower.is_regression and slower.p_value < 0.05
+    assert not similar.is_regression
+    assert slower.change_ci_low > 10.0
+
+
+def test_significant_but_small_shift_is_not_a_regression():
+    runner = BenchmarkRunner()
+    runner.set_baseline("op", synthetic_result("op", noisy(10.0, n=3000)))
+
+    # +8% with thousands of samples: p is tiny, but the effect is under 10%
+    result = runner.check_regression(
+        "op", synthetic_result("op", noisy(10.8, n=3000, seed=6))
+    )
+
+    assert result.p_value < 1e-20
+    assert result.change_ci_low < 10.0
+    assert not result.is_regression
+
+
+def test_bootstrap_change_ci_brackets_median_change():
+    baseline, current = noisy(10.0), noisy(12.0, seed=2)
+    change = (statistics.median(current) / statistics.median(baseline) - 1) * 100
+
+    low, high = bootstrap_change_ci(baseline, current, resamples=300)
+
+    assert 10.0 < low < change < high
+
+
+def test_baselines_round_trip_through_json(tmp_path):
+    path = str(tmp_path / "baselines.json")
+    runner = BenchmarkRunner(baseline_path=path)
+    runner.set_baseline("op", synthetic_result("op", noisy(10.0)))
+    runner.save_baselines()
+
+    loaded = BenchmarkRunner(baseline_path=path).get_baseline("op")
+
+    assert loaded.category is BenchmarkCategory.PERFORMANCE
+    assert loaded.samples_ms == pytest.approx(noisy(10.0))
+
+
+def test_cli_exits_non_zero_on_regression(tmp_path, capsys):
+    path = str(tmp_path / "baselines.json")
+    args = ["--baseline", path, "--only", "constraint_checking", "--min-time", "0.02"]
+
+    assert main(args + ["--update-baseline"]) == 0
+    assert main(args + ["--threshold", "1000"]) == 0
+
+    # An impossibly fast baseline makes the current run a regression.
+    runner = BenchmarkRunner(baseline_path=path)
+    runner.set_baseline(
+        "constraint_checking",
+        synthetic_result("constraint_checking", noisy(1e-6)),
+    )
+    runner.save_baselines()
+    assert main(args) == 1
+    assert "REGRESSION" in capsys.readouterr().out
@@ -0,0 +1,162 @@
+"""Tests for streaming calibration statistics and vectorized fitting."""
+
+import math
+import random
+
+import pytest
+
+from agents.core import calibration_system
+from agents.core.calibration_system import (
+    CalibrationMethod,
+    CalibrationSystem,
+    CalibrationTracker,
+    CategoryCalibrator,
+    ConfidenceAdjuster,
+    HistogramBinningCalibrator,
+    PlattScaler,
+    TemperatureScaler,
+)
+
+
+def overconfident_samples(n, seed=7):
+    """Predictions whose true accuracy is a softened version of the confidence."""
+    rng = random.Random(seed)
+    predictions, outcomes = [], []
+    for _ in range(n):
+        p = rng.uniform(0.02, 0.98)
+        true_p = 1.0 / (1.0 + math.exp(-0.4 * math.log(p / (1 - p))))
+        predictions.append(p)
+        outcomes.append(rng.random() < true_p)
+    return predictions, outcomes
+
+
+def brute_force_metrics(predictions, outcomes, num_bins=10):
+    n = len(predictions)
+    bins = [[] for _ in range(num_bins)]
+    for p, o in zip(predictions, outcomes):
+        bins[min(int(p * num_bins), num_bins - 1)].append((p, o))
+    ece = sum(
+        len(b) / n * abs(sum(o for _, o in b) / len(b) - sum(p for p, _ in b) / len(b))
+        for b in bins
+        if b
+    )
+    brier = sum((p - o) ** 2 for p, o in zip(predictions, outcomes)) / n
+    return ece, brier
+
+
+def nll(predictions, outcomes):
+    return -sum(
+        math.log(p) if o else math.log(1 - p) for p, o in zip(predictions, outcomes)
+    ) / len(predictions)
+
+
+def test_streaming_metrics_match_full_recompute():
+    predictions, outcomes = overconfident_samples(500)
+    tracker = CalibrationTracker()
+    for p, o in zip(predictions, outcomes):
+        tracker.record(p, o, category="a" if p < 0.5 else "b")
+
+    ece, brier = brute_force_metrics(predictions, outcomes)
+    metrics = tracker.get_metrics()
+    assert metrics.total_samples == 500
+    assert metrics.expected_calibration_error == pytest.approx(ece)
+    assert metrics.brier_score == pytest.approx(brier)
+    assert (
+        tracker.get_metrics("a").total_samples + tracker.get_metrics("b").total_samples
+        == 500
+    )
+
+
+def test_tracker_retains_bounded_points():
+    tracker = CalibrationTracker(max_points=5)
+    for i in range(20):
+        tracker.record(0.9, i % 2 == 0)
+
+    assert len(tracker.get_points()) == 5
+    assert tracker.total_samples == 20
+    assert tracker.get_metrics().total_samples == 20
+
+    tracker.clear()
+    assert tracker.get_metrics().total_samples == 0
+
+
+def test_temperature_fit_softens_overconfident_predictions():
+    predictions, outcomes = overconfident_samples(800)
+    scaler = TemperatureScaler()
+    scaler.fit(predictions, outcomes)
+
+    assert 1.8 < scaler.temperature < 3.5
+    assert nll(scaler.calibrate_batch(predictions), outcomes) < nll(
+        predictions, outcomes
+    )
+
+
+def test_platt_fit_stays_finite_on_separable_data():
+    scaler = PlattScaler()
+    scaler.fit([0.3, 0.5, 0.7, 0.9] * 10, [False, True, True, True] * 10)
+
+    assert math.isfinite(scaler._a) and math.isfinite(scaler._b)
+    assert scaler.calibrate(0.3) < 0.5 < scaler.calibrate(0.7)
+
+
+@pytest.mark.parametrize(
+    "calibrator", [PlattScaler(), TemperatureScaler(), HistogramBinningCalibrator()]
+)
+def test_calibrate_batch_matches_scalar(calibrator):
+    predictions, outcomes = overconfident_samples(300)
+    calibrator.fit(predictions, outcomes)
+
+    batch = calibrator.calibrate_batch(predictions[:50] + [0.0, 1.0])
+    scalar = [calibrator.calibrate(p) for p in predictions[:50] + [0.0, 1.0]]
+    assert batch == pytest.approx(scalar)
+
+
+def test_pure_python_fallback_matches_numpy(monkeypatch):
+    pytest.importorskip("numpy")
+    predictions, outcomes = overconfident_samples(300)
+    weights = [0.99 ** (299 - i) for i in range(300)]
+
+    fitted = []
+    for _ in range(2):
+        scaler = PlattScaler()
+        scaler.fit(predictions, outcomes, weights)
+        temperature = TemperatureScaler()
+        temperature.fit(predictions, outcomes, weights)
+        fitted.append((scaler._a, scaler._b, temperature.temperature))
+        monkeypatch.setattr(calibration_system, "np", None)
+
+    assert fitted[0] == pytest.approx(fitted[1], rel=1e-6)
+
+
+def test_adjuster_refits_on_bounded_window():
+    adjuster = ConfidenceAdjuster(fit_window=100, refit_threshold=50)
+    predictions, outcomes = overconfident_samples(1000)
+    for p, o in zip(predictions, outcomes):
+        adjuster.record_outcome(p, o)
+
+    assert adjuster.is_fitted
+    assert len(adjuster._window) == 100
+    assert adjuster.get_metrics().total_samples == 1000
+
+
+def test_sparse_categories_fall_back_to_pooled_fit():
+    calibrator = CategoryCalibrator(CalibrationMethod.TEMPERATURE_SCALING)
+    predictions, outcomes = overconfident_samples(2000)
+    for i, (p, o) in enumerate(zip(predictions, outcomes)):
+        calibrator.record_outcome(p, o, category=f"topic-{i % 1000}")
+
+    assert len(calibrator.get_metrics()) == 1000
+    # Two samples per category: too few for a category fit, pooled fit applies.
+    assert calibrator.adjust(0.95, "topic-3") < 0.9
+    assert calibrator.adjust(0.95, "never-seen") == calibrator.adjust(0.95, "topic-3")
+
+
+def test_system_calibrate_batch_and_bounded_history():
+    system = CalibrationSystem(history_limit=10)
+    predictions, outcomes = overconfident_samples(200)
+    for p, o in zip(predictions, outcomes):
+        system.record(p, o)
+
+    assert len(system._history) == 10
+    batch = system.calibrate_batch([0.1, 0.5, 0.9])
+    assert batch == pytest.approx([system.calibrate(c) for c in (0.1, 0.5, 0.9)])
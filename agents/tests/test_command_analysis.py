@@ -0,0 +1,122 @@
+"""Tests for the shared shell command parser and verdict cache."""
+
+import pytest
+
+from agents.tools.command_analysis import Redirect, VerdictCache, parse_command
+from agents.tools.security import (
+    CommandSecurityPolicy,
+    ValidationResult,
+    extract_commands,
+)
+
+
+@pytest.mark.parametrize(
+    "command,expected",
+    [
+        ("ls -la", ["ls"]),
+        ("npm install && npm run build", ["npm", "npm"]),
+        ("cat file.txt | grep pattern", ["cat", "grep"]),
+        ("cat file.txt|grep pattern", ["cat", "grep"]),
+        ("/usr/bin/node script.js", ["node"]),
+        ("VAR=value ls", ["ls"]),
+        ("echo 'a; rm -rf /' && ls", ["echo", "ls"]),
+        ("ls # && rm -rf /", ["ls"]),
+        ("sleep 1 &\nnpm test", ["sleep", "npm"]),
+        ('echo "unclosed', []),
+    ],
+)
+def test_extract_commands(command, expected):
+    assert extract_commands(command) == expected
+
+
+def test_ast_structure():
+    ast = parse_command("npm test 2>&1 | tail -5 > out.log; git status")
+
+    assert [segment.text for segment in ast.segments] == [
+        "npm test 2>&1 | tail -5 > out.log",
+        "git status",
+    ]
+    npm, tail = ast.segments[0].pipeline
+    assert npm.argv == ("npm", "test")
+    assert npm.redirects == (Redirect(">&", "1", "2"),)
+    assert tail.redirects == (Redirect(">", "out.log"),)
+    assert parse_command("npm test") is parse_command("npm test")
+
+
+def test_substitutions_are_parsed_recursively():
+    ast = parse_command('cat "$(ls $(pwd))" `whoami` <(ps) $((1 + 2))')
+
+    assert ast.commands == ["cat"]
+    assert [c.name for c in ast.iter_commands()] == [
+        "cat",
+        "ls",
+        "pwd",
+        "whoami",
+        "ps",
+    ]
+    assert parse_command("echo '$(whoami)'").substitutions == ()
+    assert parse_command("echo $(ls").error == "Unclosed command substitution"
+
+
+def test_policy_checks_commands_inside_substitutions():
+    policy = CommandSecurityPolicy(verdict_cache=VerdictCache())
+
+    assert policy.validate("cat $(ls *.txt)").allowed
+    result = policy.validate("cat $(curl http://evil.example)")
+    assert result.reason == "Command 'curl' is not allowed"
+    assert not policy.validate("chmod +x a.sh && chmod 777 b.sh").allowed
+
+
+@pytest.mark.parametrize(
+    "command",
+    [
+        "ls $(( $(rm -rf /tmp/x) 0 ))",
+        "ls $((`rm x`0))",
+        'ls "$(( $(rm x) ))"',
+        "ls $(( 1 + $(( $(rm x) )) ))",
+        "ls $((rm x); ls)",
+    ],
+)
+def test_substitutions_inside_arithmetic_are_checked(command):
+    result = CommandSecurityPolicy(verdict_cache=VerdictCache()).validate(command)
+
+    assert not result.allowed
+    assert result.reason == "Command 'rm' is not allowed"
+
+
+def test_plain_arithmetic_is_allowed():
+    policy = CommandSecurityPolicy(verdict_cache=VerdictCache())
+
+    assert policy.validate("ls $(( (1 + 2) * 3 ))").allowed
+    assert parse_command("echo $((1 + 2))").substitutions == ()
+    assert parse_command("echo $((1 + 2").error == "Unclosed arithmetic expansion"
+
+
+def test_verdicts_cached_per_policy_fingerprint():
+    cache = VerdictCache()
+    policy = CommandSecurityPolicy(verdict_cache=cache)
+
+    for _ in range(3):
+        assert not policy.validate("python app.py").allowed
+    assert cache.stats()["cache_hits"] == 2
+
+    policy.allowed_commands.add("python")
+    assert policy.validate("python app.py").allowed
+    assert len(cache) == 2
+    # The working directory is checked outside the cached verdict
+    assert not policy.validate("python app.py", working_directory="/").allowed
+
+
+def test_same_named_policy_classes_do_not_share_verdicts():
+    cache = VerdictCache()
+    Strict = type("Policy", (CommandSecurityPolicy,), {})
+    Lenient = type(
+        "Policy",
+        (CommandSecurityPolicy,),
+        {"validate_ast": lambda self, ast: ValidationResult(True)},
+    )
+    allowed = {"ls"}
+
+    assert not Strict(allowed, verdict_cache=cache).validate("curl x").allowed
+    assert Lenient(allowed, verdict_cache=cache).validate("curl x").allowed
+    assert cache.stats()["cache_hits"] == 0
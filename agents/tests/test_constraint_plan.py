@@ -0,0 +1,179 @@
+"""Tests for the compiled constraint evaluation plan in constraint_system."""
+
+import random
+
+from agents.core.constraint_system import (
+    Constraint,
+    ConstraintEngine,
+    ConstraintPriority,
+    ConstraintType,
+    ResourceConstraint,
+    TemporalConstraint,
+    must,
+    prefer,
+)
+
+
+class CountingConstraint(Constraint):
+    """Always-satisfied constraint that records how often it is checked."""
+
+    def __init__(self, constraint_id):
+        super().__init__(constraint_id, constraint_id, ConstraintType.HARD)
+        self.calls = 0
+
+    def check(self, context):
+        self.calls += 1
+        return True, None
+
+
+def build_engine():
+    engine = ConstraintEngine()
+    engine.register_constraint(
+        must("safety", "Safety").field("scores.safety").greater_than(0.5).build()
+    )
+    engine.register_constraint(
+        prefer("latency", "Latency", ConstraintPriority.LOW)
+        .field("latency")
+        .less_than(200)
+        .relaxable(0.5)
+        .build()
+    )
+    engine.register_constraint(
+        must("region", "Region").field("region").in_list(["eu", "us"]).build()
+    )
+    engine.register_constraint(
+        ResourceConstraint(
+            "tokens",
+            "Tokens",
+            "tokens",
+            max_value=1000,
+            constraint_type=ConstraintType.SOFT,
+        )
+    )
+    engine.register_constraint(
+        TemporalConstraint("duration", "Duration", "duration", max_duration_seconds=5.0)
+    )
+    return engine
+
+
+def make_options(n, seed=11):
+    rng = random.Random(seed)
+    return [
+        {
+            "id": i,
+            "scores": {"safety": rng.random()},
+            "latency": rng.uniform(0, 400),
+            "region": rng.choice(["eu", "us", "apac"]),
+            "resources": {"tokens": rng.uniform(0, 1500)},
+            "duration": rng.uniform(0, 8),
+        }
+        for i in range(n)
+    ]
+
+
+def reference_best(engine, options, context):
+    """The pre-plan algorithm: merge each option and run check_all."""
+    for option in options:
+        if engine.check_all({**context, **option}, allow_relaxation=False).satisfied:
+            return option, []
+    best, best_paths, best_cost = None, [], float("inf")
+    for option in options:
+        result = engine.check_all({**context, **option}, allow_relaxation=True)
+        if not result.needs_escalation and result.relaxation_paths:
+            cost = sum(p.cost for p in result.relaxation_paths)
+            if cost < best_cost:
+                best, best_paths, best_cost = option, result.relaxation_paths, cost
+    return best, best_paths
+
+
+def test_plan_matches_check_all():
+    engine = build_engine()
+    options = make_options(300)
+    context = {"user": "alice"}
+
+    flags = engine.check_options(options, context)
+
+    expected = [
+        engine.check_all({**context, **o}, allow_relaxation=False).satisfied
+        for o in options
+    ]
+    assert flags == expected
+    assert engine.find_satisfying_options(options, context) == [
+        o for o, ok in zip(options, expected) if ok
+    ]
+
+
+def test_relaxation_matches_reference():
+    engine = build_engine()
+    # Options that all violate the soft latency constraint, some fatally more.
+    options = [dict(o, latency=250 + i) for i, o in enumerate(make_options(50))]
+
+    best, paths = engine.find_best_option_with_relaxation(options, {})
+    expected_best, expected_paths = reference_best(engine, options, {})
+
+    assert best is expected_best
+    assert [p.constraint_id for p in paths] == [p.constraint_id for p in expected_paths]
+
+
+def test_first_hard_violation_short_circuits():
+    engine = ConstraintEngine()
+    engine.register_constraint(
+        must("cheap", "Cheap").field("cost").less_than(1).build()
+    )
+    counter = CountingConstraint("expensive_check")
+    engine.register_constraint(counter)
+
+    engine.check_options([{"cost": 5}] * 10, {})
+
+    assert counter.calls == 0
+
+
+def test_selective_steps_move_first():
+    engine = ConstraintEngine()
+    engine.register_constraint(
+        must("lenient", "Lenient").field("x").greater_than(-1).build()
+    )
+    engine.register_constraint(
+        must("strict", "Strict").field("x").greater_than(90).build()
+    )
+
+    engine.check_options([{"x": v} for v in range(100)], {})
+
+    assert [s.constraint.constraint_id for s in engine.compile().steps] == [
+        "strict",
+        "lenient",
+    ]
+
+
+def test_register_and_enable_trigger_replanning():
+    engine = ConstraintEngine()
+    engine.register_constraint(must("a", "A").field("x").greater_than(0).build())
+    first = engine.compile()
+    assert engine.compile() is first
+
+    engine.register_constraint(must("b", "B").field("x").less_than(10).build())
+    assert engine.compile() is not first
+    assert engine.check_options([{"x": 20}], {}) == [False]
+
+    engine.disable_constraint("b")
+    assert engine.check_options([{"x": 20}], {}) == [True]
+    engine.enable_constraint("b")
+    assert engine.check_options([{"x": 20}], {}) == [False]
+
+
+def test_relaxation_applies_to_compiled_plan():
+    engine = ConstraintEngine()
+    constraint = (
+        prefer("latency", "Latency")
+        .field("latency")
+        .less_than(100)
+        .relaxable(0.5)
+        .build()
+    )
+    engine.register_constraint(constraint)
+    assert engine.check_options([{"latency": 120}], {}) == [False]
+
+    path = constraint.get_relaxation_path({})
+    engine.apply_relaxation(path, {})
+
+    assert engine.check_options([{"latency": 120}], {}) == [True]
@@ -0,0 +1,150 @@
+"""Tests for concurrent async debate rounds."""
+
+import asyncio
+import time
+
+from agents.core.critic_system import DebateAgent as CriticDebateAgent
+from agents.core.critic_system import DebateSystem
+from agents.core.debate_system import (
+    AsyncDebateEngine,
+    ConsensusMethod,
+    DebateAgent,
+    EnhancedDebateSystem,
+    MultiPerspectiveDebate,
+    StubDebateAgent,
+)
+
+POSITIONS = {"proponent": "The claim holds", "opponent": "Counter to the claim"}
+
+
+def profiles(n=4):
+    perspectives = ["skeptic", "advocate", "neutral", "evidence_focused"]
+    return [
+        DebateAgent(f"agent{i}", f"Agent {i}", perspectives[i % 4]) for i in range(n)
+    ]
+
+
+class HangingAgent(StubDebateAgent):
+    """Stub whose vote never returns in time."""
+
+    async def vote(self, topic, positions):
+        await asyncio.sleep(10)
+
+
+class FailingAgent(StubDebateAgent):
+    async def critique(self, topic, target_id, position):
+        raise RuntimeError("backend unavailable")
+
+
+def test_round_runs_agents_concurrently():
+    engine = AsyncDebateEngine(
+        [StubDebateAgent(p, latency_s=0.2) for p in profiles(4)], early_stop=False
+    )
+
+    start = time.perf_counter()
+    result = asyncio.run(engine.run("topic", POSITIONS, rounds=1))
+    elapsed = time.perf_counter() - start
+
+    # 4 agents x (2 critiques + 1 vote) at 0.2s each would take 2.4s serially.
+    assert elapsed < 1.0
+    [round_result] = result.rounds
+    assert len(round_result["votes"]) == 4
+    assert [c["target"] for c in round_result["critiques"]["agent0"]] == [
+        "proponent",
+        "opponent",
+    ]
+
+
+def test_stub_matches_synchronous_round():
+    agents = profiles(4)
+    sync = MultiPerspectiveDebate()
+    for agent in agents:
+        sync.add_agent(agent)
+    expected = sync.conduct_round("topic", POSITIONS)
+
+    engine = AsyncDebateEngine([StubDebateAgent(p) for p in agents])
+    actual = asyncio.run(engine.conduct_round("topic", POSITIONS))
+
+    assert actual["critiques"] == expected["critiques"]
+    assert actual["votes"] == expected["votes"]
+
+
+def test_early_stop_once_consensus_is_reached():
+    agents = [StubDebateAgent(p) for p in profiles(3)]
+    engine = AsyncDebateEngine(agents)
+
+    result = asyncio.run(engine.run("topic", POSITIONS, rounds=5))
+
+    assert result.stopped_early
+    assert len(result.rounds) == 1
+    assert result.consensus.reached
+    assert result.consensus.winning_position == "proponent"
+
+
+def test_split_vote_runs_all_rounds():
+    agents = [
+        StubDebateAgent(p, preferred_position=pid)
+        for p, pid in zip(profiles(2), ["proponent", "opponent"])
+    ]
+    engine = AsyncDebateEngine(agents, consensus_method=ConsensusMethod.MAJORITY)
+
+    result = asyncio.run(engine.run("topic", POSITIONS, rounds=3))
+
+    assert not result.stopped_early
+    assert len(result.rounds) == 3
+    assert not result.consensus.reached
+    assert len(result.consensus.votes) == 6
+
+
+def test_slow_and_failing_agents_are_excluded():
+    agents = profiles(4)
+    engine = AsyncDebateEngine(
+        [
+            StubDebateAgent(agents[0]),
+            StubDebateAgent(agents[1]),
+            HangingAgent(agents[2]),
+            FailingAgent(agents[3]),
+        ],
+        agent_timeout_s=0.1,
+        early_stop=False,
+    )
+
+    start = time.perf_counter()
+    result = asyncio.run(engine.run("topic", POSITIONS, rounds=2))
+
+    assert time.perf_counter() - start < 2.0
+    assert result.timed_out == {"agent2": 2}
+    assert result.rounds[0]["errors"] == {"agent3": "backend unavailable"}
+    assert {v.agent_id for v in result.consensus.votes} == {"agent0", "agent1"}
+
+
+def test_enhanced_system_uses_registered_backend():
+    system = EnhancedDebateSystem()
+    for agent in system.debate.agents:
+        system.set_agent_backend(StubDebateAgent(agent, preferred_position="opponent"))
+
+    result = asyncio.run(
+        system.debate_claim_async("Claim", ["support"], ["against"], rounds=3)
+    )
+
+    assert result["rounds_conducted"] == 1
+    assert result["stopped_early"]
+    assert result["consensus"]["winner"] == "opponent"
+    # The synchronous debate state is untouched.
+    assert system.debate.reach_consensus().votes == []
+
+
+def test_critic_debate_async_drops_timed_out_agents():
+    async def slow(topic):
+        await asyncio.sleep(5)
+        return topic
+
+    system = DebateSystem(max_rounds=2)
+    system.add_agent(CriticDebateAgent("fast_a"))
+    system.add_agent(CriticDebateAgent("fast_b", bias="contrary"))
+    system.add_agent(CriticDebateAgent("slow", reasoning_fn=slow))
+
+    result = asyncio.run(system.debate_async("topic", agent_timeout_s=0.1))
+
+    assert len(result.rounds) == 2
+    assert [p.agent_id for p in result.rounds[0].positions] == ["fast_a", "fast_b"]
@@ -0,0 +1,152 @@
+"""Tests for batch scoring in agents.core.decision_model."""
+
+import random
+
+import pytest
+
+from agents.core import decision_model
+from agents.core.decision_model import (
+    Citation,
+    Constraint,
+    ConstraintType,
+    DecisionModel,
+    DecisionOption,
+    OptionBatch,
+    ScoredInput,
+)
+
+
+def make_options(n, seed=3):
+    rng = random.Random(seed)
+    options = []
+    for i in range(n):
+        inputs = {}
+        if i % 3:
+            citations = [Citation(f"s{i}", "fact", "evidence", rng.uniform(0.2, 1.0))]
+            inputs["value"] = ScoredInput(
+                "value", 1.0, citations=citations if i % 2 else []
+            )
+        options.append(
+            DecisionOption(
+                option_id=f"opt{i}",
+                name=f"Option {i}",
+                description="",
+                inputs=inputs,
+                raw_value=rng.uniform(0, 2),
+                cost=rng.uniform(0, 1),
+                risk_score=rng.uniform(0, 1),
+                metadata={"latency": rng.uniform(0, 100)},
+            )
+        )
+    return options
+
+
+def make_model():
+    model = DecisionModel()
+    model.add_constraint(Constraint.compare("cheap", "cost", "<=", 0.8))
+    model.add_constraint(
+        Constraint.compare(
+            "fast", "latency", "<", 60, ConstraintType.SOFT, penalty=0.25
+        )
+    )
+    model.add_constraint(
+        Constraint(
+            "not_critical",
+            ConstraintType.HARD,
+            lambda o: o["risk_level"].value != "critical",
+        )
+    )
+    return model
+
+
+def test_batch_utilities_match_scalar_reference():
+    options = make_options(60)
+    scalar = make_model().evaluate_options(make_options(60))
+    batch = make_model().evaluate_batch(options, k=5)
+
+    feasible = sorted(
+        (o for o in scalar.all_options if o.is_feasible),
+        key=lambda o: o.utility_score,
+        reverse=True,
+    )
+    assert [options[i].option_id for i in batch.top_indices] == [
+        o.option_id for o in feasible[:5]
+    ]
+    for i, option in enumerate(scalar.all_options):
+        assert batch.feasible[i] == option.is_feasible
+        if option.is_feasible:
+            assert batch.utilities[i] == pytest.approx(option.utility_score)
+    assert batch.top_options[0].option_id == scalar.selected_option.option_id
+    assert batch.blocked_counts["cheap"] == sum(o.cost > 0.8 for o in options)
+
+
+def test_batch_and_scalar_agree_on_uncited_inputs():
+    def uncited_options():
+        options = make_options(12)
+        for option in options:
+            for scored_input in option.inputs.values():
+                # Stale flag from an earlier evaluation; citations since dropped
+                scored_input.citations = []
+                scored_input.is_cited = True
+        return options
+
+    model = make_model()
+    scalar = model.evaluate_options(uncited_options())
+    options = uncited_options()
+    batch = model.evaluate_batch(options, k=12)
+
+    for i, option in enumerate(scalar.all_options):
+        assert batch.feasible[i] == option.is_feasible
+        if option.is_feasible:
+            assert batch.utilities[i] == pytest.approx(option.utility_score)
+    assert all(not inp.is_cited for option in options for inp in option.inputs.values())
+    assert [o.warnings for o in options] == [o.warnings for o in scalar.all_options]
+
+
+def test_batch_from_columns_and_top_k_tie_order():
+    batch = OptionBatch(
+        raw_value=[1.0, 2.0, 2.0, 0.5],
+        cost=[0.0, 0.0, 0.0, 0.0],
+        risk_score=[0.1, 0.1, 0.1, 0.1],
+        columns={"region": ["eu", None, "us", "eu"]},
+    )
+    model = DecisionModel()
+    model.add_constraint(
+        Constraint("has_region", ConstraintType.HARD, lambda o: o["region"] is not None)
+    )
+
+    result = model.evaluate_batch(batch, k=2)
+
+    assert result.feasible == [True, False, True, True]
+    assert result.top_indices == [2, 0]
+    assert result.selected_index == 2
+
+
+def test_batch_relaxation_keeps_non_relaxable_constraints():
+    options = make_options(10)
+    model = DecisionModel()
+    model.add_constraint(Constraint.compare("impossible", "cost", "<", -1))
+    model.add_constraint(
+        Constraint.compare("safe", "risk_score", "<", 0.5, relaxable=False)
+    )
+
+    result = model.evaluate_batch(options, k=10)
+
+    assert result.relaxed
+    assert result.feasible == [o.risk_score < 0.5 for o in options]
+
+
+def test_pure_python_batch_matches_numpy(monkeypatch):
+    pytest.importorskip("numpy")
+    with_numpy = make_model().evaluate_batch(make_options(40), k=8)
+    monkeypatch.setattr(decision_model, "np", None)
+    without_numpy = make_model().evaluate_batch(make_options(40), k=8)
+
+    assert without_numpy.top_indices == with_numpy.top_indices
+    assert without_numpy.feasible == with_numpy.feasible
+    assert without_numpy.utilities == pytest.approx(with_numpy.utilities)
+
+
+def test_compare_rejects_unknown_operator():
+    with pytest.raises(ValueError):
+        Constraint.compare("bad", "cost", "~", 1.0)
@@ -0,0 +1,216 @@
+"""Tests for the parallel, disk-cached EvalHarness in curriculum_system."""
+
+import json
+
+import pytest
+
+from agents.core.curriculum_system import (
+    EvalHarness,
+    _model_fingerprint,
+    model_fingerprint,
+)
+
+
+def always_valid(text):
+    return {"answer": {"valid": True}, "confidence": 0.9}
+
+
+def always_invalid(text):
+    return {"answer": {"valid": False}, "confidence": 0.6}
+
+
+class CountingModel:
+    def __init__(self, valid=True, fail_after=None):
+        self.valid = valid
+        self.fail_after = fail_after
+        self.calls = 0
+        self.fingerprint = f"counting-{valid}"
+
+    def __call__(self, text):
+        if self.fail_after is not None and self.calls >= self.fail_after:
+            raise KeyboardInterrupt
+        self.calls += 1
+        return {"answer": {"valid": self.valid}, "confidence": 0.8}
+
+
+def test_parallel_run_matches_sequential_order(tmp_path):
+    sequential = EvalHarness().run_eval(always_valid, "logic_reasoning")
+    harness = EvalHarness(store_dir=str(tmp_path), max_workers=4, chunk_size=2)
+    parallel = harness.run_eval(always_valid, "logic_reasoning", run_id="par")
+
+    assert [r.example_id for r in parallel.results] == [
+        r.example_id for r in sequential.results
+    ]
+    assert [r.correct for r in parallel.results] == [
+        r.correct for r in sequential.results
+    ]
+    assert parallel.aggregate_metrics["accuracy"] == pytest.approx(
+        sequential.aggregate_metrics["accuracy"]
+    )
+    stored = [r.example_id for r in harness.iter_run_results("par")]
+    assert stored == [r.example_id for r in parallel.results]
+
+
+def test_process_pool_evaluates_picklable_models(tmp_path):
+    harness = EvalHarness(max_workers=2, use_processes=True, chunk_size=3)
+    report = harness.run_eval(always_valid, "logic_reasoning")
+
+    assert report.total_examples == len(report.results)
+    assert report.aggregate_metrics["accuracy"] == pytest.approx(
+        EvalHarness()
+        .run_eval(always_valid, "logic_reasoning")
+        .aggregate_metrics["accuracy"]
+    )
+
+
+def test_cache_skips_model_calls_until_model_changes(tmp_path):
+    harness = EvalHarness(store_dir=str(tmp_path))
+    first = CountingModel()
+    harness.run_eval(first, "logic_reasoning")
+    total = first.calls
+
+    again = CountingModel()
+    harness.run_eval(again, "logic_reasoning")
+    assert again.calls == 0
+    assert harness.cache.stats()["hits"] == total
+
+    changed = CountingModel(valid=False)
+    harness.run_eval(changed, "logic_reasoning")
+    assert changed.calls == total
+
+
+def test_fingerprint_tracks_function_identity():
+    assert model_fingerprint(always_valid) == model_fingerprint(always_valid)
+    assert model_fingerprint(always_valid) != model_fingerprint(always_invalid)
+    assert model_fingerprint(CountingModel()) == "counting-True"
+
+
+def make_closure_model(valid, calls):
+    def model(text):
+        calls.append(text)
+        return {"answer": {"valid": valid}, "confidence": 0.7}
+
+    return model
+
+
+class Predictor:
+    def __init__(self, valid):
+        self.valid = valid
+
+    def predict(self, text, confidence=0.5):
+        return {"answer": {"valid": self.valid}, "confidence": confidence}
+
+
+def test_fingerprint_includes_captured_state():
+    assert model_fingerprint(make_closure_model(True, [])) == model_fingerprint(
+        make_closure_model(True, [])
+    )
+    assert model_fingerprint(make_closure_model(True, [])) != model_fingerprint(
+        make_closure_model(False, [])
+    )
+    predictor = Predictor(True)
+    assert model_fingerprint(predictor.predict) == model_fingerprint(predictor.predict)
+    assert _model_fingerprint(make_closure_model(True, []))[1]
+    assert not _model_fingerprint(predictor.predict)[1]
+
+
+def test_closures_sharing_source_do_not_share_cached_results(tmp_path):
+    harness = EvalHarness(store_dir=str(tmp_path))
+    valid_calls, invalid_calls = [], []
+
+    first = harness.run_eval(
+        make_closure_model(True, valid_calls), "logic_reasoning", run_id="a"
+    )
+    second = harness.run_eval(
+        make_closure_model(False, invalid_calls), "logic_reasoning", run_id="b"
+    )
+
+    assert len(invalid_calls) == second.total_examples
+    assert [r.predicted for r in second.results] == [{"valid": False}] * len(
+        second.results
+    )
+    assert first.aggregate_metrics["accuracy"] != second.aggregate_metrics["accuracy"]
+
+
+class Model:
+    def __init__(self, valid):
+        self.valid = valid
+
+
+def make_instance_model(valid, calls):
+    instance = Model(valid)
+
+    def model(text):
+        calls.append(text)
+        return {"answer": {"valid": instance.valid}, "confidence": 0.7}
+
+    return model
+
+
+def test_identity_fingerprinted_models_bypass_disk_cache(tmp_path):
+    harness = EvalHarness(store_dir=str(tmp_path))
+    first_calls, second_calls = [], []
+
+    # Built one after the other, so the second Model may reuse the first's id
+    first = harness.run_eval(make_instance_model(True, first_calls), "logic_reasoning")
+    second = harness.run_eval(
+        make_instance_model(False, second_calls), "logic_reasoning"
+    )
+
+    assert len(second_calls) == second.total_examples
+    assert [r.predicted for r in second.results] == [{"valid": False}] * len(
+        second.results
+    )
+    assert harness.cache.hits == 0 and len(first_calls) == first.total_examples
+    assert not list((tmp_path / "cache").rglob("*.json"))
+
+    named = harness.run_eval(
+        make_instance_model(True, []), "logic_reasoning", model_id="named"
+    )
+    assert len(list((tmp_path / "cache").rglob("*.json"))) == named.total_examples
+
+
+def test_resume_after_interruption(tmp_path):
+    harness = EvalHarness(store_dir=str(tmp_path), chunk_size=1)
+    interrupted = CountingModel(fail_after=3)
+    with pytest.raises(KeyboardInterrupt):
+        harness.run_eval(
+            interrupted, "logic_reasoning", run_id="resumable", model_id="m"
+        )
+
+    stream = tmp_path / "runs" / "resumable.jsonl"
+    assert len(stream.read_text().splitlines()) == 3
+    with stream.open("a") as f:
+        f.write('{"example_id": "trunc')  # torn final line
+
+    # A fresh harness without the cache still resumes from the stream.
+    fresh = EvalHarness(store_dir=str(tmp_path), chunk_size=1)
+    fresh.cache = None
+    model = CountingModel()
+    report = fresh.run_eval(model, "logic_reasoning", run_id="resumable", resume=True)
+
+    assert model.calls == report.total_examples - 3
+    lines = stream.read_text().splitlines()
+    assert [json.loads(line)["example_id"] for line in lines] == [
+        r.example_id for r in report.results
+    ]
+
+
+def test_compare_runs_reads_evicted_runs_from_store(tmp_path):
+    harness = EvalHarness(store_dir=str(tmp_path), history_limit=1)
+    harness.run_eval(always_invalid, "logic_reasoning", run_id="before")
+    harness.run_eval(always_valid, "logic_reasoning", run_id="after")
+    assert [r.run_id for r in harness.run_history] == ["after"]
+
+    comparison = EvalHarness(store_dir=str(tmp_path)).compare_runs("before", "after")
+
+    accuracy = comparison["metric_changes"]["accuracy"]
+    assert accuracy["delta"] == pytest.approx(accuracy["run_2"] - accuracy["run_1"])
+    changes = comparison["example_changes"]
+    assert changes["fixed"] or changes["regressed"]
+    assert not set(changes["fixed"]) & set(changes["regressed"])
+
+
+def test_compare_runs_unknown_run():
+    with pytest.raises(ValueError):
+        EvalHarness().compare_runs("missing", "also-missing")
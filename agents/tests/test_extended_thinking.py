@@ -0,0 +1,85 @@
+import pytest
+
+from agents.tools.extended_thinking import (
+    ExtendedThinkingTool,
+    WatsonGlaserThinkingTool,
+)
+
+QUERY = "If all the data supports the study, then therefore we can conclude it works?"
+OPTIONS = ["The study likely works", "It must always work", "Cannot determine"]
+
+
+def test_layer_specs_shared_per_architecture():
+    first = ExtendedThinkingTool(layers=16)
+    second = ExtendedThinkingTool(layers=16)
+
+    assert first.layer_specs is second.layer_specs
+    assert first.logic_layer_indices == [5, 6, 7, 8]
+
+
+def test_shared_layer_specs_are_read_only():
+    tool = ExtendedThinkingTool(layers=4)
+
+    with pytest.raises(TypeError):
+        tool.layer_specs[1]["name"] = "Mutated"
+    with pytest.raises(TypeError):
+        tool.layer_specs[5] = {"name": "Extra"}
+    assert ExtendedThinkingTool(layers=4).layer_specs[1]["name"] == "Perception"
+
+
+def test_thinking_history_is_bounded():
+    tool = ExtendedThinkingTool(layers=4, history_limit=3)
+    for i in range(5):
+        tool.execute(f"query {i}")
+
+    summary = tool.get_history_summary()
+    assert summary["total_queries"] == 3
+    assert summary["recent_queries"] == ["query 2", "query 3", "query 4"]
+
+
+def test_execute_many_matches_sequential_execute():
+    batch_tool = ExtendedThinkingTool(layers=8)
+    single_tool = ExtendedThinkingTool(layers=8)
+    queries = [
+        QUERY,
+        {"query": QUERY, "options": OPTIONS, "depth": 8},
+        {"query": "Evaluate the evidence", "context": "Background", "depth": 2},
+    ]
+
+    results = batch_tool.execute_many(queries, max_workers=3)
+
+    expected = [
+        single_tool.execute(QUERY),
+        single_tool.execute(QUERY, options=OPTIONS, depth=8),
+        single_tool.execute("Evaluate the evidence", context="Background", depth=2),
+    ]
+    assert [r["confidence"] for r in results] == [e["confidence"] for e in expected]
+    assert results[1]["recommendation"] == OPTIONS[0]
+    assert len(batch_tool.thinking_history) == 3
+
+
+def test_execute_many_with_process_pool():
+    tool = WatsonGlaserThinkingTool(layers=4)
+
+    results = tool.execute_many([QUERY, QUERY], max_workers=2, use_processes=True)
+
+    assert len(results) == 2
+    assert results[0]["modules"][0]["module"] == "Watson Glaser Critical Thinking"
+    assert len(tool.thinking_history) == 2
+
+
+def test_selected_strategies_are_independent_copies():
+    tool = ExtendedThinkingTool(layers=4)
+    first = tool._select_strategies(QUERY, ["logic"])
+    first[0]["score"] = -1.0
+
+    second = tool._select_strategies(QUERY, ["logic"])
+    assert second[0]["score"] > 0
+
+
+def test_strategy_table_rebuilds_after_weight_change():
+    tool = ExtendedThinkingTool(layers=4)
+    tool._select_strategies(QUERY, [])
+    tool.strategies["counterFactual"]["weight"] = 2.0
+
+    assert tool._select_strategies(QUERY, [])[0]["name"] == "counterFactual"
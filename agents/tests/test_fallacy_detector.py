@@ -4,13 +4,18 @@ Unit tests for FallacyDetector - Pattern-Based Fallacy Detection
 Tests detection of 22+ fallacy patterns across all categories.
 """
 
+import json
+import re
+
 import pytest
 
 from agents.core.fallacy_detector import (
     FallacyCategory,
     FallacyDetector,
+    FallacyIndex,
     FallacyPattern,
     FallacySeverity,
+    load_fallacy_index,
 )
 
 
@@ -301,5 +306,116 @@ class TestFallacyDatabase:
             )
 
 
+class TestFallacyIndex:
+    """Test the shared, compiled fallacy index."""
+
+    def test_database_loaded_once_and_immutable(self):
+        first, second = FallacyDetector(), FallacyDetector()
+
+        assert first.fallacies is second.fallacies
+        with pytest.raises(TypeError):
+            first.fallacies["ad_hominem"] = None
+        with pytest.raises(AttributeError):
+            first.fallacies["ad_hominem"].name = "changed"
+
+    def test_loads_json_with_builtin_fallback(self, tmp_path):
+        data = {
+            "echo": {
+                "id": "echo",
+                "name": "Echo",
+                "category": "relevance",
+                "severity": "minor",
+                "description": "Repeats itself",
+                "pattern_indicators": ["echo chamber"],
+                "example": "In the echo chamber",
+            }
+        }
+        path = tmp_path / "fallacies.json"
+        path.write_text(json.dumps(data))
+
+        detector = FallacyDetector(data_file=path)
+        assert list(detector.fallacies) == ["echo"]
+        assert detector.fallacies["echo"].severity == FallacySeverity.MINOR
+        assert [f.id for f in detector.detect("", ["An Echo Chamber"], "")] == ["echo"]
+
+        fallback = load_fallacy_index(tmp_path / "missing.json")
+        assert "ad_hominem" in fallback.fallacies
+
+    @pytest.mark.parametrize(
+        "text, present, absent",
+        [
+            ("for more information", [], ["false_dilemma"]),
+            ("this or that", ["false_dilemma"], []),
+            ("we also agreed", [], ["non_sequitur"]),
+            ("It is scary.", ["appeal_to_emotion"], []),
+            ("OR ELSE", ["false_dilemma"], []),
+        ],
+    )
+    def test_indicators_match_whole_words(self, text, present, absent):
+        ids = [f.id for f in FallacyDetector().detect("", [text], "")]
+
+        for fallacy_id in present:
+            assert fallacy_id in ids
+        for fallacy_id in absent:
+            assert fallacy_id not in ids
+
+    def test_overlapping_indicators_all_reported(self):
+        def pattern(fallacy_id, *indicators):
+            return FallacyPattern(
+                fallacy_id,
+                fallacy_id,
+                FallacyCategory.FORMAL,
+                FallacySeverity.MINOR,
+                "",
+                indicators,
+                "",
+            )
+
+        index = FallacyIndex.build(
+            [
+                pattern("a", "since then"),
+                pattern("b", "then"),
+                pattern("c", "since"),
+                pattern("d", "then eventually"),
+                pattern("e", "sin"),
+            ]
+        )
+
+        assert [f.id for f in index.match("since then eventually")] == [
+            "a",
+            "b",
+            "c",
+            "d",
+        ]
+        assert index.match("") == []
+
+    def test_matches_word_boundary_indicator_loop(self):
+        detector = FallacyDetector()
+        texts = [
+            "Either you support us or you're against us, obviously.",
+            "The expert says it will lead to chaos; therefore we must choose.",
+            "Everyone believes it. Since then, all sales rose after that.",
+            "ΠΡΕΤΕΝΔ İstanbul straße — no true Scotsman would, or else",
+            "",
+        ]
+
+        def reference(text):
+            return [
+                fallacy_id
+                for fallacy_id, fallacy in detector.fallacies.items()
+                if any(
+                    re.search(rf"(?<!\w){re.escape(i.lower())}(?!\w)", text.lower())
+                    for i in fallacy.pattern_indicators
+                )
+            ]
+
+        batch = detector.detect_batch(("", [text], "") for text in texts)
+
+        assert [[f.id for f in found] for found in batch] == [
+            reference(text + " ") for text in texts
+        ]
+        assert batch == [detector.detect("", [text], "") for text in texts]
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,101 @@
+"""Tests for time-bucketed outcome rollups in feedback_system."""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from agents.core.feedback_system import (
+    DecisionRecord,
+    OutcomeTracker,
+    OutcomeType,
+    TrendAnalyzer,
+)
+
+NOW = datetime(2026, 3, 10, 12, 30)
+
+
+def add(tracker, record_id, when, score, decision_type="tool", option="a"):
+    tracker.record_decision(
+        DecisionRecord(
+            record_id=record_id,
+            decision_type=decision_type,
+            chosen_option=option,
+            alternatives=[],
+            scores={},
+            confidence=0.8,
+            context={},
+            timestamp=when.isoformat(),
+        )
+    )
+    outcome = OutcomeType.SUCCESS if score >= 0.5 else OutcomeType.FAILURE
+    tracker.record_outcome(record_id, outcome, score)
+
+
+def test_rollups_aggregate_per_bucket_and_scope():
+    tracker = OutcomeTracker()
+    add(tracker, "r1", NOW, 1.0)
+    add(tracker, "r2", NOW - timedelta(minutes=5), 0.0, option="b")
+    add(tracker, "r3", NOW - timedelta(hours=2), 0.5, decision_type="plan")
+
+    [(start, hour)] = tracker.get_rollups("hour", 1, now=NOW)
+    assert start == datetime(2026, 3, 10, 12)
+    assert hour.count == 2
+    assert hour.success_rate == 0.5
+    assert hour.avg_score == 0.5
+    assert hour.score_std == pytest.approx(0.7071, abs=1e-4)
+
+    day = tracker.get_rollups("day", 1, now=NOW)[0][1]
+    assert day.count == 3
+    assert tracker.get_rollups("day", 1, decision_type="plan", now=NOW)[0][1].count == 1
+    assert tracker.get_rollups("hour", 3, option="b", now=NOW)[0][1].avg_score == 0.0
+
+
+def test_reporting_outcome_twice_replaces_contribution():
+    tracker = OutcomeTracker()
+    add(tracker, "r1", NOW, 0.2)
+    tracker.record_outcome("r1", OutcomeType.SUCCESS, 0.9)
+
+    rollup = tracker.get_rollups("minute", 1, now=NOW)[0][1]
+    assert rollup.count == 1
+    assert rollup.success_count == 1
+    assert rollup.avg_score == pytest.approx(0.9)
+
+
+def test_old_buckets_are_pruned_by_retention():
+    tracker = OutcomeTracker(rollup_retention={"minute": 10})
+    add(tracker, "old", NOW - timedelta(minutes=30), 1.0)
+    add(tracker, "new", NOW, 1.0)
+    add(tracker, "late", NOW - timedelta(minutes=20), 1.0)  # already out of window
+
+    assert len(tracker._rollups["minute"]) == 1
+    assert len(tracker.get_rollups("minute", 60, now=NOW)) == 1
+    assert tracker.get_rollups("hour", 1, now=NOW)[0][1].count == 3
+
+
+def test_record_pruning_keeps_indexes_consistent():
+    tracker = OutcomeTracker(max_records=20)
+    for i in range(25):
+        add(tracker, f"r{i}", NOW + timedelta(seconds=i), 1.0, option=f"o{i % 3}")
+
+    assert len(tracker._records) <= 20
+    assert "r0" not in tracker._records
+    by_option = sum(len(ids) for ids in tracker._by_option.values())
+    assert by_option == len(tracker._records)
+    # Rollups still see every outcome.
+    assert tracker.get_rollups("day", 1, now=NOW)[0][1].count == 25
+
+
+def test_trends_read_from_rollups():
+    tracker = OutcomeTracker()
+    now = datetime.now()
+    for i in range(10):
+        add(tracker, f"d{i}", now - timedelta(days=i), 0.9 if i else 0.3)
+
+    analyzer = TrendAnalyzer(tracker)
+    daily = analyzer.get_daily_trend(7)
+
+    assert len(daily) == 7
+    assert daily[0].avg_outcome_score == pytest.approx(0.3)
+    assert daily[0].trend_direction == "declining"
+    assert analyzer.get_daily_trend(7, decision_type="missing") == []
+    assert [a["day_offset"] for a in analyzer.detect_anomalies()] == [0]
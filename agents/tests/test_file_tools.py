@@ -0,0 +1,141 @@
+"""Tests for ranged reads, the line index and atomic edits in file tools."""
+
+import asyncio
+import mmap
+import os
+import random
+
+import pytest
+
+from agents.tools import file_tools
+from agents.tools.file_tools import FileReadTool, FileWriteTool, get_line_index
+
+
+def read(path, **kwargs):
+    return asyncio.run(FileReadTool().execute("read", str(path), **kwargs))
+
+
+@pytest.fixture
+def small_blocks(monkeypatch):
+    """Tiny index blocks so lines straddle many block boundaries."""
+    monkeypatch.setattr(file_tools, "LINE_INDEX_BLOCK_SIZE", 16)
+
+
+@pytest.fixture
+def log_file(tmp_path):
+    rng = random.Random(7)
+    lines = [f"{i}:" + "x" * rng.randint(0, 40) + "\n" for i in range(500)]
+    lines += ["", "\n", "trailing line without newline"]
+    path = tmp_path / "app.log"
+    path.write_text("".join(lines))
+    return path, "".join(lines).splitlines(keepends=True)
+
+
+@pytest.mark.parametrize("start,count", [(1, 1), (1, 10), (37, 5), (499, 0), (503, 9)])
+def test_line_range_matches_splitlines(small_blocks, log_file, start, count):
+    path, lines = log_file
+    expected = lines[start - 1 : start - 1 + count] if count else lines[start - 1 :]
+
+    assert read(path, start_line=start, max_lines=count) == "".join(expected)
+
+
+def test_line_range_past_end_is_empty(log_file):
+    path, lines = log_file
+    assert read(path, start_line=len(lines) + 5, max_lines=3) == ""
+
+
+@pytest.mark.parametrize("count", [1, 2, 3, 50, 10_000])
+def test_tail_reads_last_lines(log_file, count):
+    path, lines = log_file
+    assert read(path, tail=count) == "".join(lines[-count:])
+
+
+def test_byte_range(log_file):
+    path, _ = log_file
+    data = path.read_bytes()
+
+    assert read(path, offset=100, length=50) == data[100:150].decode()
+    assert read(path, offset=len(data) - 10) == data[-10:].decode()
+    assert read(path, offset=len(data) + 10, length=5) == ""
+    assert read(path, offset=-1).startswith("Error")
+
+
+def test_empty_file_and_default_read_unchanged(tmp_path):
+    empty = tmp_path / "empty.txt"
+    empty.write_text("")
+    text = tmp_path / "a.txt"
+    text.write_text("a\nb\nc\n")
+
+    assert read(empty, tail=5) == ""
+    assert read(text) == "a\nb\nc\n"
+    assert read(text, max_lines=2) == "a\nb\n"
+
+
+def test_line_index_cached_until_file_changes(tmp_path):
+    path = tmp_path / "a.txt"
+    path.write_text("one\ntwo\n")
+
+    def index():
+        with (
+            open(path, "rb") as f,
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm,
+        ):
+            return get_line_index(path, mm)
+
+    first = index()
+    assert index() is first
+    assert first.line_count == 2
+
+    path.write_text("one\ntwo\nthree")
+    os.utime(path, ns=(0, 10**9))
+    assert index().line_count == 3
+
+
+def test_edit_is_single_pass_and_atomic(tmp_path):
+    path = tmp_path / "script.sh"
+    path.write_text("echo a\necho b\necho a\n")
+    os.chmod(path, 0o750)
+    tool = FileWriteTool()
+
+    result = asyncio.run(tool.execute("edit", str(path), old_text="a", new_text="z"))
+    assert result.startswith("Warning: Found 2 occurrences")
+    assert path.read_text() == "echo z\necho b\necho z\n"
+
+    result = asyncio.run(tool.execute("edit", str(path), old_text="b", new_text="c"))
+    assert result == f"Successfully edited {path}"
+    result = asyncio.run(tool.execute("edit", str(path), old_text="q", new_text="r"))
+    assert result.startswith("Error: The specified text was not found")
+
+    assert path.stat().st_mode & 0o777 == 0o750
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["script.sh"]
+
+
+def test_write_goes_through_symlink_and_keeps_mode(tmp_path):
+    real_dir = tmp_path / "real"
+    real_dir.mkdir()
+    target = real_dir / "config.ini"
+    target.write_text("old\n")
+    os.chmod(target, 0o640)
+    link = tmp_path / "config.ini"
+    link.symlink_to(target)
+
+    result = asyncio.run(FileWriteTool().execute("write", str(link), content="new\n"))
+
+    assert result.startswith("Successfully wrote")
+    assert link.is_symlink()
+    assert target.read_text() == "new\n"
+    assert target.stat().st_mode & 0o777 == 0o640
+    assert sorted(p.name for p in real_dir.iterdir()) == ["config.ini"]
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["config.ini", "real"]
+
+
+def test_write_keeps_hard_links(tmp_path):
+    path = tmp_path / "a.txt"
+    path.write_text("old\n")
+    other = tmp_path / "b.txt"
+    os.link(path, other)
+
+    file_tools.atomic_write_text(path, "new\n")
+
+    assert other.read_text() == "new\n"
+    assert os.path.samefile(path, other)
@@ -0,0 +1,292 @@
+"""Tests for enforced deadlines and cancellation in latency_control."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from agents.core.latency_control import (
+    CancellationToken,
+    CircuitOpenError,
+    FallbackExhaustedError,
+    FallbackStep,
+    LatencyBudget,
+    LatencyController,
+    LatencyMeasurement,
+    OperationCancelledError,
+    TimeoutPolicy,
+    current_cancellation_token,
+    with_timeout,
+)
+from agents.core.retrieval_augmentation import HybridRetriever
+from agents.core.rule_engine import Predicate, Rule, RuleEngine
+
+
+def test_sync_call_is_bounded_by_deadline():
+    controller = LatencyController()
+    release = threading.Event()
+
+    start = time.perf_counter()
+    with pytest.raises(TimeoutError):
+        controller.execute_with_timeout(
+            "slow", lambda: release.wait(2.0), timeout_ms=50
+        )
+    elapsed = time.perf_counter() - start
+    release.set()
+
+    assert elapsed < 1.0
+    stats = controller.get_stats("slow")["slow"]
+    assert stats.success_rate == 0.0
+
+
+def test_deadline_cancels_token_seen_by_worker():
+    controller = LatencyController()
+    observed = {}
+    finished = threading.Event()
+
+    def cooperative():
+        token = current_cancellation_token()
+        try:
+            while True:
+                token.raise_if_cancelled()
+                time.sleep(0.005)
+        except OperationCancelledError:
+            observed["reason"] = token.reason
+            finished.set()
+
+    with pytest.raises(TimeoutError):
+        controller.execute_with_timeout("loop", cooperative, timeout_ms=30)
+
+    assert finished.wait(1.0)
+    assert observed["reason"] == "deadline exceeded"
+
+
+def test_fallback_policy_triggers_on_real_timeout():
+    controller = LatencyController()
+    controller.set_budget(
+        LatencyBudget(
+            name="search",
+            max_ms=30,
+            warning_ms=20,
+            policy=TimeoutPolicy.FALLBACK,
+            fallback=lambda: "cached",
+        )
+    )
+
+    result, measurement = controller.execute_with_timeout(
+        "search", lambda: time.sleep(0.5)
+    )
+
+    assert result == "cached"
+    assert measurement.metadata["timeout"] is True
+
+
+def test_retry_policy_is_bounded():
+    controller = LatencyController()
+    controller.set_budget(
+        LatencyBudget(
+            name="flaky",
+            max_ms=20,
+            warning_ms=10,
+            policy=TimeoutPolicy.RETRY,
+            retry_count=2,
+            retry_delay_ms=1,
+        )
+    )
+    calls = []
+
+    def slow():
+        calls.append(1)
+        time.sleep(0.1)
+
+    with pytest.raises(TimeoutError):
+        controller.execute_with_timeout("flaky", slow)
+
+    assert len(calls) == 3  # first attempt + 2 retries, no nested retries
+
+
+def test_async_execute_times_out():
+    controller = LatencyController()
+
+    async def slow():
+        await asyncio.sleep(1.0)
+
+    async def fast():
+        return 42
+
+    async def scenario():
+        with pytest.raises(TimeoutError):
+            await controller.execute_with_timeout_async("a", slow, timeout_ms=20)
+        result, measurement = await controller.execute_with_timeout_async(
+            "a", fast, timeout_ms=500
+        )
+        return result, measurement
+
+    result, measurement = asyncio.run(scenario())
+    assert result == 42
+    assert measurement.success
+
+
+def test_with_timeout_decorator_bounds_sync_and_async():
+    @with_timeout(30)
+    def slow_sync():
+        time.sleep(0.5)
+
+    @with_timeout(30)
+    async def slow_async():
+        await asyncio.sleep(0.5)
+
+    @with_timeout(500)
+    def fast():
+        return "ok"
+
+    with pytest.raises(TimeoutError):
+        slow_sync()
+    with pytest.raises(TimeoutError):
+        asyncio.run(slow_async())
+    assert fast() == "ok"
+    assert fast.__name__ == "fast"
+
+
+def test_token_deadline_and_manual_cancel():
+    token = CancellationToken(timeout_ms=10_000)
+    assert not token.cancelled
+    assert token.remaining_ms() > 0
+
+    token.cancel("user abort")
+    with pytest.raises(OperationCancelledError, match="user abort"):
+        token.raise_if_cancelled()
+
+
+def test_engines_poll_cancellation_token():
+    token = CancellationToken()
+    token.cancel()
+
+    engine = RuleEngine()
+    engine.add_fact(Predicate("human", ["socrates"]))
+    engine.add_rule(
+        Rule("mortality", [Predicate("human", ["X"])], Predicate("mortal", ["X"]))
+    )
+    with pytest.raises(OperationCancelledError):
+        engine.forward_chain(cancellation_token=token)
+
+    retriever = HybridRetriever()
+    retriever.add_document("d1", "socrates is mortal")
+    with pytest.raises(OperationCancelledError):
+        retriever.retrieve("socrates", cancellation_token=token)
+
+
+def test_hedged_request_backup_wins_when_primary_stalls():
+    controller = LatencyController()
+    calls = []
+    release = threading.Event()
+
+    def component():
+        calls.append(1)
+        if len(calls) == 1:
+            release.wait(2.0)  # primary stalls
+            return "primary"
+        return "backup"
+
+    result, measurement = controller.execute_hedged(
+        "search", component, timeout_ms=1000, hedge_after_ms=20
+    )
+    release.set()
+
+    assert result == "backup"
+    assert measurement.metadata == {"hedged": True, "backup_won": True}
+    metrics = controller.get_hedge_metrics("search")
+    assert metrics["hedge_rate"] == 1.0
+    assert metrics["win_rate"] == 1.0
+
+
+def test_hedge_delay_uses_tracked_p95():
+    controller = LatencyController(hedge_min_samples=5)
+
+    def record(ms):
+        controller._tracker.record(
+            LatencyMeasurement(
+                component="kb", duration_ms=ms, success=True, budget_exceeded=False
+            )
+        )
+
+    for ms in range(1, 5):
+        record(float(ms))
+    assert controller._hedge_delay("kb") is None  # too little history
+
+    for ms in range(5, 41):
+        record(float(ms))
+    assert controller._hedge_delay("kb") == 39.0  # p95 of 1..40 ms
+
+    result, measurement = controller.execute_hedged("kb", lambda: "fast")
+
+    assert result == "fast"
+    assert controller.get_hedge_metrics("kb") == {
+        "requests": 1,
+        "hedged": 0,
+        "backup_wins": 0,
+        "hedge_rate": 0.0,
+        "win_rate": 0.0,
+    }
+
+    # A primary slower than the tracked p95 gets a backup
+    calls = []
+
+    def stalls_once():
+        calls.append(1)
+        if len(calls) == 1:
+            time.sleep(0.5)
+            return "primary"
+        return "backup"
+
+    result, measurement = controller.execute_hedged("kb", stalls_once)
+
+    assert result == "backup"
+    assert measurement.metadata == {"hedged": True, "backup_won": True}
+
+
+def test_fallback_chain_skips_slow_and_failing_tiers():
+    controller = LatencyController()
+    controller.set_budget(LatencyBudget(name="primary", max_ms=30, warning_ms=20))
+    controller.set_budget(LatencyBudget(name="answer", max_ms=2000, warning_ms=1000))
+
+    def broken():
+        raise RuntimeError("model unavailable")
+
+    result, measurement = controller.execute_with_fallbacks(
+        "answer",
+        [
+            FallbackStep("primary", lambda: time.sleep(0.5)),
+            FallbackStep("cheap_model", broken),
+            FallbackStep("cache", lambda: "cached answer"),
+        ],
+    )
+
+    assert result == "cached answer"
+    assert measurement.metadata["served_by"] == "cache"
+    assert measurement.metadata["skipped"] == ["primary", "cheap_model"]
+    assert controller.get_fallback_metrics("answer") == {"cache": 1}
+
+
+def test_fallback_chain_respects_open_circuit_and_exhaustion():
+    controller = LatencyController()
+    for _ in range(5):
+        controller._circuit_breaker.record_failure("primary")
+    called = []
+
+    def cache_miss():
+        raise KeyError("miss")
+
+    with pytest.raises(FallbackExhaustedError) as exc_info:
+        controller.execute_with_fallbacks(
+            "answer",
+            [
+                FallbackStep("primary", lambda: called.append("primary")),
+                FallbackStep("cache", cache_miss),
+            ],
+        )
+
+    assert called == []
+    assert isinstance(exc_info.value.errors["primary"], CircuitOpenError)
+    assert controller.get_fallback_metrics("answer") == {"exhausted": 1}
@@ -205,6 +205,28 @@ class TestLogicOrchestrator:
         # (may or may not find fallacies depending on patterns)
         assert isinstance(result.fallacies, list)
 
+    def test_analyze_batch_matches_analyze(self, orchestrator):
+        """Test batch analysis gives the same results as one at a time."""
+        arguments = [
+            StructuredArgument(
+                premises=["All mammals are animals", "All dogs are mammals"],
+                conclusion="All dogs are animals",
+                argument_type=ArgumentType.CATEGORICAL,
+            ),
+            StructuredArgument(
+                premises=["Either you support us or you are against us"],
+                conclusion="You must choose",
+            ),
+            StructuredArgument(premises=["The sky is blue"], conclusion="It is day"),
+        ]
+
+        results = orchestrator.analyze_batch(arguments)
+
+        assert [r.to_dict() for r in results] == [
+            orchestrator.analyze(arg).to_dict() for arg in arguments
+        ]
+        assert "false_dilemma" in [f.id for f in results[1].fallacies]
+
 
 class TestFactoryFunctions:
     """Tests for factory functions."""
@@ -0,0 +1,38 @@
+"""Tests for the shared LRUCache and the caches built on it."""
+
+import pytest
+
+from agents.governed.decision_cache import DecisionCache
+from agents.logic.result_cache import ResultCache
+from agents.tools.command_analysis import VerdictCache
+from agents.utils.lru import LRUCache
+
+
+def test_lru_eviction_and_statistics():
+    cache = LRUCache(max_entries=2)
+    cache.put("a", None)  # None is a value, not a miss
+    cache.put("b", 2)
+    assert cache.get("a", "missing") is None
+    assert "b" in cache  # Does not refresh recency
+    cache.put("c", 3)
+
+    assert "b" not in cache
+    assert cache.get("b", "missing") == "missing"
+    assert cache.stats() == {
+        "cache_hits": 1,
+        "cache_misses": 1,
+        "evictions": 1,
+        "hit_rate": 0.5,
+        "cache_size": 2,
+        "max_entries": 2,
+    }
+    with pytest.raises(ValueError):
+        LRUCache(max_entries=0)
+
+
+@pytest.mark.parametrize("cache_type", [VerdictCache, DecisionCache, ResultCache])
+def test_caches_share_the_lru_implementation(cache_type):
+    cache = cache_type(max_entries=3)
+
+    assert isinstance(cache, LRUCache)
+    assert set(LRUCache(1).stats()) <= set(cache.stats())
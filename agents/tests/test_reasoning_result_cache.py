@@ -0,0 +1,148 @@
+import threading
+import time
+
+import pytest
+
+from agents.logic.reasoning_agent import ReasoningAgent
+from agents.logic.result_cache import ResultCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_identical_queries_hit_cache():
+    agent = ReasoningAgent(name="tester", system_prompt="test")
+    agent.add_knowledge("Socrates is mortal", source="kb", confidence=0.9)
+
+    first = agent.reason("Socrates is mortal")
+    second = agent.reason("  Socrates   is mortal ")
+
+    stats = agent.get_cache_stats()
+    assert stats["cache_hits"] == 1
+    assert stats["cache_misses"] == 1
+    assert second["conclusion"] == first["conclusion"]
+    assert second["confidence"] == first["confidence"]
+
+
+def test_cached_results_are_independent_copies():
+    agent = ReasoningAgent(name="tester", system_prompt="test")
+    first = agent.reason("Socrates is mortal")
+    first["warnings"].append("mutated")
+    first["formal_argument"].argument_structure = "mutated"
+
+    second = agent.reason("Socrates is mortal")
+
+    assert "mutated" not in second["warnings"]
+    assert second["formal_argument"].argument_structure != "mutated"
+
+
+def test_cache_hits_are_recorded_but_bypass_circuit_breaker(monkeypatch):
+    agent = ReasoningAgent(name="tester", system_prompt="test")
+    agent.reason("Socrates is mortal")
+
+    breaker_calls = []
+    monkeypatch.setattr(
+        agent.circuit_breaker,
+        "can_execute",
+        lambda name: breaker_calls.append(name),
+    )
+    agent.reason("Socrates is mortal")
+    agent.reason("Socrates is mortal")
+
+    assert breaker_calls == []
+    assert agent.latency.get_stats("reasoning_agent").count == 3
+    measurements = agent.latency._measurements["reasoning_agent"]
+    assert [m.metadata.get("cached", False) for m in measurements] == [
+        False,
+        True,
+        True,
+    ]
+    records = agent.feedback.tracker._records.values()
+    assert [r.context.get("cached", False) for r in records] == [False, True, True]
+
+
+def test_add_knowledge_invalidates_cached_answer():
+    agent = ReasoningAgent(name="tester", system_prompt="test")
+    before = agent.reason("Socrates is mortal")
+    assert before["verified"] is False
+
+    agent.add_knowledge("Socrates is mortal", source="kb", confidence=0.9)
+    after = agent.reason("Socrates is mortal")
+
+    assert after["verified"] is True
+    assert agent.get_cache_stats()["cache_hits"] == 0
+
+
+def test_cache_opt_out():
+    agent = ReasoningAgent(name="tester", system_prompt="test", enable_cache=False)
+    agent.reason("Socrates is mortal")
+    agent.reason("Socrates is mortal")
+
+    assert agent.result_cache is None
+    assert agent.get_cache_stats() == {"enabled": False}
+
+
+def test_ttl_expiry_and_lru_eviction():
+    clock = FakeClock()
+    cache = ResultCache(max_entries=2, ttl_seconds=10.0, clock=clock)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1  # "a" becomes most recently used
+
+    cache.put("c", 3)  # evicts "b"
+    assert cache.get("b") is None
+
+    clock.now = 11.0
+    assert cache.get("a") is None
+
+    stats = cache.stats()
+    assert stats["evictions"] == 1
+    assert stats["expirations"] == 1
+
+
+def test_single_flight_computes_once():
+    cache = ResultCache()
+    calls = []
+    started = threading.Event()
+
+    def compute():
+        calls.append(1)
+        started.set()
+        time.sleep(0.05)
+        return "value"
+
+    results = []
+
+    def worker():
+        results.append(cache.get_or_compute("key", compute))
+
+    leader = threading.Thread(target=worker)
+    leader.start()
+    started.wait()
+    followers = [threading.Thread(target=worker) for _ in range(4)]
+    for t in followers:
+        t.start()
+    for t in [leader, *followers]:
+        t.join()
+
+    assert len(calls) == 1
+    assert [value for value, _ in results] == ["value"] * 5
+    assert cache.stats()["coalesced"] == 4
+
+
+def test_failed_computation_is_not_cached():
+    cache = ResultCache()
+
+    def boom():
+        raise RuntimeError("fail")
+
+    with pytest.raises(RuntimeError):
+        cache.get_or_compute("key", boom)
+
+    value, from_cache = cache.get_or_compute("key", lambda: "ok")
+    assert (value, from_cache) == ("ok", False)
@@ -0,0 +1,129 @@
+"""Tests for adaptive (early-stopping) self-consistency sampling."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from agents.core.self_consistency import (
+    AnswerNormalizer,
+    ReasoningChain,
+    SelfConsistencyConfig,
+    SelfConsistencyPipeline,
+    VoteTally,
+)
+
+
+def chain(i, answer, confidence=0.8):
+    return ReasoningChain(f"c{i}", [f"step {i}"], answer, confidence)
+
+
+def make_pipeline(**overrides):
+    config = SelfConsistencyConfig(enable_verification=False, **overrides)
+    return SelfConsistencyPipeline(config)
+
+
+def test_posterior_agreement_grows_with_agreeing_votes():
+    tally = VoteTally(AnswerNormalizer())
+    values = []
+    for i in range(5):
+        tally.add(chain(i, "The answer is 42."))
+        values.append(tally.posterior_agreement())
+
+    assert values == sorted(values)
+    # Beta(6, 1): P(p > 1/2) = 1 - 2**-6
+    assert tally.posterior_agreement() == pytest.approx(63 / 64)
+    tally.add(chain(5, "41"))
+    assert tally.leader() == ("42", 5, 1)
+    assert tally.posterior_agreement() < 63 / 64
+
+
+def test_easy_question_stops_early_and_reports_savings():
+    pipeline = make_pipeline(num_samples=10, max_concurrency=1)
+    calls = []
+
+    def producer(i):
+        calls.append(i)
+        return chain(i, "Paris")
+
+    result = pipeline.process_adaptive(producer)
+
+    assert result["answer"] == "paris"
+    sampling = result["sampling"]
+    assert sampling["early_stopped"]
+    # Four agreeing chains give posterior 31/32 >= 0.95.
+    assert sampling["launched"] == len(calls) == 4
+    assert sampling["chains_saved"] == 6
+    assert pipeline.sampling_stats()["savings_rate"] == pytest.approx(0.6)
+
+
+def test_split_question_samples_everything():
+    pipeline = make_pipeline(num_samples=8, max_concurrency=3)
+
+    result = pipeline.process_adaptive(lambda i: chain(i, "yes" if i % 2 else "no"))
+
+    assert not result["sampling"]["early_stopped"]
+    assert result["sampling"]["completed"] == 8
+    assert result["consistency"].total_votes == 8
+
+
+def test_adaptive_result_matches_full_aggregation():
+    answers = ["a", "b", "a", "a", "c", "a", "a", "a"]
+    chains = [chain(i, a, 0.5 + i / 20) for i, a in enumerate(answers)]
+    pipeline = make_pipeline(num_samples=8, early_termination_threshold=1.0)
+
+    adaptive = pipeline.process_adaptive(lambda i: chains[i])
+    full = make_pipeline().process(chains)
+
+    assert adaptive["answer"] == full["answer"]
+    assert adaptive["confidence"] == pytest.approx(full["confidence"])
+
+
+def test_producers_run_concurrently_and_failures_are_skipped():
+    pipeline = make_pipeline(
+        num_samples=4, max_concurrency=4, early_termination_threshold=1.0
+    )
+    active, peak = [0], [0]
+    lock = threading.Lock()
+
+    def producer(i):
+        with lock:
+            active[0] += 1
+            peak[0] = max(peak[0], active[0])
+        time.sleep(0.05)
+        with lock:
+            active[0] -= 1
+        if i == 3:
+            raise RuntimeError("sampling failed")
+        return chain(i, "x")
+
+    result = pipeline.process_adaptive(producer)
+
+    assert peak[0] > 1
+    assert result["sampling"]["failed"] == 1
+    assert result["consistency"].total_votes == 3
+
+
+def test_async_producers_are_cancelled_after_early_stop():
+    pipeline = make_pipeline(num_samples=12, max_concurrency=6)
+    cancelled = []
+
+    async def producer(i):
+        try:
+            # Later chains are slower, so the first four settle the vote.
+            await asyncio.sleep(0.01 * (i + 1) if i < 4 else 5)
+        except asyncio.CancelledError:
+            cancelled.append(i)
+            raise
+        return chain(i, "blue")
+
+    start = time.perf_counter()
+    result = asyncio.run(pipeline.process_adaptive_async(producer))
+
+    assert time.perf_counter() - start < 2.0
+    sampling = result["sampling"]
+    assert sampling["early_stopped"]
+    assert sampling["completed"] == 4
+    assert sampling["cancelled"] == len(cancelled) > 0
+    assert sampling["chains_saved"] == 12 - sampling["launched"]
@@ -0,0 +1,107 @@
+"""Tests for the combined grammar, parse cache and batching in the semantic parser."""
+
+import pytest
+
+from agents.core.semantic_parser import (
+    EnhancedSemanticParser,
+    ModalityType,
+    PatternSet,
+    QuantifierType,
+    compile_pattern_set,
+    create_ml_ontology,
+)
+from agents.logic.grounding import QuantifierType as GroundingQuantifier
+from agents.logic.grounding import SemanticParser, create_ml_context
+from agents.semantic_parser_benchmark import SENTENCES, LegacySemanticParser
+
+EXTRA_SENTENCES = [
+    "",
+    "   All cats are animals  ",
+    "IF the model is trained THEN it predicts",
+    "Every classifier is a model and some data is biased",
+    "The dataset is not balanced",
+    "Nobody knows whether the accuracy implies quality",
+    "x",
+]
+
+
+@pytest.mark.parametrize("text", SENTENCES + EXTRA_SENTENCES)
+def test_combined_grammar_matches_sequential_patterns(text):
+    ontology = create_ml_ontology()
+
+    assert EnhancedSemanticParser(ontology).parse(text) == LegacySemanticParser(
+        ontology
+    ).parse(text)
+
+
+def test_pattern_set_match_and_priority_search():
+    patterns = PatternSet(
+        [
+            (r"^(a)(b)?c", "first"),
+            (r"^(x)y", "second"),
+            (r"\bnot\b", "negation"),
+        ]
+    )
+
+    assert patterns.match("xyz") == ("second", ("x",))
+    assert patterns.match("ac") == ("first", ("a", None))
+    assert patterns.match("zzz") is None
+    # Priority wins over position: "first" is not leftmost but ranks higher
+    assert PatternSet([(r"b", "first"), (r"a", "second")]).search("ab") == "first"
+    assert patterns.search("it is not", default="none") == "negation"
+    assert patterns.search("nothing", default="none") == "none"
+    assert patterns.matches_any("not") and not patterns.matches_any("knot")
+
+
+def test_parse_cache_is_bounded_lru():
+    parser = EnhancedSemanticParser(cache_size=2)
+
+    first = parser.parse("All men are mortal")
+    parser.parse("Socrates is a man")
+    assert parser.parse(" All men are mortal ") is first
+    parser.parse("Dogs are loyal")
+
+    stats = parser.parse_cache.stats()
+    assert len(parser.parse_cache) == 2
+    assert "Socrates is a man" not in parser.parse_cache
+    assert (stats["cache_hits"], stats["evictions"]) == (1, 1)
+    with pytest.raises(ValueError):
+        EnhancedSemanticParser(cache_size=0)
+
+
+def test_parse_batch_deduplicates():
+    parser = EnhancedSemanticParser()
+    texts = ["All men are mortal", "Dogs are loyal", " All men are mortal", ""]
+
+    results = parser.parse_batch(texts)
+
+    assert results[0] is results[2]
+    assert results == [parser.parse(text) for text in texts]
+    assert parser.parse_cache.stats()["cache_misses"] == 3
+    assert parser.parse_batch([]) == []
+
+
+def test_detection_shares_compiled_tables():
+    first, second = EnhancedSemanticParser(), EnhancedSemanticParser()
+    ml_parser = SemanticParser(create_ml_context())
+
+    assert first.compiled_sentences is second.compiled_sentences
+    assert (
+        compile_pattern_set(tuple(EnhancedSemanticParser.QUANTIFIER_PATTERNS.items()))
+        is first.compiled_quantifiers
+    )
+    assert first._detect_quantifier("Most birds fly") == QuantifierType.MOST
+    assert first._detect_modality("He knows it") == ModalityType.KNOWLEDGE
+    assert ml_parser._quantifiers is SemanticParser(create_ml_context())._quantifiers
+
+
+def test_grounding_keywords_match_whole_words():
+    parser = SemanticParser(create_ml_context())
+
+    assert parser._detect_quantifier("small models are cheap") == (
+        GroundingQuantifier.GENERIC
+    )
+    assert parser._detect_quantifier("all models are cheap") == (
+        GroundingQuantifier.UNIVERSAL
+    )
+    assert parser._detect_modality("mustard is yellow") is None
@@ -0,0 +1,165 @@
+"""Tests for CSR trust propagation and cached scoring in source_trust."""
+
+import random
+
+import pytest
+
+from agents.core import source_trust
+from agents.core.source_trust import (
+    CitationGraph,
+    Source,
+    SourceCategory,
+    SourceRegistry,
+    TrustPropagator,
+)
+
+
+def reference_propagate(sources, damping=0.85, iterations=100, tolerance=1e-6):
+    """The original dict-based PageRank loop."""
+    trust = {sid: s.base_trust for sid, s in sources.items()}
+    for _ in range(iterations):
+        new_trust, max_delta = {}, 0.0
+        for sid, source in sources.items():
+            citation_sum = 0.0
+            for citing_id in source.cited_by:
+                if citing_id in sources:
+                    out_degree = len(sources[citing_id].cited_sources)
+                    if out_degree > 0:
+                        citation_sum += trust[citing_id] / out_degree
+            new_trust[sid] = (1 - damping) * source.base_trust + damping * citation_sum
+            max_delta = max(max_delta, abs(new_trust[sid] - trust[sid]))
+        trust = new_trust
+        if max_delta < tolerance:
+            break
+    return trust
+
+
+def make_registry(n=40, citations=120, seed=0):
+    rng = random.Random(seed)
+    registry = SourceRegistry()
+    for i in range(n):
+        registry.register_source(
+            Source(f"s{i}", f"Source {i}", SourceCategory.NEWS, rng.uniform(0.2, 0.9))
+        )
+    for _ in range(citations):
+        registry.add_citation(f"s{rng.randrange(n)}", f"s{rng.randrange(n)}")
+    # Citations to and from unregistered sources
+    registry.add_citation("s0", "external")
+    registry.add_citation("ghost", "s1")
+    return registry
+
+
+@pytest.mark.parametrize("use_numpy", [True, False])
+def test_csr_propagation_matches_reference(monkeypatch, use_numpy):
+    if use_numpy:
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(source_trust, "np", None)
+    sources = make_registry().sources
+
+    expected = reference_propagate(sources)
+    actual = TrustPropagator().propagate(sources)
+
+    assert actual.keys() == expected.keys()
+    for sid in expected:
+        assert actual[sid] == pytest.approx(expected[sid], abs=1e-5)
+
+
+def test_incremental_graph_matches_rebuild():
+    registry = make_registry()
+    registry.citation_graph.csr()
+    # Merged into the existing CSR arrays on the next read
+    registry.register_source(Source("ghost", "Late", SourceCategory.UNKNOWN))
+    for i in range(0, 40, 3):
+        registry.add_citation(f"s{i}", f"s{(i * 7) % 40}")
+
+    incremental = registry.citation_graph
+    rebuilt = CitationGraph.from_sources(registry.sources)
+
+    def edges(graph):
+        indptr, indices, _ = graph.csr()
+        return {
+            (graph.ids[int(u)], graph.ids[v])
+            for v in range(len(graph))
+            for u in indices[indptr[v] : indptr[v + 1]]
+        }
+
+    assert edges(incremental) == edges(rebuilt)
+    assert ("ghost", "s1") in edges(incremental)
+    assert dict(zip(incremental.ids, incremental.out_degree)) == dict(
+        zip(rebuilt.ids, rebuilt.out_degree)
+    )
+
+
+def test_scores_are_cached_until_inputs_change(monkeypatch):
+    registry = make_registry()
+    runs = []
+    original = registry.trust_propagator.propagate_graph
+
+    def counting(*args, **kwargs):
+        runs.append(kwargs.get("initial"))
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(registry.trust_propagator, "propagate_graph", counting)
+
+    first = registry.compute_trust_scores()
+    second = registry.compute_trust_scores()
+    assert len(runs) == 1
+    assert all(first[sid] is second[sid] for sid in first)
+
+    registry.record_verification("s3", correct=False)
+    third = registry.compute_trust_scores()
+    assert len(runs) == 1
+    assert third["s3"] is not second["s3"]
+    assert all(third[sid] is second[sid] for sid in third if sid != "s3")
+
+    registry.add_citation("s5", "s6")
+    registry.compute_trust_scores()
+    assert len(runs) == 2
+    assert runs[1] is not None  # warm start from the previous trust vector
+
+    registry.sources["s7"].base_trust = 0.99
+    registry.compute_trust_scores()
+    assert len(runs) == 3
+
+
+def test_warm_start_converges_faster():
+    registry = make_registry(n=200, citations=800)
+    registry.compute_trust_scores()
+    registry.add_citation("s1", "s2")
+
+    graph = registry.citation_graph
+    base = [registry.sources[sid].base_trust for sid in graph.ids]
+    propagator = TrustPropagator()
+    cold = propagator.propagate_graph(graph, base)
+    cold_iterations = propagator.last_iterations
+    warm = propagator.propagate_graph(graph, base, initial=cold)
+
+    assert propagator.last_iterations < cold_iterations
+    assert warm == pytest.approx(cold, abs=1e-5)
+
+
+@pytest.mark.parametrize("use_numpy", [True, False])
+def test_dangling_trust_is_redistributed(monkeypatch, use_numpy):
+    if use_numpy:
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(source_trust, "np", None)
+    sources = {
+        sid: Source(sid, sid, SourceCategory.UNKNOWN, base_trust=b)
+        for sid, b in [("a", 0.6), ("b", 0.3), ("c", 0.9)]
+    }
+    for citing, cited in [("a", "b"), ("b", "c"), ("a", "c")]:
+        sources[citing].cited_sources.add(cited)
+        sources[cited].cited_by.add(citing)
+
+    leaky = TrustPropagator().propagate(sources)
+    conserving = TrustPropagator(redistribute_dangling=True).propagate(sources)
+
+    assert sum(leaky.values()) < 1.8
+    assert sum(conserving.values()) == pytest.approx(1.8, abs=1e-4)
+
+
+def test_empty_registry():
+    assert SourceRegistry().compute_trust_scores() == {}
+    assert TrustPropagator().propagate({}) == {}
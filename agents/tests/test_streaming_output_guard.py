@@ -0,0 +1,113 @@
+"""Tests for streaming PII redaction and output guarding."""
+
+import random
+
+import pytest
+
+from agents.core.safety_system import (
+    ContentPolicyChecker,
+    OutputGuard,
+    PIIDetector,
+    StreamingOutputGuard,
+)
+from agents.core.ui_hooks import EventBus, EventType, StreamHandler
+
+TEXT = (
+    "Reach me at jane.doe@example.com or 555-123-4567 after 5pm. My SSN "
+    "is 123-45-6789 and the server is 10.0.0.12, card 4111 1111 1111 1111. "
+    "Numbers like x123-45-6789 or 2024 are fine, born 04/12/1985."
+)
+
+
+def chunks(text, seed):
+    rng = random.Random(seed)
+    pieces, i = [], 0
+    while i < len(text):
+        step = rng.randint(1, 7)
+        pieces.append(text[i : i + step])
+        i += step
+    return pieces
+
+
+def stream(guard, pieces):
+    return "".join(guard.feed(piece) for piece in pieces) + guard.close()
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_stream_matches_whole_text_redaction(seed):
+    detector = PIIDetector()
+    expected, types = detector.redact(TEXT)
+
+    guard = StreamingOutputGuard(pii_detector=detector)
+    assert stream(guard, chunks(TEXT, seed)) == expected
+    assert guard.pii_types == set(types)
+    assert guard.pii_count == len(detector.detect(TEXT))
+
+
+def test_safe_prefix_is_released_before_end_of_stream():
+    guard = StreamingOutputGuard()
+    pieces = chunks("plain words " * 20 + "call 555-123-4567", seed=1)
+
+    released = [guard.feed(piece) for piece in pieces]
+
+    assert "".join(released).startswith("plain words")
+    assert len(guard._buffer) <= 2 * guard.window + 7
+    assert guard.close().endswith("call [REDACTED]")
+
+
+def test_overlapping_findings_are_merged():
+    detector = PIIDetector()
+    text = "id 123-45-6789 end"
+    findings = [("a", "", 3, 9), ("b", "", 6, 14), ("c", "", 15, 18)]
+
+    assert detector.apply_redactions(text, findings) == "id [REDACTED] [REDACTED]"
+    assert detector.redact(text) == ("id [REDACTED] end", ["ssn"])
+
+
+def test_harmful_content_blocks_the_rest_of_the_stream():
+    guard = OutputGuard().stream()
+    text = "Some intro text that is harmless. Then we attack people. " + "x " * 50
+
+    released = stream(guard, chunks(text, seed=2))
+
+    assert guard.blocked
+    assert "attack" not in released
+    assert "Blocked: Potentially harmful content: violence" in guard.warnings
+    assert guard.feed("more") == ""
+
+
+def test_stream_feeds_stream_handler():
+    bus = EventBus()
+    handler = StreamHandler(bus)
+    tokens = []
+    bus.subscribe(EventType.TOKEN_GENERATED, lambda e: tokens.append(e.data["token"]))
+    guard = OutputGuard(block_on_harmful=False).stream(sink=handler.stream_token)
+
+    for piece in chunks(TEXT + " All cats are lazy.", seed=3):
+        guard.feed(piece)
+    guard.close()
+
+    emitted = "".join(tokens)
+    assert "jane.doe@example.com" not in emitted
+    assert emitted == PIIDetector().redact(TEXT + " All cats are lazy.")[0]
+    assert any(w.startswith("PII redacted from output") for w in guard.warnings)
+    assert "Policy warning: Potential bias detected: stereotype" in guard.warnings
+
+
+def test_window_grows_with_patterns_added_mid_stream():
+    detector = PIIDetector()
+    detector.patterns = {"ssn": detector.patterns["ssn"]}
+    checker = ContentPolicyChecker()
+    checker.harmful_patterns, checker.bias_patterns = [], []
+    guard = StreamingOutputGuard(pii_detector=detector, policy_checker=checker)
+    initial = guard.window
+    text = "key sk-" + "a" * 40 + " done"
+
+    released = guard.feed("start ")
+    detector.patterns["api_key"] = r"\bsk-[a-z0-9]{40}\b"
+    released += "".join(guard.feed(piece) for piece in chunks(text, seed=2))
+    released += guard.close()
+
+    assert guard.window > initial
+    assert released == "start key [REDACTED] done"
+    assert guard.pii_types == {"api_key"}
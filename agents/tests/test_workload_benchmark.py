@@ -0,0 +1,71 @@
+"""Tests for the reasoning stack workload benchmark."""
+
+import json
+
+import pytest
+
+from agents.workload_benchmark import (
+    SCENARIOS,
+    WorkloadGenerator,
+    format_table,
+    main,
+    projected_cost,
+    run_scenarios,
+)
+
+
+def test_generator_is_deterministic_and_sized():
+    gen = WorkloadGenerator(seed=7)
+
+    assert gen.facts(20) == WorkloadGenerator(seed=7).facts(20)
+    assert gen.corpus(5) != WorkloadGenerator(seed=8).corpus(5)
+    assert len(gen.corpus(30)) == 30
+    assert len(list(gen.telemetry_stream(40))) == 40
+
+    facts, rules = gen.rule_set(16, chain_length=8)
+    assert len(facts) == 16
+    assert any(len(rule.antecedents) == 2 for rule in rules)
+
+
+def test_recursive_rules_derive_transitive_closure():
+    call, _ = SCENARIOS["forward_chain"].build(WorkloadGenerator(), 8)
+
+    derived = call()
+
+    # One chain of 8 parent links: 8 * 9 / 2 ancestor facts.
+    assert len(derived) == 36
+    assert len(call()) == 36  # every call starts from the base facts
+
+
+def test_projection_uses_observed_growth():
+    assert projected_cost([], 100) == 0.0
+    assert projected_cost([(10, 1.0)], 100) == pytest.approx(10.0)
+    # Quadratic growth between the last two points is extrapolated.
+    assert projected_cost([(10, 1.0), (20, 4.0)], 40) == pytest.approx(16.0)
+
+
+def test_small_run_reports_every_scenario():
+    report = run_scenarios(scales=[5, 20], min_time=0.01)
+
+    rows = report["results"]
+    assert {row["scenario"] for row in rows} == set(SCENARIOS)
+    assert all(row["status"] == "ok" for row in rows)
+    telemetry = [row for row in rows if row["scenario"] == "telemetry"]
+    assert telemetry[1]["ops_per_call"] == 20
+    assert all(row["throughput_ops"] > 0 for row in rows)
+
+    table = format_table(rows).splitlines()
+    assert len(table) == 2 + len(rows)
+    assert "Baseline" in table[2]
+
+
+def test_over_budget_scales_are_skipped(tmp_path, capsys):
+    path = tmp_path / "report.json"
+    args = ["--scenarios", "memory", "--scales", "10", "1000", "100000"]
+    args += ["--budget", "1e-9", "--min-time", "0.01", "--json", str(path)]
+
+    assert main(args) == 0
+
+    rows = json.loads(path.read_text())["results"]
+    assert [row["status"] for row in rows] == ["ok", "skipped", "skipped"]
+    assert "skipped" in capsys.readouterr().out
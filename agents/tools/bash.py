@@ -1,11 +1,59 @@
 import asyncio
+import codecs
+import inspect
 import os
+import signal
 from dataclasses import dataclass, field
-from typing import List, Optional
+from typing import Any, Callable, List, Optional
 
 from .base import Tool
 from .security import CommandSecurityPolicy
 
+# Bytes read from a pipe per iteration
+READ_CHUNK_SIZE = 8192
+
+
+class BoundedOutput:
+    """
+    Keeps the first and last bytes of a stream within a fixed budget.
+
+    The head fills up first; after that only the most recent bytes are kept
+    in the tail, so memory stays bounded however much the command prints.
+    """
+
+    def __init__(self, max_bytes: int):
+        self.head_limit = max_bytes // 2
+        self.tail_limit = max_bytes - self.head_limit
+        self.head = bytearray()
+        self.tail = bytearray()
+        self.total_bytes = 0
+
+    def append(self, chunk: bytes) -> None:
+        self.total_bytes += len(chunk)
+        room = self.head_limit - len(self.head)
+        if room > 0:
+            self.head += chunk[:room]
+            chunk = chunk[room:]
+        if chunk:
+            self.tail += chunk[-self.tail_limit :] if self.tail_limit else b""
+            excess = len(self.tail) - self.tail_limit
+            if excess > 0:
+                del self.tail[:excess]
+
+    @property
+    def elided_bytes(self) -> int:
+        return self.total_bytes - len(self.head) - len(self.tail)
+
+    def __bool__(self) -> bool:
+        return self.total_bytes > 0
+
+    def render(self) -> str:
+        head = self.head.decode("utf-8", errors="replace")
+        tail = self.tail.decode("utf-8", errors="replace")
+        if not self.elided_bytes:
+            return head + tail
+        return f"{head}\n[... {self.elided_bytes} bytes elided ...]\n{tail}"
+
 
 @dataclass
 class BashTool(Tool):
@@ -37,6 +85,11 @@ class BashTool(Tool):
     allow_redirects: bool = field(default=True)
     timeout: int = field(default=30)
     security_policy: CommandSecurityPolicy | None = field(default=None)
+    # Per-stream budget for captured output (half head, half tail)
+    max_output_bytes: int = field(default=64 * 1024)
+    # Called as progress_callback(stream_name, text) while output arrives;
+    # may be a coroutine function
+    progress_callback: Optional[Callable[[str, str], Any]] = field(default=None)
 
     def __post_init__(self):
         # Ensure a default sandbox policy mirrors the autonomous-coding allowlist
@@ -117,34 +170,98 @@ class BashTool(Tool):
                 stdout=asyncio.subprocess.PIPE,
                 stderr=asyncio.subprocess.PIPE,
                 cwd=cwd,
+                # Own process group, so a timeout kills the whole pipeline
+                start_new_session=os.name == "posix",
             )
 
+            stdout = BoundedOutput(self.max_output_bytes)
+            stderr = BoundedOutput(self.max_output_bytes)
+            callback_errors: List[str] = []
             try:
-                stdout, stderr = await asyncio.wait_for(
-                    process.communicate(), timeout=self.timeout
+                await asyncio.wait_for(
+                    asyncio.gather(
+                        self._pump(process.stdout, stdout, "stdout", callback_errors),
+                        self._pump(process.stderr, stderr, "stderr", callback_errors),
+                        process.wait(),
+                    ),
+                    timeout=self.timeout,
                 )
             except asyncio.TimeoutError:
-                process.kill()
-                await process.wait()
-                return f"Error: Command timed out after {self.timeout} seconds"
-
-            # Format output
-            output = ""
-            if stdout:
-                output += stdout.decode("utf-8", errors="replace")
-            if stderr:
-                if output:
-                    output += "\n--- stderr ---\n"
-                output += stderr.decode("utf-8", errors="replace")
-
-            if process.returncode != 0:
-                output += f"\n[Exit code: {process.returncode}]"
-
+                partial = self._format_output(stdout, stderr, None)
+                message = f"Error: Command timed out after {self.timeout} seconds"
+                return f"{message}\n{partial}" if partial else message
+            finally:
+                # Never leave the command running, whether we timed out, a
+                # pump failed or the caller cancelled us
+                if process.returncode is None:
+                    self._kill(process)
+                    await process.wait()
+
+            output = self._format_output(stdout, stderr, process.returncode)
+            if callback_errors:
+                output += f"\n[Progress callback failed: {callback_errors[0]}]"
             return output.strip() or "[No output]"
 
         except Exception as e:
             return f"Error executing command: {str(e)}"
 
+    async def _pump(
+        self,
+        stream: asyncio.StreamReader,
+        output: BoundedOutput,
+        name: str,
+        callback_errors: List[str],
+    ) -> None:
+        """
+        Read a pipe in chunks into a bounded buffer, reporting progress.
+
+        A failing progress callback is recorded in callback_errors and not
+        called again, so it cannot stop the output from being drained.
+        """
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        while True:
+            chunk = await stream.read(READ_CHUNK_SIZE)
+            if not chunk:
+                break
+            output.append(chunk)
+            if self.progress_callback is not None and not callback_errors:
+                text = decoder.decode(chunk)
+                if text:
+                    try:
+                        result = self.progress_callback(name, text)
+                        if inspect.isawaitable(result):
+                            await result
+                    except Exception as e:
+                        callback_errors.append(f"{type(e).__name__}: {e}")
+
+    @staticmethod
+    def _kill(process: asyncio.subprocess.Process) -> None:
+        """Kill the command's process group (or just the process)."""
+        try:
+            if os.name == "posix":
+                os.killpg(process.pid, signal.SIGKILL)
+            else:
+                process.kill()
+        except ProcessLookupError:
+            pass
+
+    @staticmethod
+    def _format_output(
+        stdout: BoundedOutput, stderr: BoundedOutput, returncode: Optional[int]
+    ) -> str:
+        output = ""
+        if stdout:
+            output += stdout.render()
+        if stderr:
+            if output:
+                output += "\n--- stderr ---\n"
+            output += stderr.render()
+
+        if returncode:
+            output += f"\n[Exit code: {returncode}]"
+
+        return output.strip()
+
     def _is_command_allowed(self, command: str) -> bool:
         # Get the base command (first word)
         base_command = command.split()[0] if command else ""
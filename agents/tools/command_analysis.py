@@ -0,0 +1,430 @@
+"""Shell command analysis shared by the bash security policies.
+
+One single-pass tokenizer turns a command string into a ``CommandAST``:
+segments (split on ``;``, ``&&``, ``||``, ``&`` and newlines), each a
+pipeline of simple commands with their arguments, leading assignments and
+redirects, plus every command substitution (``$(...)``, backticks,
+``<(...)``, ``>(...)``) parsed recursively. Quoting follows the shell:
+operators inside quotes are literal, and ``$(...)``/backticks inside double
+quotes still run.
+
+Parsing is pure, so ``parse_command`` is memoized. ``VerdictCache``
+memoizes whole validation verdicts keyed by ``(policy fingerprint, command
+string)``; agent sessions repeat the same few hundred commands constantly.
+"""
+
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Callable, Hashable, Iterator, List, Optional, Tuple
+
+from ..utils.lru import LRUCache
+
+# Skipped where a command name is expected
+SHELL_KEYWORDS = frozenset(
+    {
+        "if",
+        "then",
+        "else",
+        "elif",
+        "fi",
+        "for",
+        "while",
+        "until",
+        "do",
+        "done",
+        "case",
+        "esac",
+        "in",
+        "!",
+        "{",
+        "}",
+    }
+)
+
+SEPARATOR_OPS = frozenset({";", ";;", "&&", "||", "&", "\n"})
+PIPE_OPS = frozenset({"|", "|&"})
+REDIRECT_OPS = frozenset(
+    {">", ">>", "<", "<<", "<<<", ">&", "<&", "&>", "&>>", ">|", "<>"}
+)
+GROUPING_OPS = frozenset({"(", ")"})
+
+# Longest first, so "&&" wins over "&"
+_OPERATORS = sorted(
+    SEPARATOR_OPS - {"\n"} | PIPE_OPS | REDIRECT_OPS | GROUPING_OPS,
+    key=len,
+    reverse=True,
+)
+_OPERATOR_CHARS = frozenset("".join(_OPERATORS))
+
+
+class ShellSyntaxError(ValueError):
+    """Raised by the tokenizer for unterminated quotes or substitutions."""
+
+
+@dataclass(frozen=True)
+class Redirect:
+    op: str
+    target: str
+    fd: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class SimpleCommand:
+    """One command of a pipeline."""
+
+    name: str  # Base name of the executable; "" if there is none
+    argv: Tuple[str, ...]
+    assignments: Tuple[str, ...]
+    redirects: Tuple[Redirect, ...]
+    text: str
+
+
+@dataclass(frozen=True)
+class Segment:
+    """Commands joined by pipes, between two separators."""
+
+    pipeline: Tuple[SimpleCommand, ...]
+    text: str
+
+    @property
+    def commands(self) -> List[str]:
+        return [command.name for command in self.pipeline if command.name]
+
+
+@dataclass(frozen=True)
+class CommandAST:
+    source: str
+    segments: Tuple[Segment, ...]
+    substitutions: Tuple["CommandAST", ...] = ()
+    error: Optional[str] = None
+
+    @property
+    def commands(self) -> List[str]:
+        """Command names outside substitutions, in order."""
+        return [name for segment in self.segments for name in segment.commands]
+
+    def iter_segments(self, nested: bool = True) -> Iterator[Segment]:
+        """Segments of the command, then of each substitution if nested."""
+        yield from self.segments
+        if nested:
+            for substitution in self.substitutions:
+                yield from substitution.iter_segments(nested=True)
+
+    def iter_commands(self, nested: bool = True) -> Iterator[SimpleCommand]:
+        for segment in self.iter_segments(nested):
+            yield from segment.pipeline
+
+
+@dataclass(frozen=True)
+class _Token:
+    kind: str  # "word" or "op"
+    value: str
+    start: int
+    end: int
+
+
+class _Lexer:
+    """Tokenizes from ``pos`` until the end or an unmatched ``closer``."""
+
+    def __init__(self, source: str, pos: int = 0, closer: Optional[str] = None):
+        self.source = source
+        self.pos = pos
+        self.closer = closer
+        self.tokens: List[_Token] = []
+        self.substitutions: List[CommandAST] = []
+        self._word: List[str] = []
+        self._word_start: Optional[int] = None
+
+    def run(self) -> "_Lexer":
+        src = self.source
+        depth = 0
+        while self.pos < len(src):
+            c = src[self.pos]
+            if c in " \t":
+                self._flush()
+                self.pos += 1
+            elif c == "\n":
+                self._flush()
+                self._emit_op("\n", self.pos, self.pos + 1)
+                self.pos += 1
+            elif c == "#" and self._word_start is None:
+                end = src.find("\n", self.pos)
+                self.pos = len(src) if end < 0 else end
+            elif c == "\\":
+                self._start_word()
+                if src.startswith("\\\n", self.pos):
+                    self.pos += 2  # Line continuation
+                else:
+                    self._word.append(src[self.pos + 1 : self.pos + 2])
+                    self.pos += 2
+            elif c == "'":
+                self._start_word()
+                end = src.find("'", self.pos + 1)
+                if end < 0:
+                    raise ShellSyntaxError("Unclosed single quote")
+                self._word.append(src[self.pos + 1 : end])
+                self.pos = end + 1
+            elif c == '"':
+                self._start_word()
+                self._double_quoted()
+            elif c == "`":
+                self._start_word()
+                self._word.append(self._backtick())
+            elif c == "$" and src.startswith("$((", self.pos):
+                self._start_word()
+                self._word.append(self._arithmetic())
+            elif c == "$" and src.startswith("$(", self.pos):
+                self._start_word()
+                self._word.append(self._substitution(self.pos + 2))
+            elif c in "<>" and src.startswith("(", self.pos + 1):
+                # Process substitution <(...) / >(...)
+                self._flush()
+                self._start_word()
+                self._word.append(src[self.pos])
+                self._word.append(self._substitution(self.pos + 2))
+            elif c in _OPERATOR_CHARS:
+                if c == ")" and self.closer == ")" and depth == 0:
+                    self._flush()
+                    return self
+                op = next(o for o in _OPERATORS if src.startswith(o, self.pos))
+                start = self.pos
+                fd = None
+                if op in REDIRECT_OPS and self._word and "".join(self._word).isdigit():
+                    fd = "".join(self._word)  # "2>" redirects a descriptor
+                    start = self._word_start
+                    self._word, self._word_start = [], None
+                self._flush()
+                depth += {"(": 1, ")": -1}.get(op, 0)
+                self._emit_op(op, start, self.pos + len(op), fd)
+                self.pos += len(op)
+            else:
+                self._start_word()
+                self._word.append(c)
+                self.pos += 1
+        self._flush()
+        if self.closer is not None:
+            raise ShellSyntaxError("Unclosed command substitution")
+        return self
+
+    # ----- word and token helpers -----
+
+    def _start_word(self) -> None:
+        if self._word_start is None:
+            self._word_start = self.pos
+
+    def _flush(self) -> None:
+        if self._word_start is not None:
+            self.tokens.append(
+                _Token("word", "".join(self._word), self._word_start, self.pos)
+            )
+            self._word, self._word_start = [], None
+
+    def _emit_op(self, op: str, start: int, end: int, fd: Optional[str] = None):
+        self.tokens.append(_Token("op", op if fd is None else fd + op, start, end))
+
+    # ----- quoting and substitutions -----
+
+    def _double_quoted(self) -> None:
+        src = self.source
+        self.pos += 1
+        while self.pos < len(src):
+            c = src[self.pos]
+            if c == '"':
+                self.pos += 1
+                return
+            if c == "\\" and src[self.pos + 1 : self.pos + 2] in ('"', "\\", "$", "`"):
+                self._word.append(src[self.pos + 1])
+                self.pos += 2
+            elif c == "`":
+                self._word.append(self._backtick())
+            elif src.startswith("$((", self.pos):
+                self._word.append(self._arithmetic())
+            elif src.startswith("$(", self.pos):
+                self._word.append(self._substitution(self.pos + 2))
+            else:
+                self._word.append(c)
+                self.pos += 1
+        raise ShellSyntaxError("Unclosed double quote")
+
+    def _substitution(self, body_start: int) -> str:
+        """Parse ``$(``...``)`` from its body; returns the raw text."""
+        start = self.pos
+        inner = _Lexer(self.source, body_start, closer=")").run()
+        self.substitutions.append(
+            _build(
+                self.source, body_start, inner.pos, inner.tokens, inner.substitutions
+            )
+        )
+        self.pos = inner.pos + 1
+        return self.source[start : self.pos]
+
+    def _backtick(self) -> str:
+        src = self.source
+        end = self.pos + 1
+        while True:
+            end = src.find("`", end)
+            if end < 0:
+                raise ShellSyntaxError("Unclosed backtick")
+            if src[end - 1] != "\\":
+                break
+            end += 1
+        body = src[self.pos + 1 : end].replace("\\`", "`")
+        self.substitutions.append(parse_command(body))
+        raw = src[self.pos : end + 1]
+        self.pos = end + 1
+        return raw
+
+    def _arithmetic(self) -> str:
+        """
+        Parse ``$((``...``))``; returns the raw text.
+
+        The expression runs no commands itself, but ``$(...)``, backticks
+        and nested ``$((...))`` inside it are expanded first, so they are
+        parsed like any other substitution. Quotes are not special here:
+        scanning through them can only find more substitutions, never fewer.
+        A body that does not close with ``))`` is, as in bash, a command
+        substitution starting with a subshell, e.g. ``$((cmd); cmd)``.
+        """
+        src = self.source
+        start, found = self.pos, len(self.substitutions)
+        self.pos += 3
+        depth = 0
+        while self.pos < len(src):
+            c = src[self.pos]
+            if c == "\\":
+                self.pos += 2
+            elif c == "`":
+                self._backtick()
+            elif src.startswith("$((", self.pos):
+                self._arithmetic()
+            elif src.startswith("$(", self.pos):
+                self._substitution(self.pos + 2)
+            elif c == "(":
+                depth += 1
+                self.pos += 1
+            elif c == ")" and depth:
+                depth -= 1
+                self.pos += 1
+            elif c == ")" and src.startswith("))", self.pos):
+                self.pos += 2
+                return src[start : self.pos]
+            elif c == ")":
+                # Not arithmetic after all: re-parse as $( (...) ... )
+                del self.substitutions[found:]
+                self.pos = start
+                return self._substitution(start + 2)
+            else:
+                self.pos += 1
+        raise ShellSyntaxError("Unclosed arithmetic expansion")
+
+
+def _is_assignment(word: str) -> bool:
+    return "=" in word and not word.startswith("=")
+
+
+def _simple_command(source: str, tokens: List[_Token]) -> SimpleCommand:
+    name = ""
+    argv: List[str] = []
+    assignments: List[str] = []
+    redirects: List[Redirect] = []
+    i = 0
+    while i < len(tokens):
+        token = tokens[i]
+        i += 1
+        if token.kind == "op":
+            op = token.value.lstrip("0123456789")
+            if op in REDIRECT_OPS:
+                target = ""
+                if i < len(tokens) and tokens[i].kind == "word":
+                    target = tokens[i].value
+                    i += 1
+                fd = token.value[: len(token.value) - len(op)] or None
+                redirects.append(Redirect(op, target, fd))
+            continue  # Subshell parentheses
+        word = token.value
+        if argv:
+            argv.append(word)
+        elif word in SHELL_KEYWORDS or word.startswith("-"):
+            continue
+        elif _is_assignment(word):
+            assignments.append(word)
+        else:
+            name = os.path.basename(word)
+            argv.append(word)
+    text = source[tokens[0].start : tokens[-1].end] if tokens else ""
+    return SimpleCommand(name, tuple(argv), tuple(assignments), tuple(redirects), text)
+
+
+def _build(
+    source: str,
+    start: int,
+    end: int,
+    tokens: List[_Token],
+    substitutions: List[CommandAST],
+) -> CommandAST:
+    segments: List[Segment] = []
+    pipeline: List[SimpleCommand] = []
+    command_tokens: List[_Token] = []
+    segment_tokens: List[_Token] = []
+
+    def end_command() -> None:
+        if command_tokens:
+            pipeline.append(_simple_command(source, command_tokens))
+            command_tokens.clear()
+
+    def end_segment() -> None:
+        end_command()
+        if pipeline:
+            text = source[segment_tokens[0].start : segment_tokens[-1].end]
+            segments.append(Segment(tuple(pipeline), text))
+            pipeline.clear()
+        segment_tokens.clear()
+
+    for token in tokens:
+        if token.kind == "op" and token.value in SEPARATOR_OPS:
+            end_segment()
+        elif token.kind == "op" and token.value in PIPE_OPS:
+            end_command()
+            segment_tokens.append(token)
+        else:
+            command_tokens.append(token)
+            segment_tokens.append(token)
+    end_segment()
+
+    return CommandAST(source[start:end], tuple(segments), tuple(substitutions))
+
+
+@lru_cache(maxsize=4096)
+def parse_command(command: str) -> CommandAST:
+    """Parse a shell command string; syntax errors are reported in ``error``."""
+    try:
+        lexer = _Lexer(command).run()
+    except ShellSyntaxError as exc:
+        return CommandAST(command, (), (), error=str(exc))
+    return _build(command, 0, len(command), lexer.tokens, lexer.substitutions)
+
+
+class VerdictCache(LRUCache):
+    """
+    Thread-safe LRU cache of validation verdicts.
+
+    Keys are ``(fingerprint, command)``; the fingerprint must capture every
+    policy setting the verdict depends on, e.g. a frozenset of allowed
+    commands, so a policy change never reuses stale verdicts.
+    """
+
+    def __init__(self, max_entries: int = 4096):
+        super().__init__(max_entries)
+
+    def get_or_compute(
+        self, fingerprint: Hashable, command: str, compute: Callable[[], Any]
+    ) -> Any:
+        """Return the verdict for command under fingerprint, computing on a miss."""
+        return self._get_or_compute((fingerprint, command), compute)[0]
+
+
+# Shared by every policy that does not bring its own cache
+DEFAULT_VERDICT_CACHE = VerdictCache()
@@ -6,7 +6,355 @@ Optional reasoning modules (such as Watson Glaser critical thinking) can be embe
 to add specialized perspectives without changing the core workflow.
 """
 
-from typing import Any, Callable, Dict, List, Optional
+import functools
+import threading
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from types import MappingProxyType
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+# Default perspective text per layer; independent of the query
+_LAYER_PERSPECTIVES = {
+    1: "Perceives patterns in the question structure and context",
+    2: "Applies logical inference and deductive reasoning",
+    3: "Critically evaluates evidence strength and argument validity",
+    4: "Coordinates insights and optimizes reasoning strategies",
+}
+
+_DEFINITIVE_TERMS = ("always", "never", "all", "none", "must", "impossible")
+_HEDGE_TERMS = ("likely", "probably", "may", "might", "suggests")
+
+QueryInput = Union[str, Dict[str, Any]]
+
+
+LayerSpecs = Mapping[int, Mapping[str, str]]
+
+
+@functools.lru_cache(maxsize=64)
+def _layer_specs_for(layers: int) -> LayerSpecs:
+    """
+    Layer specifications for an architecture size.
+
+    Memoized per layer count, so every tool instance with the same
+    architecture shares one spec table. The table and each spec are
+    read-only views, so no caller can change them for later users.
+    """
+    return MappingProxyType(
+        {
+            layer_id: MappingProxyType(spec)
+            for layer_id, spec in _build_layer_specs(layers).items()
+        }
+    )
+
+
+def _build_layer_specs(layers: int) -> Dict[int, Dict[str, str]]:
+    """Build layer specifications for an architecture size."""
+    if layers == 4:
+        return {
+            1: {
+                "name": "Perception",
+                "focus": "pattern_recognition",
+                "type": "perception",
+            },
+            2: {"name": "Reasoning", "focus": "logical_inference", "type": "logic"},
+            3: {
+                "name": "Evaluation",
+                "focus": "critical_assessment",
+                "type": "evaluation",
+            },
+            4: {
+                "name": "Meta-Learning",
+                "focus": "strategy_optimization",
+                "type": "meta",
+            },
+        }
+    elif layers == 8:
+        return {
+            1: {
+                "name": "Pattern Perception",
+                "focus": "visual_structural_patterns",
+                "type": "perception",
+            },
+            2: {
+                "name": "Semantic Analysis",
+                "focus": "meaning_extraction",
+                "type": "perception",
+            },
+            3: {
+                "name": "Deductive Reasoning",
+                "focus": "logical_deduction",
+                "type": "logic",
+            },
+            4: {
+                "name": "Inductive Reasoning",
+                "focus": "pattern_generalization",
+                "type": "logic",
+            },
+            5: {
+                "name": "Critical Evaluation",
+                "focus": "evidence_assessment",
+                "type": "evaluation",
+            },
+            6: {
+                "name": "Counterfactual Analysis",
+                "focus": "alternative_scenarios",
+                "type": "evaluation",
+            },
+            7: {
+                "name": "Strategic Synthesis",
+                "focus": "strategy_coordination",
+                "type": "synthesis",
+            },
+            8: {
+                "name": "Meta-Cognition",
+                "focus": "self_monitoring",
+                "type": "meta",
+            },
+        }
+    elif layers == 16:
+        return {
+            1: {
+                "name": "Visual Pattern Recognition",
+                "focus": "visual_patterns",
+                "type": "perception",
+            },
+            2: {
+                "name": "Linguistic Pattern Recognition",
+                "focus": "language_patterns",
+                "type": "perception",
+            },
+            3: {
+                "name": "Semantic Extraction",
+                "focus": "meaning",
+                "type": "perception",
+            },
+            4: {
+                "name": "Pragmatic Understanding",
+                "focus": "context",
+                "type": "perception",
+            },
+            5: {
+                "name": "Formal Logic (Deductive)",
+                "focus": "deduction",
+                "type": "logic",
+            },
+            6: {
+                "name": "Informal Logic (Inductive)",
+                "focus": "induction",
+                "type": "logic",
+            },
+            7: {
+                "name": "Abductive Reasoning",
+                "focus": "inference_best_explanation",
+                "type": "logic",
+            },
+            8: {
+                "name": "Analogical Reasoning",
+                "focus": "analogy",
+                "type": "logic",
+            },
+            9: {
+                "name": "Evidence Evaluation",
+                "focus": "evidence_strength",
+                "type": "evaluation",
+            },
+            10: {
+                "name": "Source Credibility",
+                "focus": "source_assessment",
+                "type": "evaluation",
+            },
+            11: {
+                "name": "Counterfactual Reasoning",
+                "focus": "alternatives",
+                "type": "evaluation",
+            },
+            12: {
+                "name": "Scenario Planning",
+                "focus": "future_scenarios",
+                "type": "evaluation",
+            },
+            13: {
+                "name": "Strategic Integration",
+                "focus": "strategy_integration",
+                "type": "synthesis",
+            },
+            14: {
+                "name": "Tactical Optimization",
+                "focus": "tactics",
+                "type": "synthesis",
+            },
+            15: {
+                "name": "Meta-Cognitive Monitoring",
+                "focus": "self_monitoring",
+                "type": "meta",
+            },
+            16: {
+                "name": "Epistemic Validation",
+                "focus": "knowledge_validation",
+                "type": "meta",
+            },
+        }
+    elif layers == 32:
+        specs = {}
+        # Perception (1-4)
+        specs.update(
+            {
+                i: {
+                    "name": f"Perception-{i}",
+                    "focus": "perception",
+                    "type": "perception",
+                }
+                for i in range(1, 5)
+            }
+        )
+        # Comprehension (5-8)
+        specs.update(
+            {
+                i: {
+                    "name": f"Comprehension-{i - 4}",
+                    "focus": "comprehension",
+                    "type": "perception",
+                }
+                for i in range(5, 9)
+            }
+        )
+        # Deductive Reasoning (9-12)
+        specs.update(
+            {
+                i: {
+                    "name": f"Deductive-{i - 8}",
+                    "focus": "deduction",
+                    "type": "logic",
+                }
+                for i in range(9, 13)
+            }
+        )
+        # Inductive Reasoning (13-16)
+        specs.update(
+            {
+                i: {
+                    "name": f"Inductive-{i - 12}",
+                    "focus": "induction",
+                    "type": "logic",
+                }
+                for i in range(13, 17)
+            }
+        )
+        # Critical Evaluation (17-20)
+        specs.update(
+            {
+                i: {
+                    "name": f"Evaluation-{i - 16}",
+                    "focus": "evaluation",
+                    "type": "evaluation",
+                }
+                for i in range(17, 21)
+            }
+        )
+        # Creative Thinking (21-24)
+        specs.update(
+            {
+                i: {
+                    "name": f"Creative-{i - 20}",
+                    "focus": "creative",
+                    "type": "evaluation",
+                }
+                for i in range(21, 25)
+            }
+        )
+        # Synthesis (25-28)
+        specs.update(
+            {
+                i: {
+                    "name": f"Synthesis-{i - 24}",
+                    "focus": "synthesis",
+                    "type": "synthesis",
+                }
+                for i in range(25, 29)
+            }
+        )
+        # Meta-Cognition (29-32)
+        specs.update(
+            {
+                i: {"name": f"Meta-{i - 28}", "focus": "meta", "type": "meta"}
+                for i in range(29, 33)
+            }
+        )
+        return specs
+    else:
+        # Default: expand 4-layer pattern
+        return {
+            i: {"name": f"Layer-{i}", "focus": "general", "type": "general"}
+            for i in range(1, layers + 1)
+        }
+
+
+@functools.lru_cache(maxsize=1024)
+def _query_confidence_factor(query: str, context: Optional[str]) -> float:
+    """
+    Analyze query characteristics to determine confidence modulation factor.
+    Returns a multiplier between 0.7 and 1.3.
+
+    Pure function of its inputs, memoized so repeated queries skip the scan.
+    """
+    text = f"{context or ''} {query}".lower()
+    confidence_factor = 1.0
+
+    # Clear logical structure increases confidence
+    logic_indicators = ["all", "if", "then", "therefore", "because", "since"]
+    words = set(text.split())
+    logic_count = sum(1 for ind in logic_indicators if ind in words)
+    if logic_count >= 2:
+        confidence_factor += 0.15
+    elif logic_count == 1:
+        confidence_factor += 0.05
+
+    # Specific domain terminology increases confidence
+    specific_terms = [
+        "engineer",
+        "software",
+        "data",
+        "analysis",
+        "research",
+        "study",
+        "experiment",
+        "test",
+        "measure",
+        "calculate",
+    ]
+    if any(term in text for term in specific_terms):
+        confidence_factor += 0.05
+
+    # Vague or ambiguous language decreases confidence
+    vague_terms = ["maybe", "might", "could", "possibly", "perhaps", "unclear"]
+    if any(term in text for term in vague_terms):
+        confidence_factor -= 0.1
+
+    # Very short queries are less confident
+    if len(query.split()) < 5:
+        confidence_factor -= 0.1
+
+    # Complex multi-part questions decrease confidence slightly
+    if query.count("?") > 1 or len(query.split()) > 50:
+        confidence_factor -= 0.05
+
+    # Context availability increases confidence
+    if context and len(context) > 20:
+        confidence_factor += 0.1
+
+    # Clip to reasonable range
+    return max(0.7, min(1.3, confidence_factor))
 
 
 class ExtendedThinkingTool:
@@ -28,16 +376,20 @@ class ExtendedThinkingTool:
         verbose: bool = False,
         logic_weight: float = 0.75,
         modules: Optional[List[str]] = None,
+        history_limit: int = 1000,
     ):
         self.name = "extended_thinking"
         self.layers = layers
         self.verbose = verbose
         self.logic_weight = logic_weight  # Prioritize logic over consensus
-        self.thinking_history = []
+        # Ring buffer: oldest entries drop off once history_limit is reached
+        self.thinking_history: Deque[Dict[str, Any]] = deque(maxlen=history_limit)
+        self._history_lock = threading.Lock()
 
-        # Dynamic layer specializations based on architecture
+        # Dynamic layer specializations based on architecture (shared per size)
         self.layer_specs = self._init_layer_specs(layers)
         self.logic_layer_indices = self._identify_logic_layers()
+        self._layer_rows = self._build_layer_rows()
 
         # Reasoning strategies with weights
         self.strategies = {
@@ -58,6 +410,10 @@ class ExtendedThinkingTool:
             "counterFactual": {"weight": 0.68, "description": "Consider alternatives"},
         }
 
+        # Precomputed strategy rankings, rebuilt if self.strategies changes
+        self._strategy_signature: Optional[Tuple[Tuple[str, float], ...]] = None
+        self._strategy_tables: Dict[Tuple[bool, bool], List[Dict[str, Any]]] = {}
+
         # Optional specialized reasoning modules
         self.available_modules = self._init_available_modules()
         self.enabled_modules: List[str] = []
@@ -66,246 +422,9 @@ class ExtendedThinkingTool:
         for module_name in modules or []:
             self.enable_module(module_name)
 
-    def _init_layer_specs(self, layers: int) -> Dict[int, Dict[str, str]]:
+    def _init_layer_specs(self, layers: int) -> LayerSpecs:
         """Initialize layer specifications based on architecture size."""
-        if layers == 4:
-            return {
-                1: {
-                    "name": "Perception",
-                    "focus": "pattern_recognition",
-                    "type": "perception",
-                },
-                2: {"name": "Reasoning", "focus": "logical_inference", "type": "logic"},
-                3: {
-                    "name": "Evaluation",
-                    "focus": "critical_assessment",
-                    "type": "evaluation",
-                },
-                4: {
-                    "name": "Meta-Learning",
-                    "focus": "strategy_optimization",
-                    "type": "meta",
-                },
-            }
-        elif layers == 8:
-            return {
-                1: {
-                    "name": "Pattern Perception",
-                    "focus": "visual_structural_patterns",
-                    "type": "perception",
-                },
-                2: {
-                    "name": "Semantic Analysis",
-                    "focus": "meaning_extraction",
-                    "type": "perception",
-                },
-                3: {
-                    "name": "Deductive Reasoning",
-                    "focus": "logical_deduction",
-                    "type": "logic",
-                },
-                4: {
-                    "name": "Inductive Reasoning",
-                    "focus": "pattern_generalization",
-                    "type": "logic",
-                },
-                5: {
-                    "name": "Critical Evaluation",
-                    "focus": "evidence_assessment",
-                    "type": "evaluation",
-                },
-                6: {
-                    "name": "Counterfactual Analysis",
-                    "focus": "alternative_scenarios",
-                    "type": "evaluation",
-                },
-                7: {
-                    "name": "Strategic Synthesis",
-                    "focus": "strategy_coordination",
-                    "type": "synthesis",
-                },
-                8: {
-                    "name": "Meta-Cognition",
-                    "focus": "self_monitoring",
-                    "type": "meta",
-                },
-            }
-        elif layers == 16:
-            return {
-                1: {
-                    "name": "Visual Pattern Recognition",
-                    "focus": "visual_patterns",
-                    "type": "perception",
-                },
-                2: {
-                    "name": "Linguistic Pattern Recognition",
-                    "focus": "language_patterns",
-                    "type": "perception",
-                },
-                3: {
-                    "name": "Semantic Extraction",
-                    "focus": "meaning",
-                    "type": "perception",
-                },
-                4: {
-                    "name": "Pragmatic Understanding",
-                    "focus": "context",
-                    "type": "perception",
-                },
-                5: {
-                    "name": "Formal Logic (Deductive)",
-                    "focus": "deduction",
-                    "type": "logic",
-                },
-                6: {
-                    "name": "Informal Logic (Inductive)",
-                    "focus": "induction",
-                    "type": "logic",
-                },
-                7: {
-                    "name": "Abductive Reasoning",
-                    "focus": "inference_best_explanation",
-                    "type": "logic",
-                },
-                8: {
-                    "name": "Analogical Reasoning",
-                    "focus": "analogy",
-                    "type": "logic",
-                },
-                9: {
-                    "name": "Evidence Evaluation",
-                    "focus": "evidence_strength",
-                    "type": "evaluation",
-                },
-                10: {
-                    "name": "Source Credibility",
-                    "focus": "source_assessment",
-                    "type": "evaluation",
-                },
-                11: {
-                    "name": "Counterfactual Reasoning",
-                    "focus": "alternatives",
-                    "type": "evaluation",
-                },
-                12: {
-                    "name": "Scenario Planning",
-                    "focus": "future_scenarios",
-                    "type": "evaluation",
-                },
-                13: {
-                    "name": "Strategic Integration",
-                    "focus": "strategy_integration",
-                    "type": "synthesis",
-                },
-                14: {
-                    "name": "Tactical Optimization",
-                    "focus": "tactics",
-                    "type": "synthesis",
-                },
-                15: {
-                    "name": "Meta-Cognitive Monitoring",
-                    "focus": "self_monitoring",
-                    "type": "meta",
-                },
-                16: {
-                    "name": "Epistemic Validation",
-                    "focus": "knowledge_validation",
-                    "type": "meta",
-                },
-            }
-        elif layers == 32:
-            specs = {}
-            # Perception (1-4)
-            specs.update(
-                {
-                    i: {
-                        "name": f"Perception-{i}",
-                        "focus": "perception",
-                        "type": "perception",
-                    }
-                    for i in range(1, 5)
-                }
-            )
-            # Comprehension (5-8)
-            specs.update(
-                {
-                    i: {
-                        "name": f"Comprehension-{i - 4}",
-                        "focus": "comprehension",
-                        "type": "perception",
-                    }
-                    for i in range(5, 9)
-                }
-            )
-            # Deductive Reasoning (9-12)
-            specs.update(
-                {
-                    i: {
-                        "name": f"Deductive-{i - 8}",
-                        "focus": "deduction",
-                        "type": "logic",
-                    }
-                    for i in range(9, 13)
-                }
-            )
-            # Inductive Reasoning (13-16)
-            specs.update(
-                {
-                    i: {
-                        "name": f"Inductive-{i - 12}",
-                        "focus": "induction",
-                        "type": "logic",
-                    }
-                    for i in range(13, 17)
-                }
-            )
-            # Critical Evaluation (17-20)
-            specs.update(
-                {
-                    i: {
-                        "name": f"Evaluation-{i - 16}",
-                        "focus": "evaluation",
-                        "type": "evaluation",
-                    }
-                    for i in range(17, 21)
-                }
-            )
-            # Creative Thinking (21-24)
-            specs.update(
-                {
-                    i: {
-                        "name": f"Creative-{i - 20}",
-                        "focus": "creative",
-                        "type": "evaluation",
-                    }
-                    for i in range(21, 25)
-                }
-            )
-            # Synthesis (25-28)
-            specs.update(
-                {
-                    i: {
-                        "name": f"Synthesis-{i - 24}",
-                        "focus": "synthesis",
-                        "type": "synthesis",
-                    }
-                    for i in range(25, 29)
-                }
-            )
-            # Meta-Cognition (29-32)
-            specs.update(
-                {
-                    i: {"name": f"Meta-{i - 28}", "focus": "meta", "type": "meta"}
-                    for i in range(29, 33)
-                }
-            )
-            return specs
-        else:
-            # Default: expand 4-layer pattern
-            return {
-                i: {"name": f"Layer-{i}", "focus": "general", "type": "general"}
-                for i in range(1, layers + 1)
-            }
+        return _layer_specs_for(layers)
 
     def _identify_logic_layers(self) -> List[int]:
         """Identify which layers are logic/reasoning layers for prioritization."""
@@ -313,6 +432,29 @@ class ExtendedThinkingTool:
             i for i, spec in self.layer_specs.items() if spec.get("type") == "logic"
         ]
 
+    def _build_layer_rows(self) -> List[Tuple[int, str, str, str, float]]:
+        """
+        Precompute the query-independent part of each layer's analysis.
+
+        Rows are (layer_id, name, focus, perspective, base_confidence).
+        """
+        rows = []
+        for layer_id in range(1, self.layers + 1):
+            spec = self.layer_specs.get(
+                layer_id, {"name": f"Layer {layer_id}", "focus": "general"}
+            )
+            rows.append(
+                (
+                    layer_id,
+                    spec["name"],
+                    spec["focus"],
+                    self._layer_perspective(layer_id),
+                    # Base confidence increases with layer depth
+                    0.6 + (layer_id * 0.05),
+                )
+            )
+        return rows
+
     def _init_available_modules(self) -> Dict[str, Dict[str, Any]]:
         """Register optional reasoning modules that can augment the base tool."""
         return {
@@ -392,6 +534,88 @@ class ExtendedThinkingTool:
         Returns:
             Dict containing thinking chain, analysis, and confidence scores
         """
+        result = self._run(query, context, options, depth)
+        self._record_history(query, result)
+
+        if self.verbose:
+            self._print_thinking_process(result)
+
+        return result
+
+    def execute_many(
+        self,
+        queries: Sequence[QueryInput],
+        max_workers: Optional[int] = None,
+        use_processes: bool = False,
+    ) -> List[Dict[str, Any]]:
+        """
+        Execute extended thinking for a batch of queries concurrently.
+
+        Args:
+            queries: Query strings, or dicts with ``query`` and optional
+                ``context``, ``options`` and ``depth`` keys
+            max_workers: Pool size (defaults to the executor's default)
+            use_processes: Use a process pool instead of threads. Sidesteps
+                the GIL for large batches; module state (e.g. Watson Glaser
+                focus history) is then updated in the workers, not here.
+
+        Returns:
+            Results in the same order as ``queries``
+        """
+        requests = [self._normalize_query_input(q) for q in queries]
+        if not requests:
+            return []
+
+        if use_processes:
+            config = {
+                "layers": self.layers,
+                "logic_weight": self.logic_weight,
+                "modules": list(self.enabled_modules),
+            }
+            with ProcessPoolExecutor(
+                max_workers=max_workers,
+                initializer=_init_worker_tool,
+                initargs=(type(self), config),
+            ) as pool:
+                results = list(pool.map(_run_in_worker, requests))
+        else:
+            with ThreadPoolExecutor(max_workers=max_workers) as pool:
+                results = list(pool.map(lambda r: self._run(**r), requests))
+
+        for request, result in zip(requests, results):
+            self._record_history(request["query"], result)
+            if self.verbose:
+                self._print_thinking_process(result)
+
+        return results
+
+    @staticmethod
+    def _normalize_query_input(item: QueryInput) -> Dict[str, Any]:
+        """Convert an execute_many input into keyword arguments for _run."""
+        if isinstance(item, str):
+            return {"query": item, "context": None, "options": None, "depth": 3}
+        return {
+            "query": item["query"],
+            "context": item.get("context"),
+            "options": item.get("options"),
+            "depth": item.get("depth", 3),
+        }
+
+    def _record_history(self, query: str, result: Dict[str, Any]) -> None:
+        """Append a result to the bounded thinking history."""
+        with self._history_lock:
+            self.thinking_history.append(
+                {"query": query, "result": result, "timestamp": self._timestamp()}
+            )
+
+    def _run(
+        self,
+        query: str,
+        context: Optional[str],
+        options: Optional[List[str]],
+        depth: int,
+    ) -> Dict[str, Any]:
+        """Run the thinking pipeline without touching history or output."""
         thinking_chain = []
         step_number = 1
 
@@ -498,14 +722,6 @@ class ExtendedThinkingTool:
             "modules": module_outputs,
         }
 
-        # Store in history
-        self.thinking_history.append(
-            {"query": query, "result": result, "timestamp": self._timestamp()}
-        )
-
-        if self.verbose:
-            self._print_thinking_process(result)
-
         return result
 
     def _analyze_question(self, query: str, context: Optional[str]) -> Dict[str, Any]:
@@ -560,112 +776,69 @@ class ExtendedThinkingTool:
         Analyze query characteristics to determine confidence modulation factor.
         Returns a multiplier between 0.7 and 1.3.
         """
-        text = f"{context or ''} {query}".lower()
-        confidence_factor = 1.0
-
-        # Clear logical structure increases confidence
-        logic_indicators = ["all", "if", "then", "therefore", "because", "since"]
-        logic_count = sum(1 for ind in logic_indicators if ind in text.split())
-        if logic_count >= 2:
-            confidence_factor += 0.15
-        elif logic_count == 1:
-            confidence_factor += 0.05
-
-        # Specific domain terminology increases confidence
-        specific_terms = [
-            "engineer",
-            "software",
-            "data",
-            "analysis",
-            "research",
-            "study",
-            "experiment",
-            "test",
-            "measure",
-            "calculate",
-        ]
-        if any(term in text for term in specific_terms):
-            confidence_factor += 0.05
-
-        # Vague or ambiguous language decreases confidence
-        vague_terms = ["maybe", "might", "could", "possibly", "perhaps", "unclear"]
-        if any(term in text for term in vague_terms):
-            confidence_factor -= 0.1
-
-        # Very short queries are less confident
-        if len(query.split()) < 5:
-            confidence_factor -= 0.1
-
-        # Complex multi-part questions decrease confidence slightly
-        if query.count("?") > 1 or len(query.split()) > 50:
-            confidence_factor -= 0.05
-
-        # Context availability increases confidence
-        if context and len(context) > 20:
-            confidence_factor += 0.1
-
-        # Clip to reasonable range
-        return max(0.7, min(1.3, confidence_factor))
+        return _query_confidence_factor(query, context)
 
     def _multi_layer_analysis(
         self, query: str, context: Optional[str], depth: int
     ) -> List[Dict[str, Any]]:
         """Analyze from multiple specialized perspectives."""
-        analyses = []
-
         # Analyze query characteristics for confidence modulation
         query_confidence_factor = self._analyze_query_confidence(query, context)
 
-        for layer_id in range(1, min(self.layers + 1, depth + 1)):
-            spec = self.layer_specs.get(
-                layer_id, {"name": f"Layer {layer_id}", "focus": "general"}
-            )
-
-            # Base confidence increases with layer depth
-            base_confidence = 0.6 + (layer_id * 0.05)
-
-            # Modulate based on query characteristics
-            layer_confidence = base_confidence * query_confidence_factor
-
-            # Clip to valid range
-            layer_confidence = max(0.3, min(0.95, layer_confidence))
-
-            analysis = {
+        return [
+            {
                 "layer": layer_id,
-                "name": spec["name"],
-                "focus": spec["focus"],
-                "perspective": self._layer_perspective(layer_id, query, context),
-                "confidence": layer_confidence,
+                "name": name,
+                "focus": focus,
+                "perspective": perspective,
+                # Modulate based on query characteristics, clipped to valid range
+                "confidence": max(
+                    0.3, min(0.95, base_confidence * query_confidence_factor)
+                ),
             }
-            analyses.append(analysis)
-
-        return analyses
-
-    def _layer_perspective(
-        self, layer_id: int, query: str, context: Optional[str]
-    ) -> str:
-        """Generate perspective from specific layer."""
-        perspectives = {
-            1: "Perceives patterns in the question structure and context",
-            2: "Applies logical inference and deductive reasoning",
-            3: "Critically evaluates evidence strength and argument validity",
-            4: "Coordinates insights and optimizes reasoning strategies",
-        }
-        return perspectives.get(layer_id, f"Layer {layer_id} analysis")
+            for layer_id, name, focus, perspective, base_confidence in self._layer_rows[
+                : max(0, depth)
+            ]
+        ]
+
+    def _layer_perspective(self, layer_id: int) -> str:
+        """Generate perspective from specific layer (query-independent)."""
+        return _LAYER_PERSPECTIVES.get(layer_id, f"Layer {layer_id} analysis")
 
     def _select_strategies(
         self, query: str, concepts: List[str]
     ) -> List[Dict[str, Any]]:
         """Select relevant reasoning strategies."""
+        signature = tuple(
+            (name, data["weight"]) for name, data in self.strategies.items()
+        )
+        if signature != self._strategy_signature:
+            self._strategy_tables = {
+                (has_logic, has_evidence): self._rank_strategies(
+                    has_logic, has_evidence
+                )
+                for has_logic in (False, True)
+                for has_evidence in (False, True)
+            }
+            self._strategy_signature = signature
+
+        table = self._strategy_tables[("logic" in concepts, "evidence" in concepts)]
+        # Copies so callers can annotate results without corrupting the table
+        return [dict(entry) for entry in table]
+
+    def _rank_strategies(
+        self, has_logic: bool, has_evidence: bool
+    ) -> List[Dict[str, Any]]:
+        """Score strategies for one combination of concept flags."""
         # Score each strategy
         scored = []
         for name, data in self.strategies.items():
             score = data["weight"]
 
             # Boost score based on concepts
-            if "logic" in concepts and name in ["analytical", "eliminative"]:
+            if has_logic and name in ["analytical", "eliminative"]:
                 score += 0.1
-            if "evidence" in concepts and name in ["evaluative", "comparative"]:
+            if has_evidence and name in ["evaluative", "comparative"]:
                 score += 0.1
 
             scored.append({"name": name, "score": score, **data})
@@ -848,7 +1021,7 @@ class ExtendedThinkingTool:
     ) -> List[Dict[str, Any]]:
         """Evaluate each option using selected strategies."""
         evaluations = []
-        query_lower = query.lower()
+        query_words = set(query.lower().split())
 
         for idx, option in enumerate(options):
             option_lower = option.lower()
@@ -864,7 +1037,6 @@ class ExtendedThinkingTool:
                 confidence -= 0.05
 
             # Check if option contains key terms from query
-            query_words = set(query_lower.split())
             option_words = set(option_lower.split())
             overlap = len(query_words & option_words)
             if overlap > 3:
@@ -873,13 +1045,11 @@ class ExtendedThinkingTool:
                 confidence += 0.05
 
             # Absolute/definitive language
-            definitive_terms = ["always", "never", "all", "none", "must", "impossible"]
-            if any(term in option_lower for term in definitive_terms):
+            if any(term in option_lower for term in _DEFINITIVE_TERMS):
                 confidence -= 0.1  # Usually too strong
 
             # Hedging language (often more accurate)
-            hedge_terms = ["likely", "probably", "may", "might", "suggests"]
-            if any(term in option_lower for term in hedge_terms):
+            if any(term in option_lower for term in _HEDGE_TERMS):
                 confidence += 0.05
 
             # Add some variance based on position (first option slight advantage)
@@ -1085,7 +1255,7 @@ class ExtendedThinkingTool:
                 h["result"]["confidence"] for h in self.thinking_history
             )
             / len(self.thinking_history),
-            "recent_queries": [h["query"] for h in self.thinking_history[-5:]],
+            "recent_queries": [h["query"] for h in list(self.thinking_history)[-5:]],
         }
 
 
@@ -1148,3 +1318,16 @@ class WatsonGlaserThinkingTool(ExtendedThinkingTool):
         self.cognitive_templates = state.get("cognitive_templates", {})
         self.max_complexity = state.get("max_complexity", 1)
         self.accuracy_history = state.get("accuracy_history", [])
+
+
+# Process-pool workers keep one tool per process, built by the initializer
+_WORKER_TOOL: Optional[ExtendedThinkingTool] = None
+
+
+def _init_worker_tool(tool_cls: type, config: Dict[str, Any]) -> None:
+    global _WORKER_TOOL
+    _WORKER_TOOL = tool_cls(verbose=False, history_limit=1, **config)
+
+
+def _run_in_worker(request: Dict[str, Any]) -> Dict[str, Any]:
+    return _WORKER_TOOL._run(**request)
@@ -1,12 +1,141 @@
 """File operation tools for reading and writing files."""
 
 import asyncio
+import bisect
 import glob
+import mmap
 import os
+import threading
+import uuid
+from array import array
+from collections import OrderedDict
 from pathlib import Path
+from typing import Tuple
 
 from .base import Tool
 
+# Bytes per block of the line index; one counter is stored per block
+LINE_INDEX_BLOCK_SIZE = 64 * 1024
+LINE_INDEX_CACHE_SIZE = 32
+
+
+class LineIndex:
+    """
+    Sparse line-offset index of a file.
+
+    Stores the number of newlines before each fixed-size block, so building
+    it only counts newlines and locating a line scans at most one block.
+    """
+
+    def __init__(self, block_newlines: array, size: int, line_count: int):
+        self.block_newlines = block_newlines
+        self.size = size
+        self.line_count = line_count
+
+    @classmethod
+    def build(cls, mm: mmap.mmap) -> "LineIndex":
+        size = len(mm)
+        block_newlines = array("q")
+        newlines = 0
+        for start in range(0, size, LINE_INDEX_BLOCK_SIZE):
+            block_newlines.append(newlines)
+            newlines += mm[start : start + LINE_INDEX_BLOCK_SIZE].count(b"\n")
+        trailing = 1 if size and mm[size - 1 : size] != b"\n" else 0
+        return cls(block_newlines, size, newlines + trailing)
+
+    def line_offset(self, mm: mmap.mmap, line: int) -> int:
+        """Byte offset where 0-based line starts (file size if past the end)."""
+        if line <= 0:
+            return 0
+        if line >= self.line_count:
+            return self.size
+        # The line starts after the line-th newline; find the block holding it
+        block = bisect.bisect_left(self.block_newlines, line) - 1
+        pos = block * LINE_INDEX_BLOCK_SIZE
+        for _ in range(line - self.block_newlines[block]):
+            pos = mm.find(b"\n", pos) + 1
+        return pos
+
+
+_line_index_cache: "OrderedDict[Tuple[str, int, int], LineIndex]" = OrderedDict()
+_line_index_lock = threading.Lock()
+
+
+def get_line_index(path: Path, mm: mmap.mmap) -> LineIndex:
+    """Return the line index for a mapped file, cached by (path, mtime, size)."""
+    stat = os.stat(path)
+    key = (os.path.realpath(path), stat.st_mtime_ns, stat.st_size)
+    with _line_index_lock:
+        index = _line_index_cache.get(key)
+        if index is not None:
+            _line_index_cache.move_to_end(key)
+            return index
+
+    index = LineIndex.build(mm)
+
+    with _line_index_lock:
+        _line_index_cache[key] = index
+        while len(_line_index_cache) > LINE_INDEX_CACHE_SIZE:
+            _line_index_cache.popitem(last=False)
+    return index
+
+
+def tail_offset(mm: mmap.mmap, lines: int) -> int:
+    """Byte offset of the last ``lines`` lines, scanning back from EOF."""
+    pos = len(mm)
+    if pos and mm[pos - 1 : pos] == b"\n":
+        pos -= 1  # The final newline terminates the last line
+    for _ in range(lines):
+        pos = mm.rfind(b"\n", 0, pos)
+        if pos < 0:
+            return 0
+    return pos + 1
+
+
+def atomic_write_text(path: Path, text: str) -> None:
+    """
+    Write text via a temp file next to the real target and os.replace.
+
+    Symlinks are followed, so the link's target is updated and the link
+    kept. The target's mode, and its owner where permitted, carry over to
+    the new file. A file with several hard links is rewritten in place
+    instead, since replacing it would detach it from its other names.
+    """
+    target = Path(os.path.realpath(path))
+    try:
+        st = os.stat(target)
+    except FileNotFoundError:
+        st = None
+    if st is not None and st.st_nlink > 1:
+        with open(target, "w", encoding="utf-8") as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        return
+
+    tmp_path = target.parent / f".{target.name}.{uuid.uuid4().hex}.tmp"
+    # Created like open(..., "w") would, so new files get umask permissions
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        if st is not None:
+            os.chmod(tmp_path, st.st_mode & 0o7777)
+            if hasattr(os, "chown"):
+                try:
+                    os.chown(tmp_path, st.st_uid, st.st_gid)
+                except PermissionError:
+                    pass  # Only the owner's group may be kept, or neither
+        os.replace(tmp_path, target)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
 
 class FileReadTool(Tool):
     """Tool for reading files and listing directories."""
@@ -20,6 +149,11 @@ class FileReadTool(Tool):
             Operations:
             - read: Read the contents of a file
             - list: List files in a directory
+
+            Large files can be paged through without reading them whole:
+            - start_line (1-based) with max_lines: read a range of lines
+            - offset/length: read a byte range
+            - tail: read the last N lines
             """,
             input_schema={
                 "type": "object",
@@ -37,6 +171,22 @@ class FileReadTool(Tool):
                         "type": "integer",
                         "description": "Maximum lines to read (0 means no limit)",
                     },
+                    "start_line": {
+                        "type": "integer",
+                        "description": "First line to read, 1-based (0 means from the start)",
+                    },
+                    "offset": {
+                        "type": "integer",
+                        "description": "Byte offset to start reading at",
+                    },
+                    "length": {
+                        "type": "integer",
+                        "description": "Number of bytes to read from offset (0 means to end of file)",
+                    },
+                    "tail": {
+                        "type": "integer",
+                        "description": "Read only the last N lines",
+                    },
                     "pattern": {
                         "type": "string",
                         "description": "File pattern to match",
@@ -52,6 +202,10 @@ class FileReadTool(Tool):
         path: str,
         max_lines: int = 0,
         pattern: str = "*",
+        start_line: int = 0,
+        offset: int = 0,
+        length: int = 0,
+        tail: int = 0,
     ) -> str:
         """Execute a file read operation.
 
@@ -60,11 +214,21 @@ class FileReadTool(Tool):
             path: The file or directory path
             max_lines: Maximum lines to read (for read operation, 0 means no limit)
             pattern: File pattern to match (for list operation)
+            start_line: First line of a line-range read (1-based)
+            offset: Start of a byte-range read
+            length: Bytes to read from offset (0 means to end of file)
+            tail: Read the last N lines
 
         Returns:
             Result of the operation as string
         """
         if operation == "read":
+            if min(start_line, offset, length, tail) < 0:
+                return "Error: start_line, offset, length and tail must be >= 0"
+            if tail or start_line or offset or length:
+                return await self._read_range(
+                    path, start_line, max_lines, offset, length, tail
+                )
             return await self._read_file(path, max_lines)
         elif operation == "list":
             return await self._list_files(path, pattern)
@@ -101,6 +265,58 @@ class FileReadTool(Tool):
         except Exception as e:
             return f"Error reading {path}: {str(e)}"
 
+    async def _read_range(
+        self,
+        path: str,
+        start_line: int = 0,
+        max_lines: int = 0,
+        offset: int = 0,
+        length: int = 0,
+        tail: int = 0,
+    ) -> str:
+        """Read part of a file through mmap without loading the rest.
+
+        Args:
+            path: Path to the file to read
+            start_line: First line to read (1-based); uses the line index
+            max_lines: Number of lines from start_line (0 means to the end)
+            offset: Byte offset for a byte-range read
+            length: Bytes to read from offset (0 means to the end)
+            tail: Number of lines to read from the end of the file
+        """
+        try:
+            file_path = Path(path)
+
+            if not file_path.exists():
+                return f"Error: File not found at {path}"
+            if not file_path.is_file():
+                return f"Error: {path} is not a file"
+
+            def read_sync():
+                with open(file_path, "rb") as f:
+                    if os.fstat(f.fileno()).st_size == 0:
+                        return ""  # Empty files cannot be mapped
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        if tail:
+                            start, end = tail_offset(mm, tail), len(mm)
+                        elif start_line:
+                            index = get_line_index(file_path, mm)
+                            first = start_line - 1
+                            start = index.line_offset(mm, first)
+                            end = (
+                                index.line_offset(mm, first + max_lines)
+                                if max_lines > 0
+                                else len(mm)
+                            )
+                        else:
+                            start = min(offset, len(mm))
+                            end = start + length if length else len(mm)
+                        return mm[start:end].decode("utf-8", errors="replace")
+
+            return await asyncio.to_thread(read_sync)
+        except Exception as e:
+            return f"Error reading {path}: {str(e)}"
+
     async def _list_files(self, directory: str, pattern: str = "*") -> str:
         """List files in a directory."""
         try:
@@ -218,8 +434,7 @@ class FileWriteTool(Tool):
             os.makedirs(file_path.parent, exist_ok=True)
 
             def write_sync():
-                with open(file_path, "w", encoding="utf-8") as f:
-                    f.write(content)
+                atomic_write_text(file_path, content)
                 return f"Successfully wrote {len(content)} characters to {path}"
 
             return await asyncio.to_thread(write_sync)
@@ -241,26 +456,20 @@ class FileWriteTool(Tool):
                     with open(file_path, encoding="utf-8", errors="replace") as f:
                         content = f.read()
 
-                    if old_text not in content:
+                    # One scan finds every occurrence
+                    parts = content.split(old_text)
+                    count = len(parts) - 1
+                    if count == 0:
                         return f"Error: The specified text was not found in {path}"
 
-                    # Count occurrences to warn about multiple matches
-                    count = content.count(old_text)
+                    atomic_write_text(file_path, new_text.join(parts))
                     if count > 1:
-                        # Edit with warning about multiple occurrences
-                        new_content = content.replace(old_text, new_text)
-                        with open(file_path, "w", encoding="utf-8") as f:
-                            f.write(new_content)
+                        # Warn about multiple occurrences
                         return (
                             f"Warning: Found {count} occurrences. "
                             f"All were replaced in {path}"
                         )
-                    else:
-                        # One occurrence, straightforward replacement
-                        new_content = content.replace(old_text, new_text)
-                        with open(file_path, "w", encoding="utf-8") as f:
-                            f.write(new_content)
-                        return f"Successfully edited {path}"
+                    return f"Successfully edited {path}"
                 except UnicodeDecodeError:
                     return f"Error: {path} appears to be a binary file"
 
@@ -3,10 +3,16 @@
 from __future__ import annotations
 
 import os
-import re
 import shlex
 from dataclasses import dataclass, field
-from typing import Iterable, List, Set
+from typing import Hashable, Iterable, List, Set
+
+from .command_analysis import (
+    DEFAULT_VERDICT_CACHE,
+    CommandAST,
+    VerdictCache,
+    parse_command,
+)
 
 DEFAULT_ALLOWED_COMMANDS: Set[str] = {
     # File inspection
@@ -39,78 +45,29 @@ DEFAULT_ALLOWED_COMMANDS: Set[str] = {
 COMMANDS_NEEDING_EXTRA_VALIDATION = {"pkill", "chmod", "init.sh"}
 
 
-@dataclass
+@dataclass(frozen=True)
 class ValidationResult:
     allowed: bool
     reason: str = ""
 
 
 def split_command_segments(command_string: str) -> list[str]:
-    """Split compound commands on &&, ||, and ; while respecting quotes."""
+    """Split compound commands on &&, ||, ; and & while respecting quotes."""
 
-    segments = re.split(r"\s*(?:&&|\|\|)\s*", command_string)
-    result: list[str] = []
-    for segment in segments:
-        sub_segments = re.split(r"(?<![\"'])\s*;\s*(?![\"'])", segment)
-        for sub in sub_segments:
-            sub = sub.strip()
-            if sub:
-                result.append(sub)
-    return result
+    ast = parse_command(command_string)
+    if ast.error:
+        stripped = command_string.strip()
+        return [stripped] if stripped else []
+    return [segment.text for segment in ast.segments]
 
 
 def extract_commands(command_string: str) -> list[str]:
     """Extract command names from a shell string, handling pipes and chaining."""
 
-    commands: list[str] = []
-    segments = re.split(r"(?<![\"'])\s*;\s*(?![\"'])", command_string)
-
-    for segment in segments:
-        segment = segment.strip()
-        if not segment:
-            continue
-
-        try:
-            tokens = shlex.split(segment)
-        except ValueError:
-            return []
-
-        if not tokens:
-            continue
-
-        expect_command = True
-        for token in tokens:
-            if token in ("|", "||", "&&", "&"):
-                expect_command = True
-                continue
-            if token in (
-                "if",
-                "then",
-                "else",
-                "elif",
-                "fi",
-                "for",
-                "while",
-                "until",
-                "do",
-                "done",
-                "case",
-                "esac",
-                "in",
-                "!",
-                "{",
-                "}",
-            ):
-                continue
-            if token.startswith("-"):
-                continue
-            if "=" in token and not token.startswith("="):
-                continue
-            if expect_command:
-                commands.append(os.path.basename(token))
-                expect_command = False
-
-    return commands
+    ast = parse_command(command_string)
+    if ast.error:
+        return []
+    return ast.commands
 
 
 def validate_pkill_command(command_string: str) -> ValidationResult:
@@ -184,6 +141,7 @@ class CommandSecurityPolicy:
     allowed_paths: List[str] = field(
         default_factory=lambda: [os.path.abspath(os.getcwd())]
     )
+    verdict_cache: VerdictCache | None = field(default=None, repr=False, compare=False)
 
     def is_path_allowed(self, directory: str | None) -> bool:
         if directory is None:
@@ -194,15 +152,39 @@ class CommandSecurityPolicy:
             abs_dir.startswith(os.path.abspath(path)) for path in self.allowed_paths
         )
 
+    def fingerprint(self) -> Hashable:
+        """Every setting a command verdict depends on."""
+        return (type(self), frozenset(self.allowed_commands))
+
     def validate(
         self, command: str, working_directory: str | None = None
     ) -> ValidationResult:
         if not command.strip():
             return ValidationResult(False, "Command is empty")
 
-        segments = split_command_segments(command)
-        for segment in segments:
-            commands = extract_commands(segment)
+        cache = self.verdict_cache
+        if cache is None:
+            cache = DEFAULT_VERDICT_CACHE
+        validation = cache.get_or_compute(
+            self.fingerprint(),
+            command,
+            lambda: self.validate_ast(parse_command(command)),
+        )
+        if not validation.allowed:
+            return validation
+
+        if not self.is_path_allowed(working_directory):
+            return ValidationResult(False, "Working directory is outside the sandbox")
+
+        return ValidationResult(True)
+
+    def validate_ast(self, ast: CommandAST) -> ValidationResult:
+        """Check every command, including those in substitutions, uncached."""
+        if ast.error:
+            return ValidationResult(False, "Unable to parse command")
+
+        for segment in ast.iter_segments(nested=True):
+            commands = segment.commands
             if not commands:
                 return ValidationResult(False, "Unable to parse command")
 
@@ -210,12 +192,10 @@ class CommandSecurityPolicy:
                 if cmd not in self.allowed_commands:
                     return ValidationResult(False, f"Command '{cmd}' is not allowed")
 
-            if any(cmd in COMMANDS_NEEDING_EXTRA_VALIDATION for cmd in commands):
-                validation = validate_commands(segment, commands)
-                if not validation.allowed:
-                    return validation
-
-        if not self.is_path_allowed(working_directory):
-            return ValidationResult(False, "Working directory is outside the sandbox")
+            for simple in segment.pipeline:
+                if simple.name in COMMANDS_NEEDING_EXTRA_VALIDATION:
+                    validation = validate_commands(simple.text, [simple.name])
+                    if not validation.allowed:
+                        return validation
 
         return ValidationResult(True)
@@ -1,6 +1,7 @@
 """Agent utility modules."""
 
 from .history_util import MessageHistory
+from .lru import LRUCache
 from .tool_util import execute_tools
 
-__all__ = ["MessageHistory", "execute_tools"]
+__all__ = ["LRUCache", "MessageHistory", "execute_tools"]
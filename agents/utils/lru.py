@@ -0,0 +1,125 @@
+"""Bounded, thread-safe LRU cache shared by the memo caches across packages."""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+_MISSING = object()
+
+
+class LRUCache:
+    """
+    Thread-safe LRU cache with hit, miss and eviction statistics.
+
+    Subclasses add key schemes, expiry or invalidation by overriding
+    ``_lookup``/``_store`` and extending ``_stats``; both hooks run with
+    the lock held.
+
+    Usage:
+        cache = LRUCache(max_entries=1024)
+        cache.put("key", value)
+        cache.get("key")
+        cache.stats()["hit_rate"]
+    """
+
+    def __init__(self, max_entries: int = 1024):
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.max_entries = max_entries
+
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value for key, or default."""
+        with self._lock:
+            value, found = self._lookup(key)
+            if found:
+                self._hits += 1
+                return value
+            self._misses += 1
+            return default
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Store a value, evicting the least recently used entry if full."""
+        with self._lock:
+            self._store(key, value)
+
+    def invalidate(self, key: Hashable) -> None:
+        """Remove a single entry."""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all entries (statistics are kept)."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return cache statistics for monitoring."""
+        with self._lock:
+            return self._stats()
+
+    def __contains__(self, key: Hashable) -> bool:
+        """Membership test that leaves recency and statistics untouched."""
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _get_or_compute(
+        self,
+        key: Hashable,
+        compute: Callable[[], Any],
+        store_if: Optional[Callable[[Any], bool]] = None,
+    ) -> Tuple[Any, bool]:
+        """
+        Return (value, from_cache), computing and storing the value on a miss.
+
+        ``compute`` runs without the lock, so concurrent misses may compute
+        the same value; ``store_if`` is checked under the lock before storing.
+        """
+        with self._lock:
+            value, found = self._lookup(key)
+            if found:
+                self._hits += 1
+                return value, True
+            self._misses += 1
+
+        value = compute()
+
+        with self._lock:
+            if store_if is None or store_if(value):
+                self._store(key, value)
+        return value, False
+
+    def _lookup(self, key: Hashable) -> Tuple[Any, bool]:
+        """Find an entry and mark it most recently used. Caller holds lock."""
+        value = self._entries.get(key, _MISSING)
+        if value is _MISSING:
+            return None, False
+        self._entries.move_to_end(key)
+        return value, True
+
+    def _store(self, key: Hashable, value: Any) -> None:
+        """Insert an entry and enforce the size bound. Caller holds lock."""
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+
+    def _stats(self) -> Dict[str, Any]:
+        """Statistics dict; subclasses extend it. Caller holds lock."""
+        total = self._hits + self._misses
+        return {
+            "cache_hits": self._hits,
+            "cache_misses": self._misses,
+            "evictions": self._evictions,
+            "hit_rate": self._hits / max(1, total),
+            "cache_size": len(self._entries),
+            "max_entries": self.max_entries,
+        }
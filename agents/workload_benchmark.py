@@ -0,0 +1,495 @@
+"""
+Workload Benchmark - Reasoning Stack Hot Paths at Scale
+
+Generates synthetic workloads (knowledge bases, document corpora, recursive
+rule sets, telemetry streams) and drives the reasoning stack's hot paths
+against them at growing sizes:
+
+    reasoning      ReasoningAgent.reason over a KB of N facts
+    orchestrator   LogicOrchestrator.analyze on an N-premise argument chain
+    retrieval      HybridRetriever.retrieve over a corpus of N chunks
+    forward_chain  RuleEngine.forward_chain with recursive rules over N facts
+    memory         MemorySystem.retrieve over N stored memories
+    telemetry      TelemetryLogger ingestion of an N-event stream
+
+Every (scenario, scale) point records the build time and traced memory
+footprint of the workload, and per-call latency, throughput and peak memory
+measured by benchmark_suite.BenchmarkRunner. The report is written as JSON
+and as a markdown scaling table in the format used by SCALABILITY_ANALYSIS.md.
+
+A scale is skipped when its cost, projected from the growth observed at the
+smaller scales, exceeds --budget seconds; the default run therefore stops
+each curve where it turns expensive, and a larger budget fills it in.
+
+Usage:
+    python agents/workload_benchmark.py
+    python agents/workload_benchmark.py --scenarios retrieval memory
+    python agents/workload_benchmark.py --budget 600 --json report.json
+"""
+
+import argparse
+import json
+import math
+import os
+import random
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass
+from itertools import cycle
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from agents.core.benchmark_suite import (
+    BenchmarkCategory,
+    BenchmarkConfig,
+    BenchmarkRunner,
+)
+from agents.core.logic_orchestrator import (
+    ArgumentType,
+    LogicOrchestrator,
+    StructuredArgument,
+)
+from agents.core.memory_system import MemorySystem, MemoryType
+from agents.core.retrieval_augmentation import HybridRetriever
+from agents.core.rule_engine import Predicate, Rule, RuleEngine
+from agents.core.telemetry_replay import EventType, InMemoryEventStore, TelemetryLogger
+from agents.logic.reasoning_agent import ReasoningAgent
+
+TelemetryRecord = Tuple[str, EventType, Dict[str, Any]]
+
+
+class WorkloadGenerator:
+    """Deterministic synthetic workloads; equal seeds give equal data."""
+
+    def __init__(self, seed: int = 0, topics: int = 50, vocabulary: int = 2000):
+        self.seed = seed
+        self.topics = topics
+        self.vocabulary = [f"term{i}" for i in range(vocabulary)]
+
+    def _rng(self, salt: str) -> random.Random:
+        return random.Random(f"{self.seed}:{salt}")
+
+    def facts(self, n: int) -> List[str]:
+        """Categorical and attributive statements spread over the topics."""
+        rng = self._rng("facts")
+        statements = []
+        for i in range(n):
+            topic = rng.randrange(self.topics)
+            if i % 2:
+                statements.append(f"All entity{i} are kind{topic}")
+            else:
+                statements.append(f"entity{i} is a member of kind{topic}")
+        return statements
+
+    def corpus(self, n: int, words: int = 30) -> List[Tuple[str, str]]:
+        """``(chunk_id, text)`` pairs mixing topic words with a wide vocabulary."""
+        rng = self._rng("corpus")
+        chunks = []
+        for i in range(n):
+            body = " ".join(rng.choices(self.vocabulary, k=words))
+            topic = rng.randrange(self.topics)
+            chunks.append((f"chunk{i}", f"topic{topic} evidence claim{i % 11} {body}"))
+        return chunks
+
+    def queries(self, n: int = 16) -> List[str]:
+        """Retrieval and reasoning queries that hit the generated topics."""
+        rng = self._rng("queries")
+        return [
+            f"topic{rng.randrange(self.topics)} evidence "
+            f"{rng.choice(self.vocabulary)} claim{rng.randrange(11)}"
+            for _ in range(n)
+        ]
+
+    def rule_set(
+        self, n: int, chain_length: int = 8
+    ) -> Tuple[List[Predicate], List[Rule]]:
+        """
+        ``n`` parent facts in chains of ``chain_length`` plus the recursive
+        ancestor rules, whose closure derives chain_length*(chain_length+1)/2
+        ancestor facts per chain over chain_length forward-chaining rounds.
+        """
+        facts = []
+        for i in range(n):
+            chain, position = divmod(i, chain_length)
+            facts.append(
+                Predicate(
+                    "parent", [f"n{chain}_{position}", f"n{chain}_{position + 1}"]
+                )
+            )
+        rules = [
+            Rule(
+                "ancestor_base",
+                [Predicate("parent", ["X", "Y"])],
+                Predicate("ancestor", ["X", "Y"]),
+            ),
+            Rule(
+                "ancestor_step",
+                [Predicate("parent", ["X", "Y"]), Predicate("ancestor", ["Y", "Z"])],
+                Predicate("ancestor", ["X", "Z"]),
+            ),
+        ]
+        return facts, rules
+
+    def argument_chain(self, n: int) -> StructuredArgument:
+        """A modus ponens chain p0, p0->p1, ..., therefore pN."""
+        premises = [f"If p{i} then p{i + 1}" for i in range(n)] + ["p0"]
+        return StructuredArgument(
+            premises=premises,
+            conclusion=f"p{n}",
+            argument_type=ArgumentType.PROPOSITIONAL,
+        )
+
+    def telemetry_stream(self, n: int, sessions: int = 20) -> Iterator[TelemetryRecord]:
+        """Interleaved agent sessions of inputs, tool calls, metrics and errors."""
+        rng = self._rng("telemetry")
+        kinds = [
+            (EventType.INPUT, 0.3),
+            (EventType.TOOL_CALL, 0.3),
+            (EventType.METRIC, 0.3),
+            (EventType.ERROR, 0.1),
+        ]
+        event_types = [kind for kind, _ in kinds]
+        weights = [weight for _, weight in kinds]
+        for i in range(n):
+            event_type = rng.choices(event_types, weights)[0]
+            yield (
+                f"session{rng.randrange(sessions)}",
+                event_type,
+                {"seq": i, "value": rng.random(), "tool": f"tool{i % 7}"},
+            )
+
+
+@dataclass
+class Scenario:
+    """A hot path driven at a ladder of workload sizes."""
+
+    name: str
+    target: str
+    unit: str
+    scales: Tuple[int, ...]
+    # Builds the workload for a scale and returns (call, operations per call)
+    build: Callable[[WorkloadGenerator, int], Tuple[Callable[[], Any], int]]
+
+
+def _build_reasoning(gen: WorkloadGenerator, n: int) -> Tuple[Callable[[], Any], int]:
+    agent = ReasoningAgent(
+        "workload", "Synthetic workload benchmark agent", enable_cache=False
+    )
+    for statement in gen.facts(n):
+        agent.add_knowledge(statement, source="workload")
+    queries = cycle(f"Are all entity{i} kind{i % gen.topics}?" for i in range(1, 33, 2))
+    return lambda: agent.reason(next(queries)), 1
+
+
+def _build_orchestrator(
+    gen: WorkloadGenerator, n: int
+) -> Tuple[Callable[[], Any], int]:
+    orchestrator = LogicOrchestrator()
+    argument = gen.argument_chain(n)
+    return lambda: orchestrator.analyze(argument), 1
+
+
+def _build_retrieval(gen: WorkloadGenerator, n: int) -> Tuple[Callable[[], Any], int]:
+    retriever = HybridRetriever()
+    for chunk_id, text in gen.corpus(n):
+        retriever.add_document(chunk_id, text)
+    queries = cycle(gen.queries())
+    return lambda: retriever.retrieve(next(queries), top_k=10), 1
+
+
+def _build_forward_chain(
+    gen: WorkloadGenerator, n: int
+) -> Tuple[Callable[[], Any], int]:
+    facts, rules = gen.rule_set(n)
+    engine = RuleEngine()
+    for rule in rules:
+        engine.add_rule(rule)
+    base = set(facts)
+
+    def call() -> List[Predicate]:
+        # forward_chain mutates the fact set; every call starts from the base
+        engine.facts = set(base)
+        engine.clear_trace()
+        return engine.forward_chain()
+
+    return call, 1
+
+
+def _build_memory(gen: WorkloadGenerator, n: int) -> Tuple[Callable[[], Any], int]:
+    memory = MemorySystem(max_memories=n)
+    for statement in gen.facts(n):
+        memory.store(statement, MemoryType.FACT)
+    queries = cycle(f"kind{i} entity" for i in range(0, gen.topics, 3))
+    return lambda: memory.retrieve(next(queries), top_k=10), 1
+
+
+def _build_telemetry(gen: WorkloadGenerator, n: int) -> Tuple[Callable[[], Any], int]:
+    stream = list(gen.telemetry_stream(n))
+
+    def call() -> int:
+        logger = TelemetryLogger(InMemoryEventStore(max_events=n))
+        for session_id, event_type, data in stream:
+            logger.log(session_id, event_type, data)
+        return len(logger.store.query(session_id="session0"))
+
+    return call, n
+
+
+SCENARIOS: Dict[str, Scenario] = {
+    s.name: s
+    for s in [
+        Scenario(
+            "reasoning",
+            "ReasoningAgent.reason",
+            "facts",
+            (100, 1_000, 10_000, 100_000),
+            _build_reasoning,
+        ),
+        Scenario(
+            "orchestrator",
+            "LogicOrchestrator.analyze",
+            "premises",
+            (10, 100, 1_000),
+            _build_orchestrator,
+        ),
+        Scenario(
+            "retrieval",
+            "HybridRetriever.retrieve",
+            "chunks",
+            (100, 1_000, 10_000, 100_000),
+            _build_retrieval,
+        ),
+        Scenario(
+            "forward_chain",
+            "RuleEngine.forward_chain",
+            "parent facts",
+            (10, 100, 1_000, 10_000),
+            _build_forward_chain,
+        ),
+        Scenario(
+            "memory",
+            "MemorySystem.retrieve",
+            "memories",
+            (1_000, 10_000, 100_000),
+            _build_memory,
+        ),
+        Scenario(
+            "telemetry",
+            "TelemetryLogger.log",
+            "events",
+            (1_000, 10_000, 100_000),
+            _build_telemetry,
+        ),
+    ]
+}
+
+
+def projected_cost(points: Sequence[Tuple[int, float]], scale: int) -> float:
+    """
+    Extrapolate the cost in seconds of ``scale`` from earlier (scale, cost)
+    points, using the growth exponent between the last two (clamped to
+    [1, 3]) or linear growth when only one point exists.
+    """
+    if not points:
+        return 0.0
+    last_scale, last_cost = points[-1]
+    exponent = 1.0
+    if len(points) > 1:
+        prev_scale, prev_cost = points[-2]
+        if prev_cost > 0 and last_cost > 0 and last_scale != prev_scale:
+            exponent = math.log(last_cost / prev_cost) / math.log(
+                last_scale / prev_scale
+            )
+            exponent = min(max(exponent, 1.0), 3.0)
+    return last_cost * (scale / last_scale) ** exponent
+
+
+def run_point(
+    scenario: Scenario,
+    scale: int,
+    gen: WorkloadGenerator,
+    runner: BenchmarkRunner,
+    min_time: float = 0.5,
+    budget: float = 30.0,
+) -> Dict[str, Any]:
+    """Build one workload and measure its hot path."""
+    started = time.perf_counter()
+    tracemalloc.start()
+    try:
+        call, ops_per_call = scenario.build(gen, scale)
+        footprint, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    build_s = time.perf_counter() - started
+
+    config = BenchmarkConfig(
+        name=f"{scenario.name}@{scale}",
+        category=BenchmarkCategory.PERFORMANCE,
+        warmup_iterations=1,
+        iterations=3,
+        timeout_seconds=budget,
+        auto_calibrate=True,
+        min_time_seconds=min_time,
+        bootstrap_resamples=200,
+    )
+    result = runner.run_benchmark(config, call)
+    mean_s = result.mean_ms / 1000
+    return {
+        "scenario": scenario.name,
+        "target": scenario.target,
+        "unit": scenario.unit,
+        "scale": scale,
+        "status": "ok" if result.success else "error",
+        "error": result.error,
+        "build_s": build_s,
+        "footprint_mb": footprint / (1024 * 1024),
+        "iterations": result.iterations,
+        "mean_ms": result.mean_ms,
+        "p50_ms": result.p50_ms,
+        "p99_ms": result.p99_ms,
+        "ci_low_ms": result.ci_low_ms,
+        "ci_high_ms": result.ci_high_ms,
+        "ops_per_call": ops_per_call,
+        "throughput_ops": ops_per_call / mean_s if mean_s > 0 else 0.0,
+        "call_peak_mb": result.memory_mb,
+        "elapsed_s": time.perf_counter() - started,
+    }
+
+
+def run_scenarios(
+    names: Optional[Sequence[str]] = None,
+    scales: Optional[Sequence[int]] = None,
+    max_scale: Optional[int] = None,
+    budget: float = 30.0,
+    min_time: float = 0.5,
+    seed: int = 0,
+    log: Optional[Callable[[str], None]] = None,
+) -> Dict[str, Any]:
+    """
+    Run the selected scenarios over their scale ladders (or ``scales``).
+
+    Once a scale is projected to exceed ``budget`` seconds it and every
+    larger scale of that scenario are reported with status "skipped".
+    """
+    gen = WorkloadGenerator(seed)
+    runner = BenchmarkRunner()
+    rows: List[Dict[str, Any]] = []
+
+    for name in names or list(SCENARIOS):
+        scenario = SCENARIOS[name]
+        ladder = sorted(scales or scenario.scales)
+        if max_scale is not None:
+            ladder = [s for s in ladder if s <= max_scale]
+        costs: List[Tuple[int, float]] = []
+        skipping = False
+        for scale in ladder:
+            projected = projected_cost(costs, scale)
+            if skipping or projected > budget:
+                skipping = True
+                rows.append(
+                    {
+                        "scenario": scenario.name,
+                        "target": scenario.target,
+                        "unit": scenario.unit,
+                        "scale": scale,
+                        "status": "skipped",
+                        "projected_s": projected,
+                    }
+                )
+                continue
+            row = run_point(scenario, scale, gen, runner, min_time, budget)
+            rows.append(row)
+            # Unavoidable cost of a point: the build plus warmup and 3 calls
+            costs.append((scale, row["build_s"] + 4 * row["mean_ms"] / 1000))
+            if log:
+                log(
+                    f"{scenario.name:<14} {scale:>8} {row['unit']:<13} "
+                    f"{row['mean_ms']:10.3f} ms  build {row['build_s']:.2f}s"
+                )
+
+    return {
+        "seed": seed,
+        "budget_s": budget,
+        "min_time_s": min_time,
+        "python": sys.version.split()[0],
+        "results": rows,
+    }
+
+
+def format_table(rows: List[Dict[str, Any]]) -> str:
+    """Render scaling rows as a markdown table (growth relative to the first scale)."""
+    lines = [
+        "| Scenario | Target | Scale | Build (s) | Mean (ms) | p99 (ms) | "
+        "Ops/s | Growth | Footprint (MB) | Call Peak (MB) |",
+        "|----------|--------|-------|-----------|-----------|----------|"
+        "-------|--------|----------------|----------------|",
+    ]
+    first: Dict[str, Dict[str, Any]] = {}
+    for row in rows:
+        scale = f"{row['scale']:,} {row['unit']}"
+        if row["status"] == "skipped":
+            lines.append(
+                f"| **{row['scenario']}** | `{row['target']}` | {scale} | "
+                f"skipped (~{row['projected_s']:,.0f}s projected) | | | | | | |"
+            )
+            continue
+        base = first.setdefault(row["scenario"], row)
+        growth = (
+            "Baseline"
+            if base is row
+            else f"{row['mean_ms'] / base['mean_ms']:.1f}x"
+            if base["mean_ms"]
+            else "-"
+        )
+        lines.append(
+            f"| **{row['scenario']}** | `{row['target']}` | {scale} | "
+            f"{row['build_s']:.2f} | {row['mean_ms']:.3f} | {row['p99_ms']:.3f} | "
+            f"{row['throughput_ops']:,.0f} | {growth} | {row['footprint_mb']:.1f} | "
+            f"{row['call_peak_mb'] or 0.0:.2f} |"
+        )
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Reasoning stack workload benchmark")
+    parser.add_argument("--scenarios", nargs="+", choices=sorted(SCENARIOS))
+    parser.add_argument(
+        "--scales", nargs="+", type=int, help="Override every scenario's scale ladder"
+    )
+    parser.add_argument("--max-scale", type=int)
+    parser.add_argument(
+        "--budget",
+        type=float,
+        default=30.0,
+        help="Skip scales projected to take longer than this many seconds",
+    )
+    parser.add_argument("--min-time", type=float, default=0.5)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", help="Write the machine-readable report here")
+    parser.add_argument("--markdown", help="Write the scaling table here")
+    args = parser.parse_args(argv)
+
+    report = run_scenarios(
+        args.scenarios,
+        scales=args.scales,
+        max_scale=args.max_scale,
+        budget=args.budget,
+        min_time=args.min_time,
+        seed=args.seed,
+        log=lambda line: print(line, file=sys.stderr),
+    )
+    table = format_table(report["results"])
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+    if args.markdown:
+        with open(args.markdown, "w", encoding="utf-8") as f:
+            f.write(table + "\n")
+    print(table)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,10 +4,28 @@ Security Hooks for Autonomous Coding Agent
 
 Pre-tool-use hooks that validate bash commands for security.
 Uses an allowlist approach - only explicitly permitted commands can run.
+
+Commands are parsed by the shared agents.tools.command_analysis module and
+verdicts are cached per (allowlist, command string).
 """
 
-import os
+import re
 import shlex
+import sys
+from pathlib import Path
+
+try:
+    from agents.tools.command_analysis import (
+        DEFAULT_VERDICT_CACHE,
+        parse_command,
+    )
+except ImportError:
+    # Run from this directory: make the repository root importable
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+    from agents.tools.command_analysis import (
+        DEFAULT_VERDICT_CACHE,
+        parse_command,
+    )
 
 # Allowed commands for development tasks
 # Minimal set needed for the autonomous coding demo
@@ -43,6 +61,10 @@ ALLOWED_COMMANDS = {
 COMMANDS_NEEDING_EXTRA_VALIDATION = {"pkill", "chmod", "init.sh"}
 
 
+# Command substitution allows arbitrary execution and bypasses the allowlist
+SUBSTITUTION_PATTERN = re.compile(r"\$\(|\`")
+
+
 def split_command_segments(command_string: str) -> list[str]:
     """
     Split a compound command into individual command segments.
@@ -55,22 +77,11 @@ def split_command_segments(command_string: str) -> list[str]:
     Returns:
         List of individual command segments
     """
-    import re
-
-    # Split on && and || while preserving the ability to handle each segment
-    # This regex splits on && or || that aren't inside quotes
-    segments = re.split(r"\s*(?:&&|\|\|)\s*", command_string)
-
-    # Further split on semicolons
-    result = []
-    for segment in segments:
-        sub_segments = re.split(r'(?<!["\'])\s*;\s*(?!["\'])', segment)
-        for sub in sub_segments:
-            sub = sub.strip()
-            if sub:
-                result.append(sub)
-
-    return result
+    ast = parse_command(command_string)
+    if ast.error:
+        stripped = command_string.strip()
+        return [stripped] if stripped else []
+    return [segment.text for segment in ast.segments]
 
 
 def extract_commands(command_string: str) -> list[str]:
@@ -86,83 +97,17 @@ def extract_commands(command_string: str) -> list[str]:
     Returns:
         List of command names found in the string
     """
-    commands = []
-
     # SECURITY: Detect command substitution patterns before processing
-    # These allow arbitrary command execution and bypass the allowlist
-    import re as re_security
-
-    if re_security.search(r"\$\(|\`", command_string):
-        # Command substitution detected - fail safe by returning empty
+    # Fail safe by returning empty, even for quoted occurrences
+    if SUBSTITUTION_PATTERN.search(command_string):
         return []
 
-    # shlex doesn't treat ; as a separator, so we need to pre-process
-    import re
-
-    # Split on semicolons that aren't inside quotes (simple heuristic)
-    # This handles common cases like "echo hello; ls"
-    segments = re.split(r'(?<!["\'])\s*;\s*(?!["\'])', command_string)
-
-    for segment in segments:
-        segment = segment.strip()
-        if not segment:
-            continue
-
-        try:
-            tokens = shlex.split(segment)
-        except ValueError:
-            # Malformed command (unclosed quotes, etc.)
-            # Return empty to trigger block (fail-safe)
-            return []
-
-        if not tokens:
-            continue
-
-        # Track when we expect a command vs arguments
-        expect_command = True
-
-        for token in tokens:
-            # Shell operators indicate a new command follows
-            if token in ("|", "||", "&&", "&"):
-                expect_command = True
-                continue
-
-            # Skip shell keywords that precede commands
-            if token in (
-                "if",
-                "then",
-                "else",
-                "elif",
-                "fi",
-                "for",
-                "while",
-                "until",
-                "do",
-                "done",
-                "case",
-                "esac",
-                "in",
-                "!",
-                "{",
-                "}",
-            ):
-                continue
-
-            # Skip flags/options
-            if token.startswith("-"):
-                continue
-
-            # Skip variable assignments (VAR=value)
-            if "=" in token and not token.startswith("="):
-                continue
-
-            if expect_command:
-                # Extract the base command name (handle paths like /usr/bin/python)
-                cmd = os.path.basename(token)
-                commands.append(cmd)
-                expect_command = False
-
-    return commands
+    ast = parse_command(command_string)
+    if ast.error or ast.substitutions:
+        # Malformed command (unclosed quotes, etc.) or process substitution
+        # Return empty to trigger block (fail-safe)
+        return []
+    return ast.commands
 
 
 def validate_pkill_command(command_string: str) -> tuple[bool, str]:
@@ -250,8 +195,6 @@ def validate_chmod_command(command_string: str) -> tuple[bool, str]:
 
     # Only allow +x variants (making files executable)
     # This matches: +x, u+x, g+x, o+x, a+x, ug+x, etc.
-    import re
-
     if not re.match(r"^[ugoa]*\+x$", mode):
         return False, f"chmod only allowed with +x mode, got: {mode}"
 
@@ -301,6 +244,43 @@ def get_command_for_validation(cmd: str, segments: list[str]) -> str:
     return ""
 
 
+EXTRA_VALIDATORS = {
+    "pkill": validate_pkill_command,
+    "chmod": validate_chmod_command,
+    "init.sh": validate_init_script,
+}
+
+
+def validate_command(command: str) -> tuple[bool, str]:
+    """
+    Validate a full command string against the allowlist, uncached.
+
+    Sensitive commands are validated on their own text, so every
+    occurrence is checked.
+
+    Returns:
+        Tuple of (is_allowed, reason_if_blocked)
+    """
+    if not extract_commands(command):
+        # Could not parse - fail safe by blocking
+        return False, f"Could not parse command for security validation: {command}"
+
+    for simple in parse_command(command).iter_commands(nested=False):
+        cmd = simple.name
+        if not cmd:
+            continue
+        if cmd not in ALLOWED_COMMANDS:
+            return False, f"Command '{cmd}' is not in the allowed commands list"
+
+        # Additional validation for sensitive commands
+        if cmd in COMMANDS_NEEDING_EXTRA_VALIDATION:
+            allowed, reason = EXTRA_VALIDATORS[cmd](simple.text)
+            if not allowed:
+                return False, reason
+
+    return True, ""
+
+
 async def bash_security_hook(input_data, tool_use_id=None, context=None):
     """
     Pre-tool-use hook that validates bash commands using an allowlist.
@@ -322,45 +302,10 @@ async def bash_security_hook(input_data, tool_use_id=None, context=None):
     if not command:
         return {}
 
-    # Extract all commands from the command string
-    commands = extract_commands(command)
-
-    if not commands:
-        # Could not parse - fail safe by blocking
-        return {
-            "decision": "block",
-            "reason": f"Could not parse command for security validation: {command}",
-        }
-
-    # Split into segments for per-command validation
-    segments = split_command_segments(command)
-
-    # Check each command against the allowlist
-    for cmd in commands:
-        if cmd not in ALLOWED_COMMANDS:
-            return {
-                "decision": "block",
-                "reason": f"Command '{cmd}' is not in the allowed commands list",
-            }
-
-        # Additional validation for sensitive commands
-        if cmd in COMMANDS_NEEDING_EXTRA_VALIDATION:
-            # Find the specific segment containing this command
-            cmd_segment = get_command_for_validation(cmd, segments)
-            if not cmd_segment:
-                cmd_segment = command  # Fallback to full command
-
-            if cmd == "pkill":
-                allowed, reason = validate_pkill_command(cmd_segment)
-                if not allowed:
-                    return {"decision": "block", "reason": reason}
-            elif cmd == "chmod":
-                allowed, reason = validate_chmod_command(cmd_segment)
-                if not allowed:
-                    return {"decision": "block", "reason": reason}
-            elif cmd == "init.sh":
-                allowed, reason = validate_init_script(cmd_segment)
-                if not allowed:
-                    return {"decision": "block", "reason": reason}
-
+    fingerprint = ("bash_security_hook", frozenset(ALLOWED_COMMANDS))
+    allowed, reason = DEFAULT_VERDICT_CACHE.get_or_compute(
+        fingerprint, command, lambda: validate_command(command)
+    )
+    if not allowed:
+        return {"decision": "block", "reason": reason}
     return {}
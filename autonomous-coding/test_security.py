@@ -253,6 +253,10 @@ def main():
         "$(echo pkill) node",
         'eval "pkill node"',
         'bash -c "pkill node"',
+        "ls|xargs rm",
+        "cat file.txt >/dev/null;rm -rf /",
+        # Every occurrence of a sensitive command is validated
+        "chmod +x init.sh && chmod 777 init.sh",
         # chmod with disallowed modes
         "chmod 777 file.sh",
         "chmod 755 file.sh",
@@ -0,0 +1,147 @@
+"""
+Local load test for the reasoning API server.
+
+Fires concurrent requests at ``/api/reason`` (or ``/api/reason/batch``) over
+persistent keep-alive connections and reports throughput and latency
+percentiles.
+
+Usage:
+    python trainer/server.py --production --quiet &
+    python trainer/load_test.py --requests 500 --concurrency 16
+    python trainer/load_test.py --batch-size 8
+"""
+
+import argparse
+import http.client
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List
+from urllib.parse import urlparse
+
+SAMPLE_QUERIES = [
+    "All humans are mortal and Socrates is human",
+    "If it rains then the ground is wet",
+    "Is the argument valid or is it a fallacy",
+    "Socrates is mortal",
+]
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(
+        0, min(len(sorted_values) - 1, int(round(pct / 100 * len(sorted_values))) - 1)
+    )
+    return sorted_values[rank]
+
+
+def run_load_test(
+    url: str, total_requests: int, concurrency: int, batch_size: int
+) -> Dict[str, float]:
+    parsed = urlparse(url)
+    path = "/api/reason/batch" if batch_size > 1 else "/api/reason"
+    local = threading.local()
+    latencies: List[float] = []
+    status_counts: Dict[int, int] = {}
+    lock = threading.Lock()
+
+    def connection() -> http.client.HTTPConnection:
+        if not hasattr(local, "conn"):
+            local.conn = http.client.HTTPConnection(
+                parsed.hostname, parsed.port or 80, timeout=60
+            )
+        return local.conn
+
+    def one_request(i: int) -> None:
+        if batch_size > 1:
+            payload = {
+                "queries": [
+                    {"query": SAMPLE_QUERIES[(i + j) % len(SAMPLE_QUERIES)]}
+                    for j in range(batch_size)
+                ]
+            }
+        else:
+            payload = {"query": SAMPLE_QUERIES[i % len(SAMPLE_QUERIES)]}
+        body = json.dumps(payload)
+
+        start = time.perf_counter()
+        try:
+            conn = connection()
+            conn.request(
+                "POST", path, body=body, headers={"Content-Type": "application/json"}
+            )
+            response = conn.getresponse()
+            response.read()
+            status = response.status
+            if response.getheader("Connection", "").lower() == "close":
+                conn.close()
+                del local.conn
+        except (OSError, http.client.HTTPException):
+            status = 0
+            if hasattr(local, "conn"):
+                local.conn.close()
+                del local.conn
+        elapsed_ms = (time.perf_counter() - start) * 1000
+
+        with lock:
+            status_counts[status] = status_counts.get(status, 0) + 1
+            if status == 200:
+                latencies.append(elapsed_ms)
+
+    wall_start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        list(pool.map(one_request, range(total_requests)))
+    wall_seconds = time.perf_counter() - wall_start
+
+    latencies.sort()
+    ok = status_counts.get(200, 0)
+    return {
+        "requests": total_requests,
+        "ok": ok,
+        "rejected_503": status_counts.get(503, 0),
+        "errors": total_requests - ok - status_counts.get(503, 0),
+        "wall_seconds": wall_seconds,
+        "throughput_rps": ok / wall_seconds if wall_seconds else 0.0,
+        "queries_per_second": ok * batch_size / wall_seconds if wall_seconds else 0.0,
+        "p50_ms": percentile(latencies, 50),
+        "p95_ms": percentile(latencies, 95),
+        "p99_ms": percentile(latencies, 99),
+        "max_ms": latencies[-1] if latencies else 0.0,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Load test the reasoning server")
+    parser.add_argument("--url", default="http://127.0.0.1:8000")
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=1,
+        help="Queries per request; values > 1 use /api/reason/batch",
+    )
+    args = parser.parse_args()
+
+    stats = run_load_test(args.url, args.requests, args.concurrency, args.batch_size)
+
+    print("=" * 50)
+    print("LOAD TEST RESULTS")
+    print("=" * 50)
+    print(f"Requests:      {stats['requests']} (concurrency {args.concurrency})")
+    print(f"OK:            {stats['ok']}")
+    print(f"503 rejected:  {stats['rejected_503']}")
+    print(f"Other errors:  {stats['errors']}")
+    print(f"Throughput:    {stats['throughput_rps']:.1f} req/s")
+    print(f"Queries/s:     {stats['queries_per_second']:.1f}")
+    print(
+        f"Latency (ms):  p50={stats['p50_ms']:.1f} "
+        f"p95={stats['p95_ms']:.1f} p99={stats['p99_ms']:.1f} max={stats['max_ms']:.1f}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,37 @@
+"""
+Reasoning API server for the trainer UI.
+
+Serves the static trainer pages and a small JSON API backed by
+``ReasoningAgent``:
+
+- ``POST /api/reason``        - reason about a single query
+- ``POST /api/reason/batch``  - reason about a list of queries in one call
+
+Two serving modes are available:
+
+- ``dev`` (default): single-threaded, one shared agent. Matches the original
+  behaviour and is convenient for local debugging.
+- ``production``: threaded HTTP/1.1 server with keep-alive, a pool of
+  per-worker agents (so ``reasoning_chain`` state is never shared between
+  concurrent requests) and a bounded admission queue that answers ``503``
+  when the server is saturated.
+
+Usage:
+    python trainer/server.py
+    python trainer/server.py --production --workers 8 --queue-size 32
+"""
+
+import argparse
+import functools
 import http.server
 import json
 import os
+import queue
 import socketserver
 import sys
+import threading
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 
 # Add project root to path to import agents
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -10,76 +39,307 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from agents.logic.reasoning_agent import LogicType, ReasoningAgent
 
 PORT = 8000
+STATIC_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_WORKERS = 4
+DEFAULT_QUEUE_SIZE = 16
+MAX_BATCH_SIZE = 32
+AGENT_ACQUIRE_TIMEOUT_SECONDS = 30.0
+RETRY_AFTER_SECONDS = 1
+
+
+def create_agent(verbose: bool = True) -> ReasoningAgent:
+    """Build one trainer agent."""
+    return ReasoningAgent(
+        name="TrainerAI",
+        system_prompt="You are a logic tutor helping a student learn critical thinking.",
+        logic_framework=LogicType.PROPOSITIONAL,
+        verbose=verbose,
+    )
+
+
+class AgentPool:
+    """
+    Fixed-size pool of ReasoningAgent instances.
+
+    Each request checks out an agent for its exclusive use, so per-call state
+    such as ``reasoning_chain`` is never mutated by two requests at once.
+    """
+
+    def __init__(self, size: int, factory: Callable[[], ReasoningAgent]):
+        if size < 1:
+            raise ValueError("Agent pool size must be at least 1")
+        self.size = size
+        self._agents: "queue.Queue[ReasoningAgent]" = queue.Queue(maxsize=size)
+        for _ in range(size):
+            self._agents.put(factory())
+
+    @contextmanager
+    def acquire(self, timeout: Optional[float] = None) -> Iterator[ReasoningAgent]:
+        """Check out an agent, returning it to the pool afterwards."""
+        agent = self._agents.get(timeout=timeout)
+        try:
+            yield agent
+        finally:
+            self._agents.put(agent)
+
+    def available(self) -> int:
+        """Number of idle agents."""
+        return self._agents.qsize()
+
+
+class ServerBusyError(Exception):
+    """Raised when the admission queue is full."""
+
+
+class ReasoningServerMixin:
+    """Shared state for reasoning servers: agent pool and admission control."""
+
+    agent_pool: AgentPool
+    max_pending: int
+
+    def setup_reasoning(self, agent_pool: AgentPool, max_pending: int) -> None:
+        self.agent_pool = agent_pool
+        self.max_pending = max_pending
+        self._admission = threading.BoundedSemaphore(max_pending)
+
+    @contextmanager
+    def admit(self) -> Iterator[None]:
+        """Admit one API request or raise ServerBusyError without blocking."""
+        if not self._admission.acquire(blocking=False):
+            raise ServerBusyError("Server is at capacity")
+        try:
+            yield
+        finally:
+            self._admission.release()
+
+
+class DevReasoningServer(ReasoningServerMixin, socketserver.TCPServer):
+    """Single-threaded server for local development."""
+
+    allow_reuse_address = True
+
+
+class ThreadedReasoningServer(ReasoningServerMixin, http.server.ThreadingHTTPServer):
+    """Thread-per-connection server for production serving."""
+
+    allow_reuse_address = True
+    daemon_threads = True
+
 
-# Initialize Agent
-agent = ReasoningAgent(
-    name="TrainerAI",
-    system_prompt="You are a logic tutor helping a student learn critical thinking.",
-    logic_framework=LogicType.PROPOSITIONAL,
-    verbose=True,
-)
+def build_response(result: Dict[str, Any]) -> Dict[str, Any]:
+    """Project an agent result onto the JSON shape the trainer UI expects."""
+    return {
+        "conclusion": result["conclusion"],
+        "confidence": result["confidence"],
+        "reasoning_chain": [
+            {
+                "premise": step["premise"],
+                "rule": step["rule"],
+                "conclusion": step["conclusion"],
+            }
+            for step in result.get("reasoning_chain", [])
+        ],
+        "formal_notation": result.get("formal_conclusion"),
+        "warnings": result.get("warnings", []),
+    }
+
+
+def parse_query(item: Any) -> Tuple[Optional[str], str]:
+    """Extract (query, context) from a request item (dict or plain string)."""
+    if isinstance(item, str):
+        return item, ""
+    if isinstance(item, dict):
+        return item.get("query"), item.get("context", "") or ""
+    return None, ""
+
+
+def run_query(agent: ReasoningAgent, query: str, context: str) -> Dict[str, Any]:
+    """Execute reasoning for one query on the given agent."""
+    # Combining context and query for the agent
+    full_prompt = f"{context}\n\nQuestion: {query}" if context else query
+    return build_response(agent.reason(full_prompt))
 
 
 class ReasoningRequestHandler(http.server.SimpleHTTPRequestHandler):
+    server: ReasoningServerMixin
+
     def do_POST(self):
-        if self.path == "/api/reason":
-            content_length = int(self.headers["Content-Length"])
-            post_data = self.rfile.read(content_length)
+        if self.path not in ("/api/reason", "/api/reason/batch"):
+            self.send_error(404, "Not Found")
+            return
 
-            try:
-                data = json.loads(post_data.decode("utf-8"))
-                query = data.get("query")
-                context = data.get("context", "")
+        data = self._read_json()
+        if data is None:
+            return
 
+        try:
+            with self.server.admit():
+                if self.path == "/api/reason":
+                    self._handle_reason(data)
+                else:
+                    self._handle_batch(data)
+        except ServerBusyError:
+            self._send_json(
+                503,
+                {"error": "Server busy, retry later"},
+                extra_headers={"Retry-After": str(RETRY_AFTER_SECONDS)},
+            )
+        except queue.Empty:
+            self._send_json(
+                503,
+                {"error": "No reasoning worker available"},
+                extra_headers={"Retry-After": str(RETRY_AFTER_SECONDS)},
+            )
+        except Exception as e:
+            print(f"Error processing request: {e}")
+            self.send_error(500, str(e))
+
+    def _handle_reason(self, data: Any) -> None:
+        query, context = parse_query(data)
+        if not query:
+            self.send_error(400, "Missing 'query' field")
+            return
+
+        print(f"Received reasoning request: {query[:50]}...")
+
+        with self.server.agent_pool.acquire(
+            timeout=AGENT_ACQUIRE_TIMEOUT_SECONDS
+        ) as agent:
+            response = run_query(agent, query, context)
+        self._send_json(200, response)
+
+    def _handle_batch(self, data: Any) -> None:
+        items = data.get("queries") if isinstance(data, dict) else data
+        if not isinstance(items, list) or not items:
+            self.send_error(400, "Expected a non-empty 'queries' list")
+            return
+        if len(items) > MAX_BATCH_SIZE:
+            self.send_error(413, f"Batch exceeds {MAX_BATCH_SIZE} queries")
+            return
+
+        print(f"Received batch reasoning request: {len(items)} queries")
+
+        results: List[Dict[str, Any]] = []
+        # One agent serves the whole batch: the queries run back-to-back
+        # without re-entering the pool between items.
+        with self.server.agent_pool.acquire(
+            timeout=AGENT_ACQUIRE_TIMEOUT_SECONDS
+        ) as agent:
+            for item in items:
+                query, context = parse_query(item)
                 if not query:
-                    self.send_error(400, "Missing 'query' field")
-                    return
-
-                print(f"Received reasoning request: {query[:50]}...")
-
-                # Execute reasoning
-                # Combining context and query for the agent
-                full_prompt = f"{context}\n\nQuestion: {query}" if context else query
-                result = agent.reason(full_prompt)
-
-                # Construct response
-                response = {
-                    "conclusion": result["conclusion"],
-                    "confidence": result["confidence"],
-                    "reasoning_chain": [
-                        {
-                            "premise": step["premise"],
-                            "rule": step["rule"],
-                            "conclusion": step["conclusion"],
-                        }
-                        for step in result["reasoning_chain"]
-                    ],
-                    "formal_notation": result["formal_conclusion"],
-                    "warnings": result.get("warnings", []),
-                }
-
-                self.send_response(200)
-                self.send_header("Content-type", "application/json")
-                self.send_header(
-                    "Access-Control-Allow-Origin", "*"
-                )  # Allow all for local dev
-                self.end_headers()
-                self.wfile.write(json.dumps(response).encode("utf-8"))
-
-            except Exception as e:
-                print(f"Error processing request: {e}")
-                self.send_error(500, str(e))
-        else:
-            self.send_error(404, "Not Found")
+                    results.append({"error": "Missing 'query' field"})
+                    continue
+                try:
+                    results.append(run_query(agent, query, context))
+                except Exception as e:
+                    results.append({"error": str(e)})
+        self._send_json(200, {"results": results})
+
+    def _read_json(self) -> Any:
+        """Read and decode the request body, replying with an error on failure."""
+        length_header = self.headers.get("Content-Length")
+        if length_header is None:
+            self.send_error(411, "Content-Length required")
+            return None
+        try:
+            content_length = int(length_header)
+            post_data = self.rfile.read(content_length)
+            return json.loads(post_data.decode("utf-8"))
+        except (ValueError, UnicodeDecodeError):
+            self.send_error(400, "Invalid JSON body")
+            return None
+
+    def _send_json(
+        self,
+        status: int,
+        payload: Any,
+        extra_headers: Optional[Dict[str, str]] = None,
+    ) -> None:
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-type", "application/json")
+        # Content-Length is required for keep-alive connections
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Access-Control-Allow-Origin", "*")  # Allow all for local dev
+        for name, value in (extra_headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
 
     def do_OPTIONS(self):
         self.send_response(200)
         self.send_header("Access-Control-Allow-Origin", "*")
         self.send_header("Access-Control-Allow-Methods", "POST, OPTIONS")
         self.send_header("Access-Control-Allow-Headers", "Content-Type")
+        self.send_header("Content-Length", "0")
         self.end_headers()
 
 
-print(f"Starting Reasoning Server on port {PORT}...")
-with socketserver.TCPServer(("", PORT), ReasoningRequestHandler) as httpd:
-    httpd.serve_forever()
+class KeepAliveReasoningRequestHandler(ReasoningRequestHandler):
+    """HTTP/1.1 handler so clients can reuse connections."""
+
+    protocol_version = "HTTP/1.1"
+    # Small JSON responses would otherwise stall on delayed ACKs
+    disable_nagle_algorithm = True
+
+
+def make_server(
+    port: int = PORT,
+    production: bool = False,
+    workers: int = DEFAULT_WORKERS,
+    queue_size: int = DEFAULT_QUEUE_SIZE,
+    verbose: bool = True,
+    host: str = "",
+) -> socketserver.TCPServer:
+    """
+    Build a configured reasoning server.
+
+    In production mode up to ``workers`` requests reason concurrently and a
+    further ``queue_size`` wait for a free agent; anything beyond that is
+    rejected with ``503``.
+    """
+    if production:
+        pool = AgentPool(workers, lambda: create_agent(verbose=verbose))
+        handler = functools.partial(
+            KeepAliveReasoningRequestHandler, directory=STATIC_DIR
+        )
+        server = ThreadedReasoningServer((host, port), handler)
+        server.setup_reasoning(pool, max_pending=workers + queue_size)
+    else:
+        pool = AgentPool(1, lambda: create_agent(verbose=verbose))
+        handler = functools.partial(ReasoningRequestHandler, directory=STATIC_DIR)
+        server = DevReasoningServer((host, port), handler)
+        server.setup_reasoning(pool, max_pending=1)
+    return server
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Reasoning API server")
+    parser.add_argument("--port", type=int, default=PORT)
+    parser.add_argument(
+        "--production",
+        action="store_true",
+        help="Threaded keep-alive server with an agent pool and backpressure",
+    )
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS)
+    parser.add_argument("--queue-size", type=int, default=DEFAULT_QUEUE_SIZE)
+    parser.add_argument(
+        "--quiet", action="store_true", help="Disable verbose agent output"
+    )
+    args = parser.parse_args(argv)
+
+    mode = "production" if args.production else "dev"
+    print(f"Starting Reasoning Server on port {args.port} ({mode} mode)...")
+    with make_server(
+        port=args.port,
+        production=args.production,
+        workers=args.workers,
+        queue_size=args.queue_size,
+        verbose=not args.quiet and not args.production,
+    ) as httpd:
+        httpd.serve_forever()
+
+
+if __name__ == "__main__":
+    main()